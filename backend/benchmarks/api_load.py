@@ -0,0 +1,282 @@
+"""
+Multi-user load test of the API against the in-memory Supabase.
+
+    python -m benchmarks.api_load --users 50 --duration 30 --latency-ms 20
+    python -m benchmarks.api_load --users 200 --duration 60 --latency-ms 35 --jitter-ms 15 --mix board=8,bet=1,dashboard=2
+
+The FastAPI app runs in-process behind httpx's ASGI transport (no lifespan, so
+no scheduler) with `USE_FAKE_SUPABASE=1`. Before the run a synthetic board drop
+is published through the same stubbed Odds API the scan benchmarks use. Each
+virtual user then authenticates as its own id and loops over a weighted mix of:
+
+- board: poll `/api/board/latest` and the straight-bets surface with `If-None-Match`
+- bet: log a bet from the board with `POST /bets`
+- dashboard: `GET /summary`, `/balances` and `/bets`
+
+The report lists latency percentiles and errors per route, then the fake
+database's per-query tally. Comparing a route's latency with the Supabase time
+it accounts for separates database round trips from work done in the app.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from benchmarks.scan_pipeline import PROP_MARKETS, Workload, _Payloads, _install_stubs, _percentile, configure_benchmark_environment
+
+SCENARIOS = ("board", "bet", "dashboard")
+DEFAULT_MIX = "board=6,bet=1,dashboard=3"
+
+
+@dataclass
+class RouteStats:
+    samples_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+    not_modified: int = 0
+
+    def record(self, elapsed_ms: float, status: int) -> None:
+        self.samples_ms.append(elapsed_ms)
+        if status == 304:
+            self.not_modified += 1
+        elif status >= 400:
+            self.errors += 1
+
+
+def parse_mix(raw: str) -> dict[str, int]:
+    mix: dict[str, int] = {}
+    for item in raw.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario '{name}'. Choose from: {', '.join(SCENARIOS)}")
+        mix[name] = max(0, int(weight or 1))
+    if not any(mix.values()):
+        raise ValueError("--mix needs at least one scenario with a positive weight")
+    return mix
+
+
+def configure_load_environment(*, latency_ms: float, jitter_ms: float) -> None:
+    configure_benchmark_environment()
+    os.environ["USE_FAKE_SUPABASE"] = "1"
+    os.environ.setdefault("ENVIRONMENT", "test")
+    os.environ["FAKE_SUPABASE_LATENCY_MS"] = str(latency_ms)
+    os.environ["FAKE_SUPABASE_JITTER_MS"] = str(jitter_ms)
+    os.environ["TESTING"] = "1"
+    os.environ.pop("BETA_INVITE_CODE", None)
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+
+async def publish_synthetic_board(workload: Workload) -> list[dict[str, Any]]:
+    """Run a straight and prop scan on synthetic odds and publish them as a scheduled drop; return the sides."""
+    import database
+    from services.board_snapshot import persist_board_meta_snapshot
+    from services.odds_api import scan_all_sides
+    from services.player_props import scan_player_props_for_event_ids
+    from services.runtime_support import retry_supabase
+    from services.scan_cache import persist_latest_scan_payload
+    from services.scan_payload import SCAN_PAYLOAD_SCHEMA_VERSION
+
+    payloads = _Payloads(workload)
+    database._supabase = None
+    db = database.get_db()
+    _install_stubs(payloads, db=db)
+
+    scanned_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    straight = await scan_all_sides(payloads.sport, source="benchmark")
+    props = await scan_player_props_for_event_ids(
+        sport=payloads.sport,
+        event_ids=list(payloads.event_odds),
+        markets=PROP_MARKETS,
+        source="benchmark",
+    )
+    surfaces = {
+        "straight_bets": {**straight, "surface": "straight_bets", "sport": "all"},
+        "player_props": {**props, "surface": "player_props", "sport": "all"},
+    }
+    sides: list[dict[str, Any]] = []
+    for surface, payload in surfaces.items():
+        payload.update(scanned_at=scanned_at, schema_version=SCAN_PAYLOAD_SCHEMA_VERSION)
+        persist_latest_scan_payload(
+            db=db,
+            payload=payload,
+            retry_supabase=retry_supabase,
+            log_event=lambda *_args, **_kwargs: None,
+            surface=surface,
+            scope="latest",
+        )
+        sides.extend(payload.get("sides") or [])
+    persist_board_meta_snapshot(
+        db=db,
+        snapshot_type="scheduled",
+        scanned_at=scanned_at,
+        retry_supabase=retry_supabase,
+        log_event=lambda *_args, **_kwargs: None,
+        game_context=None,
+        surfaces_included=list(surfaces),
+        sports_included=[payloads.sport],
+        events_scanned=int(straight.get("events_fetched") or 0) + int(props.get("events_fetched") or 0),
+        total_sides=len(sides),
+    )
+    db.reset_stats()
+    return sides
+
+
+def _bet_body(side: dict[str, Any], rng: random.Random) -> dict[str, Any]:
+    surface = str(side.get("surface") or "straight_bets")
+    return {
+        "sport": side.get("sport") or "basketball_nba",
+        "event": side.get("event") or "Benchmark Event",
+        "market": "ML" if surface == "straight_bets" else "Prop",
+        "surface": surface,
+        "sportsbook": side.get("sportsbook") or "DraftKings",
+        "promo_type": "standard",
+        "odds_american": side.get("book_odds") or 110,
+        "stake": rng.choice((5, 10, 25, 50)),
+        "commence_time": side.get("commence_time"),
+        "clv_team": side.get("team"),
+        "clv_sport_key": side.get("sport"),
+        "clv_event_id": side.get("event_id"),
+        "source_event_id": side.get("event_id"),
+        "source_market_key": side.get("market_key"),
+        "source_selection_key": side.get("selection_key"),
+    }
+
+
+async def _virtual_user(
+    client: httpx.AsyncClient,
+    user_id: str,
+    *,
+    mix: dict[str, int],
+    sides: list[dict[str, Any]],
+    deadline: float,
+    think_ms: float,
+    stats: dict[str, RouteStats],
+    seed: int,
+) -> None:
+    rng = random.Random(seed)
+    headers = {"Authorization": f"Bearer {user_id}"}
+    etags: dict[str, str] = {}
+    names, weights = list(mix), list(mix.values())
+
+    async def _call(route: str, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        started = time.perf_counter()
+        response = await client.request(method, url, headers={**headers, **kwargs.pop("headers", {})}, **kwargs)
+        stats.setdefault(route, RouteStats()).record((time.perf_counter() - started) * 1000, response.status_code)
+        return response
+
+    async def _poll(route: str, url: str) -> None:
+        response = await _call(route, "GET", url, headers={"If-None-Match": etags[route]} if route in etags else {})
+        if response.headers.get("etag"):
+            etags[route] = response.headers["etag"]
+
+    while time.perf_counter() < deadline:
+        scenario = rng.choices(names, weights)[0]
+        if scenario == "board":
+            await _poll("GET /api/board/latest", "/api/board/latest")
+            await _poll("GET /api/board/latest/surface", "/api/board/latest/surface?surface=straight_bets")
+        elif scenario == "bet" and sides:
+            await _call("POST /bets", "POST", "/bets", json=_bet_body(rng.choice(sides), rng))
+        elif scenario == "dashboard":
+            await _call("GET /summary", "GET", "/summary")
+            await _call("GET /balances", "GET", "/balances")
+            await _call("GET /bets", "GET", "/bets?limit=100")
+        if think_ms:
+            await asyncio.sleep(rng.uniform(0.5, 1.5) * think_ms / 1000)
+
+
+async def run_load(
+    *,
+    users: int,
+    duration: float,
+    mix: dict[str, int],
+    think_ms: float,
+    workload: Workload,
+) -> tuple[dict[str, RouteStats], dict[str, dict[str, float]], float]:
+    """Publish a board, drive `users` concurrent sessions for `duration` seconds; return route stats, DB stats, elapsed."""
+    import database
+    from main import app
+
+    sides = await publish_synthetic_board(workload)
+    stats: dict[str, RouteStats] = {}
+    transport = httpx.ASGITransport(app=app)
+    started = time.perf_counter()
+    async with httpx.AsyncClient(transport=transport, base_url="http://load.test", timeout=None) as client:
+        await asyncio.gather(*(
+            _virtual_user(
+                client,
+                f"load-user-{index:04d}",
+                mix=mix,
+                sides=sides,
+                deadline=started + duration,
+                think_ms=think_ms,
+                stats=stats,
+                seed=index,
+            )
+            for index in range(users)
+        ))
+    elapsed = time.perf_counter() - started
+    return stats, database.get_db().stats(), elapsed
+
+
+def _format_report(stats: dict[str, RouteStats], db_stats: dict[str, dict[str, float]], elapsed: float) -> str:
+    lines = [
+        f"{'route':<32} {'reqs':>7} {'rps':>8} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'304':>6} {'errors':>7}",
+    ]
+    for route, entry in sorted(stats.items()):
+        samples = entry.samples_ms
+        lines.append(
+            f"{route:<32} {len(samples):>7} {len(samples) / elapsed:>8.1f} "
+            f"{statistics.median(samples) if samples else 0:>9.1f} {_percentile(samples, 95):>9.1f} "
+            f"{max(samples, default=0):>9.1f} {entry.not_modified:>6} {entry.errors:>7}"
+        )
+    lines.append("")
+    lines.append(f"{'supabase query':<40} {'calls':>7} {'rows':>8} {'avg ms':>8} {'total s':>9}")
+    for key, entry in sorted(db_stats.items(), key=lambda item: -item[1]["total_ms"]):
+        calls = int(entry["calls"])
+        lines.append(
+            f"{key:<40} {calls:>7} {int(entry['rows']):>8} {entry['total_ms'] / max(1, calls):>8.1f} {entry['total_ms'] / 1000:>9.2f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=25, help="concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds to run after the board is published")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"scenario weights (default {DEFAULT_MIX})")
+    parser.add_argument("--think-ms", type=float, default=250.0, help="mean pause between a user's actions")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="injected latency per Supabase query")
+    parser.add_argument("--jitter-ms", type=float, default=5.0, help="+/- jitter on the injected latency")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply the synthetic board size")
+    args = parser.parse_args(argv)
+
+    configure_load_environment(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms)
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as exc:
+        parser.error(str(exc))
+    stats, db_stats, elapsed = asyncio.run(
+        run_load(
+            users=max(1, args.users),
+            duration=max(0.1, args.duration),
+            mix=mix,
+            think_ms=max(0.0, args.think_ms),
+            workload=Workload.scaled(args.scale),
+        )
+    )
+    print(_format_report(stats, db_stats, elapsed))
+    return 1 if any(entry.errors for entry in stats.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
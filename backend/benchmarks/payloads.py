@@ -0,0 +1,205 @@
+"""
+Synthetic Odds API payloads for the scan benchmarks.
+
+Slates are deterministic for a given seed and scale along events x books x
+markets x players. Shapes follow `/sports/{sport}/odds` and
+`/sports/{sport}/events/{id}/odds`, including deeplinks, so scanners take
+the same branches as on live data.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from services.odds_api import SHARP_BOOK, TARGET_BOOKS
+from services.player_props import PLAYER_PROP_BOOKS
+from services.team_aliases import TEAM_ALIASES_BY_SPORT
+
+_FIRST_NAMES = ("Jalen", "Luka", "Tyrese", "Anthony", "Devin", "Jaylen", "Shai", "Donovan", "Zion", "Paolo", "Scottie", "Cade")
+_LAST_NAMES = ("Brown", "Williams", "Johnson", "Davis", "Edwards", "Mitchell", "Green", "Harris", "Murray", "Barnes", "Allen", "Young")
+_PROP_LINES = {
+    "player_points": (12.5, 31.5),
+    "player_rebounds": (3.5, 12.5),
+    "player_assists": (2.5, 10.5),
+    "player_threes": (0.5, 4.5),
+    "player_points_rebounds_assists": (18.5, 44.5),
+}
+
+
+def _american_pair(rng: random.Random, hold: float = 0.045) -> tuple[int, int]:
+    """Two-way American prices around a random fair probability with `hold` of vig."""
+    fair = rng.uniform(0.25, 0.75)
+    prices = []
+    for prob in (fair, 1.0 - fair):
+        implied = min(0.97, prob * (1.0 + hold))
+        if implied >= 0.5:
+            prices.append(-round(100 * implied / (1.0 - implied)))
+        else:
+            prices.append(round(100 * (1.0 - implied) / implied))
+    return prices[0], prices[1]
+
+
+def _jitter(rng: random.Random, price: int) -> int:
+    moved = price + rng.randint(-12, 12)
+    if -100 < moved < 100:
+        return 100 if price > 0 else -105
+    return moved
+
+
+def _book_keys(books: int) -> list[str]:
+    return [SHARP_BOOK, *list(TARGET_BOOKS)[: max(0, books - 1)]]
+
+
+def _prop_book_keys(books: int) -> list[str]:
+    # Pinnacle is not a prop reference; the consensus comes from the prop books themselves.
+    return list(PLAYER_PROP_BOOKS)[: max(1, books)]
+
+
+def _team_pairs(sport: str, events: int) -> list[tuple[str, str]]:
+    teams = [entry.full_name for entry in TEAM_ALIASES_BY_SPORT.get(sport, TEAM_ALIASES_BY_SPORT["basketball_nba"])]
+    pairs = []
+    for index in range(events):
+        home = teams[(2 * index) % len(teams)]
+        away = teams[(2 * index + 1) % len(teams)]
+        pairs.append((home, away))
+    return pairs
+
+
+def _event_stub(sport: str, index: int, home: str, away: str, now: datetime) -> dict[str, Any]:
+    return {
+        "id": f"bench{index:05d}",
+        "sport_key": sport,
+        "commence_time": (now + timedelta(hours=2 + index % 10)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "home_team": home,
+        "away_team": away,
+    }
+
+
+def synthetic_odds_slate(
+    *,
+    sport: str = "basketball_nba",
+    events: int = 12,
+    books: int = 6,
+    seed: int = 7,
+) -> list[dict[str, Any]]:
+    """`/odds?markets=h2h,spreads,totals` response: Pinnacle plus `books - 1` target books per event."""
+    rng = random.Random(seed)
+    now = datetime.now(UTC)
+    slate = []
+    for index, (home, away) in enumerate(_team_pairs(sport, events)):
+        event = _event_stub(sport, index, home, away, now)
+        h2h = _american_pair(rng)
+        spread = rng.choice((-7.5, -5.5, -3.5, -1.5, 2.5, 4.5))
+        total = rng.choice((214.5, 221.5, 228.5, 233.5))
+        spread_prices = _american_pair(rng, hold=0.04)
+        total_prices = _american_pair(rng, hold=0.04)
+        bookmakers = []
+        for book in _book_keys(books):
+            link = f"https://sportsbook.example/{book}/event/{event['id']}"
+            bookmakers.append({
+                "key": book,
+                "title": book.title(),
+                "last_update": event["commence_time"],
+                "link": link,
+                "markets": [
+                    {
+                        "key": "h2h",
+                        "link": link,
+                        "outcomes": [
+                            {"name": home, "price": _jitter(rng, h2h[0]), "link": f"{link}/h2h/home"},
+                            {"name": away, "price": _jitter(rng, h2h[1]), "link": f"{link}/h2h/away"},
+                        ],
+                    },
+                    {
+                        "key": "spreads",
+                        "link": link,
+                        "outcomes": [
+                            {"name": home, "price": _jitter(rng, spread_prices[0]), "point": spread},
+                            {"name": away, "price": _jitter(rng, spread_prices[1]), "point": -spread},
+                        ],
+                    },
+                    {
+                        "key": "totals",
+                        "link": link,
+                        "outcomes": [
+                            {"name": "Over", "price": _jitter(rng, total_prices[0]), "point": total},
+                            {"name": "Under", "price": _jitter(rng, total_prices[1]), "point": total},
+                        ],
+                    },
+                ],
+            })
+        slate.append({**event, "bookmakers": bookmakers})
+    return slate
+
+
+def synthetic_prop_events(
+    *,
+    sport: str = "basketball_nba",
+    events: int = 8,
+    books: int = 6,
+    markets: list[str] | None = None,
+    players_per_team: int = 8,
+    seed: int = 11,
+) -> dict[str, dict[str, Any]]:
+    """Event id -> `/events/{id}/odds` response with Over/Under lines per player, market and book."""
+    rng = random.Random(seed)
+    now = datetime.now(UTC)
+    market_keys = markets or list(_PROP_LINES)
+    payloads: dict[str, dict[str, Any]] = {}
+    for index, (home, away) in enumerate(_team_pairs(sport, events)):
+        event = _event_stub(sport, index, home, away, now)
+        players = [
+            f"{_FIRST_NAMES[(index + slot) % len(_FIRST_NAMES)]} {_LAST_NAMES[(index * 3 + slot) % len(_LAST_NAMES)]}"
+            for slot in range(2 * players_per_team)
+        ]
+        lines = {
+            (player, market): int(rng.uniform(*_PROP_LINES.get(market, (0.5, 9.5)))) + 0.5
+            for player in players
+            for market in market_keys
+        }
+        prices = {key: _american_pair(rng, hold=0.06) for key in lines}
+        bookmakers = []
+        for book in _prop_book_keys(books):
+            link = f"https://sportsbook.example/{book}/event/{event['id']}"
+            book_markets = []
+            for market in market_keys:
+                outcomes = []
+                for player in players:
+                    line = lines[(player, market)]
+                    over, under = prices[(player, market)]
+                    outcomes.append({"name": "Over", "description": player, "point": line, "price": _jitter(rng, over), "link": f"{link}/{market}"})
+                    outcomes.append({"name": "Under", "description": player, "point": line, "price": _jitter(rng, under), "link": f"{link}/{market}"})
+                book_markets.append({"key": market, "link": link, "outcomes": outcomes})
+            bookmakers.append({"key": book, "title": book.title(), "last_update": event["commence_time"], "link": link, "markets": book_markets})
+        payloads[event["id"]] = {**event, "bookmakers": bookmakers}
+    return payloads
+
+
+def synthetic_pending_bets(sides: list[dict[str, Any]], *, count: int, seed: int = 13) -> list[dict[str, Any]]:
+    """Pending `bets` rows logged against a sample of `sides`, for duplicate-state annotation."""
+    rng = random.Random(seed)
+    sample = rng.sample(sides, min(count, len(sides))) if sides else []
+    rows = []
+    for index, side in enumerate(sample):
+        surface = str(side.get("surface") or "straight_bets")
+        rows.append({
+            "id": f"bet-{index:05d}",
+            "user_id": "bench-user",
+            "result": "pending",
+            "odds_american": side.get("book_odds"),
+            "sport": side.get("sport"),
+            "market": "ML" if surface == "straight_bets" else "Prop",
+            "surface": surface,
+            "sportsbook": side.get("sportsbook"),
+            "commence_time": side.get("commence_time"),
+            "clv_team": side.get("team"),
+            "event": side.get("event"),
+            "clv_sport_key": side.get("sport"),
+            "clv_event_id": side.get("event_id"),
+            "source_event_id": side.get("event_id"),
+            "source_market_key": side.get("market_key"),
+            "source_selection_key": side.get("selection_key"),
+        })
+    return rows
@@ -0,0 +1,389 @@
+"""
+Offline benchmarks for the scan pipeline.
+
+From `backend/`:
+
+    python -m benchmarks.scan_pipeline                    # run and compare with benchmarks/baseline.json
+    python -m benchmarks.scan_pipeline --scale 4          # 4x events and players per event
+    python -m benchmarks.scan_pipeline --replay slate.json
+    python -m benchmarks.scan_pipeline --update-baseline
+
+Odds API calls are answered by a stubbed `services.http_client` from synthetic
+(or `--replay`ed) payloads and Supabase is a `FakeSupabase`, so nothing leaves
+the machine and no credits are spent. Each stage runs in its own subprocess so
+`peak_rss_mb` is that stage's high-water mark, comparable to the 512MB boxes.
+A run fails (exit 1) when a stage's p50 latency or peak RSS regresses past
+`--tolerance` against the baseline recorded with the same workload.
+
+A replay file is JSON: {"sport": ..., "odds": [<odds response>],
+"event_odds": {<event id>: <event odds response>}}.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+STAGES = (
+    "scan_all_sides",
+    "scan_player_props_for_event_ids",
+    "merge_player_prop_scan_results",
+    "persist_player_prop_board_artifacts",
+    "annotate_sides_with_duplicate_state",
+)
+BENCH_USER_ID = "bench-user"
+PROP_MARKETS = ["player_points", "player_rebounds", "player_assists", "player_threes"]
+
+
+@dataclass(frozen=True)
+class Workload:
+    sport: str = "basketball_nba"
+    straight_events: int = 12
+    prop_events: int = 8
+    books: int = 6
+    players_per_team: int = 8
+    pending_bets: int = 40
+    replay: str | None = None
+
+    @classmethod
+    def scaled(cls, scale: float, replay: str | None = None) -> "Workload":
+        base = cls()
+        return cls(
+            straight_events=max(1, round(base.straight_events * scale)),
+            prop_events=max(1, round(base.prop_events * scale)),
+            players_per_team=max(1, round(base.players_per_team * scale)),
+            pending_bets=max(1, round(base.pending_bets * scale)),
+            replay=replay,
+        )
+
+
+@dataclass
+class StageResult:
+    stage: str
+    iterations: int
+    ops_per_sec: float
+    p50_ms: float
+    p95_ms: float
+    peak_rss_mb: float | None
+    items: int
+
+
+class _Payloads:
+    def __init__(self, workload: Workload) -> None:
+        if workload.replay:
+            recorded = json.loads(Path(workload.replay).read_text(encoding="utf-8"))
+            self.sport = str(recorded.get("sport") or workload.sport)
+            self.odds = list(recorded.get("odds") or [])
+            self.event_odds = dict(recorded.get("event_odds") or {})
+        else:
+            from benchmarks.payloads import synthetic_odds_slate, synthetic_prop_events
+
+            self.sport = workload.sport
+            self.odds = synthetic_odds_slate(sport=workload.sport, events=workload.straight_events, books=workload.books)
+            self.event_odds = synthetic_prop_events(
+                sport=workload.sport,
+                events=workload.prop_events,
+                books=workload.books,
+                markets=PROP_MARKETS,
+                players_per_team=workload.players_per_team,
+            )
+
+
+def _install_stubs(payloads: _Payloads, db: Any = None) -> None:
+    """Answer Odds API GETs from `payloads` (any other URL is a harness bug) and point `get_db` at `db` or an empty fake."""
+    import database
+    import services.http_client as http_client
+    import services.odds_api as odds_api
+    import services.player_props as player_props
+
+    from fake_supabase import FakeSupabase
+
+    database._supabase = db if db is not None else FakeSupabase()
+    odds_api.ODDS_API_KEY = player_props.ODDS_API_KEY = os.environ["ODDS_API_KEY"]
+
+    async def _request_with_retries(method: str, url: str, *, params: dict | None = None, **_kwargs: Any) -> httpx.Response:
+        request = httpx.Request(method, url, params={k: v for k, v in (params or {}).items() if k != "apiKey"})
+        path = request.url.path
+        if "/events/" in path and path.endswith("/odds"):
+            event_id = path.split("/events/", 1)[1].split("/", 1)[0]
+            wanted = set(str((params or {}).get("markets") or "").split(","))
+            event = payloads.event_odds.get(event_id)
+            if event is None:
+                return httpx.Response(404, request=request, json={"message": "event not found"})
+            body = {
+                **event,
+                "bookmakers": [
+                    {**book, "markets": [market for market in book.get("markets") or [] if market.get("key") in wanted]}
+                    for book in event.get("bookmakers") or []
+                ],
+            }
+        elif path.endswith("/odds"):
+            body = payloads.odds
+        else:
+            raise RuntimeError(f"benchmark http stub has no payload for {path}")
+        headers = {"x-requests-remaining": "1000000", "x-requests-used": "0", "x-requests-last": "0"}
+        return httpx.Response(200, request=request, json=body, headers=headers)
+
+    http_client.request_with_retries = _request_with_retries
+
+
+def configure_benchmark_environment() -> None:
+    """No Redis or real keys from a local .env; no event odds batching or caching across iterations.
+
+    Runs before any service module is imported, since several read their env at import time.
+    """
+    os.environ["REDIS_URL"] = ""
+    os.environ.setdefault("ODDS_API_KEY", "benchmark")
+    os.environ["EVENT_ODDS_BATCH_WINDOW_MS"] = "0"
+    os.environ["EVENT_ODDS_SLICE_TTL_SECONDS"] = "0"
+
+
+def _noop_log_event(*_args: Any, **_kwargs: Any) -> None:
+    return None
+
+
+def _retry_direct(operation: Callable[[], Any], *_args: Any, **_kwargs: Any) -> Any:
+    return operation()
+
+
+async def _prepare(stage: str, payloads: _Payloads, workload: Workload) -> tuple[Callable[[], Awaitable[int]], Callable[[], None]]:
+    """(run one iteration -> items processed, reset between iterations) for `stage`."""
+    from fake_supabase import FakeSupabase
+    from services.odds_api import scan_all_sides
+    from services.player_prop_board import persist_player_prop_board_artifacts
+    from services.player_props import merge_player_prop_scan_results, scan_player_props_for_event_ids
+    from services.scanner_duplicate_detection import annotate_sides_with_duplicate_state
+    import services.shared_state as shared_state
+
+    event_ids = list(payloads.event_odds)
+
+    def _reset() -> None:
+        # Scan caches and credit-budget state would otherwise turn later iterations into lookups.
+        shared_state._MEMORY_TTL_STORE.clear()
+
+    async def _scan_props(ids: list[str]) -> dict:
+        return await scan_player_props_for_event_ids(
+            sport=payloads.sport,
+            event_ids=ids,
+            markets=PROP_MARKETS,
+            source="benchmark",
+        )
+
+    if stage == "scan_all_sides":
+        async def _run() -> int:
+            result = await scan_all_sides(payloads.sport, source="benchmark")
+            return len(result.get("sides") or [])
+        return _run, _reset
+
+    if stage == "scan_player_props_for_event_ids":
+        async def _run() -> int:
+            return len((await _scan_props(event_ids)).get("sides") or [])
+        return _run, _reset
+
+    half = max(1, len(event_ids) // 2)
+    first, second = await _scan_props(event_ids[:half]), await _scan_props(event_ids[half:])
+    _reset()
+
+    if stage == "merge_player_prop_scan_results":
+        async def _run() -> int:
+            merged = merge_player_prop_scan_results((payloads.sport, first), (payloads.sport, second))
+            return len(merged.get("sides") or [])
+        return _run, _reset
+
+    merged = merge_player_prop_scan_results((payloads.sport, first), (payloads.sport, second))
+    merged["scanned_at"] = "2026-01-01T00:00:00Z"
+
+    if stage == "persist_player_prop_board_artifacts":
+        db = FakeSupabase()
+
+        async def _run() -> int:
+            counts = persist_player_prop_board_artifacts(
+                db=db,
+                payload=merged,
+                retry_supabase=_retry_direct,
+                log_event=_noop_log_event,
+            )
+            return int(counts.get("browse_total") or 0)
+        return _run, _reset
+
+    if stage == "annotate_sides_with_duplicate_state":
+        from benchmarks.payloads import synthetic_pending_bets
+
+        straight = (await scan_all_sides(payloads.sport, source="benchmark")).get("sides") or []
+        sides = [*straight, *(merged.get("sides") or [])]
+        db = FakeSupabase({"bets": synthetic_pending_bets(sides, count=workload.pending_bets)})
+        _reset()
+
+        async def _run() -> int:
+            annotated = annotate_sides_with_duplicate_state(db, BENCH_USER_ID, copy.copy(sides))
+            return len(annotated)
+        return _run, _reset
+
+    raise ValueError(f"Unknown stage '{stage}'. Choose from: {', '.join(STAGES)}")
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:
+        # Windows has no getrusage; report the stage without a memory figure.
+        return None
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+
+async def run_stage(stage: str, workload: Workload, *, iterations: int, warmup: int = 1) -> StageResult:
+    payloads = _Payloads(workload)
+    _install_stubs(payloads)
+    run, reset = await _prepare(stage, payloads, workload)
+    items = 0
+    for _ in range(max(0, warmup)):
+        reset()
+        items = await run()
+    samples: list[float] = []
+    for _ in range(max(1, iterations)):
+        reset()
+        started = time.perf_counter()
+        items = await run()
+        samples.append((time.perf_counter() - started) * 1000)
+    total_seconds = sum(samples) / 1000
+    return StageResult(
+        stage=stage,
+        iterations=len(samples),
+        ops_per_sec=round(len(samples) / total_seconds, 3) if total_seconds > 0 else 0.0,
+        p50_ms=round(statistics.median(samples), 3),
+        p95_ms=round(_percentile(samples, 95), 3),
+        peak_rss_mb=_peak_rss_mb(),
+        items=items,
+    )
+
+
+def _run_stage_isolated(stage: str, workload: Workload, iterations: int) -> StageResult:
+    command = [
+        sys.executable,
+        "-m",
+        "benchmarks.scan_pipeline",
+        "--stage",
+        stage,
+        "--iterations",
+        str(iterations),
+        "--workload-json",
+        json.dumps(asdict(workload)),
+        "--emit-json",
+    ]
+    completed = subprocess.run(command, capture_output=True, text=True, cwd=Path(__file__).resolve().parents[1], check=False)
+    if completed.returncode != 0:
+        raise RuntimeError(f"stage {stage} failed:\n{completed.stderr[-4000:]}")
+    return StageResult(**json.loads(completed.stdout.strip().splitlines()[-1]))
+
+
+def compare_to_baseline(
+    results: list[StageResult],
+    baseline: dict[str, Any] | None,
+    workload: Workload,
+    *,
+    tolerance: float,
+) -> list[str]:
+    """Regression messages for stages slower or larger than the baseline by more than `tolerance`."""
+    if not isinstance(baseline, dict) or baseline.get("workload") != asdict(workload):
+        return []
+    regressions = []
+    stages = baseline.get("stages") or {}
+    for result in results:
+        recorded = stages.get(result.stage)
+        if not isinstance(recorded, dict):
+            continue
+        for metric in ("p50_ms", "peak_rss_mb"):
+            before = float(recorded.get(metric) or 0)
+            after = float(getattr(result, metric) or 0)
+            if before > 0 and after > before * (1 + tolerance):
+                regressions.append(f"{result.stage}: {metric} {before:g} -> {after:g} (+{(after / before - 1) * 100:.0f}%)")
+    return regressions
+
+
+def _format_table(results: list[StageResult], baseline: dict[str, Any] | None) -> str:
+    recorded = (baseline or {}).get("stages") or {}
+    lines = [f"{'stage':<38} {'items':>7} {'ops/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'rss MB':>7} {'p50 vs base':>12}"]
+    for result in results:
+        before = (recorded.get(result.stage) or {}).get("p50_ms")
+        delta = f"{(result.p50_ms / before - 1) * 100:+.0f}%" if before else "-"
+        rss = f"{result.peak_rss_mb:.1f}" if result.peak_rss_mb is not None else "-"
+        lines.append(
+            f"{result.stage:<38} {result.items:>7} {result.ops_per_sec:>9.2f} {result.p50_ms:>9.2f} "
+            f"{result.p95_ms:>9.2f} {rss:>7} {delta:>12}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stage", action="append", choices=STAGES, help="run only these stages (repeatable)")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply events, players and pending bets")
+    parser.add_argument("--replay", help="recorded Odds API payloads to use instead of synthetic slates")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p50 / peak RSS growth before failing")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH))
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--no-isolate", action="store_true", help="run stages in this process (RSS is then cumulative)")
+    parser.add_argument("--workload-json", help=argparse.SUPPRESS)
+    parser.add_argument("--emit-json", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    configure_benchmark_environment()
+
+    workload = Workload(**json.loads(args.workload_json)) if args.workload_json else Workload.scaled(args.scale, args.replay)
+    stages = args.stage or list(STAGES)
+
+    if args.emit_json:
+        result = asyncio.run(run_stage(stages[0], workload, iterations=args.iterations))
+        print(json.dumps(asdict(result)))
+        return 0
+
+    if args.no_isolate:
+        results = [asyncio.run(run_stage(stage, workload, iterations=args.iterations)) for stage in stages]
+    else:
+        results = [_run_stage_isolated(stage, workload, args.iterations) for stage in stages]
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8")) if baseline_path.exists() else None
+    print(_format_table(results, baseline if isinstance(baseline, dict) and baseline.get("workload") == asdict(workload) else None))
+
+    if args.update_baseline:
+        recorded = {
+            "workload": asdict(workload),
+            "python": sys.version.split()[0],
+            "stages": {result.stage: asdict(result) for result in results},
+        }
+        baseline_path.write_text(json.dumps(recorded, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline written to {baseline_path}")
+        return 0
+
+    regressions = compare_to_baseline(results, baseline, workload, tolerance=args.tolerance)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
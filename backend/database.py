@@ -12,6 +12,13 @@ load_dotenv()
 
 _supabase: Client | None = None
 PRODUCTION_SUPABASE_PROJECT_REFS = {"xzeakifampttrqqhhibu"}
+FAKE_SUPABASE_ENV = "USE_FAKE_SUPABASE"
+FAKE_SUPABASE_ALLOWED_ENVIRONMENTS = {"development", "test"}
+
+
+def fake_supabase_enabled() -> bool:
+    """True when `get_db()` should hand out the in-memory `FakeSupabase` (local load tests)."""
+    return os.getenv(FAKE_SUPABASE_ENV) == "1"
 
 
 def _supabase_project_ref(raw_url: str | None) -> str | None:
@@ -36,6 +43,17 @@ def _guard_test_database(url: str | None) -> None:
 def get_db() -> Client:
     """Get Supabase client instance (service role, bypasses RLS). Lazily initializes the client."""
     global _supabase
+    if _supabase is None and fake_supabase_enabled():
+        environment = (os.getenv("ENVIRONMENT") or "").strip().lower()
+        if environment not in FAKE_SUPABASE_ALLOWED_ENVIRONMENTS:
+            # Fail closed: an unset or misspelled ENVIRONMENT must never serve fake data.
+            raise RuntimeError(
+                f"Refusing {FAKE_SUPABASE_ENV}=1 unless ENVIRONMENT is development or test "
+                f"(got {environment or 'unset'!r})."
+            )
+        from fake_supabase import fake_supabase_from_env
+
+        _supabase = fake_supabase_from_env()
     if _supabase is None:
         # When TESTING=1, optional test project env vars allow a separate Supabase for integration tests
         if os.getenv("TESTING") == "1":
@@ -0,0 +1,495 @@
+"""
+In-memory stand-in for the supabase-py client.
+
+Implements the query-builder subset the services use
+(`table().select().eq().in_().order().range().execute()`, `not_`, `or_`,
+`insert`, `upsert`, `update`, `delete`) over plain lists of dicts, so scan and
+board code can be exercised without a database. Filters compare values as
+stored; there is no type coercion, RLS, or join syntax in `select`. `rpc()`
+answers PGRST202 so callers take their per-row fallback, and `auth.get_user`
+accepts any bearer token as the user id.
+
+`get_db()` returns one of these when `USE_FAKE_SUPABASE=1`; see
+`fake_supabase_from_env` for latency injection and seeding.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable
+
+
+# Column defaults from the migrations for tables the API inserts into and later reads with `row[...]`;
+# PostgREST returns every column, so rows missing these would raise where the real database would not.
+COLUMN_DEFAULTS: dict[str, dict[str, Any]] = {
+    "bets": {
+        "event_date": lambda: datetime.now(UTC).date().isoformat(),
+        "settled_at": None,
+        "promo_type": "standard",
+        "boost_percent": None,
+        "winnings_cap": None,
+        "payout_override": None,
+        "result": "pending",
+        "notes": None,
+        "surface": "straight_bets",
+        "pinnacle_odds_at_close": None,
+        "is_paper": False,
+        "auto_logged": False,
+        "ev_lock_version": 1,
+    },
+    "transactions": {"notes": None},
+}
+
+
+@dataclass
+class FakeResponse:
+    data: Any
+    count: int | None = None
+
+
+def _sort_key(value: Any) -> tuple[int, Any]:
+    # NULLs sort last ascending and first descending, as in Postgres; keep mixed types from raising.
+    if value is None:
+        return (1, "")
+    return (0, value if isinstance(value, (int, float)) else str(value))
+
+
+def _like_matches(value: Any, pattern: str, *, case_insensitive: bool) -> bool:
+    if value is None:
+        return False
+    # PostgREST accepts `*` for `%` so patterns survive URL encoding.
+    pattern = pattern.replace("*", "%")
+    text = str(value)
+    if case_insensitive:
+        text, pattern = text.lower(), pattern.lower()
+    parts = pattern.split("%")
+    if len(parts) == 1:
+        return text == pattern
+    if not text.startswith(parts[0]) or not text.endswith(parts[-1]):
+        return False
+    position = len(parts[0])
+    for part in parts[1:-1]:
+        found = text.find(part, position)
+        if found < 0:
+            return False
+        position = found + len(part)
+    return position <= len(text) - len(parts[-1])
+
+
+def _predicate(op: str, column: str, value: Any) -> Callable[[dict[str, Any]], bool]:
+    if op == "eq":
+        return lambda row: row.get(column) == value
+    if op == "neq":
+        return lambda row: row.get(column) != value
+    if op in {"gt", "gte", "lt", "lte"}:
+        compare = {
+            "gt": lambda left: left > value,
+            "gte": lambda left: left >= value,
+            "lt": lambda left: left < value,
+            "lte": lambda left: left <= value,
+        }[op]
+        return lambda row: row.get(column) is not None and compare(row.get(column))
+    if op == "in":
+        allowed = list(value)
+        return lambda row: row.get(column) in allowed
+    if op == "is":
+        expected = None if value in (None, "null") else value
+        return lambda row: row.get(column) is expected or row.get(column) == expected
+    if op in {"like", "ilike"}:
+        return lambda row: _like_matches(row.get(column), str(value), case_insensitive=op == "ilike")
+    raise ValueError(f"FakeSupabase does not support the '{op}' filter")
+
+
+def _coerce_token(token: str) -> Any:
+    lowered = token.lower()
+    if lowered in {"null", "true", "false"}:
+        return {"null": None, "true": True, "false": False}[lowered]
+    for cast in (int, float):
+        try:
+            return cast(token)
+        except ValueError:
+            continue
+    return token.strip('"')
+
+
+def _split_top_level(text: str) -> list[str]:
+    parts, depth, current = [], 0, []
+    for char in text:
+        if char == "," and depth == 0:
+            parts.append("".join(current))
+            current = []
+            continue
+        depth += {"(": 1, ")": -1}.get(char, 0)
+        current.append(char)
+    if current:
+        parts.append("".join(current))
+    return [part.strip() for part in parts if part.strip()]
+
+
+def _or_predicate(filters: str) -> Callable[[dict[str, Any]], bool]:
+    """Parse a PostgREST `or=(col.op.value,...)` list; only flat conditions are supported."""
+    predicates = []
+    for condition in _split_top_level(filters):
+        column, op, raw = condition.split(".", 2)
+        negate = op == "not"
+        if negate:
+            op, raw = raw.split(".", 1)
+        if op == "in":
+            value: Any = [_coerce_token(item) for item in _split_top_level(raw.strip("()"))]
+        elif op in {"like", "ilike"}:
+            value = raw
+        else:
+            value = _coerce_token(raw)
+        predicate = _predicate(op, column, value)
+        predicates.append((lambda p: lambda row: not p(row))(predicate) if negate else predicate)
+    return lambda row: any(predicate(row) for predicate in predicates)
+
+
+class FakeQuery:
+    def __init__(self, client: "FakeSupabase", table: str) -> None:
+        self._client = client
+        self._table = table
+        self._action = "select"
+        self._columns: list[str] | None = None
+        self._count: str | None = None
+        self._filters: list[Callable[[dict[str, Any]], bool]] = []
+        self._order: list[tuple[str, bool]] = []
+        self._limit: int | None = None
+        self._offset = 0
+        self._payload: Any = None
+        self._on_conflict: str | None = None
+        self._single = False
+        self._maybe_single = False
+        self._negate_next = False
+
+    # -- actions -------------------------------------------------------------
+
+    def select(self, columns: str = "*", *, count: str | None = None) -> "FakeQuery":
+        if self._action == "select":
+            cleaned = [column.strip() for column in str(columns or "*").split(",") if column.strip()]
+            self._columns = None if "*" in cleaned else cleaned
+        self._count = count
+        return self
+
+    def insert(self, rows: dict | list[dict], **_kwargs: Any) -> "FakeQuery":
+        self._action, self._payload = "insert", rows
+        return self
+
+    def upsert(self, rows: dict | list[dict], *, on_conflict: str | None = None, **_kwargs: Any) -> "FakeQuery":
+        self._action, self._payload, self._on_conflict = "upsert", rows, on_conflict
+        return self
+
+    def update(self, values: dict, **_kwargs: Any) -> "FakeQuery":
+        self._action, self._payload = "update", values
+        return self
+
+    def delete(self, **_kwargs: Any) -> "FakeQuery":
+        self._action = "delete"
+        return self
+
+    # -- filters -------------------------------------------------------------
+
+    def _where(self, predicate: Callable[[dict[str, Any]], bool]) -> "FakeQuery":
+        if self._negate_next:
+            self._negate_next = False
+            self._filters.append(lambda row: not predicate(row))
+        else:
+            self._filters.append(predicate)
+        return self
+
+    @property
+    def not_(self) -> "FakeQuery":
+        self._negate_next = True
+        return self
+
+    def eq(self, column: str, value: Any) -> "FakeQuery":
+        return self._where(_predicate("eq", column, value))
+
+    def neq(self, column: str, value: Any) -> "FakeQuery":
+        return self._where(_predicate("neq", column, value))
+
+    def gt(self, column: str, value: Any) -> "FakeQuery":
+        return self._where(_predicate("gt", column, value))
+
+    def gte(self, column: str, value: Any) -> "FakeQuery":
+        return self._where(_predicate("gte", column, value))
+
+    def lt(self, column: str, value: Any) -> "FakeQuery":
+        return self._where(_predicate("lt", column, value))
+
+    def lte(self, column: str, value: Any) -> "FakeQuery":
+        return self._where(_predicate("lte", column, value))
+
+    def in_(self, column: str, values: list[Any]) -> "FakeQuery":
+        return self._where(_predicate("in", column, values))
+
+    def is_(self, column: str, value: Any) -> "FakeQuery":
+        return self._where(_predicate("is", column, value))
+
+    def like(self, column: str, pattern: str) -> "FakeQuery":
+        return self._where(_predicate("like", column, pattern))
+
+    def ilike(self, column: str, pattern: str) -> "FakeQuery":
+        return self._where(_predicate("ilike", column, pattern))
+
+    def or_(self, filters: str, **_kwargs: Any) -> "FakeQuery":
+        return self._where(_or_predicate(filters))
+
+    def match(self, criteria: dict[str, Any]) -> "FakeQuery":
+        for column, value in criteria.items():
+            self.eq(column, value)
+        return self
+
+    # -- modifiers -----------------------------------------------------------
+
+    def order(self, column: str, *, desc: bool = False, **_kwargs: Any) -> "FakeQuery":
+        self._order.append((column, desc))
+        return self
+
+    def limit(self, size: int, **_kwargs: Any) -> "FakeQuery":
+        self._limit = max(0, int(size))
+        return self
+
+    def range(self, start: int, end: int, **_kwargs: Any) -> "FakeQuery":
+        self._offset = max(0, int(start))
+        self._limit = max(0, int(end) - int(start) + 1)
+        return self
+
+    def single(self) -> "FakeQuery":
+        self._single = True
+        return self
+
+    def maybe_single(self) -> "FakeQuery":
+        self._maybe_single = True
+        return self
+
+    # -- execution -----------------------------------------------------------
+
+    def _matches(self, row: dict[str, Any]) -> bool:
+        return all(predicate(row) for predicate in self._filters)
+
+    def _project(self, row: dict[str, Any]) -> dict[str, Any]:
+        if self._columns is None:
+            return copy.deepcopy(row)
+        return {column: copy.deepcopy(row.get(column)) for column in self._columns}
+
+    def execute(self) -> FakeResponse:
+        started = time.perf_counter()
+        rows = 0
+        try:
+            self._client._simulate_latency()
+            response = self._execute()
+            rows = len(response.data) if isinstance(response.data, list) else int(response.data is not None)
+            return response
+        finally:
+            self._client._record(f"{self._table}.{self._action}", rows, time.perf_counter() - started)
+
+    def _execute(self) -> FakeResponse:
+        with self._client._lock:
+            rows = self._client._tables.setdefault(self._table, [])
+            if self._action == "insert":
+                return FakeResponse(data=[self._client._insert(self._table, row) for row in _as_rows(self._payload)])
+            if self._action == "upsert":
+                return FakeResponse(
+                    data=[self._client._upsert(self._table, row, self._on_conflict) for row in _as_rows(self._payload)]
+                )
+            if self._action == "update":
+                self._client._drop_indexes(self._table)
+                updated = []
+                for row in rows:
+                    if self._matches(row):
+                        row.update(copy.deepcopy(self._payload))
+                        updated.append(copy.deepcopy(row))
+                return FakeResponse(data=updated)
+            if self._action == "delete":
+                self._client._drop_indexes(self._table)
+                removed = [row for row in rows if self._matches(row)]
+                rows[:] = [row for row in rows if not self._matches(row)]
+                return FakeResponse(data=removed)
+
+            selected = [row for row in rows if self._matches(row)]
+            for column, desc in reversed(self._order):
+                selected.sort(key=lambda row: _sort_key(row.get(column)), reverse=desc)
+            total = len(selected)
+            end = None if self._limit is None else self._offset + self._limit
+            data = [self._project(row) for row in selected[self._offset:end]]
+        count = total if self._count else None
+        if self._single or self._maybe_single:
+            if not data and self._maybe_single:
+                return FakeResponse(data=None, count=count)
+            if len(data) != 1:
+                raise ValueError(f"Expected a single row from {self._table}, got {len(data)}")
+            return FakeResponse(data=data[0], count=count)
+        return FakeResponse(data=data, count=count)
+
+
+def _as_rows(payload: Any) -> list[dict[str, Any]]:
+    if isinstance(payload, dict):
+        return [payload]
+    return [row for row in payload or [] if isinstance(row, dict)]
+
+
+class FakeRpc:
+    def __init__(self, client: "FakeSupabase", function_name: str) -> None:
+        self._client = client
+        self._function_name = function_name
+
+    def execute(self) -> FakeResponse:
+        started = time.perf_counter()
+        try:
+            self._client._simulate_latency()
+            raise FakeRpcMissing(self._function_name)
+        finally:
+            self._client._record(f"rpc.{self._function_name}", 0, time.perf_counter() - started)
+
+
+class FakeRpcMissing(Exception):
+    """What PostgREST answers for a function that is not in the schema cache."""
+
+    code = "PGRST202"
+
+    def __init__(self, function_name: str) -> None:
+        self.message = f"Could not find the function public.{function_name} in the schema cache"
+        super().__init__(self.message)
+
+
+class FakeAuth:
+    """`auth.get_user` that treats the bearer token itself as the user id."""
+
+    def get_user(self, token: str) -> SimpleNamespace:
+        user_id = str(token or "").strip()
+        if not user_id:
+            raise ValueError("Invalid or expired token")
+        return SimpleNamespace(user=SimpleNamespace(id=user_id, email=f"{user_id}@fake-supabase.local"))
+
+
+class FakeSupabase:
+    """Drop-in for `supabase.Client` over in-memory tables; safe to share across threads.
+
+    Every `execute()` sleeps `latency_ms` +/- `jitter_ms` outside the table lock,
+    like a network round trip, and is tallied per `table.action` in `stats()`.
+    """
+
+    def __init__(
+        self,
+        tables: dict[str, list[dict[str, Any]]] | None = None,
+        *,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        self.auth = FakeAuth()
+        self._latency_ms = max(0.0, float(latency_ms))
+        self._jitter_ms = max(0.0, float(jitter_ms))
+        self._random = random.Random(seed)
+        self._stats: dict[str, dict[str, float]] = {}
+        self._lock = threading.RLock()
+        self._tables: dict[str, list[dict[str, Any]]] = {
+            name: [dict(row) for row in rows] for name, rows in (tables or {}).items()
+        }
+        # (table, conflict columns) -> conflict values -> row; rebuilt lazily after updates and deletes.
+        self._indexes: dict[tuple[str, tuple[str, ...]], dict[tuple[Any, ...], dict[str, Any]]] = {}
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def rpc(self, function_name: str, _params: dict[str, Any] | None = None) -> FakeRpc:
+        return FakeRpc(self, function_name)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """`table.action` -> calls, rows returned and total milliseconds including injected latency."""
+        with self._lock:
+            return {key: dict(value) for key, value in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def _simulate_latency(self) -> None:
+        if not self._latency_ms and not self._jitter_ms:
+            return
+        delay_ms = self._latency_ms + self._random.uniform(-self._jitter_ms, self._jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+    def _record(self, key: str, rows: int, elapsed_seconds: float) -> None:
+        with self._lock:
+            entry = self._stats.setdefault(key, {"calls": 0, "rows": 0, "total_ms": 0.0})
+            entry["calls"] += 1
+            entry["rows"] += rows
+            entry["total_ms"] += elapsed_seconds * 1000
+
+    def rows(self, name: str) -> list[dict[str, Any]]:
+        with self._lock:
+            return copy.deepcopy(self._tables.get(name, []))
+
+    def _drop_indexes(self, table: str) -> None:
+        for key in [key for key in self._indexes if key[0] == table]:
+            self._indexes.pop(key, None)
+
+    def _index(self, table: str, columns: tuple[str, ...]) -> dict[tuple[Any, ...], dict[str, Any]]:
+        key = (table, columns)
+        index = self._indexes.get(key)
+        if index is None:
+            index = {}
+            for row in self._tables.get(table, []):
+                if all(column in row for column in columns):
+                    index.setdefault(tuple(row[column] for column in columns), row)
+            self._indexes[key] = index
+        return index
+
+    def _insert(self, table: str, row: dict[str, Any]) -> dict[str, Any]:
+        stored = copy.deepcopy(row)
+        stored.setdefault("id", str(uuid.uuid4()))
+        stored.setdefault("created_at", datetime.now(UTC).isoformat())
+        for column, default in COLUMN_DEFAULTS.get(table, {}).items():
+            if column not in stored:
+                stored[column] = default() if callable(default) else default
+        self._tables.setdefault(table, []).append(stored)
+        for (index_table, columns), index in self._indexes.items():
+            if index_table == table and all(column in stored for column in columns):
+                index.setdefault(tuple(stored[column] for column in columns), stored)
+        return copy.deepcopy(stored)
+
+    def _upsert(self, table: str, row: dict[str, Any], on_conflict: str | None) -> dict[str, Any]:
+        columns = tuple(column.strip() for column in (on_conflict or "id").split(",") if column.strip())
+        if all(column in row for column in columns):
+            existing = self._index(table, columns).get(tuple(row[column] for column in columns))
+            if existing is not None:
+                existing.update(copy.deepcopy(row))
+                return copy.deepcopy(existing)
+        return self._insert(table, row)
+
+
+def fake_supabase_from_env() -> FakeSupabase:
+    """Build the `USE_FAKE_SUPABASE=1` client.
+
+    `FAKE_SUPABASE_LATENCY_MS` / `FAKE_SUPABASE_JITTER_MS` inject per-query delay
+    and `FAKE_SUPABASE_SEED_PATH` names a JSON file of `{table: [rows]}` to start from.
+    """
+
+    def _float_env(name: str) -> float:
+        try:
+            return max(0.0, float(os.getenv(name) or 0))
+        except ValueError:
+            return 0.0
+
+    tables = None
+    seed_path = (os.getenv("FAKE_SUPABASE_SEED_PATH") or "").strip()
+    if seed_path:
+        tables = json.loads(Path(seed_path).read_text(encoding="utf-8"))
+    return FakeSupabase(
+        tables,
+        latency_ms=_float_env("FAKE_SUPABASE_LATENCY_MS"),
+        jitter_ms=_float_env("FAKE_SUPABASE_JITTER_MS"),
+    )
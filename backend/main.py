@@ -16,7 +16,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from services import ops_runtime
+from services.analytics_events import start_analytics_event_flusher, stop_analytics_event_flusher
 from services.app_bootstrap import validate_environment
+from services.request_metrics import RequestMetricsMiddleware
 from services.scheduler_runtime import start_scheduler, stop_scheduler
 
 load_dotenv()
@@ -30,11 +32,13 @@ async def lifespan(app: FastAPI):
     ops_runtime.configure_app(app)
     validate_environment()
     ops_runtime.init_ops_status()
+    await start_analytics_event_flusher(app)
     await start_scheduler(app)
     try:
         yield
     finally:
         await stop_scheduler(app)
+        await stop_analytics_event_flusher(app)
 
 
 app = FastAPI(
@@ -45,6 +49,7 @@ app = FastAPI(
 )
 ops_runtime.configure_app(app)
 
+app.add_middleware(RequestMetricsMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -8,7 +8,12 @@ from starlette.concurrency import run_in_threadpool
 
 from database import get_db
 from services.analytics_events import (
+    ENQUEUE_FULL,
+    ENQUEUE_QUEUED,
+    AnalyticsEventBuffer,
+    build_analytics_event_payload,
     capture_analytics_event,
+    get_analytics_event_buffer,
     is_supported_analytics_event,
     normalize_session_id,
 )
@@ -27,6 +32,13 @@ class AnalyticsEventIngestRequest(BaseModel):
     dedupe_key: str | None = Field(default=None, max_length=180)
 
 
+MAX_ANALYTICS_BATCH_EVENTS = 50
+
+
+class AnalyticsEventBatchIngestRequest(BaseModel):
+    events: list[AnalyticsEventIngestRequest] = Field(min_length=1, max_length=MAX_ANALYTICS_BATCH_EVENTS)
+
+
 def _extract_bearer_token(authorization: str | None) -> str | None:
     if not isinstance(authorization, str):
         return None
@@ -81,6 +93,23 @@ async def _optional_user_from_authorization(authorization: str | None) -> tuple[
     return str(user.id), _extract_user_email(user)
 
 
+def _get_db_or_none():
+    try:
+        return get_db()
+    except Exception:
+        # Analytics ingestion is best-effort; route should still return ok=False-style status
+        # via inserted flag rather than raising hard infra errors.
+        return None
+
+
+def _properties_with_identity(properties: dict[str, Any] | None, user_email: str | None) -> dict[str, Any]:
+    out = dict(properties or {})
+    if user_email:
+        # Always set from authenticated identity so clients cannot spoof this field.
+        out["user_email"] = user_email
+    return out
+
+
 @router.post("/analytics/events")
 async def ingest_analytics_event(
     payload: AnalyticsEventIngestRequest,
@@ -97,21 +126,33 @@ async def ingest_analytics_event(
     if not user_id and not session_id:
         raise HTTPException(status_code=422, detail="session_id is required for anonymous analytics events")
 
-    properties = dict(payload.properties or {})
-    if user_email:
-        # Always set from authenticated identity so clients cannot spoof this field.
-        properties["user_email"] = user_email
-
-    db = None
-    try:
-        db = get_db()
-    except Exception:
-        # Analytics ingestion is best-effort; route should still return ok=False-style status
-        # via inserted flag rather than raising hard infra errors.
-        pass
-
-    inserted = capture_analytics_event(
-        db=db,
+    properties = _properties_with_identity(payload.properties, user_email)
+
+    buffer = get_analytics_event_buffer()
+    if buffer.active:
+        status = buffer.enqueue(
+            build_analytics_event_payload(
+                event_name=event_name,
+                source="frontend",
+                user_id=user_id,
+                session_id=session_id,
+                route=payload.route,
+                app_area=payload.app_area,
+                properties=properties,
+                dedupe_key=payload.dedupe_key,
+            )
+        )
+        if status != ENQUEUE_FULL:
+            # The row is written by the next flush, so report it as queued rather than inserted.
+            return {
+                "ok": True,
+                "inserted": False,
+                "queued": status == ENQUEUE_QUEUED,
+            }
+
+    inserted = await run_in_threadpool(
+        capture_analytics_event,
+        db=_get_db_or_none(),
         retry_supabase=retry_supabase,
         log_event=log_event,
         event_name=event_name,
@@ -127,4 +168,74 @@ async def ingest_analytics_event(
     return {
         "ok": True,
         "inserted": inserted,
+        "queued": False,
+    }
+
+
+@router.post("/analytics/events/batch")
+async def ingest_analytics_event_batch(
+    payload: AnalyticsEventBatchIngestRequest,
+    x_session_id: str | None = Header(default=None, alias="X-Session-ID"),
+    authorization: str | None = Header(default=None, alias="Authorization"),
+):
+    user_id, user_email = await _optional_user_from_authorization(authorization)
+    header_session_id = normalize_session_id(x_session_id)
+
+    rows: list[dict[str, Any]] = []
+    rejected = 0
+    for event in payload.events:
+        event_name = event.event_name.strip()
+        session_id = normalize_session_id(event.session_id) or header_session_id
+        if not is_supported_analytics_event(event_name) or (not user_id and not session_id):
+            rejected += 1
+            continue
+        rows.append(
+            build_analytics_event_payload(
+                event_name=event_name,
+                source="frontend",
+                user_id=user_id,
+                session_id=session_id,
+                route=event.route,
+                app_area=event.app_area,
+                properties=_properties_with_identity(event.properties, user_email),
+                dedupe_key=event.dedupe_key,
+            )
+        )
+
+    shared_buffer = get_analytics_event_buffer()
+    request_buffer = AnalyticsEventBuffer(max_pending=MAX_ANALYTICS_BATCH_EVENTS)
+    queued = 0
+    inserted = 0
+    duplicates = 0
+    for row in rows:
+        status = shared_buffer.enqueue(row) if shared_buffer.active else ENQUEUE_FULL
+        if status == ENQUEUE_QUEUED:
+            queued += 1
+            continue
+        if status == ENQUEUE_FULL:
+            # Without the background flusher (tests, one-off scripts) or while it is backed up,
+            # the batch still goes out as a single multi-row insert from a request-scoped buffer.
+            status = request_buffer.enqueue(row)
+        if status != ENQUEUE_QUEUED:
+            duplicates += 1
+
+    if request_buffer.pending_count():
+        db = _get_db_or_none()
+        if db is not None:
+            # Nothing flushes this buffer again once the request ends.
+            inserted = await run_in_threadpool(
+                request_buffer.flush,
+                db=db,
+                retry_supabase=retry_supabase,
+                log_event=log_event,
+                requeue=False,
+            )
+
+    return {
+        "ok": True,
+        "accepted": queued + inserted,
+        "queued": queued,
+        "inserted": inserted,
+        "duplicates": duplicates,
+        "rejected": rejected,
     }
@@ -1,20 +1,22 @@
 """Board API routes.
 
 GET  /api/board/latest  — returns the canonical board snapshot (no outbound calls)
+GET  /api/board/events  — server-sent events for new snapshots and refresh progress
 POST /api/board/refresh — scoped manual refresh (rate-limited, does NOT overwrite board:latest)
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
 import time
 
 from datetime import UTC, datetime
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from auth import get_current_user
 from database import get_db
@@ -27,7 +29,13 @@ from models import (
     PlayerPropBoardPickEmPageResponse,
     ScopedRefreshResponse,
 )
-from services.board_snapshot import load_board_snapshot, persist_scoped_refresh
+from services.board_events import BOARD_EVENT_REFRESH, publish_board_event, stream_board_events
+from services.board_snapshot import (
+    board_latest_body_version,
+    board_latest_response_body,
+    load_board_snapshot,
+    persist_scoped_refresh,
+)
 from services.ops_runtime import persist_ops_job_run as _persist_ops_job_run
 from services.ops_runtime import set_ops_status as _set_ops_status
 from services.player_prop_board import (
@@ -46,7 +54,22 @@ from services.runtime_support import BOOT_ID as _BOOT_ID
 from services.runtime_support import log_event as _log_event
 from services.runtime_support import retry_supabase as _retry_supabase
 from services.scan_runtime import sync_pickem_research_from_props_payload as _sync_pickem_research_from_props_payload
-from services.scanner_duplicate_detection import annotate_sides_with_duplicate_state
+from services.board_response_bodies import BOARD_LATEST_BODY, STRAIGHT_BETS_SURFACE_BODY, get_board_body
+from services.scan_cache import full_scan_response_body, scan_payload_version
+from services.scanner_duplicate_detection import (
+    annotate_sides_with_duplicate_state,
+    duplicate_state_version,
+    load_pending_duplicate_rows,
+)
+from utils.http_cache import (
+    REVALIDATE_CACHE_CONTROL,
+    apply_cache_headers,
+    encoded_json_response,
+    etag_matches,
+    not_modified_response,
+    strong_etag,
+    weak_etag,
+)
 from utils.telemetry import rss_mb
 from utils.time_utils import utc_now_iso_z
 
@@ -263,6 +286,21 @@ def _meta_from_fallback_surfaces(
     )
 
 
+def _duplicate_overlay(db, user_id: str) -> tuple[list[dict] | None, str | None]:
+    """Pending rows for duplicate annotations plus their version, or (None, None) if they cannot be preloaded."""
+    try:
+        pending_rows = load_pending_duplicate_rows(db, user_id)
+    except Exception:
+        return None, None
+    return pending_rows, duplicate_state_version(pending_rows)
+
+
+def _annotate_with_overlay(db, user_id: str, sides: list[dict], pending_rows: list[dict] | None) -> list[dict]:
+    if pending_rows is None:
+        return annotate_sides_with_duplicate_state(db, user_id, sides)
+    return annotate_sides_with_duplicate_state(db, user_id, sides, pending_rows=pending_rows)
+
+
 def _parse_books_param(books: str | None) -> list[str]:
     if not books:
         return []
@@ -270,13 +308,19 @@ def _parse_books_param(books: str | None) -> list[str]:
 
 
 @router.get("/board/latest", response_model=BoardResponse)
-def get_board_latest(user: dict = Depends(get_current_user)):
+def get_board_latest(
+    user: dict = Depends(get_current_user),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    accept_encoding: str | None = Header(default=None, alias="Accept-Encoding"),
+):
     """Return the latest canonical board snapshot.
 
     Pure DB read — never triggers outbound API calls.
     Serves the canonical snapshot metadata plus optional game context, with
     nullable surface payloads. Returns an empty sentinel if the canonical
-    snapshot is missing or malformed.
+    snapshot is missing or malformed. Answers 304 when `If-None-Match`
+    carries the current snapshot's ETag. In full mode the body is served from
+    the bytes encoded when the snapshot was published.
     """
     request_id = f"board_latest_{uuid4().hex[:10]}"
     rss_before = rss_mb()
@@ -370,6 +414,16 @@ def get_board_latest(user: dict = Depends(get_current_user)):
             },
         )
 
+    raw_meta = raw.get("meta") if isinstance(raw, dict) else None
+    etag = (
+        weak_etag("board_latest", mode, raw_meta.get("snapshot_id"), raw_meta.get("scanned_at"))
+        if isinstance(raw_meta, dict) and raw_meta.get("snapshot_id")
+        else None
+    )
+    if etag_matches(if_none_match, etag):
+        _log_event("board.latest.not_modified", request_id=request_id, mode=mode)
+        return not_modified_response(etag)
+
     # Helper: build a response dict and return as JSONResponse to avoid
     # heavyweight Pydantic parsing/serialization on large cached payloads.
     def _safe_keys(value: object) -> list[str]:
@@ -458,6 +512,26 @@ def get_board_latest(user: dict = Depends(get_current_user)):
 
     try:
         raw_board = raw if isinstance(raw, dict) else None
+        if mode == "full" and etag is not None:
+            body = get_board_body(
+                BOARD_LATEST_BODY,
+                board_latest_body_version(raw_meta),
+                lambda: board_latest_response_body(raw_board),
+            )
+            _log_event(
+                "board.latest.completed",
+                request_id=request_id,
+                boot_id=_BOOT_ID,
+                pid=os.getpid(),
+                mode=mode,
+                rss_mb=rss_mb(),
+                body_bytes=body.size,
+            )
+            return encoded_json_response(
+                body,
+                accept_encoding,
+                headers={"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL},
+            )
         payload = _build_response_payload(raw_board=raw_board)
         # Use jsonable_encoder to tolerate datetimes/UUIDs that may exist in older/stale cache rows.
         encoded = jsonable_encoder(payload)
@@ -482,7 +556,9 @@ def get_board_latest(user: dict = Depends(get_current_user)):
             mode=mode,
             rss_mb=rss_mb(),
         )
-        return JSONResponse(status_code=200, content=encoded)
+        json_response = JSONResponse(status_code=200, content=encoded)
+        apply_cache_headers(json_response, etag)
+        return json_response
     except MemoryError as e:
         _log_event("board.latest.mode", level="error", request_id=request_id, mode=mode, status="oom_guard")
         return JSONResponse(
@@ -516,8 +592,15 @@ def get_board_latest(user: dict = Depends(get_current_user)):
 def get_board_latest_surface(
     surface: str = Query(..., description="Surface to load: straight_bets or player_props"),
     user: dict = Depends(get_current_user),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    accept_encoding: str | None = Header(default=None, alias="Accept-Encoding"),
+    response: Response = None,
 ):
-    """Load a per-surface latest payload from global_scan_cache (surface:latest)."""
+    """Load a per-surface latest payload from global_scan_cache (surface:latest).
+
+    straight_bets is the same for every user, so it is served from the bytes
+    encoded when the surface was published.
+    """
     from services.scan_cache import load_latest_scan_payload
 
     request_id = f"board_surface_{uuid4().hex[:10]}"
@@ -560,12 +643,23 @@ def get_board_latest_surface(
         )
         return None
 
+    user_id = str(user.get("id") or "")
+    pending_rows, overlay_version = _duplicate_overlay(db, user_id) if surface == "player_props" else (None, "")
+    etag = (
+        weak_etag("board_surface", scan_payload_version(payload), overlay_version)
+        if overlay_version is not None
+        else None
+    )
+    if etag_matches(if_none_match, etag):
+        _log_event("board.latest_surface.not_modified", request_id=request_id, surface=surface)
+        return not_modified_response(etag)
+
     if surface == "player_props":
         sides_raw = payload.get("sides")
         sides = sides_raw if isinstance(sides_raw, list) else []
         payload = {
             **payload,
-            "sides": annotate_sides_with_duplicate_state(db, str(user.get("id") or ""), sides),
+            "sides": _annotate_with_overlay(db, user_id, sides, pending_rows),
         }
 
     sides_raw = payload.get("sides")
@@ -578,9 +672,49 @@ def get_board_latest_surface(
         sides_count=sides_count,
         scanned_at=payload.get("scanned_at"),
     )
+    if surface == "straight_bets":
+        body = get_board_body(
+            STRAIGHT_BETS_SURFACE_BODY,
+            tuple(scan_payload_version(payload)),
+            lambda: full_scan_response_body(payload),
+        )
+        return encoded_json_response(
+            body,
+            accept_encoding,
+            headers={"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL},
+        )
+    apply_cache_headers(response, etag)
     return payload
 
 
+def _player_prop_board_page_etag(
+    *,
+    view: str,
+    meta: dict,
+    page: int,
+    page_size: int,
+    paged_items: list[dict],
+    filtered_total: int,
+    has_more: bool,
+    overlay_version: str | None,
+) -> str | None:
+    """ETag over what a page body is built from; items are immutable within one published `scanned_at`."""
+    if overlay_version is None:
+        return None
+    return strong_etag(
+        "board_player_props",
+        view,
+        meta.get("scanned_at"),
+        meta.get("total"),
+        page,
+        page_size,
+        filtered_total,
+        has_more,
+        [(item.get("selection_key") or item.get("comparison_key"), item.get("sportsbook")) for item in paged_items],
+        overlay_version,
+    )
+
+
 def _build_player_prop_board_page_response(
     *,
     view: str,
@@ -593,6 +727,8 @@ def _build_player_prop_board_page_response(
     page: int,
     page_size: int,
     tz_offset_minutes: int | None,
+    if_none_match: str | None = None,
+    response: Response | None = None,
 ):
     try:
         db = get_db()
@@ -620,7 +756,22 @@ def _build_player_prop_board_page_response(
     if meta is None:
         return None
 
-    annotated_items = annotate_sides_with_duplicate_state(db, user_id, paged_items)
+    pending_rows, overlay_version = _duplicate_overlay(db, user_id)
+    etag = _player_prop_board_page_etag(
+        view=view,
+        meta=meta,
+        page=page,
+        page_size=page_size,
+        paged_items=paged_items,
+        filtered_total=filtered_total,
+        has_more=has_more,
+        overlay_version=overlay_version,
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+
+    annotated_items = _annotate_with_overlay(db, user_id, paged_items, pending_rows)
+    apply_cache_headers(response, etag)
     return {
         "items": annotated_items,
         "page": page,
@@ -646,6 +797,8 @@ def get_board_latest_player_props_opportunities(
     search: str | None = Query(default=None),
     tz_offset_minutes: int | None = Query(default=None),
     user: dict = Depends(get_current_user),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    response: Response = None,
 ):
     return _build_player_prop_board_page_response(
         view=BOARD_VIEW_OPPORTUNITIES,
@@ -658,6 +811,8 @@ def get_board_latest_player_props_opportunities(
         page=page,
         page_size=page_size,
         tz_offset_minutes=tz_offset_minutes,
+        if_none_match=if_none_match,
+        response=response,
     )
 
 
@@ -672,6 +827,8 @@ def get_board_latest_player_props_browse(
     search: str | None = Query(default=None),
     tz_offset_minutes: int | None = Query(default=None),
     user: dict = Depends(get_current_user),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    response: Response = None,
 ):
     return _build_player_prop_board_page_response(
         view=BOARD_VIEW_BROWSE,
@@ -684,6 +841,8 @@ def get_board_latest_player_props_browse(
         page=page,
         page_size=page_size,
         tz_offset_minutes=tz_offset_minutes,
+        if_none_match=if_none_match,
+        response=response,
     )
 
 
@@ -698,6 +857,8 @@ def get_board_latest_player_props_pickem(
     search: str | None = Query(default=None),
     tz_offset_minutes: int | None = Query(default=None),
     user: dict = Depends(get_current_user),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    response: Response = None,
 ):
     db = get_db()
     meta, paged_items, filtered_total, source_total, has_more = load_player_prop_board_filtered_page(
@@ -719,6 +880,21 @@ def get_board_latest_player_props_pickem(
     if meta is None:
         return None
 
+    # Pick'em cards carry no per-user duplicate state.
+    etag = _player_prop_board_page_etag(
+        view=BOARD_VIEW_PICKEM,
+        meta=meta,
+        page=page,
+        page_size=page_size,
+        paged_items=paged_items,
+        filtered_total=filtered_total,
+        has_more=has_more,
+        overlay_version="",
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+
+    apply_cache_headers(response, etag)
     return {
         "items": paged_items,
         "page": page,
@@ -844,6 +1020,21 @@ def get_board_latest_promos(
     )
 
 
+@router.get("/board/events")
+async def get_board_events(request: Request, user: dict = Depends(get_current_user)):
+    """Stream board change notifications as server-sent events.
+
+    Emits the latest `board.snapshot`, `board.drop` and `board.refresh` events
+    on connect, then each new one as drops and scoped refreshes publish them.
+    Clients refetch board payloads only when a snapshot id or refresh changes.
+    """
+    return StreamingResponse(
+        stream_board_events(is_disconnected=request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/board/refresh", response_model=ScopedRefreshResponse)
 async def refresh_board_scope(
     scope: str = Query(default="player_props", description="Surface to refresh: straight_bets or player_props"),
@@ -878,6 +1069,7 @@ async def refresh_board_scope(
     started_at = utc_now_iso_z()
     started_clock = time.monotonic()
     run_id = f"scoped_refresh_{uuid4().hex[:10]}"
+    publish_board_event(BOARD_EVENT_REFRESH, run_id=run_id, surface=scope, status="started")
 
     def _record_scoped_refresh_failure(error: Exception, *, status_code: int, detail: str) -> None:
         finished_at = utc_now_iso_z()
@@ -895,6 +1087,7 @@ async def refresh_board_scope(
             errors=errors,
         )
         _set_ops_status("last_board_refresh", status_payload)
+        publish_board_event(BOARD_EVENT_REFRESH, run_id=run_id, surface=scope, status="failed")
         _persist_ops_job_run(
             job_kind="board_scoped_refresh",
             source="manual_refresh",
@@ -967,7 +1160,8 @@ async def refresh_board_scope(
         _record_scoped_refresh_failure(e, status_code=500, detail=f"Failed to build response: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to build response: {e}")
 
-    refreshed_at = persist_scoped_refresh(
+    refreshed_at = await asyncio.to_thread(
+        persist_scoped_refresh,
         db=db,
         surface=scope,
         scan_payload=scan_payload.model_dump(),
@@ -991,7 +1185,16 @@ async def refresh_board_scope(
         errors=[],
     )
     _set_ops_status("last_board_refresh", status_payload)
-    _persist_ops_job_run(
+    publish_board_event(
+        BOARD_EVENT_REFRESH,
+        run_id=run_id,
+        surface=scope,
+        status="completed",
+        refreshed_at=refreshed_at,
+        total_sides=len(scan_payload.sides),
+    )
+    await asyncio.to_thread(
+        _persist_ops_job_run,
         job_kind="board_scoped_refresh",
         source="manual_refresh",
         status="completed",
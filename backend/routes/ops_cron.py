@@ -25,7 +25,7 @@ from services.ops_runtime import (
     runtime_state,
     set_ops_status,
 )
-from services.runtime_support import log_event, new_run_id, retry_supabase, utc_now_iso
+from services.runtime_support import get_supabase_retry_metrics, log_event, new_run_id, retry_supabase, utc_now_iso
 from services.scan_runtime import piggyback_clv
 from services.shared_state import allow_fixed_window_rate_limit
 
@@ -264,7 +264,8 @@ async def cron_run_scan_impl(
             "captured_at": finished,
         },
     )
-    persist_ops_job_run(
+    await asyncio.to_thread(
+        persist_ops_job_run,
         job_kind="ops_trigger_scan" if ops_status_key == "last_ops_trigger_scan" else "scheduled_scan",
         source="ops_trigger" if ops_status_key == "last_ops_trigger_scan" else "scheduler",
         status="completed" if not errors else "completed_with_errors",
@@ -337,7 +338,7 @@ async def cron_run_board_drop_impl(
     persist_ops_job_run: Callable[..., None],
     get_db: Callable[[], Any],
     retry_supabase: Callable[[Callable[[], Any]], Any] | None,
-    piggyback_clv: Callable[[list[dict[str, Any]]], Any] | None = None,
+    piggyback_clv: Callable[..., Any] | None = None,
     run_id_prefix: str = "ops_board_drop",
     log_prefix: str = "ops.trigger.board_drop",
     board_drop_source: str = "ops_trigger_board_drop",
@@ -419,7 +420,7 @@ async def cron_run_board_drop_impl(
         # Keep CLV piggyback best-effort and non-blocking so board refresh success semantics stay unchanged.
         if piggyback_clv is not None and fresh_sides:
             try:
-                piggyback_result = piggyback_clv(fresh_sides)
+                piggyback_result = piggyback_clv(fresh_sides, source=board_drop_source)
                 if inspect.isawaitable(piggyback_result):
                     async def _run_piggyback() -> None:
                         try:
@@ -615,7 +616,8 @@ async def cron_run_board_drop_impl(
     set_ops_status(ops_status_key, status_payload)
     set_ops_status("last_board_refresh", board_refresh_status_payload)
 
-    persist_ops_job_run(
+    await asyncio.to_thread(
+        persist_ops_job_run,
         job_kind="ops_trigger_board_drop",
         source="ops_trigger",
         status="completed" if not errors else "completed_with_errors",
@@ -733,7 +735,8 @@ async def cron_run_auto_settle_impl(
                 summary_meta[key] = summary.get(key)
         if not summary_meta:
             summary_meta = None
-    persist_ops_job_run(
+    await asyncio.to_thread(
+        persist_ops_job_run,
         job_kind="auto_settle",
         source=ops_status_source,
         status="completed",
@@ -794,7 +797,9 @@ def ops_status_impl(
     db_ok, db_error = check_db_ready()
     scheduler_fresh_ok, scheduler_freshness = check_scheduler_freshness(runtime["scheduler_expected"])
     from services.odds_api import get_odds_api_activity_snapshot
+    from services.odds_api_budget import get_odds_api_budget_snapshot
     from services.ops_history import load_ops_status_snapshot
+    from services.pricing_kernel import get_pricing_cache_stats
 
     fallback_ops = get_ops_status()
     odds_api_activity = get_odds_api_activity_snapshot()
@@ -819,6 +824,16 @@ def ops_status_impl(
                 error_class=type(exc).__name__,
                 error=str(exc),
             )
+    try:
+        ops = {**ops, "odds_api_budget": get_odds_api_budget_snapshot()}
+    except Exception as exc:
+        log_event(
+            "ops.status.odds_api_budget_failed",
+            level="warning",
+            error_class=type(exc).__name__,
+            error=str(exc),
+        )
+    ops = {**ops, "pricing_cache": get_pricing_cache_stats()}
 
     return {
         "timestamp": utc_now_iso(),
@@ -861,6 +876,76 @@ def ops_model_calibration_summary_impl(
     return get_summary(get_db())
 
 
+def ops_rebuild_model_calibration_rollups_impl(
+    x_cron_token: str | None,
+    *,
+    require_valid_cron_token: Callable[[str | None], None],
+    get_db: Callable[[], Any],
+    rebuild_rollups: Callable[[Any], int],
+    log_event: Callable[..., None],
+) -> dict[str, Any]:
+    """Protected backfill/repair of the model-calibration rollup table."""
+    require_valid_cron_token(x_cron_token)
+    started_at = time.monotonic()
+    bucket_count = rebuild_rollups(get_db())
+    duration_ms = round((time.monotonic() - started_at) * 1000, 2)
+    log_event(
+        "ops.model_calibration.rollups_rebuilt",
+        bucket_count=bucket_count,
+        duration_ms=duration_ms,
+    )
+    return {"ok": True, "bucket_count": bucket_count, "duration_ms": duration_ms}
+
+
+def ops_train_player_prop_weights_impl(
+    x_cron_token: str | None,
+    *,
+    dry_run: bool,
+    rebuild_accumulators: bool,
+    require_valid_cron_token: Callable[[str | None], None],
+    get_db: Callable[[], Any],
+    train_weights: Callable[..., dict[str, Any]],
+    rebuild_weight_accumulators: Callable[[Any], int],
+    log_event: Callable[..., None],
+) -> dict[str, Any]:
+    """Protected player-prop weight training, optionally as a dry-run diff."""
+    require_valid_cron_token(x_cron_token)
+    started_at = time.monotonic()
+    db = get_db()
+    rebuilt_buckets = rebuild_weight_accumulators(db) if rebuild_accumulators else None
+    result = train_weights(db, dry_run=dry_run)
+    duration_ms = round((time.monotonic() - started_at) * 1000, 2)
+    log_event(
+        "ops.player_prop_weights.trained",
+        dry_run=dry_run,
+        rebuilt_buckets=rebuilt_buckets,
+        trained_rows=result.get("trained_rows"),
+        training_source=result.get("training_source"),
+        duration_ms=duration_ms,
+    )
+    return {**result, "rebuilt_buckets": rebuilt_buckets, "duration_ms": duration_ms}
+
+
+def ops_request_metrics_impl(
+    x_cron_token: str | None,
+    *,
+    reset: bool,
+    require_valid_cron_token: Callable[[str | None], None],
+    get_snapshot: Callable[[], dict[str, Any]],
+    reset_histograms: Callable[[], None],
+    get_supabase_metrics: Callable[[], dict[str, Any]] | None = None,
+    get_live_state_metrics: Callable[[], dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Protected per-route latency histogram snapshot, optionally resetting the window."""
+    require_valid_cron_token(x_cron_token)
+    snapshot = get_snapshot()
+    if reset:
+        reset_histograms()
+    supabase = get_supabase_metrics() if get_supabase_metrics is not None else None
+    live_state = get_live_state_metrics() if get_live_state_metrics is not None else None
+    return {**snapshot, "supabase": supabase, "live_state": live_state, "reset": reset}
+
+
 def ops_pickem_research_summary_impl(
     x_cron_token: str | None,
     *,
@@ -1041,7 +1126,8 @@ async def cron_run_clv_daily_impl(
             "summary": summary,
         },
     )
-    persist_ops_job_run(
+    await asyncio.to_thread(
+        persist_ops_job_run,
         job_kind="clv_daily",
         source=ops_status_source,
         status="completed",
@@ -1097,7 +1183,8 @@ async def ops_replay_recent_clv_impl(
             "summary": summary,
         },
     )
-    persist_ops_job_run(
+    await asyncio.to_thread(
+        persist_ops_job_run,
         job_kind="clv_replay",
         source="ops",
         status="completed",
@@ -1279,7 +1366,8 @@ async def _ops_trigger_board_refresh_async(
         },
     )
 
-    persist_ops_job_run(
+    await asyncio.to_thread(
+        persist_ops_job_run,
         job_kind="ops_trigger_board_drop",
         source="ops_trigger",
         status="queued",
@@ -1498,6 +1586,69 @@ def ops_model_calibration_summary(
     )
 
 
+@router.post("/api/ops/trigger/model-calibration-rollups")
+def ops_trigger_model_calibration_rollups(
+    x_ops_token: str | None = Header(default=None, alias="X-Ops-Token"),
+    x_cron_token: str | None = Header(default=None, alias="X-Cron-Token"),
+    _auth: None = Depends(require_ops_token),
+):
+    from services.model_calibration import rebuild_model_calibration_rollups
+
+    return ops_rebuild_model_calibration_rollups_impl(
+        x_cron_token=x_ops_token or x_cron_token,
+        require_valid_cron_token=validate_ops_token,
+        get_db=get_db,
+        rebuild_rollups=rebuild_model_calibration_rollups,
+        log_event=log_event,
+    )
+
+
+@router.post("/api/ops/trigger/player-prop-weights")
+def ops_trigger_player_prop_weights(
+    dry_run: bool = Query(default=False),
+    rebuild_accumulators: bool = Query(default=False),
+    x_ops_token: str | None = Header(default=None, alias="X-Ops-Token"),
+    x_cron_token: str | None = Header(default=None, alias="X-Cron-Token"),
+    _auth: None = Depends(require_ops_token),
+):
+    from services.player_prop_weights import (
+        rebuild_player_prop_weight_accumulators,
+        train_player_prop_model_weights,
+    )
+
+    return ops_train_player_prop_weights_impl(
+        x_cron_token=x_ops_token or x_cron_token,
+        dry_run=dry_run,
+        rebuild_accumulators=rebuild_accumulators,
+        require_valid_cron_token=validate_ops_token,
+        get_db=get_db,
+        train_weights=train_player_prop_model_weights,
+        rebuild_weight_accumulators=rebuild_player_prop_weight_accumulators,
+        log_event=log_event,
+    )
+
+
+@router.get("/api/ops/request-metrics")
+def ops_request_metrics(
+    reset: bool = Query(default=False),
+    x_ops_token: str | None = Header(default=None, alias="X-Ops-Token"),
+    x_cron_token: str | None = Header(default=None, alias="X-Cron-Token"),
+    _auth: None = Depends(require_ops_token),
+):
+    from services.live_game_state import get_live_game_state_metrics
+    from services.request_metrics import get_route_latency_snapshot, reset_route_latency_histograms
+
+    return ops_request_metrics_impl(
+        x_cron_token=x_ops_token or x_cron_token,
+        reset=reset,
+        require_valid_cron_token=validate_ops_token,
+        get_snapshot=get_route_latency_snapshot,
+        reset_histograms=reset_route_latency_histograms,
+        get_supabase_metrics=get_supabase_retry_metrics,
+        get_live_state_metrics=get_live_game_state_metrics,
+    )
+
+
 @router.get("/api/ops/pickem-research/summary", response_model=PickEmResearchSummaryResponse)
 def ops_pickem_research_summary(
     x_ops_token: str | None = Header(default=None, alias="X-Ops-Token"),
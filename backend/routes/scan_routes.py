@@ -1,7 +1,8 @@
+import asyncio
 import time
 
 import httpx
-from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 
 from database import get_db
 from dependencies import require_scan_rate_limit
@@ -11,8 +12,11 @@ from services.ops_runtime import persist_ops_job_run, set_ops_status
 from services.runtime_support import log_event, new_run_id, retry_supabase, utc_now_iso
 from services.scan_cache import (
     DEFAULT_SURFACE,
-    resolve_scan_latest_response,
+    empty_scan_response,
+    load_latest_scan_payload,
     scan_cache_exception_to_http_exception,
+    scan_payload_version,
+    with_enriched_scan_sides,
 )
 from services.scan_markets import (
     apply_manual_scan_bundle,
@@ -29,12 +33,16 @@ from services.scan_runtime import (
     capture_research_opportunities,
     get_cached_or_scan_for_surface,
     get_environment,
+    load_pending_duplicate_rows,
     persist_latest_full_scan,
     piggyback_clv,
     scan_for_ev_surface,
     scanner_supported_sports,
     sync_pickem_research_from_props_payload,
 )
+from services.scan_payload import is_trusted_scan_payload, scan_json_response
+from services.scanner_duplicate_detection import duplicate_state_version
+from utils.http_cache import apply_cache_headers, etag_matches, not_modified_response, strong_etag
 from utils.request_context import get_request_id
 
 
@@ -191,7 +199,7 @@ async def scan_markets_impl(
             detail=f"Unsupported sport. Choose from: {', '.join(supported_sports)}",
         )
 
-    def _finalize_manual_scan_bundle(bundle: dict):
+    async def _finalize_manual_scan_bundle(bundle: dict):
         captured_at = utc_now_iso()
         response_payload = apply_manual_scan_bundle_fn(
             bundle=bundle,
@@ -220,7 +228,9 @@ async def scan_markets_impl(
                 **payload,
             ),
         )
-        persist_ops_job_run(
+        # Off the event loop so the job-history insert keeps its retry backoff.
+        await asyncio.to_thread(
+            persist_ops_job_run,
             job_kind="manual_scan",
             source="manual_scan",
             status="completed",
@@ -249,7 +259,7 @@ async def scan_markets_impl(
                 get_cached_or_scan=_get_cached_or_scan_with_activity,
                 annotate_sides=lambda sides: annotate_sides(db, user["id"], sides),
             )
-            return _finalize_manual_scan_bundle(single_sport)
+            return await _finalize_manual_scan_bundle(single_sport)
 
         all_sports = await run_all_sports_manual_scan(
             surface=surface,
@@ -258,9 +268,10 @@ async def scan_markets_impl(
             get_cached_or_scan=_get_cached_or_scan_with_activity,
             annotate_sides=lambda sides: annotate_sides(db, user["id"], sides),
         )
-        return _finalize_manual_scan_bundle(all_sports)
+        return await _finalize_manual_scan_bundle(all_sports)
     except Exception as e:
-        capture_backend_event(
+        await asyncio.to_thread(
+            capture_backend_event,
             db,
             event_name="scanner_failed",
             user_id=str(user.get("id") or ""),
@@ -285,18 +296,41 @@ def scan_latest_impl(
     get_db,
     retry_supabase,
     annotate_sides,
+    load_pending_rows=None,
+    if_none_match: str | None = None,
+    response: Response | None = None,
 ):
     if surface not in SUPPORTED_SURFACES:
         raise HTTPException(status_code=400, detail=f"Unsupported surface '{surface}'")
 
     db = get_db()
     try:
-        payload = resolve_scan_latest_response(
-            db=db,
-            retry_supabase=retry_supabase,
-            enrich_sides=lambda sides: annotate_sides(db, user["id"], sides),
-            surface=surface,
+        payload = load_latest_scan_payload(db=db, retry_supabase=retry_supabase, surface=surface)
+        if payload is None:
+            return empty_scan_response(surface=surface)
+
+        # The ETag covers the published payload plus the user's duplicate-state overlay.
+        pending_rows = load_pending_rows(db, user["id"]) if load_pending_rows is not None else None
+        etag = (
+            strong_etag("scan_latest", scan_payload_version(payload), duplicate_state_version(pending_rows))
+            if pending_rows is not None
+            else None
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified_response(etag)
+
+        payload = with_enriched_scan_sides(
+            payload=payload,
+            enrich_sides=lambda sides: (
+                annotate_sides(db, user["id"], sides)
+                if pending_rows is None
+                else annotate_sides(db, user["id"], sides, pending_rows=pending_rows)
+            ),
         )
+        if is_trusted_scan_payload(payload):
+            trusted_response = scan_json_response({**payload, "surface": payload.get("surface") or surface})
+            apply_cache_headers(trusted_response, etag)
+            return trusted_response
         if isinstance(payload, dict):
             payload["surface"] = payload.get("surface") or surface
             raw_sides = payload.get("sides")
@@ -305,6 +339,7 @@ def scan_latest_impl(
                     side if isinstance(side, dict) and side.get("surface") else {"surface": surface, **side}
                     for side in raw_sides
                 ]
+        apply_cache_headers(response, etag)
         return payload
     except Exception as e:
         raise scan_cache_exception_to_http_exception(e)
@@ -363,6 +398,8 @@ async def scan_markets(
 async def scan_latest(
     surface: str = DEFAULT_SURFACE,
     user: dict = Depends(require_scan_rate_limit),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    response: Response = None,
 ):
     return scan_latest_impl(
         surface=surface,
@@ -370,4 +407,7 @@ async def scan_latest(
         get_db=get_db,
         retry_supabase=retry_supabase,
         annotate_sides=annotate_sides_with_duplicate_state,
+        load_pending_rows=load_pending_duplicate_rows,
+        if_none_match=if_none_match,
+        response=response,
     )
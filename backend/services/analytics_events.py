@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime
 from typing import Any, Callable
 
@@ -32,6 +36,18 @@ _MAX_SESSION_ID_LEN = 120
 _MAX_DEDUPE_KEY_LEN = 180
 _MAX_PROPERTIES_JSON_BYTES = 2048
 
+ANALYTICS_FLUSH_INTERVAL_ENV = "ANALYTICS_FLUSH_INTERVAL_SECONDS"
+_DEFAULT_FLUSH_INTERVAL_SECONDS = 2.0
+_MAX_PENDING_EVENTS = 1000
+_FLUSH_CHUNK_SIZE = 100
+_RECENT_DEDUPE_TTL_SECONDS = 15 * 60
+_MAX_RECENT_DEDUPE_KEYS = 5000
+_MAX_FLUSH_ATTEMPTS = 3
+
+ENQUEUE_QUEUED = "queued"
+ENQUEUE_DUPLICATE = "duplicate"
+ENQUEUE_FULL = "full"
+
 ANALYTICS_AUDIENCE_EXTERNAL = "external"
 ANALYTICS_AUDIENCE_ALL = "all"
 EXTERNAL_ANALYTICS_EXCLUDED_CLASSES: frozenset[str] = frozenset({"internal", "test"})
@@ -299,9 +315,8 @@ def _run_with_retry(operation: Callable[[], Any], retry_supabase: Callable[[Call
     return retry_supabase(operation)
 
 
-def capture_analytics_event(
+def build_analytics_event_payload(
     *,
-    db,
     event_name: str,
     source: str,
     user_id: str | None,
@@ -310,15 +325,13 @@ def capture_analytics_event(
     app_area: str | None,
     properties: dict[str, Any] | None = None,
     dedupe_key: str | None = None,
-    retry_supabase: Callable[[Callable[[], Any]], Any] | None = None,
-    log_event: Callable[..., None] | None = None,
     captured_at: str | None = None,
-) -> bool:
+) -> dict[str, Any]:
     normalized_event = (event_name or "").strip()
     if not is_supported_analytics_event(normalized_event):
         raise ValueError(f"Unsupported analytics event: {normalized_event}")
 
-    payload = {
+    return {
         "captured_at": captured_at or _utc_now_iso(),
         "event_name": normalized_event,
         "source": (source or "backend").strip().lower(),
@@ -330,6 +343,40 @@ def capture_analytics_event(
         "dedupe_key": _normalize_dedupe_key(dedupe_key),
     }
 
+
+def _is_dedupe_conflict(exc: Exception) -> bool:
+    message = str(exc).lower()
+    return "duplicate key value" in message and "dedupe" in message
+
+
+def capture_analytics_event(
+    *,
+    db,
+    event_name: str,
+    source: str,
+    user_id: str | None,
+    session_id: str | None,
+    route: str | None,
+    app_area: str | None,
+    properties: dict[str, Any] | None = None,
+    dedupe_key: str | None = None,
+    retry_supabase: Callable[[Callable[[], Any]], Any] | None = None,
+    log_event: Callable[..., None] | None = None,
+    captured_at: str | None = None,
+) -> bool:
+    payload = build_analytics_event_payload(
+        event_name=event_name,
+        source=source,
+        user_id=user_id,
+        session_id=session_id,
+        route=route,
+        app_area=app_area,
+        properties=properties,
+        dedupe_key=dedupe_key,
+        captured_at=captured_at,
+    )
+    normalized_event = payload["event_name"]
+
     try:
         _run_with_retry(
             lambda: db.table("analytics_events").insert(payload).execute(),
@@ -337,8 +384,7 @@ def capture_analytics_event(
         )
         return True
     except Exception as exc:
-        message = str(exc).lower()
-        if "duplicate key value" in message and "dedupe" in message:
+        if _is_dedupe_conflict(exc):
             return False
         if log_event is not None:
             try:
@@ -392,6 +438,24 @@ def capture_backend_event(
     if normalized_email:
         payload_properties["user_email"] = normalized_email
 
+    if _EVENT_BUFFER.active:
+        try:
+            payload = build_analytics_event_payload(
+                event_name=event_name,
+                source="backend",
+                user_id=user_id,
+                session_id=session_id,
+                route=route,
+                app_area=app_area,
+                properties=payload_properties,
+                dedupe_key=dedupe_key,
+            )
+        except Exception:
+            return False
+        status = _EVENT_BUFFER.enqueue(payload)
+        if status != ENQUEUE_FULL:
+            return status == ENQUEUE_QUEUED
+
     resolved_retry, resolved_log = _resolve_runtime_hooks(retry_supabase, log_event)
     try:
         return capture_analytics_event(
@@ -409,3 +473,284 @@ def capture_backend_event(
         )
     except Exception:
         return False
+
+
+class AnalyticsEventBuffer:
+    """In-process write buffer for analytics rows.
+
+    Rows are deduped by ``dedupe_key`` against the pending queue, rows being
+    flushed, and a short window of recently inserted keys, then written as
+    multi-row inserts. Rows from a failed insert go back to the front of the
+    queue for up to ``_MAX_FLUSH_ATTEMPTS`` flushes before they are dropped.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_pending: int = _MAX_PENDING_EVENTS,
+        chunk_size: int = _FLUSH_CHUNK_SIZE,
+        dedupe_ttl_seconds: float = _RECENT_DEDUPE_TTL_SECONDS,
+        max_recent_keys: int = _MAX_RECENT_DEDUPE_KEYS,
+    ) -> None:
+        self.max_pending = max(1, int(max_pending))
+        self.chunk_size = max(1, int(chunk_size))
+        self.dedupe_ttl_seconds = float(dedupe_ttl_seconds)
+        self.max_recent_keys = max(1, int(max_recent_keys))
+        self.active = False
+        self._lock = threading.Lock()
+        # (row, failed flush attempts so far)
+        self._pending: list[tuple[dict[str, Any], int]] = []
+        self._pending_keys: set[str] = set()
+        self._inflight_keys: set[str] = set()
+        self._recent_keys: OrderedDict[str, float] = OrderedDict()
+        self._stats = {
+            "queued": 0,
+            "deduped": 0,
+            "rejected_full": 0,
+            "inserted": 0,
+            "requeued": 0,
+            "dropped": 0,
+            "flushes": 0,
+        }
+
+    def _prune_recent_keys(self, now: float) -> None:
+        while self._recent_keys:
+            key, expires_at = next(iter(self._recent_keys.items()))
+            if expires_at > now and len(self._recent_keys) <= self.max_recent_keys:
+                break
+            self._recent_keys.popitem(last=False)
+
+    def enqueue(self, payload: dict[str, Any]) -> str:
+        dedupe_key = payload.get("dedupe_key")
+        now = time.monotonic()
+        with self._lock:
+            if dedupe_key:
+                self._prune_recent_keys(now)
+                if (
+                    dedupe_key in self._pending_keys
+                    or dedupe_key in self._inflight_keys
+                    or dedupe_key in self._recent_keys
+                ):
+                    self._stats["deduped"] += 1
+                    return ENQUEUE_DUPLICATE
+            if len(self._pending) >= self.max_pending:
+                self._stats["rejected_full"] += 1
+                return ENQUEUE_FULL
+            self._pending.append((payload, 0))
+            if dedupe_key:
+                self._pending_keys.add(dedupe_key)
+            self._stats["queued"] += 1
+            return ENQUEUE_QUEUED
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "pending": len(self._pending),
+                "active": self.active,
+            }
+
+    def _drain(self) -> list[tuple[dict[str, Any], int]]:
+        with self._lock:
+            entries = self._pending
+            self._pending = []
+            self._inflight_keys |= self._pending_keys
+            self._pending_keys = set()
+            return entries
+
+    def _mark_inserted(self, rows: list[dict[str, Any]]) -> None:
+        """Move persisted rows' keys from in-flight to the recent-dedupe window."""
+        expires_at = time.monotonic() + self.dedupe_ttl_seconds
+        with self._lock:
+            for row in rows:
+                key = row.get("dedupe_key")
+                if not key:
+                    continue
+                self._inflight_keys.discard(key)
+                self._recent_keys[key] = expires_at
+                self._recent_keys.move_to_end(key)
+
+    def _requeue(self, entries: list[tuple[dict[str, Any], int]], *, requeue: bool) -> tuple[int, int]:
+        """Put failed rows back at the front of the queue; return ``(requeued, dropped)``."""
+        kept: list[tuple[dict[str, Any], int]] = []
+        dropped = 0
+        with self._lock:
+            room = self.max_pending - len(self._pending)
+            for row, attempts in entries:
+                key = row.get("dedupe_key")
+                if key:
+                    self._inflight_keys.discard(key)
+                if (
+                    not requeue
+                    or attempts + 1 >= _MAX_FLUSH_ATTEMPTS
+                    or len(kept) >= room
+                    or (key and key in self._pending_keys)
+                ):
+                    dropped += 1
+                    continue
+                kept.append((row, attempts + 1))
+                if key:
+                    self._pending_keys.add(key)
+            self._pending[:0] = kept
+            self._stats["requeued"] += len(kept)
+            self._stats["dropped"] += dropped
+        return len(kept), dropped
+
+    def _bump(self, **deltas: int) -> None:
+        with self._lock:
+            for key, value in deltas.items():
+                self._stats[key] += value
+
+    def flush(
+        self,
+        *,
+        db,
+        retry_supabase: Callable[[Callable[[], Any]], Any] | None = None,
+        log_event: Callable[..., None] | None = None,
+        requeue: bool = True,
+    ) -> int:
+        """Write every pending row and return how many were inserted.
+
+        Failed rows are requeued for a later flush unless ``requeue`` is false
+        (request-scoped buffers, shutdown), in which case they are dropped and logged.
+        """
+        entries = self._drain()
+        if not entries:
+            return 0
+
+        inserted = 0
+        for start in range(0, len(entries), self.chunk_size):
+            chunk_entries = entries[start : start + self.chunk_size]
+            chunk = [row for row, _ in chunk_entries]
+            try:
+                _run_with_retry(
+                    lambda chunk=chunk: db.table("analytics_events").insert(chunk).execute(),
+                    retry_supabase,
+                )
+                self._mark_inserted(chunk)
+                inserted += len(chunk)
+                continue
+            except Exception as exc:
+                if not _is_dedupe_conflict(exc):
+                    requeued, dropped = self._requeue(chunk_entries, requeue=requeue)
+                    _log_flush_failure(log_event, exc, rows=len(chunk), requeued=requeued, dropped=dropped)
+                    continue
+
+            # One already-persisted dedupe key rejects the whole multi-row insert;
+            # retry this chunk row-by-row so the rest still land.
+            for entry in chunk_entries:
+                row = entry[0]
+                try:
+                    _run_with_retry(
+                        lambda row=row: db.table("analytics_events").insert(row).execute(),
+                        retry_supabase,
+                    )
+                    inserted += 1
+                except Exception as exc:
+                    if not _is_dedupe_conflict(exc):
+                        requeued, dropped = self._requeue([entry], requeue=requeue)
+                        _log_flush_failure(log_event, exc, rows=1, requeued=requeued, dropped=dropped)
+                        continue
+                # Inserted now or already persisted by an earlier write.
+                self._mark_inserted([row])
+
+        self._bump(inserted=inserted, flushes=1)
+        return inserted
+
+
+def _log_flush_failure(
+    log_event: Callable[..., None] | None,
+    exc: Exception,
+    *,
+    rows: int,
+    requeued: int = 0,
+    dropped: int = 0,
+) -> None:
+    if log_event is None:
+        return
+    try:
+        log_event(
+            "analytics.flush_failed",
+            level="warning",
+            rows=rows,
+            requeued=requeued,
+            dropped=dropped,
+            error_class=type(exc).__name__,
+            error=str(exc),
+        )
+    except Exception:
+        pass
+
+
+_EVENT_BUFFER = AnalyticsEventBuffer()
+
+
+def get_analytics_event_buffer() -> AnalyticsEventBuffer:
+    return _EVENT_BUFFER
+
+
+def analytics_flush_interval_seconds() -> float:
+    raw = (os.getenv(ANALYTICS_FLUSH_INTERVAL_ENV) or "").strip()
+    if not raw:
+        return _DEFAULT_FLUSH_INTERVAL_SECONDS
+    try:
+        return max(0.25, float(raw))
+    except ValueError:
+        return _DEFAULT_FLUSH_INTERVAL_SECONDS
+
+
+def flush_analytics_event_buffer(db=None, *, requeue: bool = True) -> int:
+    retry, log = _resolve_runtime_hooks(None, None)
+    if db is None:
+        if _EVENT_BUFFER.pending_count() == 0:
+            return 0
+        from database import get_db
+
+        db = get_db()
+    return _EVENT_BUFFER.flush(db=db, retry_supabase=retry, log_event=log, requeue=requeue)
+
+
+async def _run_analytics_flush_loop(interval_seconds: float) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await asyncio.to_thread(flush_analytics_event_buffer)
+        except Exception as exc:
+            _, log = _resolve_runtime_hooks(None, None)
+            _log_flush_failure(log, exc, rows=0)
+
+
+async def start_analytics_event_flusher(app=None) -> None:
+    """Enable buffered analytics writes and start the periodic flush task."""
+    if os.getenv("TESTING") == "1":
+        return
+    if app is not None and getattr(app.state, "analytics_flush_task", None) is not None:
+        return
+
+    _EVENT_BUFFER.active = True
+    task = asyncio.create_task(_run_analytics_flush_loop(analytics_flush_interval_seconds()))
+    if app is not None:
+        app.state.analytics_flush_task = task
+
+
+async def stop_analytics_event_flusher(app=None) -> None:
+    """Stop the flush task and write whatever is still pending."""
+    task = getattr(app.state, "analytics_flush_task", None) if app is not None else None
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        app.state.analytics_flush_task = None
+
+    _EVENT_BUFFER.active = False
+    try:
+        # Nothing flushes after shutdown, so failed rows are dropped and logged here.
+        await asyncio.to_thread(flush_analytics_event_buffer, requeue=False)
+    except Exception:
+        pass
@@ -7,6 +7,7 @@ import os
 
 from fastapi import FastAPI
 
+from database import fake_supabase_enabled
 from services import ops_runtime
 from services.paper_autolog_runner import (
     is_paper_experiment_autolog_enabled,
@@ -25,7 +26,7 @@ from services.scheduler_runtime import (
 
 
 def validate_environment() -> None:
-    required = ["SUPABASE_URL", "SUPABASE_SERVICE_ROLE_KEY"]
+    required = [] if fake_supabase_enabled() else ["SUPABASE_URL", "SUPABASE_SERVICE_ROLE_KEY"]
     missing = [name for name in required if not os.getenv(name)]
     if missing:
         raise RuntimeError(f"Missing required environment variables: {', '.join(missing)}")
@@ -8,22 +8,19 @@ import logging
 import time
 from datetime import UTC, datetime, timedelta
 
-import httpx
 from fastapi import HTTPException
 
 from services.analytics_events import capture_backend_event
 from calculations import (
-    american_to_decimal,
-    calculate_clv,
-    calculate_ev,
     calculate_real_profit,
     compute_blend_weight,
 )
 from models import BetCreate, BetResult, BetResponse, BetUpdate
+from services.pricing_kernel import bet_clv, bet_ev, decimal_odds, hold_from_odds
+from services.runtime_support import retry_supabase
 from utils.request_context import (
     get_correlation_id,
     get_request_id,
-    record_db_roundtrip,
 )
 
 logger = logging.getLogger("ev_tracker")
@@ -46,61 +43,13 @@ def _log_structured_event(event: str, *, level: str = "info", **fields) -> None:
     getattr(logger, level.lower(), logger.info)(json.dumps(payload, default=str))
 
 
-def _retry_supabase(f, retries: int = 2, *, label: str = "supabase.request", slow_ms: float = 250.0):
-    """Retry a Supabase/PostgREST request on transient transport errors."""
-    last_err = None
-    for attempt in range(retries):
-        started_at = time.monotonic()
-        try:
-            result = f()
-            duration_ms = round((time.monotonic() - started_at) * 1000, 2)
-            record_db_roundtrip(duration_ms)
-            if attempt > 0 or duration_ms >= slow_ms:
-                _log_structured_event(
-                    "supabase.request.completed",
-                    label=label,
-                    duration_ms=duration_ms,
-                    attempt=attempt + 1,
-                    retries=retries,
-                )
-            return result
-        except (
-            httpx.RemoteProtocolError,
-            httpx.ReadError,
-            httpx.ConnectError,
-            httpx.PoolTimeout,
-            httpx.TimeoutException,
-        ) as e:
-            last_err = e
-            duration_ms = round((time.monotonic() - started_at) * 1000, 2)
-            record_db_roundtrip(duration_ms)
-            if attempt == retries - 1:
-                _log_structured_event(
-                    "supabase.request.failed",
-                    level="warning",
-                    label=label,
-                    duration_ms=duration_ms,
-                    attempt=attempt + 1,
-                    retries=retries,
-                    error_class=type(e).__name__,
-                    error=str(e),
-                )
-                raise
-            delay_seconds = min(0.35, 0.1 * (2**attempt))
-            _log_structured_event(
-                "supabase.request.retrying",
-                level="warning",
-                label=label,
-                duration_ms=duration_ms,
-                attempt=attempt + 1,
-                retries=retries,
-                retry_delay_ms=round(delay_seconds * 1000, 2),
-                error_class=type(e).__name__,
-                error=str(e),
-            )
-            time.sleep(delay_seconds)
-    if last_err:
-        raise last_err
+def _retry_supabase(f, retries: int = 2, *, label: str | None = None, slow_ms: float = 250.0):
+    """Retry a Supabase/PostgREST request on transient transport errors.
+
+    Shares the backoff and circuit breaker in `runtime_support.retry_supabase`
+    and keeps this module's request-id tagged log lines.
+    """
+    return retry_supabase(f, retries, label=label, slow_ms=slow_ms, log=_log_structured_event)
 
 
 def get_user_settings(db, user_id: str) -> dict:
@@ -243,14 +192,12 @@ def _lock_ev_for_row(db, bet_id: str, user_id: str, row: dict, settings: dict) -
     k_derived = build_effective_k(settings, k_data["k_obs"], k_data["bonus_stake_settled"])
     k_eff = k_derived["k_factor_effective"]
 
-    from calculations import calculate_hold_from_odds
-
-    decimal_odds = american_to_decimal(row["odds_american"])
+    book_decimal = decimal_odds(row["odds_american"])
     payout_override = row.get("payout_override")
     stake = float(row.get("stake") or 0)
     promo_type = row.get("promo_type")
 
-    decimal_odds_for_ev = decimal_odds
+    decimal_odds_for_ev = book_decimal
     if (payout_override is not None and stake
             and promo_type in ("standard", "no_sweat", "promo_qualifier")):
         try:
@@ -262,9 +209,9 @@ def _lock_ev_for_row(db, bet_id: str, user_id: str, row: dict, settings: dict) -
 
     vig = None
     if row.get("opposing_odds"):
-        vig = calculate_hold_from_odds(row["odds_american"], row["opposing_odds"])
+        vig = hold_from_odds(row["odds_american"], row["opposing_odds"])
 
-    ev_result = calculate_ev(
+    ev_result = bet_ev(
         stake=stake,
         decimal_odds=decimal_odds_for_ev,
         promo_type=promo_type,
@@ -305,10 +252,8 @@ def _lock_ev_for_row(db, bet_id: str, user_id: str, row: dict, settings: dict) -
 
 def build_bet_response(row: dict, k_factor: float) -> BetResponse:
     """Convert database row to BetResponse with calculated fields."""
-    from calculations import calculate_hold_from_odds
-
-    decimal_odds = american_to_decimal(row["odds_american"])
-    decimal_odds_for_ev = decimal_odds
+    book_decimal = decimal_odds(row["odds_american"])
+    decimal_odds_for_ev = book_decimal
 
     payout_override = row.get("payout_override")
     promo_type = row.get("promo_type")
@@ -327,9 +272,9 @@ def build_bet_response(row: dict, k_factor: float) -> BetResponse:
 
     vig = None
     if row.get("opposing_odds"):
-        vig = calculate_hold_from_odds(row["odds_american"], row["opposing_odds"])
+        vig = hold_from_odds(row["odds_american"], row["opposing_odds"])
 
-    ev_result = calculate_ev(
+    ev_result = bet_ev(
         stake=row["stake"],
         decimal_odds=decimal_odds_for_ev,
         promo_type=row["promo_type"],
@@ -352,7 +297,7 @@ def build_bet_response(row: dict, k_factor: float) -> BetResponse:
     clv_ev_percent = None
     beat_close = None
     if row.get("pinnacle_odds_at_entry") and row.get("pinnacle_odds_at_close"):
-        clv_result = calculate_clv(row["odds_american"], row["pinnacle_odds_at_close"])
+        clv_result = bet_clv(row["odds_american"], row["pinnacle_odds_at_close"])
         clv_ev_percent = clv_result["clv_ev_percent"]
         beat_close = clv_result["beat_close"]
 
@@ -384,7 +329,7 @@ def build_bet_response(row: dict, k_factor: float) -> BetResponse:
         sportsbook=row["sportsbook"],
         promo_type=row["promo_type"],
         odds_american=row["odds_american"],
-        odds_decimal=decimal_odds,
+        odds_decimal=book_decimal,
         stake=row["stake"],
         boost_percent=row.get("boost_percent"),
         winnings_cap=row.get("winnings_cap"),
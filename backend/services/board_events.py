@@ -0,0 +1,220 @@
+"""
+Board change notifications served by `GET /api/board/events`.
+
+Board drops and scoped refreshes publish small events (the new snapshot id,
+refresh progress) so clients refetch board payloads only when something
+changed instead of polling them. Events go through Redis pub/sub when
+`REDIS_URL` is configured, so subscribers on every worker see them; without
+Redis they fan out in-process. The latest event of each kind is also kept in
+shared state so a (re)connecting client can compare snapshot ids immediately.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable
+from uuid import uuid4
+
+from services.runtime_support import log_event
+from services.shared_state import get_json, open_pubsub, publish_json, set_json
+from utils.time_utils import utc_now_iso_z
+
+BOARD_EVENTS_CHANNEL = "board:events"
+BOARD_EVENTS_LATEST_TTL_SECONDS = 2 * 24 * 60 * 60
+BOARD_EVENT_SUBSCRIBER_QUEUE_SIZE = 32
+BOARD_EVENTS_RETRY_MS = 5000
+
+BOARD_EVENT_SNAPSHOT = "board.snapshot"
+BOARD_EVENT_DROP = "board.drop"
+BOARD_EVENT_REFRESH = "board.refresh"
+_REPLAY_KINDS = (
+    BOARD_EVENT_SNAPSHOT,
+    BOARD_EVENT_DROP,
+    f"{BOARD_EVENT_REFRESH}:straight_bets",
+    f"{BOARD_EVENT_REFRESH}:player_props",
+)
+
+
+def _heartbeat_seconds() -> float:
+    try:
+        return max(1.0, float(os.getenv("BOARD_EVENTS_HEARTBEAT_SECONDS", "20")))
+    except ValueError:
+        return 20.0
+
+
+def _event_kind(event: dict[str, Any]) -> str:
+    event_type = str(event.get("type") or "")
+    if event_type == BOARD_EVENT_REFRESH and event.get("surface"):
+        return f"{event_type}:{event['surface']}"
+    return event_type
+
+
+def _latest_key(kind: str) -> str:
+    return f"board:events:latest:{kind}"
+
+
+class _Subscriber:
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=BOARD_EVENT_SUBSCRIBER_QUEUE_SIZE)
+
+    def push(self, event: dict[str, Any]) -> None:
+        # Runs on the subscriber's loop. A slow client only needs the newest state.
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+
+class BoardEventHub:
+    """Process-local fan-out to SSE subscribers, fed by a Redis listener thread when Redis is configured."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: set[_Subscriber] = set()
+        self._listener: threading.Thread | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def add_subscriber(self) -> _Subscriber:
+        subscriber = _Subscriber(asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.add(subscriber)
+        self._ensure_listener()
+        return subscriber
+
+    def remove_subscriber(self, subscriber: _Subscriber) -> None:
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def deliver(self, event: dict[str, Any]) -> None:
+        """Thread-safe: hand `event` to every subscriber on its own event loop."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.push, event)
+            except RuntimeError:
+                # Subscriber's loop already closed.
+                self.remove_subscriber(subscriber)
+
+    def _ensure_listener(self) -> None:
+        with self._lock:
+            if self._listener is not None and self._listener.is_alive():
+                return
+            try:
+                pubsub = open_pubsub(BOARD_EVENTS_CHANNEL)
+            except Exception as exc:
+                log_event("board.events.subscribe_failed", level="warning", error_class=type(exc).__name__, error=str(exc))
+                return
+            if pubsub is None:
+                return
+            self._listener = threading.Thread(
+                target=self._listen,
+                args=(pubsub,),
+                name="board-events-listener",
+                daemon=True,
+            )
+            self._listener.start()
+
+    def _listen(self, pubsub) -> None:
+        while pubsub is not None:
+            try:
+                for message in pubsub.listen():
+                    try:
+                        event = json.loads(message.get("data") or "")
+                    except (TypeError, ValueError):
+                        continue
+                    if isinstance(event, dict):
+                        self.deliver(event)
+            except Exception as exc:
+                log_event("board.events.listener_failed", level="warning", error_class=type(exc).__name__, error=str(exc))
+            finally:
+                # Release the dead connection before subscribing on a new one.
+                _close_pubsub(pubsub)
+            pubsub = _reopen_pubsub()
+
+
+def _close_pubsub(pubsub) -> None:
+    try:
+        pubsub.close()
+    except Exception:
+        pass
+
+
+def _reopen_pubsub():
+    """Resubscribe after a listener failure, backing off until Redis answers. None means Redis is gone."""
+    while True:
+        time.sleep(1.0)
+        try:
+            return open_pubsub(BOARD_EVENTS_CHANNEL)
+        except Exception as exc:
+            log_event("board.events.subscribe_failed", level="warning", error_class=type(exc).__name__, error=str(exc))
+
+
+_HUB = BoardEventHub()
+
+
+def publish_board_event(event_type: str, **fields: Any) -> dict[str, Any]:
+    """Record and broadcast one board event. Never raises: notifications must not fail a drop or refresh."""
+    event: dict[str, Any] = {
+        "id": uuid4().hex[:16],
+        "type": event_type,
+        "published_at": utc_now_iso_z(timespec="milliseconds"),
+        **fields,
+    }
+    try:
+        set_json(_latest_key(_event_kind(event)), event, BOARD_EVENTS_LATEST_TTL_SECONDS)
+        if not publish_json(BOARD_EVENTS_CHANNEL, event):
+            _HUB.deliver(event)
+    except Exception as exc:
+        log_event(
+            "board.events.publish_failed",
+            level="warning",
+            event_type=event_type,
+            error_class=type(exc).__name__,
+            error=str(exc),
+        )
+    return event
+
+
+def latest_board_events() -> list[dict[str, Any]]:
+    """Most recent event of each kind, oldest first."""
+    events = [event for event in (get_json(_latest_key(kind)) for kind in _REPLAY_KINDS) if isinstance(event, dict)]
+    events.sort(key=lambda event: str(event.get("published_at") or ""))
+    return events
+
+
+def format_sse(event: dict[str, Any]) -> str:
+    data = json.dumps(event, separators=(",", ":"), default=str)
+    return f"id: {event.get('id', '')}\nevent: {event.get('type', 'message')}\ndata: {data}\n\n"
+
+
+async def stream_board_events(
+    *,
+    is_disconnected: Callable[[], Awaitable[bool]] | None = None,
+) -> AsyncIterator[str]:
+    """SSE frames: the latest event of each kind, then live events with periodic keepalive comments."""
+    # Subscribe before reading the replay so nothing published in between is missed.
+    subscriber = _HUB.add_subscriber()
+    try:
+        yield f"retry: {BOARD_EVENTS_RETRY_MS}\n\n"
+        for event in latest_board_events():
+            yield format_sse(event)
+        while True:
+            try:
+                event = await asyncio.wait_for(subscriber.queue.get(), timeout=_heartbeat_seconds())
+            except asyncio.TimeoutError:
+                if is_disconnected is not None and await is_disconnected():
+                    return
+                yield ": keepalive\n\n"
+                continue
+            yield format_sse(event)
+    finally:
+        _HUB.remove_subscriber(subscriber)
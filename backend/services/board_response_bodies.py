@@ -0,0 +1,61 @@
+"""
+Pre-serialized board response bodies.
+
+Board reads used to re-encode the same multi-MB payload on every request.
+Publishers (board snapshots, the straight-bets surface) now serialize and
+compress each new version once, at persist time, and the routes serve those
+bytes with the matching `Content-Encoding`. Other workers build a version the
+first time they serve it. Only the newest version of each body is kept.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Hashable
+
+from services.runtime_support import log_event
+from utils.http_cache import EncodedJsonBody, encode_json_body
+
+BOARD_LATEST_BODY = "board_latest:full"
+STRAIGHT_BETS_SURFACE_BODY = "surface:straight_bets"
+
+_LOCK = threading.Lock()
+_BODIES: dict[str, tuple[Hashable, EncodedJsonBody]] = {}
+
+
+def _store(name: str, version: Hashable, body: EncodedJsonBody) -> None:
+    with _LOCK:
+        _BODIES[name] = (version, body)
+
+
+def publish_board_body(name: str, version: Hashable, build: Callable[[], Any]) -> None:
+    """Encode and keep the body for `version`. Never raises: publishing must not fail a persist."""
+    try:
+        body = encode_json_body(build())
+    except Exception as exc:
+        log_event(
+            "board.response_body.publish_failed",
+            level="warning",
+            body=name,
+            error_class=type(exc).__name__,
+            error=str(exc),
+        )
+        return
+    _store(name, version, body)
+    log_event("board.response_body.published", body=name, bytes=body.size)
+
+
+def get_board_body(name: str, version: Hashable, build: Callable[[], Any]) -> EncodedJsonBody:
+    """Body for `version`, encoding it from `build()` only when this process has not seen it yet."""
+    with _LOCK:
+        entry = _BODIES.get(name)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+    body = encode_json_body(build())
+    _store(name, version, body)
+    return body
+
+
+def reset_board_bodies() -> None:
+    with _LOCK:
+        _BODIES.clear()
@@ -15,6 +15,8 @@ from datetime import UTC, datetime
 from typing import Any, Callable
 from uuid import uuid4
 
+from services.board_response_bodies import BOARD_LATEST_BODY, publish_board_body
+
 
 BOARD_LATEST_KEY = "board:latest"
 
@@ -52,6 +54,29 @@ def _payload_sports_included(payload: dict[str, Any] | None, *, fallback: str) -
     return [fallback]
 
 
+def board_latest_body_version(meta: dict[str, Any]) -> tuple[Any, Any]:
+    return (meta.get("snapshot_id"), meta.get("scanned_at"))
+
+
+def board_latest_response_body(payload: dict[str, Any]) -> dict[str, Any]:
+    """What `GET /api/board/latest` serves for a snapshot: meta and game_context, never the surfaces."""
+    game_context = payload.get("game_context")
+    return {
+        "meta": payload.get("meta"),
+        "game_context": game_context if isinstance(game_context, dict) else None,
+        "straight_bets": None,
+        "player_props": None,
+    }
+
+
+def _publish_board_latest_body(payload: dict[str, Any]) -> None:
+    publish_board_body(
+        BOARD_LATEST_BODY,
+        board_latest_body_version(payload["meta"]),
+        lambda: board_latest_response_body(payload),
+    )
+
+
 def persist_board_snapshot(
     *,
     db,
@@ -122,6 +147,7 @@ def persist_board_snapshot(
                 .execute()
             )
         )
+        _publish_board_latest_body(payload)
     except Exception as e:
         log_event(
             "board_snapshot.persist_failed",
@@ -186,6 +212,7 @@ def persist_board_meta_snapshot(
                 .execute()
             )
         )
+        _publish_board_latest_body(payload)
     except Exception as e:
         log_event(
             "board_snapshot.persist_meta_failed",
@@ -3,6 +3,7 @@ from __future__ import annotations
 import copy
 import json
 from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -243,8 +244,8 @@ def _context_keys(event_id: Any, commence_time: Any) -> list[str]:
     return keys
 
 
-def _build_reference_coverage(sides: list[dict[str, Any]]) -> dict[str, Any]:
-    coverage: dict[str, Any] = {
+def _new_reference_coverage() -> dict[str, Any]:
+    return {
         "straight_events": set(),
         "straight_markets": defaultdict(set),
         "straight_lines": defaultdict(set),
@@ -256,43 +257,9 @@ def _build_reference_coverage(sides: list[dict[str, Any]]) -> dict[str, Any]:
         "prop_sides": defaultdict(set),
     }
 
-    for side in sides:
-        surface = str(side.get("surface") or "straight_bets").strip().lower()
-        contexts = _context_keys(side.get("event_id"), side.get("commence_time"))
-        if not contexts:
-            continue
-        if surface == "player_props":
-            market_key = _normalize_text(side.get("market_key"))
-            player_name = _normalize_text(side.get("player_name"))
-            participant_id = _normalize_participant_id(side.get("participant_id"))
-            selection_side = _normalize_text(side.get("selection_side"))
-            line_value = _normalize_line_value(side.get("line_value"))
-            for context in contexts:
-                coverage["prop_events"].add(context)
-                if market_key:
-                    coverage["prop_markets"][context].add(market_key)
-                for identity_key in _prop_identity_keys(player_name=player_name, participant_id=participant_id):
-                    if market_key:
-                        coverage["prop_players"][(context, market_key)].add(identity_key)
-                    if market_key and line_value is not None:
-                        coverage["prop_lines"][(context, market_key, identity_key)].add(line_value)
-                    if market_key and line_value is not None and selection_side:
-                        coverage["prop_sides"][(context, market_key, identity_key, line_value)].add(selection_side)
-            continue
-
-        market_key = _normalize_text(side.get("market_key")) or "h2h"
-        team = _normalize_text(side.get("team"))
-        line_value = _normalize_line_value(side.get("line_value"))
-        line_key = line_value if market_key in {"spreads", "totals"} else None
-        for context in contexts:
-            coverage["straight_events"].add(context)
-            coverage["straight_markets"][context].add(market_key)
-            if market_key in {"spreads", "totals"} and line_key is not None:
-                coverage["straight_lines"][(context, market_key)].add(line_key)
-            if team:
-                coverage["straight_selections"][(context, market_key, line_key)].add(team)
 
-    return coverage
+def _build_reference_coverage(sides: list[dict[str, Any]]) -> dict[str, Any]:
+    return build_reference_index(sides).coverage
 
 
 def _straight_market_label(row: dict[str, Any]) -> str:
@@ -371,44 +338,143 @@ def _is_missing_scan_opportunities_column_error(error: Exception, *columns: str)
     return any(column.strip().lower() in combined for column in columns if column)
 
 
-def build_reference_snapshots(sides: list[dict[str, Any]]) -> tuple[dict[tuple[str, str], float], dict[tuple[str, str], float]]:
-    snapshot_by_event: dict[tuple[str, str], float] = {}
-    snapshot_by_time: dict[tuple[str, str], float] = {}
-    for side in sides:
-        if str(side.get("surface") or "straight_bets").strip().lower() != "straight_bets":
-            continue
-        event_id = str(side.get("event_id") or "").strip()
-        commence_time = str(side.get("commence_time") or "")
-        team = _normalize_text(side.get("team"))
-        pinnacle_odds = side.get("pinnacle_odds")
-        if pinnacle_odds is None or not team:
+@dataclass
+class ReferenceIndex:
+    """Every reference lookup structure for one batch of fetched sides.
+
+    Built once by `build_reference_index` and shared by the bet, research and
+    pick'em snapshot updaters so a fetch only normalizes its sides one time.
+    """
+
+    straight_snapshot_by_event: dict[tuple[str, str], float] = field(default_factory=dict)
+    straight_snapshot_by_time: dict[tuple[str, str], float] = field(default_factory=dict)
+    straight_pair_by_event: dict[str, dict[str, float]] = field(default_factory=dict)
+    straight_pair_by_time: dict[str, dict[str, float]] = field(default_factory=dict)
+    straight_exact_snapshot_by_event: dict[tuple[str, str, str, float], float] = field(default_factory=dict)
+    straight_exact_snapshot_by_time: dict[tuple[str, str, str, float], float] = field(default_factory=dict)
+    straight_exact_pair_by_event: dict[tuple[str, str, float], dict[str, float]] = field(default_factory=dict)
+    straight_exact_pair_by_time: dict[tuple[str, str, float], dict[str, float]] = field(default_factory=dict)
+    prop_snapshot_by_event: dict[tuple[str, str, str, str, float], float] = field(default_factory=dict)
+    prop_snapshot_by_time: dict[tuple[str, str, str, str, float], float] = field(default_factory=dict)
+    prop_pair_by_event: dict[tuple[str, str, str, float], dict[str, float]] = field(default_factory=dict)
+    prop_pair_by_time: dict[tuple[str, str, str, float], dict[str, float]] = field(default_factory=dict)
+    coverage: dict[str, Any] = field(default_factory=_new_reference_coverage)
+    sports: list[str] = field(default_factory=list)
+
+    def has_straight_references(self) -> bool:
+        return bool(
+            self.straight_snapshot_by_event
+            or self.straight_snapshot_by_time
+            or self.straight_exact_snapshot_by_event
+            or self.straight_exact_snapshot_by_time
+        )
+
+    def has_prop_references(self) -> bool:
+        return bool(self.prop_snapshot_by_event or self.prop_snapshot_by_time)
+
+    def has_references(self) -> bool:
+        return self.has_straight_references() or self.has_prop_references()
+
+
+def _index_straight_side(index: ReferenceIndex, side: dict[str, Any], contexts: list[str], *, surface: str) -> None:
+    raw_market_key = _normalize_text(side.get("market_key"))
+    market_key = raw_market_key or "h2h"
+    team = _normalize_text(side.get("team"))
+    line_value = _normalize_line_value(side.get("line_value"))
+    line_key = line_value if market_key in {"spreads", "totals"} else None
+    coverage = index.coverage
+    for context in contexts:
+        coverage["straight_events"].add(context)
+        coverage["straight_markets"][context].add(market_key)
+        if line_key is not None:
+            coverage["straight_lines"][(context, market_key)].add(line_key)
+        if team:
+            coverage["straight_selections"][(context, market_key, line_key)].add(team)
+
+    pinnacle_odds = side.get("pinnacle_odds")
+    if surface != "straight_bets" or not team or pinnacle_odds is None:
+        return
+    odds = float(pinnacle_odds)
+    event_id = str(side.get("event_id") or "").strip()
+    commence_time = str(side.get("commence_time") or "")
+    if event_id:
+        index.straight_snapshot_by_event[(event_id, team)] = odds
+        index.straight_pair_by_event.setdefault(event_id, {})[team] = odds
+    if commence_time:
+        index.straight_snapshot_by_time[(commence_time, team)] = odds
+        index.straight_pair_by_time.setdefault(commence_time, {})[team] = odds
+    if raw_market_key not in {"spreads", "totals"} or line_value is None:
+        return
+    pair_line = abs(line_value) if raw_market_key == "spreads" else line_value
+    if event_id:
+        index.straight_exact_snapshot_by_event[(event_id, team, raw_market_key, line_value)] = odds
+        index.straight_exact_pair_by_event.setdefault((event_id, raw_market_key, pair_line), {})[team] = odds
+    if commence_time:
+        index.straight_exact_snapshot_by_time[(commence_time, team, raw_market_key, line_value)] = odds
+        index.straight_exact_pair_by_time.setdefault((commence_time, raw_market_key, pair_line), {})[team] = odds
+
+
+def _index_prop_side(index: ReferenceIndex, side: dict[str, Any], contexts: list[str]) -> None:
+    market_key = _normalize_text(side.get("market_key"))
+    selection_side = _normalize_text(side.get("selection_side"))
+    line_value = _normalize_line_value(side.get("line_value"))
+    identity_keys = _prop_identity_keys(player_name=side.get("player_name"), participant_id=side.get("participant_id"))
+    coverage = index.coverage
+    for context in contexts:
+        coverage["prop_events"].add(context)
+        if not market_key:
             continue
-        if commence_time:
-            snapshot_by_time[(commence_time, team)] = float(pinnacle_odds)
+        coverage["prop_markets"][context].add(market_key)
+        for identity_key in identity_keys:
+            coverage["prop_players"][(context, market_key)].add(identity_key)
+            if line_value is not None:
+                coverage["prop_lines"][(context, market_key, identity_key)].add(line_value)
+                if selection_side:
+                    coverage["prop_sides"][(context, market_key, identity_key, line_value)].add(selection_side)
+
+    reference_odds = side.get("reference_odds")
+    if reference_odds is None or not identity_keys or not market_key or not selection_side or line_value is None:
+        return
+    odds = float(reference_odds)
+    event_id = str(side.get("event_id") or "").strip()
+    commence_time = str(side.get("commence_time") or "")
+    for identity_key in identity_keys:
         if event_id:
-            snapshot_by_event[(event_id, team)] = float(pinnacle_odds)
-    return snapshot_by_event, snapshot_by_time
+            index.prop_snapshot_by_event[(event_id, identity_key, market_key, selection_side, line_value)] = odds
+            index.prop_pair_by_event.setdefault((event_id, identity_key, market_key, line_value), {})[selection_side] = odds
+        if commence_time:
+            index.prop_snapshot_by_time[(commence_time, identity_key, market_key, selection_side, line_value)] = odds
+            index.prop_pair_by_time.setdefault((commence_time, identity_key, market_key, line_value), {})[selection_side] = odds
+
+
+def build_reference_index(sides: list[dict[str, Any]]) -> ReferenceIndex:
+    """Normalize each side once and fill every snapshot, pair and coverage map."""
+    index = ReferenceIndex()
+    sports: set[str] = set()
+    for side in sides:
+        sport = str(side.get("sport") or "").strip()
+        if sport:
+            sports.add(sport)
+        surface = str(side.get("surface") or "straight_bets").strip().lower()
+        contexts = _context_keys(side.get("event_id"), side.get("commence_time"))
+        if surface == "player_props":
+            _index_prop_side(index, side, contexts)
+        else:
+            _index_straight_side(index, side, contexts, surface=surface)
+    index.sports = sorted(sports)
+    return index
+
+
+def build_reference_snapshots(sides: list[dict[str, Any]]) -> tuple[dict[tuple[str, str], float], dict[tuple[str, str], float]]:
+    index = build_reference_index(sides)
+    return index.straight_snapshot_by_event, index.straight_snapshot_by_time
 
 
 def build_reference_pair_snapshots(
     sides: list[dict[str, Any]],
 ) -> tuple[dict[str, dict[str, float]], dict[str, dict[str, float]]]:
-    snapshot_by_event: dict[str, dict[str, float]] = {}
-    snapshot_by_time: dict[str, dict[str, float]] = {}
-    for side in sides:
-        if str(side.get("surface") or "straight_bets").strip().lower() != "straight_bets":
-            continue
-        event_id = str(side.get("event_id") or "").strip()
-        commence_time = str(side.get("commence_time") or "")
-        team = _normalize_text(side.get("team"))
-        pinnacle_odds = side.get("pinnacle_odds")
-        if pinnacle_odds is None or not team:
-            continue
-        if event_id:
-            snapshot_by_event.setdefault(event_id, {})[team] = float(pinnacle_odds)
-        if commence_time:
-            snapshot_by_time.setdefault(commence_time, {})[team] = float(pinnacle_odds)
-    return snapshot_by_event, snapshot_by_time
+    index = build_reference_index(sides)
+    return index.straight_pair_by_event, index.straight_pair_by_time
 
 
 def _straight_pair_line_key(market_key: Any, line_value: Any) -> tuple[str, float] | None:
@@ -424,102 +490,29 @@ def _straight_pair_line_key(market_key: Any, line_value: Any) -> tuple[str, floa
 def build_straight_exact_reference_snapshots(
     sides: list[dict[str, Any]],
 ) -> tuple[dict[tuple[str, str, str, float], float], dict[tuple[str, str, str, float], float]]:
-    snapshot_by_event: dict[tuple[str, str, str, float], float] = {}
-    snapshot_by_time: dict[tuple[str, str, str, float], float] = {}
-    for side in sides:
-        if str(side.get("surface") or "straight_bets").strip().lower() != "straight_bets":
-            continue
-        market_key = _normalize_text(side.get("market_key"))
-        team = _normalize_text(side.get("team"))
-        line_value = _normalize_line_value(side.get("line_value"))
-        pinnacle_odds = side.get("pinnacle_odds")
-        if market_key not in {"spreads", "totals"} or not team or line_value is None or pinnacle_odds is None:
-            continue
-        event_id = str(side.get("event_id") or "").strip()
-        commence_time = str(side.get("commence_time") or "")
-        if event_id:
-            snapshot_by_event[(event_id, team, market_key, line_value)] = float(pinnacle_odds)
-        if commence_time:
-            snapshot_by_time[(commence_time, team, market_key, line_value)] = float(pinnacle_odds)
-    return snapshot_by_event, snapshot_by_time
+    index = build_reference_index(sides)
+    return index.straight_exact_snapshot_by_event, index.straight_exact_snapshot_by_time
 
 
 def build_straight_exact_pair_snapshots(
     sides: list[dict[str, Any]],
 ) -> tuple[dict[tuple[str, str, float], dict[str, float]], dict[tuple[str, str, float], dict[str, float]]]:
-    snapshot_by_event: dict[tuple[str, str, float], dict[str, float]] = {}
-    snapshot_by_time: dict[tuple[str, str, float], dict[str, float]] = {}
-    for side in sides:
-        if str(side.get("surface") or "straight_bets").strip().lower() != "straight_bets":
-            continue
-        team = _normalize_text(side.get("team"))
-        pair_key = _straight_pair_line_key(side.get("market_key"), side.get("line_value"))
-        pinnacle_odds = side.get("pinnacle_odds")
-        if not team or pair_key is None or pinnacle_odds is None:
-            continue
-        event_id = str(side.get("event_id") or "").strip()
-        commence_time = str(side.get("commence_time") or "")
-        if event_id:
-            snapshot_by_event.setdefault((event_id, pair_key[0], pair_key[1]), {})[team] = float(pinnacle_odds)
-        if commence_time:
-            snapshot_by_time.setdefault((commence_time, pair_key[0], pair_key[1]), {})[team] = float(pinnacle_odds)
-    return snapshot_by_event, snapshot_by_time
+    index = build_reference_index(sides)
+    return index.straight_exact_pair_by_event, index.straight_exact_pair_by_time
 
 
 def build_prop_reference_snapshots(
     sides: list[dict[str, Any]],
 ) -> tuple[dict[tuple[str, str, str, str, float], float], dict[tuple[str, str, str, str, float], float]]:
-    snapshot_by_event: dict[tuple[str, str, str, str, float], float] = {}
-    snapshot_by_time: dict[tuple[str, str, str, str, float], float] = {}
-    for side in sides:
-        if str(side.get("surface") or "").strip().lower() != "player_props":
-            continue
-        event_id = str(side.get("event_id") or "").strip()
-        commence_time = str(side.get("commence_time") or "")
-        participant_keys = _prop_identity_keys(
-            player_name=side.get("player_name"),
-            participant_id=side.get("participant_id"),
-        )
-        market_key = _normalize_text(side.get("market_key"))
-        selection_side = _normalize_text(side.get("selection_side"))
-        line_value = _normalize_line_value(side.get("line_value"))
-        reference_odds = side.get("reference_odds")
-        if reference_odds is None or not participant_keys or not market_key or not selection_side or line_value is None:
-            continue
-        for participant_key in participant_keys:
-            if commence_time:
-                snapshot_by_time[(commence_time, participant_key, market_key, selection_side, line_value)] = float(reference_odds)
-            if event_id:
-                snapshot_by_event[(event_id, participant_key, market_key, selection_side, line_value)] = float(reference_odds)
-    return snapshot_by_event, snapshot_by_time
+    index = build_reference_index(sides)
+    return index.prop_snapshot_by_event, index.prop_snapshot_by_time
 
 
 def build_prop_reference_pair_snapshots(
     sides: list[dict[str, Any]],
 ) -> tuple[dict[tuple[str, str, str, float], dict[str, float]], dict[tuple[str, str, str, float], dict[str, float]]]:
-    snapshot_by_event: dict[tuple[str, str, str, float], dict[str, float]] = {}
-    snapshot_by_time: dict[tuple[str, str, str, float], dict[str, float]] = {}
-    for side in sides:
-        if str(side.get("surface") or "").strip().lower() != "player_props":
-            continue
-        participant_keys = _prop_identity_keys(
-            player_name=side.get("player_name"),
-            participant_id=side.get("participant_id"),
-        )
-        market_key = _normalize_text(side.get("market_key"))
-        selection_side = _normalize_text(side.get("selection_side"))
-        line_value = _normalize_line_value(side.get("line_value"))
-        reference_odds = side.get("reference_odds")
-        if reference_odds is None or not participant_keys or not market_key or not selection_side or line_value is None:
-            continue
-        event_id = str(side.get("event_id") or "").strip()
-        commence_time = str(side.get("commence_time") or "")
-        for participant_key in participant_keys:
-            if event_id:
-                snapshot_by_event.setdefault((event_id, participant_key, market_key, line_value), {})[selection_side] = float(reference_odds)
-            if commence_time:
-                snapshot_by_time.setdefault((commence_time, participant_key, market_key, line_value), {})[selection_side] = float(reference_odds)
-    return snapshot_by_event, snapshot_by_time
+    index = build_reference_index(sides)
+    return index.prop_pair_by_event, index.prop_pair_by_time
 
 
 def lookup_reference_odds(
@@ -1396,6 +1389,11 @@ def finalize_tracked_clv_closes_from_latest(
             updated_summary["pickem_updates"]["close_rejected_count"] += 1
             _mark_snapshot_reason(updated_summary["pickem_updates"], "latest_not_in_close_window")
 
+    if updated_summary["research_updates"]["close_updated"]:
+        from services.research_opportunities import invalidate_research_opportunities_summary_cache
+
+        invalidate_research_opportunities_summary_cache()
+
     return {
         "job_source": "clv_finalize",
         "grace_minutes": grace_minutes,
@@ -1428,30 +1426,26 @@ def update_bet_reference_snapshots(
     sides: list[dict[str, Any]],
     allow_close: bool,
     now: datetime | None = None,
+    reference_index: ReferenceIndex | None = None,
     allow_retroactive_close_capture: bool = False,
 ) -> dict[str, Any]:
     if not sides:
         return _normalize_snapshot_summary(_new_snapshot_update_summary())
 
-    straight_snapshot_by_event, straight_snapshot_by_time = build_reference_snapshots(sides)
-    straight_exact_snapshot_by_event, straight_exact_snapshot_by_time = build_straight_exact_reference_snapshots(sides)
-    prop_snapshot_by_event, prop_snapshot_by_time = build_prop_reference_snapshots(sides)
-    straight_pair_by_event, straight_pair_by_time = build_reference_pair_snapshots(sides)
-    straight_exact_pair_by_event, straight_exact_pair_by_time = build_straight_exact_pair_snapshots(sides)
-    prop_pair_by_event, prop_pair_by_time = build_prop_reference_pair_snapshots(sides)
-    coverage = _build_reference_coverage(sides)
-
-    if (
-        not straight_snapshot_by_event
-        and not straight_snapshot_by_time
-        and not straight_exact_snapshot_by_event
-        and not straight_exact_snapshot_by_time
-        and not prop_snapshot_by_event
-        and not prop_snapshot_by_time
-    ):
+    index = reference_index or build_reference_index(sides)
+    straight_snapshot_by_event, straight_snapshot_by_time = index.straight_snapshot_by_event, index.straight_snapshot_by_time
+    straight_exact_snapshot_by_event = index.straight_exact_snapshot_by_event
+    straight_exact_snapshot_by_time = index.straight_exact_snapshot_by_time
+    prop_snapshot_by_event, prop_snapshot_by_time = index.prop_snapshot_by_event, index.prop_snapshot_by_time
+    straight_pair_by_event, straight_pair_by_time = index.straight_pair_by_event, index.straight_pair_by_time
+    straight_exact_pair_by_event, straight_exact_pair_by_time = index.straight_exact_pair_by_event, index.straight_exact_pair_by_time
+    prop_pair_by_event, prop_pair_by_time = index.prop_pair_by_event, index.prop_pair_by_time
+    coverage = index.coverage
+
+    if not index.has_references():
         return _normalize_snapshot_summary(_new_snapshot_update_summary())
 
-    sports = sorted({str(side.get("sport") or "").strip() for side in sides if side.get("sport")})
+    sports = index.sports
     sports_set = {s for s in sports if s}
     query = (
         db.table("bets")
@@ -1619,30 +1613,26 @@ def update_scan_opportunity_reference_snapshots(
     sides: list[dict[str, Any]],
     allow_close: bool,
     now: datetime | None = None,
+    reference_index: ReferenceIndex | None = None,
 ) -> dict[str, Any]:
     if not sides:
         return {"latest_updated": 0, "close_updated": 0}
 
-    straight_snapshot_by_event, straight_snapshot_by_time = build_reference_snapshots(sides)
-    straight_exact_snapshot_by_event, straight_exact_snapshot_by_time = build_straight_exact_reference_snapshots(sides)
-    prop_snapshot_by_event, prop_snapshot_by_time = build_prop_reference_snapshots(sides)
-    straight_pair_by_event, straight_pair_by_time = build_reference_pair_snapshots(sides)
-    straight_exact_pair_by_event, straight_exact_pair_by_time = build_straight_exact_pair_snapshots(sides)
-    prop_pair_by_event, prop_pair_by_time = build_prop_reference_pair_snapshots(sides)
-    coverage = _build_reference_coverage(sides)
-    if (
-        not straight_snapshot_by_event
-        and not straight_snapshot_by_time
-        and not straight_exact_snapshot_by_event
-        and not straight_exact_snapshot_by_time
-        and not prop_snapshot_by_event
-        and not prop_snapshot_by_time
-    ):
+    index = reference_index or build_reference_index(sides)
+    straight_snapshot_by_event, straight_snapshot_by_time = index.straight_snapshot_by_event, index.straight_snapshot_by_time
+    straight_exact_snapshot_by_event = index.straight_exact_snapshot_by_event
+    straight_exact_snapshot_by_time = index.straight_exact_snapshot_by_time
+    prop_snapshot_by_event, prop_snapshot_by_time = index.prop_snapshot_by_event, index.prop_snapshot_by_time
+    straight_pair_by_event, straight_pair_by_time = index.straight_pair_by_event, index.straight_pair_by_time
+    straight_exact_pair_by_event, straight_exact_pair_by_time = index.straight_exact_pair_by_event, index.straight_exact_pair_by_time
+    prop_pair_by_event, prop_pair_by_time = index.prop_pair_by_event, index.prop_pair_by_time
+    coverage = index.coverage
+    if not index.has_references():
         return {"latest_updated": 0, "close_updated": 0}
 
     from services.research_opportunities import is_missing_scan_opportunities_error
 
-    sports = sorted({str(side.get("sport") or "").strip() for side in sides if side.get("sport")})
+    sports = index.sports
     try:
         query = (
             db.table("scan_opportunities")
@@ -1811,6 +1801,11 @@ def update_scan_opportunity_reference_snapshots(
                 _mark_snapshot_reason(summary, "write_failed")
                 raise
 
+    if summary.get("close_updated"):
+        from services.research_opportunities import invalidate_research_opportunities_summary_cache
+
+        invalidate_research_opportunities_summary_cache()
+
     return {
         "latest_updated": int(summary.get("latest_updated", 0)),
         "close_updated": int(summary.get("close_updated", 0)),
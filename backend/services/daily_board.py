@@ -294,8 +294,56 @@ async def run_daily_board_drop(
     4) Scan player props for the supported NBA + MLB slates using sport-specific market sets.
     5) Capture research opportunities from fresh board sides.
     6) Persist board:latest with game_context + straight_bets + player_props.
+
+    Progress and the new snapshot id are published as board events for
+    `/api/board/events` subscribers.
     """
+    from services.board_events import BOARD_EVENT_DROP, publish_board_event
+
+    run_id = f"board_{uuid4().hex[:12]}"
+    publish_board_event(BOARD_EVENT_DROP, run_id=run_id, source=source, status="started")
+    try:
+        result = await _run_daily_board_drop(
+            run_id=run_id,
+            db=db,
+            source=source,
+            scan_label=scan_label,
+            mst_anchor_time=mst_anchor_time,
+            retry_supabase=retry_supabase,
+            log_event=log_event,
+        )
+    except Exception as exc:
+        publish_board_event(
+            BOARD_EVENT_DROP,
+            run_id=run_id,
+            source=source,
+            status="failed",
+            error_class=type(exc).__name__,
+        )
+        raise
+    publish_board_event(
+        BOARD_EVENT_DROP,
+        run_id=run_id,
+        source=source,
+        status="completed",
+        snapshot_id=result.get("snapshot_id"),
+        duration_ms=result.get("duration_ms"),
+    )
+    return result
+
+
+async def _run_daily_board_drop(
+    *,
+    run_id: str,
+    db,
+    source: str,
+    scan_label: str,
+    mst_anchor_time: str | None,
+    retry_supabase: Callable,
+    log_event: Callable[..., None],
+) -> dict[str, Any]:
     from models import FullScanResponse as _FSR
+    from services.board_events import BOARD_EVENT_DROP, BOARD_EVENT_SNAPSHOT, publish_board_event
     from services.board_snapshot import persist_board_meta_snapshot
     from services.odds_api import fetch_events, fetch_featured_lines_slate, get_cached_or_scan
     from services.pickem_research import capture_pickem_research_observations
@@ -314,13 +362,13 @@ async def run_daily_board_drop(
     )
     from services.research_opportunities import capture_scan_opportunities
     from services.scan_cache import persist_latest_scan_payload
+    from services.scan_payload import SCAN_PAYLOAD_SCHEMA_VERSION
     from services.scan_markets import (
         aggregate_manual_scan_all_sports,
         manual_scan_sports_for_env,
         scanned_at_from_fetched_timestamp,
     )
 
-    run_id = f"board_{uuid4().hex[:12]}"
     started_at = time.monotonic()
     scanned_at = _utc_now_iso()
 
@@ -441,6 +489,13 @@ async def run_daily_board_drop(
         rss_mb=rss_mb(),
         approx_bytes_sampled=_approx_sampled_json_bytes({"sides": straight_sides}, sample_sides=80),
     )
+    publish_board_event(
+        BOARD_EVENT_DROP,
+        run_id=run_id,
+        source=source,
+        status="straight_built",
+        straight_sides=len(straight_sides),
+    )
 
     prop_results_by_sport: list[tuple[str, dict[str, Any]]] = []
     for sport_key in prop_sports:
@@ -486,6 +541,13 @@ async def run_daily_board_drop(
         rss_mb=rss_mb(),
         approx_bytes_sampled=_approx_sampled_json_bytes({"sides": props_sides}, sample_sides=80) if isinstance(props_sides, list) else None,
     )
+    publish_board_event(
+        BOARD_EVENT_DROP,
+        run_id=run_id,
+        source=source,
+        status="props_built",
+        props_sides=len(props_sides) if isinstance(props_sides, list) else None,
+    )
 
     # Persist +EV board sides into scan_opportunities for both surfaces.
     if db is not None:
@@ -527,6 +589,7 @@ async def run_daily_board_drop(
             )
 
     # Build payload dicts manually to avoid Pydantic model_dump() copying large sides arrays.
+    # `schema_version` marks them as scanner output that readers may serve without revalidation.
     straight_payload: dict[str, Any] = {
         "surface": "straight_bets",
         "sport": "all",
@@ -537,6 +600,7 @@ async def run_daily_board_drop(
         "scanned_at": straight_scanned_at,
         "diagnostics": straight_aggregate.get("diagnostics"),
         "prizepicks_cards": straight_aggregate.get("prizepicks_cards"),
+        "schema_version": SCAN_PAYLOAD_SCHEMA_VERSION,
     }
 
     props_payload: dict[str, Any] = {
@@ -550,13 +614,15 @@ async def run_daily_board_drop(
         "diagnostics": props_result.get("diagnostics"),
         "pickem_cards": props_result.get("pickem_cards"),
         "prizepicks_cards": props_result.get("prizepicks_cards"),
+        "schema_version": SCAN_PAYLOAD_SCHEMA_VERSION,
     }
 
     board_props_artifacts_summary: dict[str, Any] | None = None
     if db is not None:
         board_chunk_size = int(os.getenv("PLAYER_PROPS_BOARD_CHUNK_SIZE") or "250") or 250
         board_legacy_max = int(os.getenv("PLAYER_PROPS_BOARD_LEGACY_MAX_ITEMS") or "150") or 150
-        board_props_artifacts_summary = persist_player_prop_board_artifacts(
+        board_props_artifacts_summary = await asyncio.to_thread(
+            persist_player_prop_board_artifacts,
             db=db,
             payload=props_payload,
             retry_supabase=retry_supabase,
@@ -716,7 +782,8 @@ async def run_daily_board_drop(
         )
 
         try:
-            persist_latest_scan_payload(
+            await asyncio.to_thread(
+                persist_latest_scan_payload,
                 db=db,
                 payload=straight_payload_to_persist,
                 retry_supabase=retry_supabase,
@@ -733,7 +800,8 @@ async def run_daily_board_drop(
                 error=str(exc),
             )
         try:
-            persist_latest_scan_payload(
+            await asyncio.to_thread(
+                persist_latest_scan_payload,
                 db=db,
                 payload=props_payload_to_persist,
                 retry_supabase=retry_supabase,
@@ -770,7 +838,8 @@ async def run_daily_board_drop(
             source=source,
             rss_mb=rss_mb(),
         )
-        snapshot_id = persist_board_meta_snapshot(
+        snapshot_id = await asyncio.to_thread(
+            persist_board_meta_snapshot,
             db=db,
             snapshot_type="scheduled",
             scanned_at=scanned_at,
@@ -789,6 +858,14 @@ async def run_daily_board_drop(
             snapshot_id=snapshot_id,
             rss_mb=rss_mb(),
         )
+        publish_board_event(
+            BOARD_EVENT_SNAPSHOT,
+            snapshot_id=snapshot_id,
+            snapshot_type="scheduled",
+            scanned_at=scanned_at,
+            surfaces_included=["straight_bets", "player_props"],
+            run_id=run_id,
+        )
 
     duration_ms = round((time.monotonic() - started_at) * 1000, 2)
     props_diagnostics = props_result.get("diagnostics") if isinstance(props_result.get("diagnostics"), dict) else {}
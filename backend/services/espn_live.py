@@ -10,6 +10,7 @@ from services.espn_scoreboard import (
     fetch_nba_game_summary,
     fetch_nba_scoreboard_for_date,
 )
+from services.live_game_state import LiveStateCache
 from services.live_provider_contracts import (
     LiveBetCandidate,
     LivePlayerStatRequest,
@@ -19,12 +20,13 @@ from services.live_provider_contracts import (
 from services.prop_settler import (
     NBA_SPORT_KEY,
     PROP_MARKET_TO_ESPN_STAT,
+    PlayerNameIndex,
     _market_stat_value_from_player_stats,
-    _match_player_stat_key,
     _normalize_player_name,
     _parse_utc_iso,
     build_player_stat_map,
 )
+from services.provider_event_map import find_mapped_event, remember_live_event_match
 from services.shared_state import get_json, set_json
 from services.team_aliases import canonical_short_name, canonical_team_token
 
@@ -36,6 +38,8 @@ _STALE_EVENT_TTL_SECONDS = 10 * 60
 _FRESH_SUMMARY_TTL_SECONDS = 60
 _STALE_SUMMARY_TTL_SECONDS = 10 * 60
 _MAX_MATCH_DRIFT = timedelta(hours=18)
+_SCOREBOARD_STATE: LiveStateCache[tuple[list[LiveEventSnapshot], bool, bool]] = LiveStateCache("espn.scoreboard")
+_PLAYER_STATE: LiveStateCache[tuple[PlayerNameIndex, bool, bool]] = LiveStateCache("espn.players")
 
 
 def _utc_now() -> datetime:
@@ -252,6 +256,29 @@ async def _fetch_cached_summary(event_id: str) -> tuple[dict[str, Any], bool, bo
         return {}, False, False
 
 
+async def _scoreboard_events_for_date(date_value: str) -> tuple[list[LiveEventSnapshot], bool, bool]:
+    """Normalized scoreboard events for one date, parsed once per refresh window."""
+
+    async def _load() -> tuple[list[LiveEventSnapshot], bool, bool]:
+        rows, cache_hit, stale = await _fetch_cached_scoreboard_date(date_value)
+        events = [event for event in (normalize_espn_nba_event(row, stale=stale) for row in rows) if event is not None]
+        return events, cache_hit, stale
+
+    (events, cache_hit, stale), from_memory = await _SCOREBOARD_STATE.get(date_value, _load)
+    return events, cache_hit or from_memory, stale
+
+
+async def _player_index_for_event(event_id: str) -> tuple[PlayerNameIndex, bool, bool]:
+    """Player stat lines for one game, indexed once per refresh window and shared by every bet."""
+
+    async def _load() -> tuple[PlayerNameIndex, bool, bool]:
+        summary, cache_hit, stale = await _fetch_cached_summary(event_id)
+        return PlayerNameIndex(build_player_stat_map(summary, sport=NBA_SPORT_KEY)), cache_hit, stale
+
+    (name_index, cache_hit, stale), from_memory = await _PLAYER_STATE.get(event_id, _load)
+    return name_index, cache_hit or from_memory, stale
+
+
 def _candidate_dates(candidates: list[LiveBetCandidate], now: datetime | None) -> list[str]:
     dates: list[str] = []
     seen: set[str] = set()
@@ -383,11 +410,10 @@ async def _match_event_by_player_summary(
     for event in _candidate_player_summary_events(candidate, events):
         if event.status not in {"live", "final"}:
             continue
-        summary, cache_hit, stale = await _fetch_cached_summary(event.provider_event_id)
+        name_index, cache_hit, stale = await _player_index_for_event(event.provider_event_id)
         any_cache_hit = any_cache_hit or cache_hit
         any_stale = any_stale or stale
-        stat_map = build_player_stat_map(summary, sport=NBA_SPORT_KEY)
-        player_stats, _match_kind = _match_player_stat_key(norm, participant, stat_map)
+        player_stats, _match_kind = name_index.match(norm, participant)
         if player_stats is not None:
             matches.append(event)
 
@@ -414,36 +440,50 @@ class EspnLiveProvider:
         if not nba_candidates:
             return {}
 
-        rows: list[dict[str, Any]] = []
+        normalized: list[LiveEventSnapshot] = []
+        seen: set[str] = set()
         any_cache_hit = False
         any_stale = False
         for date_value in _candidate_dates(nba_candidates, now):
-            date_rows, cache_hit, stale = await _fetch_cached_scoreboard_date(date_value)
-            rows.extend(date_rows)
+            date_events, cache_hit, stale = await _scoreboard_events_for_date(date_value)
             any_cache_hit = any_cache_hit or cache_hit
             any_stale = any_stale or stale
-
-        normalized: list[LiveEventSnapshot] = []
-        seen: set[str] = set()
-        for row in rows:
-            event = normalize_espn_nba_event(row, stale=any_stale)
-            if event is None or event.provider_event_id in seen:
-                continue
-            seen.add(event.provider_event_id)
-            normalized.append(event)
+            for event in date_events:
+                if event.provider_event_id in seen:
+                    continue
+                seen.add(event.provider_event_id)
+                normalized.append(event)
 
         out: dict[str, ProviderLookupResult] = {}
         for candidate in nba_candidates:
-            event, confidence, reason = _match_event_for_candidate(candidate, normalized)
             candidate_cache_hit = any_cache_hit
             candidate_stale = any_stale
-            if event is None and reason == "missing_team_mapping":
-                event, confidence, reason, summary_cache_hit, summary_stale = await _match_event_by_player_summary(
+            event, mapping = find_mapped_event(
+                NBA_SPORT_KEY,
+                ESPN_PROVIDER,
+                odds_event_ids=(candidate.source_event_id, candidate.clv_event_id),
+                events=normalized,
+            )
+            if event is not None:
+                confidence, reason = "provider_event_map", None
+            else:
+                event, confidence, reason = _match_event_for_candidate(candidate, normalized)
+                if event is None and reason == "missing_team_mapping":
+                    event, confidence, reason, summary_cache_hit, summary_stale = await _match_event_by_player_summary(
+                        candidate,
+                        normalized,
+                    )
+                    candidate_cache_hit = candidate_cache_hit or summary_cache_hit
+                    candidate_stale = candidate_stale or summary_stale
+                mapping = None
+            if event is not None:
+                remember_live_event_match(
                     candidate,
-                    normalized,
+                    event,
+                    provider=ESPN_PROVIDER,
+                    confidence=confidence,
+                    mapping=mapping,
                 )
-                candidate_cache_hit = candidate_cache_hit or summary_cache_hit
-                candidate_stale = candidate_stale or summary_stale
             out[candidate.bet_id] = ProviderLookupResult(
                 candidate=candidate,
                 event=event,
@@ -478,10 +518,9 @@ class EspnLiveProvider:
                 )
                 continue
 
-            summary, cache_hit, stale = await _fetch_cached_summary(request.provider_event_id)
-            stat_map = build_player_stat_map(summary, sport=NBA_SPORT_KEY)
+            name_index, cache_hit, stale = await _player_index_for_event(request.provider_event_id)
             norm = _normalize_player_name(participant)
-            player_stats, match_kind = _match_player_stat_key(norm, participant, stat_map)
+            player_stats, match_kind = name_index.match(norm, participant)
             if player_stats is None:
                 out[candidate.bet_id] = ProviderPlayerStatResult(
                     request=request,
@@ -0,0 +1,218 @@
+"""
+Per-event Odds API prop requests merged across jobs.
+
+`scan_player_props`, CLV close capture, the alt pitcher-K lookup and scoped
+board refreshes each fetch `/events/{id}/odds` for their own market list, so
+one event could be billed several times within minutes for overlapping
+markets. Requests for an event arriving within `EVENT_ODDS_BATCH_WINDOW_MS`
+of each other now go out as one call over the union of their still-missing
+markets. Responses are kept per (event, market) for
+`EVENT_ODDS_SLICE_TTL_SECONDS` and every caller gets an event payload holding
+only the markets it asked for. Assembled payloads share market objects with
+the cache and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+from services.odds_api_budget import JOB_PRIORITIES, job_class_for_source
+
+EventOddsFetch = Callable[..., Awaitable[tuple[dict, httpx.Response]]]
+
+EVENT_ODDS_MAX_EVENTS = 512
+
+_REGISTRY: list["EventOddsBroker"] = []
+
+
+def _batch_window_seconds() -> float:
+    try:
+        return max(0.0, float(os.getenv("EVENT_ODDS_BATCH_WINDOW_MS", "20"))) / 1000.0
+    except ValueError:
+        return 0.02
+
+
+def _slice_ttl_seconds() -> float:
+    try:
+        return max(0.0, float(os.getenv("EVENT_ODDS_SLICE_TTL_SECONDS", "60")))
+    except ValueError:
+        return 60.0
+
+
+@dataclass
+class EventOddsBrokerStats:
+    hits: int = 0
+    calls: int = 0
+    merged: int = 0
+    joined: int = 0
+
+
+@dataclass
+class _EventEntry:
+    event: dict[str, Any]
+    # Bookmaker fields other than `markets`, in response order.
+    books: dict[str, dict[str, Any]] = field(default_factory=dict)
+    # market key -> (expires_at, bookmaker key -> market object)
+    slices: dict[str, tuple[float, dict[str, dict[str, Any]]]] = field(default_factory=dict)
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class _Batch:
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    markets: set[str] = field(default_factory=set)
+    sources: list[str] = field(default_factory=list)
+    sent: bool = False
+    task: asyncio.Task | None = None
+
+
+class EventOddsBroker:
+    """Merges concurrent per-event market requests into single calls and serves per-market slices."""
+
+    def __init__(self, fetch: EventOddsFetch) -> None:
+        self._fetch = fetch
+        self.stats = EventOddsBrokerStats()
+        self._entries: dict[tuple[str, str], _EventEntry] = {}
+        self._batches: dict[tuple[str, str], list[_Batch]] = {}
+        _REGISTRY.append(self)
+
+    async def fetch(self, *, sport: str, event_id: str, markets: list[str], source: str) -> tuple[dict, httpx.Response]:
+        key = (sport, event_id)
+        wanted = list(dict.fromkeys(markets))
+        missing = self._missing(key, wanted)
+        if not missing:
+            self.stats.hits += 1
+            return self._assemble(key, wanted), self._cached_response(key)
+
+        loop = asyncio.get_running_loop()
+        batches = [batch for batch in self._batches.get(key, []) if batch.loop is loop]
+        waits: list[_Batch] = []
+        for batch in batches:
+            if batch.sent and batch.markets & missing:
+                waits.append(batch)
+                missing -= batch.markets
+        if waits:
+            self.stats.joined += 1
+        if missing:
+            collecting = next((batch for batch in batches if not batch.sent), None)
+            if collecting is None:
+                collecting = self._open_batch(key, loop)
+            else:
+                self.stats.merged += 1
+            collecting.markets |= missing
+            collecting.sources.append(source)
+            waits.append(collecting)
+
+        responses = await asyncio.gather(*(asyncio.shield(batch.future) for batch in waits))
+        return self._assemble(key, wanted), responses[-1]
+
+    def _open_batch(self, key: tuple[str, str], loop: asyncio.AbstractEventLoop) -> _Batch:
+        batch = _Batch(loop=loop, future=loop.create_future())
+        self._batches.setdefault(key, []).append(batch)
+        batch.task = loop.create_task(self._send(key, batch))
+        return batch
+
+    async def _send(self, key: tuple[str, str], batch: _Batch) -> None:
+        try:
+            await asyncio.sleep(_batch_window_seconds())
+            batch.sent = True
+            # The merged call is billed to the most urgent job waiting on it.
+            source = min(batch.sources, key=lambda item: JOB_PRIORITIES.get(job_class_for_source(item), len(JOB_PRIORITIES)))
+            markets = sorted(batch.markets)
+            self.stats.calls += 1
+            payload, resp = await self._fetch(sport=key[0], event_id=key[1], markets=markets, source=source)
+            self._store(key, payload, markets, resp)
+        except asyncio.CancelledError:
+            batch.future.cancel()
+            raise
+        except Exception as exc:
+            batch.future.set_exception(exc)
+            # Waiters re-raise it; mark retrieved so a failure nobody awaited is not logged.
+            batch.future.exception()
+        else:
+            batch.future.set_result(resp)
+        finally:
+            pending = self._batches.get(key, [])
+            if batch in pending:
+                pending.remove(batch)
+            if not pending:
+                self._batches.pop(key, None)
+
+    def _missing(self, key: tuple[str, str], markets: list[str]) -> set[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return set(markets)
+        now = time.monotonic()
+        return {market for market in markets if market not in entry.slices or entry.slices[market][0] <= now}
+
+    def _store(self, key: tuple[str, str], payload: dict, markets: list[str], resp: httpx.Response) -> None:
+        now = time.monotonic()
+        if key not in self._entries and len(self._entries) >= EVENT_ODDS_MAX_EVENTS:
+            self._prune(now)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _EventEntry(event={})
+        entry.event = {name: value for name, value in payload.items() if name != "bookmakers"}
+        entry.headers = {**resp.headers, "x-requests-last": "0"}
+        expires_at = now + _slice_ttl_seconds()
+        fetched: dict[str, dict[str, dict[str, Any]]] = {market: {} for market in markets}
+        for bookmaker in payload.get("bookmakers") or []:
+            book_key = bookmaker.get("key")
+            if not book_key:
+                continue
+            entry.books[book_key] = {name: value for name, value in bookmaker.items() if name != "markets"}
+            for market in bookmaker.get("markets") or []:
+                market_key = market.get("key")
+                if market_key in fetched:
+                    fetched[market_key][book_key] = market
+        for market_key, by_book in fetched.items():
+            entry.slices[market_key] = (expires_at, by_book)
+
+    def _prune(self, now: float) -> None:
+        for key in [k for k, entry in self._entries.items() if all(exp <= now for exp, _ in entry.slices.values())]:
+            self._entries.pop(key, None)
+        while len(self._entries) >= EVENT_ODDS_MAX_EVENTS:
+            self._entries.pop(next(iter(self._entries)))
+
+    def _assemble(self, key: tuple[str, str], markets: list[str]) -> dict:
+        entry = self._entries.get(key)
+        if entry is None:
+            return {"id": key[1], "bookmakers": []}
+        slices = [entry.slices[market][1] for market in markets if market in entry.slices]
+        bookmakers = []
+        for book_key, book in entry.books.items():
+            book_markets = [by_book[book_key] for by_book in slices if book_key in by_book]
+            if book_markets:
+                bookmakers.append({**book, "markets": book_markets})
+        return {**entry.event, "bookmakers": bookmakers}
+
+    def _cached_response(self, key: tuple[str, str]) -> httpx.Response:
+        entry = self._entries.get(key)
+        return httpx.Response(200, headers=entry.headers if entry is not None else {"x-requests-last": "0"})
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._batches.clear()
+        self.stats = EventOddsBrokerStats()
+
+
+def get_event_odds_broker_metrics() -> dict[str, int]:
+    totals = EventOddsBrokerStats()
+    for broker in _REGISTRY:
+        totals.hits += broker.stats.hits
+        totals.calls += broker.stats.calls
+        totals.merged += broker.stats.merged
+        totals.joined += broker.stats.joined
+    return {"hits": totals.hits, "calls": totals.calls, "merged": totals.merged, "joined": totals.joined}
+
+
+def reset_event_odds_brokers() -> None:
+    for broker in _REGISTRY:
+        broker.clear()
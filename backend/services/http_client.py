@@ -7,6 +7,8 @@ from typing import Any, Iterable
 
 import httpx
 
+from utils.request_context import record_http_roundtrip
+
 _CLIENT: httpx.AsyncClient | None = None
 _CLIENT_LOCK = asyncio.Lock()
 
@@ -89,6 +91,7 @@ async def request_with_retries(
     attempts = max(1, retries + 1)
 
     for attempt in range(attempts):
+        started_at = time.monotonic()
         try:
             upper = method.upper()
 
@@ -140,6 +143,7 @@ async def request_with_retries(
                         resp = await client.post(url, json=json)
                 else:
                     raise AttributeError("http client lacks request/get/post")
+            record_http_roundtrip(round((time.monotonic() - started_at) * 1000, 2))
             if resp.status_code in set(retryable_status_codes) and attempt < attempts - 1:
                 # Drain body to release connection back to pool.
                 try:
@@ -152,6 +156,7 @@ async def request_with_retries(
             return resp
         except Exception as exc:
             last_exc = exc if isinstance(exc, Exception) else Exception(str(exc))
+            record_http_roundtrip(round((time.monotonic() - started_at) * 1000, 2))
             if attempt >= attempts - 1 or not _is_retryable_httpx_error(last_exc):
                 raise
             sleep_s = min(2.0, 0.25 * (2**attempt)) + random.random() * 0.15
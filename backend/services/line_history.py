@@ -0,0 +1,248 @@
+"""
+Append-only line-movement history per (event, market, selection, book).
+
+Fresh straight scans already carry every target-book price and the Pinnacle
+reference for each selection. Instead of overwriting those, each scan appends
+them to `line_history`: one row per series holding the opening tick time and a
+JSONB list of `[seconds_since_previous_tick, price_delta]` pairs. The first
+pair is `[0, opening_price]`, and a pair is only appended when the price moves,
+so a quiet line costs one `last_seen_at` update per scan.
+
+Writes go through the `append_line_history_ticks` merge function (migration
+028) and fall back to select-then-upsert while it is missing. Reads decode a
+series back into `(datetime, american_price)` points for range queries and
+downsampling, without any Odds API calls.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any, Callable
+
+from services.supabase_merge import is_missing_rpc_function_error, merge_rows_via_rpc
+
+LINE_HISTORY_TABLE = "line_history"
+LINE_HISTORY_APPEND_FUNCTION = "append_line_history_ticks"
+REFERENCE_SPORTSBOOK = "Pinnacle"
+LINE_HISTORY_RETENTION_DAYS = int(os.getenv("LINE_HISTORY_RETENTION_DAYS", "30"))
+LINE_HISTORY_PRUNE_INTERVAL_SECONDS = 6 * 60 * 60
+_SELECT_CHUNK_SIZE = 200
+
+_PRUNE_LOCK = threading.Lock()
+_LAST_PRUNE_ATTEMPT_MONOTONIC = 0.0
+
+LinePoint = tuple[datetime, int]
+
+
+def _book_slug(sportsbook: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "", sportsbook.lower())
+
+
+def _american_price(value: Any) -> int | None:
+    try:
+        price = int(round(float(value)))
+    except (TypeError, ValueError):
+        return None
+    return price if abs(price) >= 100 else None
+
+
+def _parse_iso(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(UTC)
+
+
+def _iso(value: datetime) -> str:
+    return value.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def build_line_ticks(sides: list[dict[str, Any]], *, captured_at: str) -> list[dict[str, Any]]:
+    """One tick per (selection, book) in `sides`: each side's target-book price plus its Pinnacle reference."""
+    # Whole seconds keep the stored time deltas exact.
+    tick_at = _iso(_parse_iso(captured_at))
+    ticks: dict[str, dict[str, Any]] = {}
+    for side in sides:
+        event_id = str(side.get("event_id") or "").strip()
+        selection_key = str(side.get("selection_key") or "").strip()
+        if not event_id or not selection_key:
+            continue
+        quotes = ((str(side.get("sportsbook") or "").strip(), side.get("book_odds")), (REFERENCE_SPORTSBOOK, side.get("pinnacle_odds")))
+        for sportsbook, raw_price in quotes:
+            price = _american_price(raw_price)
+            if not sportsbook or price is None:
+                continue
+            series_key = f"{selection_key}|{_book_slug(sportsbook)}"
+            ticks[series_key] = {
+                "series_key": series_key,
+                "sport": side.get("sport"),
+                "event_id": event_id,
+                "market_key": side.get("market_key"),
+                "selection_key": selection_key,
+                "sportsbook": sportsbook,
+                "commence_time": side.get("commence_time"),
+                "price": price,
+                "tick_at": tick_at,
+            }
+    return list(ticks.values())
+
+
+def merge_line_tick(row: dict[str, Any] | None, tick: dict[str, Any]) -> dict[str, Any]:
+    """The `line_history` row after appending `tick`; mirrors `append_line_history_ticks`."""
+    if row is None:
+        return {
+            "series_key": tick["series_key"],
+            "sport": tick.get("sport"),
+            "event_id": tick["event_id"],
+            "market_key": tick.get("market_key"),
+            "selection_key": tick["selection_key"],
+            "sportsbook": tick["sportsbook"],
+            "commence_time": tick.get("commence_time"),
+            "first_tick_at": tick["tick_at"],
+            "last_tick_at": tick["tick_at"],
+            "last_seen_at": tick["tick_at"],
+            "last_price": tick["price"],
+            "tick_count": 1,
+            "ticks": [[0, tick["price"]]],
+        }
+    merged = dict(row)
+    tick_at, last_tick_at = _parse_iso(tick["tick_at"]), _parse_iso(str(row["last_tick_at"]))
+    merged["commence_time"] = tick.get("commence_time") or row.get("commence_time")
+    merged["last_seen_at"] = _iso(max(tick_at, _parse_iso(str(row.get("last_seen_at") or row["last_tick_at"]))))
+    if tick["price"] != row["last_price"] and tick_at > last_tick_at:
+        merged["ticks"] = [*(row.get("ticks") or []), [int((tick_at - last_tick_at).total_seconds()), tick["price"] - row["last_price"]]]
+        merged["tick_count"] = int(row.get("tick_count") or 0) + 1
+        merged["last_tick_at"] = tick["tick_at"]
+        merged["last_price"] = tick["price"]
+    return merged
+
+
+def _append_line_ticks_row_by_row(db, ticks: list[dict[str, Any]]) -> tuple[int, int]:
+    """Select-then-upsert path used until the append function is deployed; concurrent writers can drop a tick."""
+    existing: dict[str, dict[str, Any]] = {}
+    keys = [tick["series_key"] for tick in ticks]
+    for start in range(0, len(keys), _SELECT_CHUNK_SIZE):
+        response = db.table(LINE_HISTORY_TABLE).select("*").in_("series_key", keys[start:start + _SELECT_CHUNK_SIZE]).execute()
+        existing.update({row["series_key"]: row for row in response.data or [] if row.get("series_key")})
+    rows = [merge_line_tick(existing.get(tick["series_key"]), tick) for tick in ticks]
+    db.table(LINE_HISTORY_TABLE).upsert(rows, on_conflict="series_key").execute()
+    ticked = sum(1 for row in rows if row["last_tick_at"] == row["last_seen_at"])
+    return len(rows), ticked
+
+
+def _maybe_prune_line_history(db, *, log_event: Callable[..., None] | None) -> None:
+    global _LAST_PRUNE_ATTEMPT_MONOTONIC
+
+    now = time.monotonic()
+    with _PRUNE_LOCK:
+        if _LAST_PRUNE_ATTEMPT_MONOTONIC > 0 and now - _LAST_PRUNE_ATTEMPT_MONOTONIC < LINE_HISTORY_PRUNE_INTERVAL_SECONDS:
+            return
+        _LAST_PRUNE_ATTEMPT_MONOTONIC = now
+
+    cutoff = _iso(datetime.now(UTC) - timedelta(days=LINE_HISTORY_RETENTION_DAYS))
+    try:
+        db.table(LINE_HISTORY_TABLE).delete().lt("last_seen_at", cutoff).execute()
+    except Exception as exc:
+        if log_event is not None:
+            log_event("line_history.prune_failed", level="warning", error_class=type(exc).__name__, error=str(exc))
+
+
+def append_line_ticks(
+    db,
+    *,
+    sides: list[dict[str, Any]],
+    captured_at: str,
+    log_event: Callable[..., None] | None = None,
+) -> dict[str, int]:
+    """Append this scan's prices to `line_history`; returns series written and how many of them moved."""
+    ticks = build_line_ticks(sides, captured_at=captured_at)
+    if not ticks:
+        return {"series": 0, "ticked": 0}
+    try:
+        merged = merge_rows_via_rpc(db, function_name=LINE_HISTORY_APPEND_FUNCTION, rows=ticks)
+    except Exception as exc:
+        if not is_missing_rpc_function_error(exc, LINE_HISTORY_APPEND_FUNCTION):
+            raise
+        series, ticked = _append_line_ticks_row_by_row(db, ticks)
+    else:
+        series = sum(int(row.get("series_count") or 0) for row in merged)
+        ticked = sum(int(row.get("ticked_count") or 0) for row in merged)
+    _maybe_prune_line_history(db, log_event=log_event)
+    return {"series": series, "ticked": ticked}
+
+
+def decode_line_ticks(first_tick_at: str, ticks: list[list[int]]) -> list[LinePoint]:
+    """`[(tick time, american price), ...]` from a stored series."""
+    points: list[LinePoint] = []
+    at, price = _parse_iso(first_tick_at), 0
+    for seconds, delta in ticks or []:
+        at += timedelta(seconds=int(seconds))
+        price += int(delta)
+        points.append((at, price))
+    return points
+
+
+def line_price_at(points: list[LinePoint], at: datetime) -> int | None:
+    """Price in effect at `at` (last tick at or before it), or None before the series opened."""
+    price = None
+    for tick_at, tick_price in points:
+        if tick_at > at:
+            break
+        price = tick_price
+    return price
+
+
+def slice_line_points(points: list[LinePoint], *, start: datetime | None = None, end: datetime | None = None) -> list[LinePoint]:
+    """Ticks in `[start, end]`, led by the price carried into `start` when the series opened earlier."""
+    sliced = [point for point in points if (start is None or point[0] >= start) and (end is None or point[0] <= end)]
+    if start is not None:
+        carried = line_price_at(points, start)
+        if carried is not None and (not sliced or sliced[0][0] > start):
+            sliced.insert(0, (start, carried))
+    return sliced
+
+
+def downsample_line_points(points: list[LinePoint], *, bucket_seconds: int) -> list[LinePoint]:
+    """Last tick per `bucket_seconds` window (bucket close), keeping the opening tick."""
+    if bucket_seconds <= 0 or len(points) <= 2:
+        return list(points)
+    origin = points[0][0]
+    buckets: dict[int, LinePoint] = {}
+    for point in points[1:]:
+        buckets[int((point[0] - origin).total_seconds()) // bucket_seconds] = point
+    return [points[0], *buckets.values()]
+
+
+def load_line_history(
+    db,
+    *,
+    event_id: str,
+    selection_key: str | None = None,
+    sportsbook: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    bucket_seconds: int | None = None,
+) -> list[dict[str, Any]]:
+    """Decoded series for an event, optionally narrowed to a selection and book, a time range and a bucket size."""
+    query = db.table(LINE_HISTORY_TABLE).select("*").eq("event_id", event_id)
+    if selection_key:
+        query = query.eq("selection_key", selection_key)
+    if sportsbook:
+        query = query.eq("sportsbook", sportsbook)
+    series = []
+    for row in query.execute().data or []:
+        points = slice_line_points(decode_line_ticks(str(row["first_tick_at"]), row.get("ticks") or []), start=start, end=end)
+        if bucket_seconds:
+            points = downsample_line_points(points, bucket_seconds=bucket_seconds)
+        series.append({
+            "series_key": row["series_key"],
+            "sport": row.get("sport"),
+            "event_id": row.get("event_id"),
+            "market_key": row.get("market_key"),
+            "selection_key": row.get("selection_key"),
+            "sportsbook": row.get("sportsbook"),
+            "last_seen_at": row.get("last_seen_at"),
+            "points": [{"at": _iso(at), "price": price} for at, price in points],
+        })
+    return series
@@ -0,0 +1,113 @@
+"""
+Per-game live state shared by every Open Bets poll served by this process.
+
+Live providers keep their raw scoreboard / box score payloads in shared state,
+but every poll used to decode, normalize and index them again for each bet.
+The caches here hold the *parsed* per-game state (normalized events, player
+name indexes, linescores) and refresh each key at most once per
+`LIVE_GAME_STATE_REFRESH_SECONDS`; concurrent polls wait on the same refresh.
+Per-user requests then only join their pending bets against these states, so
+live-tracking cost follows active games rather than users x bets.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+LIVE_GAME_STATE_MAX_KEYS = 512
+
+_REGISTRY: list["LiveStateCache[Any]"] = []
+
+
+def _refresh_seconds() -> float:
+    try:
+        return max(0.0, float(os.getenv("LIVE_GAME_STATE_REFRESH_SECONDS", "15")))
+    except ValueError:
+        return 15.0
+
+
+@dataclass
+class LiveStateCacheStats:
+    hits: int = 0
+    refreshes: int = 0
+    joined: int = 0
+
+
+class LiveStateCache(Generic[T]):
+    """Single-flight, short-TTL memo of parsed live state keyed by date or provider event id."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.stats = LiveStateCacheStats()
+        self._entries: dict[str, tuple[float, T]] = {}
+        self._inflight: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Future]] = {}
+        _REGISTRY.append(self)
+
+    async def get(self, key: str, load: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Return (value, served_from_memory); `load` runs once per key per refresh window."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            self.stats.hits += 1
+            return entry[1], True
+
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight[0] is loop:
+            self.stats.joined += 1
+            return await asyncio.shield(inflight[1]), True
+
+        future: asyncio.Future = loop.create_future()
+        self._inflight[key] = (loop, future)
+        self.stats.refreshes += 1
+        try:
+            value = await load()
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Joiners re-raise it; mark retrieved so an unjoined failure is not logged.
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            self._store(key, value)
+            return value, False
+        finally:
+            if self._inflight.get(key, (None, None))[1] is future:
+                self._inflight.pop(key, None)
+
+    def _store(self, key: str, value: T) -> None:
+        now = time.monotonic()
+        if len(self._entries) >= LIVE_GAME_STATE_MAX_KEYS:
+            for stale_key in [k for k, (expires_at, _v) in self._entries.items() if expires_at <= now]:
+                self._entries.pop(stale_key, None)
+            while len(self._entries) >= LIVE_GAME_STATE_MAX_KEYS:
+                self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (now + _refresh_seconds(), value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._inflight.clear()
+        self.stats = LiveStateCacheStats()
+
+
+def get_live_game_state_metrics() -> dict[str, dict[str, int]]:
+    return {
+        cache.name: {
+            "keys": len(cache._entries),
+            "hits": cache.stats.hits,
+            "joined": cache.stats.joined,
+            "refreshes": cache.stats.refreshes,
+        }
+        for cache in _REGISTRY
+    }
+
+
+def reset_live_game_state() -> None:
+    for cache in _REGISTRY:
+        cache.clear()
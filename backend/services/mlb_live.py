@@ -12,11 +12,12 @@ from services.live_provider_contracts import (
     ProviderLookupResult,
     ProviderPlayerStatResult,
 )
+from services.live_game_state import LiveStateCache
 from services.prop_settler import (
     MLB_SPORT_KEY,
     PROP_MARKET_TO_MLB_STAT,
+    PlayerNameIndex,
     _market_stat_value_from_player_stats,
-    _match_player_stat_key,
     _mlb_extract_matchup,
     _normalize_player_name,
     _parse_mlb_game_datetime,
@@ -26,6 +27,7 @@ from services.prop_settler import (
     fetch_mlb_game_boxscore,
     fetch_mlb_schedule_for_date,
 )
+from services.provider_event_map import find_mapped_event, remember_live_event_match
 from services.shared_state import get_json, set_json
 from services.team_aliases import canonical_short_name, canonical_team_token
 
@@ -50,6 +52,9 @@ _SUPPORTED_MLB_PROP_MARKETS = {
     "batter_hits_alternate",
     "batter_hits_runs_rbis",
 }
+_SCHEDULE_STATE: LiveStateCache[tuple[list[LiveEventSnapshot], bool, bool]] = LiveStateCache("mlb.schedule")
+_PLAYER_STATE: LiveStateCache[tuple[PlayerNameIndex, bool, bool]] = LiveStateCache("mlb.players")
+_LINESCORE_STATE: LiveStateCache[tuple[dict[str, Any], bool, bool]] = LiveStateCache("mlb.linescore")
 
 
 def _utc_now() -> datetime:
@@ -289,6 +294,37 @@ async def _fetch_cached_linescore(game_pk: str) -> tuple[dict[str, Any], bool, b
         return {}, False, False
 
 
+async def _schedule_events_for_date(date_value: str) -> tuple[list[LiveEventSnapshot], bool, bool]:
+    """Normalized schedule games for one date, parsed once per refresh window."""
+
+    async def _load() -> tuple[list[LiveEventSnapshot], bool, bool]:
+        rows, cache_hit, stale = await _fetch_cached_schedule_date(date_value)
+        events = [event for event in (normalize_mlb_game(row) for row in rows) if event is not None]
+        return events, cache_hit, stale
+
+    (events, cache_hit, stale), from_memory = await _SCHEDULE_STATE.get(date_value, _load)
+    return events, cache_hit or from_memory, stale
+
+
+async def _player_index_for_game(game_pk: str) -> tuple[PlayerNameIndex, bool, bool]:
+    """Box score player lines for one game, indexed once per refresh window and shared by every bet."""
+
+    async def _load() -> tuple[PlayerNameIndex, bool, bool]:
+        boxscore, cache_hit, stale = await _fetch_cached_boxscore(game_pk)
+        return PlayerNameIndex(build_player_stat_map(boxscore, sport=MLB_SPORT_KEY)), cache_hit, stale
+
+    (name_index, cache_hit, stale), from_memory = await _PLAYER_STATE.get(game_pk, _load)
+    return name_index, cache_hit or from_memory, stale
+
+
+async def _linescore_for_game(game_pk: str) -> tuple[dict[str, Any], bool, bool]:
+    (linescore, cache_hit, stale), from_memory = await _LINESCORE_STATE.get(
+        game_pk,
+        lambda: _fetch_cached_linescore(game_pk),
+    )
+    return linescore, cache_hit or from_memory, stale
+
+
 def _candidate_dates(candidates: list[LiveBetCandidate], now: datetime | None) -> list[str]:
     dates: list[str] = []
     seen: set[str] = set()
@@ -462,35 +498,49 @@ class MlbLiveProvider:
         if not mlb_candidates:
             return {}
 
-        rows: list[dict[str, Any]] = []
+        normalized: list[LiveEventSnapshot] = []
+        seen: set[str] = set()
         any_cache_hit = False
         any_stale = False
         for date_value in _candidate_dates(mlb_candidates, now):
-            date_rows, cache_hit, stale = await _fetch_cached_schedule_date(date_value)
-            rows.extend(date_rows)
+            date_events, cache_hit, stale = await _schedule_events_for_date(date_value)
             any_cache_hit = any_cache_hit or cache_hit
             any_stale = any_stale or stale
-
-        normalized: list[LiveEventSnapshot] = []
-        seen: set[str] = set()
-        for row in rows:
-            event = normalize_mlb_game(row)
-            if event is None or event.provider_event_id in seen:
-                continue
-            seen.add(event.provider_event_id)
-            normalized.append(event)
+            for event in date_events:
+                if event.provider_event_id in seen:
+                    continue
+                seen.add(event.provider_event_id)
+                normalized.append(event)
 
         matched: dict[str, tuple[LiveBetCandidate, LiveEventSnapshot | None, str, str | None]] = {}
         live_event_ids: set[str] = set()
         for candidate in mlb_candidates:
-            event, confidence, reason = _match_event_for_candidate(candidate, normalized)
+            event, mapping = find_mapped_event(
+                MLB_SPORT_KEY,
+                MLB_PROVIDER,
+                odds_event_ids=(candidate.source_event_id, candidate.clv_event_id),
+                events=normalized,
+            )
+            if event is not None:
+                confidence, reason = "provider_event_map", None
+            else:
+                event, confidence, reason = _match_event_for_candidate(candidate, normalized)
+                mapping = None
+            if event is not None:
+                remember_live_event_match(
+                    candidate,
+                    event,
+                    provider=MLB_PROVIDER,
+                    confidence=confidence,
+                    mapping=mapping,
+                )
             matched[candidate.bet_id] = (candidate, event, confidence, reason)
             if event is not None and event.status == "live":
                 live_event_ids.add(event.provider_event_id)
 
         linescores: dict[str, tuple[dict[str, Any], bool, bool]] = {}
         for provider_event_id in live_event_ids:
-            linescores[provider_event_id] = await _fetch_cached_linescore(provider_event_id)
+            linescores[provider_event_id] = await _linescore_for_game(provider_event_id)
 
         out: dict[str, ProviderLookupResult] = {}
         for bet_id, (candidate, event, confidence, reason) in matched.items():
@@ -520,7 +570,7 @@ class MlbLiveProvider:
         requests: list[LivePlayerStatRequest],
     ) -> dict[str, ProviderPlayerStatResult]:
         out: dict[str, ProviderPlayerStatResult] = {}
-        boxscores: dict[str, tuple[dict[str, Any], bool, bool]] = {}
+        name_indexes: dict[str, tuple[PlayerNameIndex, bool, bool]] = {}
 
         for request in requests:
             candidate = request.candidate
@@ -541,12 +591,11 @@ class MlbLiveProvider:
                 )
                 continue
 
-            if request.provider_event_id not in boxscores:
-                boxscores[request.provider_event_id] = await _fetch_cached_boxscore(request.provider_event_id)
-            summary, cache_hit, stale = boxscores[request.provider_event_id]
-            stat_map = build_player_stat_map(summary, sport=MLB_SPORT_KEY)
+            if request.provider_event_id not in name_indexes:
+                name_indexes[request.provider_event_id] = await _player_index_for_game(request.provider_event_id)
+            name_index, cache_hit, stale = name_indexes[request.provider_event_id]
             norm = _normalize_player_name(participant)
-            player_stats, match_kind = _match_player_stat_key(norm, participant, stat_map)
+            player_stats, match_kind = name_index.match(norm, participant)
             if player_stats is None:
                 out[candidate.bet_id] = ProviderPlayerStatResult(
                     request=request,
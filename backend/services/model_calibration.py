@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime, timezone
 from typing import Any
 
@@ -15,6 +16,7 @@ from models import (
     PlayerPropShadowCandidateSummary,
 )
 from services.player_prop_weights import (
+    apply_player_prop_weight_accumulator_delta,
     is_missing_player_prop_model_weights_error,
     is_missing_scan_opportunity_model_evaluations_error,
 )
@@ -24,6 +26,8 @@ from services.player_prop_candidate_observations import (
     is_missing_player_prop_model_candidate_observations_error,
     update_player_prop_model_candidate_observation_close_snapshot,
 )
+from services.runtime_support import log_event
+from services.supabase_merge import is_missing_rpc_function_error, merge_rows_via_rpc
 from services.supabase_paging import fetch_all_rows
 
 BASELINE_MODEL_KEY = "props_v1_live"
@@ -36,6 +40,44 @@ RELEASE_GATE_LOG_LOSS_DEADBAND = 0.00001
 RELEASE_GATE_CLV_DEADBAND_PCT_POINTS = 0.10
 RELEASE_GATE_BEAT_CLOSE_DEADBAND_PCT_POINTS = 1.0
 PLAYER_PROP_WEIGHT_STALE_AFTER_HOURS = 72
+RECENT_COMPARISON_LIMIT = 12
+RECENT_COMPARISON_ROW_LIMIT = 120
+
+MODEL_CALIBRATION_ROLLUP_TABLE = "scan_opportunity_model_calibration_rollups"
+ROLLUP_DIMENSION_COHORT = "cohort"
+ROLLUP_DIMENSION_MODEL = "model"
+ROLLUP_DIMENSION_MARKET = "market"
+ROLLUP_DIMENSION_SPORTSBOOK = "sportsbook"
+ROLLUP_DIMENSION_INTERPOLATION_MODE = "interpolation_mode"
+ROLLUP_DIMENSION_RELEASE_GATE = "release_gate"
+ROLLUP_DIMENSION_RELEASE_GATE_PAIRS = "release_gate_pairs"
+ROLLUP_COHORT_ALL_KEY = "all"
+ROLLUP_RELEASE_GATE_BASELINE_KEY = "baseline"
+ROLLUP_RELEASE_GATE_CANDIDATE_KEY = "candidate"
+ROLLUP_RELEASE_GATE_PAIRS_KEY = "pairs"
+ROLLUP_WRITE_CHUNK_SIZE = 500
+# Written only by a full rebuild; until it exists the rollups may hold just the deltas
+# recorded since migration 025, so readers fold the raw rows instead.
+ROLLUP_SEEDED_MARKER_KEY = ("__meta__", "seeded", "rebuild")
+MODEL_CALIBRATION_ROLLUP_INCREMENT_FUNCTION = "increment_model_calibration_rollups"
+MODEL_CALIBRATION_ROLLUP_REPLACE_FUNCTION = "replace_model_calibration_rollups"
+MODEL_EVALUATION_SUMMARY_COLUMNS = (
+    "opportunity_key,model_key,capture_role,surface,sport,event,team,sportsbook,sportsbook_key,market,event_id,"
+    "player_name,selection_side,line_value,first_seen_at,last_seen_at,first_true_prob,last_true_prob,"
+    "first_reference_odds,last_reference_odds,first_ev_percentage,last_ev_percentage,"
+    "first_confidence_score,last_confidence_score,first_reference_bookmaker_count,last_reference_bookmaker_count,"
+    "first_interpolation_mode,last_interpolation_mode,close_reference_odds,close_opposing_reference_odds,"
+    "close_true_prob,close_quality,close_captured_at,first_clv_ev_percent,last_clv_ev_percent,"
+    "first_beat_close,last_beat_close,first_brier_score,last_brier_score,first_log_loss,last_log_loss"
+)
+# Close-snapshot updates re-read enough of each row to retract its previous rollup and
+# player-prop weight accumulator contribution.
+_CLOSE_SNAPSHOT_SELECT_COLUMNS = (
+    "id,opportunity_key,model_key,market,sportsbook,sportsbook_key,first_interpolation_mode,first_seen_at,"
+    "first_true_prob,last_true_prob,first_book_odds,last_book_odds,first_ev_percentage,"
+    "close_true_prob,close_quality,close_captured_at,first_clv_ev_percent,first_beat_close,"
+    "first_brier_score,first_log_loss"
+)
 
 
 def _utc_now() -> datetime:
@@ -132,9 +174,7 @@ def update_scan_opportunity_model_evaluations_close_snapshot(
     try:
         result = (
             db.table("scan_opportunity_model_evaluations")
-            .select(
-                "id,first_true_prob,last_true_prob,first_book_odds,last_book_odds"
-            )
+            .select(_CLOSE_SNAPSHOT_SELECT_COLUMNS)
             .eq("opportunity_key", opportunity_key)
             .execute()
         )
@@ -143,8 +183,11 @@ def update_scan_opportunity_model_evaluations_close_snapshot(
             return 0
         raise
 
+    before_rows = [dict(row) for row in (result.data or [])]
+    after_rows: list[dict[str, Any]] = []
     updated = 0
     for row in result.data or []:
+        after_rows.append(row)
         first_book_odds = _coerce_float(row.get("first_book_odds"))
         last_book_odds = _coerce_float(row.get("last_book_odds"))
         if first_book_odds is None and last_book_odds is None:
@@ -192,8 +235,13 @@ def update_scan_opportunity_model_evaluations_close_snapshot(
             "last_log_loss": last_metrics.get("log_loss") if last_metrics else None,
         }
         db.table("scan_opportunity_model_evaluations").update(payload).eq("id", row["id"]).execute()
+        after_rows[-1] = {**row, **payload}
         updated += 1
 
+    if updated:
+        _record_model_calibration_rollup_delta(db, before_rows=before_rows, after_rows=after_rows)
+        _record_player_prop_weight_accumulator_delta(db, before_rows=before_rows, after_rows=after_rows)
+
     try:
         update_player_prop_model_candidate_observation_close_snapshot(
             db,
@@ -208,73 +256,522 @@ def update_scan_opportunity_model_evaluations_close_snapshot(
 
     return updated
 
+def _cohort_key(row: dict[str, Any]) -> str:
+    first_seen_dt = _coerce_datetime(row.get("first_seen_at"))
+    return first_seen_dt.date().isoformat() if first_seen_dt is not None else "unknown"
+
+
+def _breakdown_dimension_keys(row: dict[str, Any]) -> list[tuple[str, str]]:
+    return [
+        (ROLLUP_DIMENSION_MODEL, str(row.get("model_key") or "Unknown")),
+        (ROLLUP_DIMENSION_MARKET, str(row.get("market") or "Unknown")),
+        (ROLLUP_DIMENSION_SPORTSBOOK, str(row.get("sportsbook") or "Unknown")),
+        (ROLLUP_DIMENSION_INTERPOLATION_MODE, str(row.get("first_interpolation_mode") or "Unknown")),
+    ]
+
+
+@dataclass
+class CalibrationMetricAccumulator:
+    """Mergeable close-calibration totals for one cohort/dimension bucket."""
+
+    captured_count: int = 0
+    valid_close_count: int = 0
+    paired_close_count: int = 0
+    fallback_close_count: int = 0
+    beat_close_count: int = 0
+    brier_count: int = 0
+    brier_sum: float = 0.0
+    brier_sum_sq: float = 0.0
+    log_loss_count: int = 0
+    log_loss_sum: float = 0.0
+    log_loss_sum_sq: float = 0.0
+    clv_count: int = 0
+    clv_sum: float = 0.0
+    clv_sum_sq: float = 0.0
+
+    def add_row(self, row: dict[str, Any], close_status: str) -> None:
+        self.captured_count += 1
+        if close_status != "valid":
+            return
+        self.valid_close_count += 1
+        if row.get("close_quality") == "single":
+            self.fallback_close_count += 1
+        if row.get("first_beat_close") is True:
+            self.beat_close_count += 1
+        for metric, field in (
+            ("brier", "first_brier_score"),
+            ("log_loss", "first_log_loss"),
+            ("clv", "first_clv_ev_percent"),
+        ):
+            value = _coerce_float(row.get(field))
+            if value is None:
+                continue
+            setattr(self, f"{metric}_count", getattr(self, f"{metric}_count") + 1)
+            setattr(self, f"{metric}_sum", getattr(self, f"{metric}_sum") + value)
+            setattr(self, f"{metric}_sum_sq", getattr(self, f"{metric}_sum_sq") + value * value)
+
+    def merge(self, other: "CalibrationMetricAccumulator", *, sign: int = 1) -> None:
+        for item in fields(self):
+            setattr(self, item.name, getattr(self, item.name) + sign * getattr(other, item.name))
+
+    def is_zero(self) -> bool:
+        return all(abs(getattr(self, item.name)) <= IDENTICAL_MODEL_VALUE_EPSILON for item in fields(self))
+
+    def average(self, metric: str, digits: int) -> float | None:
+        count = getattr(self, f"{metric}_count")
+        if count <= 0:
+            return None
+        return round(getattr(self, f"{metric}_sum") / count, digits)
+
+    def beat_close_pct(self) -> float | None:
+        return _pct(self.beat_close_count, self.valid_close_count)
+
+    def to_metrics(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_metrics(cls, metrics: dict[str, Any] | None) -> "CalibrationMetricAccumulator":
+        return _accumulator_from_metrics(cls, metrics)
+
+
+@dataclass
+class ReleaseGatePairAccumulator:
+    """Mergeable baseline-vs-shadow pairwise diagnostics for the release gate."""
+
+    pair_count: int = 0
+    comparison_count: int = 0
+    true_prob_delta_count: int = 0
+    true_prob_delta_sum: float = 0.0
+    true_prob_delta_abs_sum: float = 0.0
+    true_prob_delta_abs_max: float = 0.0
+    identical_true_prob_count: int = 0
+    ev_delta_count: int = 0
+    ev_delta_sum: float = 0.0
+    ev_delta_abs_sum: float = 0.0
+    ev_delta_abs_max: float = 0.0
+    identical_ev_count: int = 0
+    brier_candidate_better_count: int = 0
+    brier_baseline_better_count: int = 0
+    brier_tie_count: int = 0
+    log_loss_candidate_better_count: int = 0
+    log_loss_baseline_better_count: int = 0
+    log_loss_tie_count: int = 0
+
+    def add_pair(self, baseline: dict[str, Any], candidate: dict[str, Any]) -> None:
+        self.pair_count += 1
+
+        baseline_true_prob = _coerce_float(baseline.get("first_true_prob"))
+        candidate_true_prob = _coerce_float(candidate.get("first_true_prob"))
+        if baseline_true_prob is not None and candidate_true_prob is not None:
+            true_prob_delta = (candidate_true_prob - baseline_true_prob) * 100
+            self.true_prob_delta_count += 1
+            self.true_prob_delta_sum += true_prob_delta
+            self.true_prob_delta_abs_sum += abs(true_prob_delta)
+            self.true_prob_delta_abs_max = max(self.true_prob_delta_abs_max, abs(true_prob_delta))
+            if abs(candidate_true_prob - baseline_true_prob) <= IDENTICAL_MODEL_VALUE_EPSILON:
+                self.identical_true_prob_count += 1
+
+        baseline_ev = _coerce_float(baseline.get("first_ev_percentage"))
+        candidate_ev = _coerce_float(candidate.get("first_ev_percentage"))
+        if baseline_ev is not None and candidate_ev is not None:
+            ev_delta = candidate_ev - baseline_ev
+            self.ev_delta_count += 1
+            self.ev_delta_sum += ev_delta
+            self.ev_delta_abs_sum += abs(ev_delta)
+            self.ev_delta_abs_max = max(self.ev_delta_abs_max, abs(ev_delta))
+            if abs(ev_delta) <= IDENTICAL_MODEL_VALUE_EPSILON:
+                self.identical_ev_count += 1
+
+        for metric, field in (("brier", "first_brier_score"), ("log_loss", "first_log_loss")):
+            baseline_value = _coerce_float(baseline.get(field))
+            candidate_value = _coerce_float(candidate.get(field))
+            if baseline_value is None or candidate_value is None:
+                continue
+            if candidate_value < baseline_value - METRIC_TIE_EPSILON:
+                bucket = f"{metric}_candidate_better_count"
+            elif candidate_value > baseline_value + METRIC_TIE_EPSILON:
+                bucket = f"{metric}_baseline_better_count"
+            else:
+                bucket = f"{metric}_tie_count"
+            setattr(self, bucket, getattr(self, bucket) + 1)
+
+    def merge(self, other: "ReleaseGatePairAccumulator", *, sign: int = 1) -> None:
+        for item in fields(self):
+            if item.name in _PAIR_MAX_FIELDS:
+                # Maxima cannot be un-merged; a retracted pair keeps the historical max.
+                if sign > 0:
+                    setattr(self, item.name, max(getattr(self, item.name), getattr(other, item.name)))
+                continue
+            setattr(self, item.name, getattr(self, item.name) + sign * getattr(other, item.name))
+
+    def is_zero(self) -> bool:
+        return all(
+            abs(getattr(self, item.name)) <= IDENTICAL_MODEL_VALUE_EPSILON
+            for item in fields(self)
+            if item.name not in _PAIR_MAX_FIELDS
+        )
+
+    def diagnostics(self) -> dict[str, Any]:
+        def _delta_stats(prefix: str) -> tuple[float | None, float | None, float | None]:
+            count = getattr(self, f"{prefix}_count")
+            if count <= 0:
+                return None, None, None
+            return (
+                round(getattr(self, f"{prefix}_sum") / count, 4),
+                round(getattr(self, f"{prefix}_abs_sum") / count, 4),
+                round(getattr(self, f"{prefix}_abs_max"), 4),
+            )
+
+        avg_true_prob_delta, avg_abs_true_prob_delta, max_abs_true_prob_delta = _delta_stats("true_prob_delta")
+        avg_ev_delta, avg_abs_ev_delta, max_abs_ev_delta = _delta_stats("ev_delta")
+        return {
+            "avg_true_prob_delta_pct_points": avg_true_prob_delta,
+            "avg_abs_true_prob_delta_pct_points": avg_abs_true_prob_delta,
+            "max_abs_true_prob_delta_pct_points": max_abs_true_prob_delta,
+            "identical_true_prob_count": self.identical_true_prob_count,
+            "identical_true_prob_pct": _pct(self.identical_true_prob_count, self.pair_count),
+            "avg_ev_delta_pct_points": avg_ev_delta,
+            "avg_abs_ev_delta_pct_points": avg_abs_ev_delta,
+            "max_abs_ev_delta_pct_points": max_abs_ev_delta,
+            "identical_ev_count": self.identical_ev_count,
+            "identical_ev_pct": _pct(self.identical_ev_count, self.pair_count),
+            "brier_candidate_better_count": self.brier_candidate_better_count,
+            "brier_baseline_better_count": self.brier_baseline_better_count,
+            "brier_tie_count": self.brier_tie_count,
+            "log_loss_candidate_better_count": self.log_loss_candidate_better_count,
+            "log_loss_baseline_better_count": self.log_loss_baseline_better_count,
+            "log_loss_tie_count": self.log_loss_tie_count,
+        }
+
+    def to_metrics(self) -> dict[str, Any]:
+        return asdict(self)
 
-def _build_breakdown(
+    @classmethod
+    def from_metrics(cls, metrics: dict[str, Any] | None) -> "ReleaseGatePairAccumulator":
+        return _accumulator_from_metrics(cls, metrics)
+
+
+_PAIR_MAX_FIELDS = frozenset({"true_prob_delta_abs_max", "ev_delta_abs_max"})
+
+ModelCalibrationRollupKey = tuple[str, str, str]
+ModelCalibrationAccumulator = CalibrationMetricAccumulator | ReleaseGatePairAccumulator
+
+
+def _accumulator_from_metrics(cls, metrics: dict[str, Any] | None):
+    accumulator = cls()
+    source = metrics if isinstance(metrics, dict) else {}
+    for item in fields(accumulator):
+        value = _coerce_float(source.get(item.name))
+        if value is None:
+            continue
+        setattr(accumulator, item.name, int(round(value)) if item.type == "int" else value)
+    return accumulator
+
+
+def _new_accumulator(dimension: str) -> ModelCalibrationAccumulator:
+    if dimension == ROLLUP_DIMENSION_RELEASE_GATE_PAIRS:
+        return ReleaseGatePairAccumulator()
+    return CalibrationMetricAccumulator()
+
+
+def build_model_calibration_rollups(
     rows: list[dict[str, Any]],
-    *,
-    key_fn,
-    paired_opportunity_keys: set[str] | None = None,
-) -> list[ModelCalibrationBreakdownItem]:
+) -> dict[ModelCalibrationRollupKey, ModelCalibrationAccumulator]:
+    """Fold evaluation rows into per-(cohort date, dimension, key) accumulators."""
+    rollups: dict[ModelCalibrationRollupKey, ModelCalibrationAccumulator] = {}
+
+    def _bucket(key: ModelCalibrationRollupKey) -> Any:
+        if key not in rollups:
+            rollups[key] = _new_accumulator(key[1])
+        return rollups[key]
+
     groups: dict[str, list[dict[str, Any]]] = defaultdict(list)
     for row in rows:
-        groups[str(key_fn(row) or "Unknown")].append(row)
-
-    items: list[ModelCalibrationBreakdownItem] = []
-    for key, bucket_rows in groups.items():
-        valid_rows = [row for row in bucket_rows if row.get("_close_status") == "valid"]
-        paired_count = len(
-            {
-                str(row.get("opportunity_key") or "")
-                for row in valid_rows
-                if str(row.get("opportunity_key") or "") in (paired_opportunity_keys or set())
-            }
+        groups[str(row.get("opportunity_key") or "").strip()].append(row)
+
+    for opportunity_key, group in groups.items():
+        valid_by_model: dict[str, dict[str, Any]] = {}
+        valid_buckets: set[ModelCalibrationRollupKey] = set()
+        for row in group:
+            close_status = _comparison_close_status(row)
+            cohort_key = _cohort_key(row)
+            row_buckets = [(cohort_key, ROLLUP_DIMENSION_COHORT, ROLLUP_COHORT_ALL_KEY)] + [
+                (cohort_key, dimension, key) for dimension, key in _breakdown_dimension_keys(row)
+            ]
+            for bucket_key in row_buckets:
+                _bucket(bucket_key).add_row(row, close_status)
+            if close_status != "valid":
+                continue
+            valid_buckets.update(row_buckets)
+            model_key = str(row.get("model_key") or "").strip()
+            if model_key in {BASELINE_MODEL_KEY, SHADOW_MODEL_KEY}:
+                valid_by_model[model_key] = row
+
+        if not opportunity_key or not valid_by_model:
+            continue
+        baseline = valid_by_model.get(BASELINE_MODEL_KEY)
+        candidate = valid_by_model.get(SHADOW_MODEL_KEY)
+        pair_cohort_key = _cohort_key(baseline or candidate or {})
+        pairs_key = (pair_cohort_key, ROLLUP_DIMENSION_RELEASE_GATE_PAIRS, ROLLUP_RELEASE_GATE_PAIRS_KEY)
+        _bucket(pairs_key).comparison_count += 1
+        if baseline is None or candidate is None:
+            continue
+
+        for bucket_key in valid_buckets:
+            _bucket(bucket_key).paired_close_count += 1
+        _bucket(pairs_key).add_pair(baseline, candidate)
+        _bucket((pair_cohort_key, ROLLUP_DIMENSION_RELEASE_GATE, ROLLUP_RELEASE_GATE_BASELINE_KEY)).add_row(
+            baseline, "valid"
         )
-        beat_close_count = sum(1 for row in valid_rows if row.get("first_beat_close") is True)
-
-        avg_brier = None
-        avg_log_loss = None
-        avg_clv = None
-        beat_close_pct = None
-        if valid_rows:
-            avg_brier = round(
-                sum(float(row["first_brier_score"]) for row in valid_rows if row.get("first_brier_score") is not None)
-                / max(1, sum(1 for row in valid_rows if row.get("first_brier_score") is not None)),
-                6,
-            )
-            avg_log_loss = round(
-                sum(float(row["first_log_loss"]) for row in valid_rows if row.get("first_log_loss") is not None)
-                / max(1, sum(1 for row in valid_rows if row.get("first_log_loss") is not None)),
-                6,
-            )
-            avg_clv = round(
-                sum(float(row["first_clv_ev_percent"]) for row in valid_rows if row.get("first_clv_ev_percent") is not None)
-                / max(1, sum(1 for row in valid_rows if row.get("first_clv_ev_percent") is not None)),
-                2,
-            )
-            beat_close_pct = round((beat_close_count / len(valid_rows)) * 100, 2)
-
-        items.append(
-            ModelCalibrationBreakdownItem(
-                key=key,
-                captured_count=len(bucket_rows),
-                valid_close_count=len(valid_rows),
-                paired_close_count=paired_count,
-                avg_brier_score=avg_brier,
-                avg_log_loss=avg_log_loss,
-                avg_clv_percent=avg_clv,
-                beat_close_pct=beat_close_pct,
+        _bucket((pair_cohort_key, ROLLUP_DIMENSION_RELEASE_GATE, ROLLUP_RELEASE_GATE_CANDIDATE_KEY)).add_row(
+            candidate, "valid"
+        )
+
+    return rollups
+
+
+def model_calibration_rollup_delta(
+    *,
+    before_rows: list[dict[str, Any]],
+    after_rows: list[dict[str, Any]],
+) -> dict[ModelCalibrationRollupKey, ModelCalibrationAccumulator]:
+    """Return the accumulator change from replacing ``before_rows`` with ``after_rows``.
+
+    Both lists must hold every evaluation row for the opportunities involved so
+    paired/comparison counts are recomputed consistently.
+    """
+    delta = build_model_calibration_rollups(after_rows)
+    for key, accumulator in build_model_calibration_rollups(before_rows).items():
+        if key not in delta:
+            delta[key] = _new_accumulator(key[1])
+        delta[key].merge(accumulator, sign=-1)
+    return {key: accumulator for key, accumulator in delta.items() if not accumulator.is_zero()}
+
+
+def is_missing_model_calibration_rollups_error(error: Exception) -> bool:
+    msg = str(error)
+    message = str(getattr(error, "message", "") or "")
+    combined = f"{msg} {message}".lower()
+    code = str(getattr(error, "code", "") or "").strip().upper()
+    return code == "PGRST205" or (MODEL_CALIBRATION_ROLLUP_TABLE in combined and "schema cache" in combined)
+
+
+def _load_model_calibration_rollups(
+    db,
+) -> dict[ModelCalibrationRollupKey, ModelCalibrationAccumulator] | None:
+    """Persisted rollups, or None when the table is missing or has not been seeded by a rebuild."""
+    try:
+        records = fetch_all_rows(
+            query_factory=lambda offset, page_size: (
+                db.table(MODEL_CALIBRATION_ROLLUP_TABLE)
+                .select("cohort_key,dimension,dimension_key,metrics")
+                .order("cohort_key", desc=False)
+                .order("dimension", desc=False)
+                .order("dimension_key", desc=False)
+                .range(offset, offset + page_size - 1)
             )
         )
+    except Exception as exc:
+        if is_missing_model_calibration_rollups_error(exc):
+            return None
+        raise
 
-    items.sort(key=lambda item: (-item.valid_close_count, -item.captured_count, item.key))
-    return items
+    rollups: dict[ModelCalibrationRollupKey, ModelCalibrationAccumulator] = {}
+    seeded = False
+    for record in records:
+        key = (
+            str(record.get("cohort_key") or "unknown"),
+            str(record.get("dimension") or ""),
+            str(record.get("dimension_key") or "Unknown"),
+        )
+        if key == ROLLUP_SEEDED_MARKER_KEY:
+            seeded = True
+            continue
+        if not key[1]:
+            continue
+        if key[1] == ROLLUP_DIMENSION_RELEASE_GATE_PAIRS:
+            rollups[key] = ReleaseGatePairAccumulator.from_metrics(record.get("metrics"))
+        else:
+            rollups[key] = CalibrationMetricAccumulator.from_metrics(record.get("metrics"))
+    return rollups if seeded else None
 
 
-def _average_metric(rows: list[dict[str, Any]], field: str, digits: int) -> float | None:
-    values = [float(row[field]) for row in rows if row.get(field) is not None]
-    if not values:
-        return None
-    return round(sum(values) / len(values), digits)
+def _rollup_record(key: ModelCalibrationRollupKey, accumulator: ModelCalibrationAccumulator, updated_at: str) -> dict[str, Any]:
+    cohort_key, dimension, dimension_key = key
+    return {
+        "cohort_key": cohort_key,
+        "dimension": dimension,
+        "dimension_key": dimension_key,
+        "metrics": accumulator.to_metrics(),
+        "updated_at": updated_at,
+    }
+
+
+def apply_model_calibration_rollup_delta(
+    db,
+    *,
+    before_rows: list[dict[str, Any]],
+    after_rows: list[dict[str, Any]],
+) -> int:
+    """Merge an evaluation-row change into the persisted rollups; returns buckets written."""
+    delta = model_calibration_rollup_delta(before_rows=before_rows, after_rows=after_rows)
+    if not delta:
+        return 0
+
+    updated_at = _utc_now().isoformat().replace("+00:00", "Z")
+    try:
+        merged_counts = merge_rows_via_rpc(
+            db,
+            function_name=MODEL_CALIBRATION_ROLLUP_INCREMENT_FUNCTION,
+            rows=[_rollup_record(key, change, updated_at) for key, change in delta.items()],
+            chunk_size=ROLLUP_WRITE_CHUNK_SIZE,
+        )
+    except Exception as exc:
+        if is_missing_model_calibration_rollups_error(exc):
+            return 0
+        if not is_missing_rpc_function_error(exc, MODEL_CALIBRATION_ROLLUP_INCREMENT_FUNCTION):
+            raise
+    else:
+        return sum(int(row.get("bucket_count") or 0) for row in merged_counts)
+    return _apply_model_calibration_rollup_delta_row_by_row(db, delta, updated_at)
+
+
+def _apply_model_calibration_rollup_delta_row_by_row(
+    db,
+    delta: dict[ModelCalibrationRollupKey, ModelCalibrationAccumulator],
+    updated_at: str,
+) -> int:
+    """Select-then-upsert path used until the increment function is deployed; concurrent writers can lose a delta."""
+    cohort_keys = sorted({key[0] for key in delta})
+    try:
+        existing = (
+            db.table(MODEL_CALIBRATION_ROLLUP_TABLE)
+            .select("cohort_key,dimension,dimension_key,metrics")
+            .in_("cohort_key", cohort_keys)
+            .execute()
+        )
+    except Exception as exc:
+        if is_missing_model_calibration_rollups_error(exc):
+            return 0
+        raise
+
+    current: dict[ModelCalibrationRollupKey, dict[str, Any]] = {
+        (
+            str(record.get("cohort_key") or "unknown"),
+            str(record.get("dimension") or ""),
+            str(record.get("dimension_key") or "Unknown"),
+        ): record.get("metrics")
+        for record in (existing.data or [])
+    }
+    records: list[dict[str, Any]] = []
+    for key, change in delta.items():
+        merged = (
+            ReleaseGatePairAccumulator.from_metrics(current.get(key))
+            if key[1] == ROLLUP_DIMENSION_RELEASE_GATE_PAIRS
+            else CalibrationMetricAccumulator.from_metrics(current.get(key))
+        )
+        merged.merge(change)
+        records.append(_rollup_record(key, merged, updated_at))
+
+    db.table(MODEL_CALIBRATION_ROLLUP_TABLE).upsert(
+        records,
+        on_conflict="cohort_key,dimension,dimension_key",
+    ).execute()
+    return len(records)
+
+
+def _record_model_calibration_rollup_delta(
+    db,
+    *,
+    before_rows: list[dict[str, Any]],
+    after_rows: list[dict[str, Any]],
+) -> None:
+    # Rollups are derived data: a failed merge must never block the evaluation write
+    # itself, and `rebuild_model_calibration_rollups` can always repair drift.
+    try:
+        apply_model_calibration_rollup_delta(db, before_rows=before_rows, after_rows=after_rows)
+    except Exception as exc:
+        log_event(
+            "model_calibration.rollup_update_failed",
+            level="warning",
+            error_class=type(exc).__name__,
+            error=str(exc),
+        )
+
+
+def _record_player_prop_weight_accumulator_delta(
+    db,
+    *,
+    before_rows: list[dict[str, Any]],
+    after_rows: list[dict[str, Any]],
+) -> None:
+    try:
+        apply_player_prop_weight_accumulator_delta(db, before_rows=before_rows, after_rows=after_rows)
+    except Exception as exc:
+        log_event(
+            "player_prop_weights.accumulator_update_failed",
+            level="warning",
+            error_class=type(exc).__name__,
+            error=str(exc),
+        )
+
+
+def record_model_calibration_captures(db, inserted_rows: list[dict[str, Any]]) -> None:
+    """Count freshly inserted (still pending) evaluation rows into the rollups."""
+    if inserted_rows:
+        _record_model_calibration_rollup_delta(db, before_rows=[], after_rows=inserted_rows)
+
+
+def _fetch_model_evaluation_rows(db) -> list[dict[str, Any]]:
+    return fetch_all_rows(
+        query_factory=lambda offset, page_size: (
+            db.table("scan_opportunity_model_evaluations")
+            .select(MODEL_EVALUATION_SUMMARY_COLUMNS)
+            .order("opportunity_key", desc=False)
+            .order("model_key", desc=False)
+            .range(offset, offset + page_size - 1)
+        )
+    )
+
+
+def rebuild_model_calibration_rollups(db) -> int:
+    """Recompute every rollup bucket from the raw evaluation table (backfill/repair)."""
+    try:
+        rows = _fetch_model_evaluation_rows(db)
+    except Exception as exc:
+        if is_missing_scan_opportunity_model_evaluations_error(exc):
+            return 0
+        raise
+
+    rollups = build_model_calibration_rollups(rows)
+    updated_at = _utc_now().isoformat().replace("+00:00", "Z")
+    records = [_rollup_record(key, accumulator, updated_at) for key, accumulator in rollups.items()]
+    marker = {
+        "cohort_key": ROLLUP_SEEDED_MARKER_KEY[0],
+        "dimension": ROLLUP_SEEDED_MARKER_KEY[1],
+        "dimension_key": ROLLUP_SEEDED_MARKER_KEY[2],
+        "metrics": {"bucket_count": len(records), "evaluation_row_count": len(rows)},
+        "updated_at": updated_at,
+    }
+    try:
+        # One transaction: readers keep seeing the previous rollups until the swap commits.
+        db.rpc(MODEL_CALIBRATION_ROLLUP_REPLACE_FUNCTION, {"p_rows": [*records, marker]}).execute()
+    except Exception as exc:
+        if not is_missing_rpc_function_error(exc, MODEL_CALIBRATION_ROLLUP_REPLACE_FUNCTION):
+            raise
+        # Without the function, the marker is deleted first and written last, so readers
+        # fall back to the raw rows instead of serving a half-written table.
+        db.table(MODEL_CALIBRATION_ROLLUP_TABLE).delete().neq("dimension", "").execute()
+        for start in range(0, len(records), ROLLUP_WRITE_CHUNK_SIZE):
+            db.table(MODEL_CALIBRATION_ROLLUP_TABLE).upsert(
+                records[start : start + ROLLUP_WRITE_CHUNK_SIZE],
+                on_conflict="cohort_key,dimension,dimension_key",
+            ).execute()
+        db.table(MODEL_CALIBRATION_ROLLUP_TABLE).upsert(
+            [marker],
+            on_conflict="cohort_key,dimension,dimension_key",
+        ).execute()
+    return len(records)
 
 
 def _metric_delta(candidate: float | None, baseline: float | None, digits: int) -> float | None:
@@ -291,95 +788,6 @@ def _delta_within_deadband(delta: float | None, deadband: float, *, lower_is_bet
     return delta >= -deadband
 
 
-def _delta_stats(values: list[float], digits: int) -> tuple[float | None, float | None, float | None]:
-    if not values:
-        return None, None, None
-    return (
-        round(sum(values) / len(values), digits),
-        round(sum(abs(value) for value in values) / len(values), digits),
-        round(max(abs(value) for value in values), digits),
-    )
-
-
-def _release_gate_pairwise_diagnostics(
-    paired_rows: list[tuple[dict[str, Any], dict[str, Any]]],
-) -> dict[str, Any]:
-    true_prob_deltas: list[float] = []
-    ev_deltas: list[float] = []
-    identical_true_prob_count = 0
-    identical_ev_count = 0
-    brier_candidate_better_count = 0
-    brier_baseline_better_count = 0
-    brier_tie_count = 0
-    log_loss_candidate_better_count = 0
-    log_loss_baseline_better_count = 0
-    log_loss_tie_count = 0
-
-    for baseline, candidate in paired_rows:
-        baseline_true_prob = _coerce_float(baseline.get("first_true_prob"))
-        candidate_true_prob = _coerce_float(candidate.get("first_true_prob"))
-        if baseline_true_prob is not None and candidate_true_prob is not None:
-            true_prob_delta = (candidate_true_prob - baseline_true_prob) * 100
-            true_prob_deltas.append(true_prob_delta)
-            if abs(candidate_true_prob - baseline_true_prob) <= IDENTICAL_MODEL_VALUE_EPSILON:
-                identical_true_prob_count += 1
-
-        baseline_ev = _coerce_float(baseline.get("first_ev_percentage"))
-        candidate_ev = _coerce_float(candidate.get("first_ev_percentage"))
-        if baseline_ev is not None and candidate_ev is not None:
-            ev_delta = candidate_ev - baseline_ev
-            ev_deltas.append(ev_delta)
-            if abs(ev_delta) <= IDENTICAL_MODEL_VALUE_EPSILON:
-                identical_ev_count += 1
-
-        baseline_brier = _coerce_float(baseline.get("first_brier_score"))
-        candidate_brier = _coerce_float(candidate.get("first_brier_score"))
-        if baseline_brier is not None and candidate_brier is not None:
-            if candidate_brier < baseline_brier - METRIC_TIE_EPSILON:
-                brier_candidate_better_count += 1
-            elif candidate_brier > baseline_brier + METRIC_TIE_EPSILON:
-                brier_baseline_better_count += 1
-            else:
-                brier_tie_count += 1
-
-        baseline_log_loss = _coerce_float(baseline.get("first_log_loss"))
-        candidate_log_loss = _coerce_float(candidate.get("first_log_loss"))
-        if baseline_log_loss is not None and candidate_log_loss is not None:
-            if candidate_log_loss < baseline_log_loss - METRIC_TIE_EPSILON:
-                log_loss_candidate_better_count += 1
-            elif candidate_log_loss > baseline_log_loss + METRIC_TIE_EPSILON:
-                log_loss_baseline_better_count += 1
-            else:
-                log_loss_tie_count += 1
-
-    avg_true_prob_delta, avg_abs_true_prob_delta, max_abs_true_prob_delta = _delta_stats(true_prob_deltas, 4)
-    avg_ev_delta, avg_abs_ev_delta, max_abs_ev_delta = _delta_stats(ev_deltas, 4)
-    paired_count = len(paired_rows)
-
-    return {
-        "avg_true_prob_delta_pct_points": avg_true_prob_delta,
-        "avg_abs_true_prob_delta_pct_points": avg_abs_true_prob_delta,
-        "max_abs_true_prob_delta_pct_points": max_abs_true_prob_delta,
-        "identical_true_prob_count": identical_true_prob_count,
-        "identical_true_prob_pct": (
-            round((identical_true_prob_count / paired_count) * 100, 2)
-            if paired_count
-            else None
-        ),
-        "avg_ev_delta_pct_points": avg_ev_delta,
-        "avg_abs_ev_delta_pct_points": avg_abs_ev_delta,
-        "max_abs_ev_delta_pct_points": max_abs_ev_delta,
-        "identical_ev_count": identical_ev_count,
-        "identical_ev_pct": round((identical_ev_count / paired_count) * 100, 2) if paired_count else None,
-        "brier_candidate_better_count": brier_candidate_better_count,
-        "brier_baseline_better_count": brier_baseline_better_count,
-        "brier_tie_count": brier_tie_count,
-        "log_loss_candidate_better_count": log_loss_candidate_better_count,
-        "log_loss_baseline_better_count": log_loss_baseline_better_count,
-        "log_loss_tie_count": log_loss_tie_count,
-    }
-
-
 def _empty_weight_status(*, available: bool = True) -> PlayerPropModelWeightStatus:
     return PlayerPropModelWeightStatus(
         override_count=0,
@@ -606,124 +1014,29 @@ def _get_shadow_candidate_summary(db) -> PlayerPropShadowCandidateSummary:
         weight_status=weight_status,
     )
 
-
-def _paired_release_gate_rows(
-    valid_rows: list[dict[str, Any]],
-) -> tuple[list[tuple[dict[str, Any], dict[str, Any]]], set[str]]:
-    comparison_groups: dict[str, dict[str, dict[str, Any]]] = defaultdict(dict)
-    comparison_keys: set[str] = set()
-
-    for row in valid_rows:
-        model_key = str(row.get("model_key") or "").strip()
-        if model_key not in {BASELINE_MODEL_KEY, SHADOW_MODEL_KEY}:
-            continue
-        opportunity_key = str(row.get("opportunity_key") or "").strip()
-        if not opportunity_key:
-            continue
-        comparison_groups[opportunity_key][model_key] = row
-        comparison_keys.add(opportunity_key)
-
-    paired_rows: list[tuple[dict[str, Any], dict[str, Any]]] = []
-    for opportunity_key, group in comparison_groups.items():
-        baseline = group.get(BASELINE_MODEL_KEY)
-        candidate = group.get(SHADOW_MODEL_KEY)
-        if baseline is None or candidate is None:
-            continue
-        paired_rows.append((baseline, candidate))
-
-    return paired_rows, comparison_keys
-
-
-def get_model_calibration_summary(db) -> ModelCalibrationSummaryResponse:
-    try:
-        rows = fetch_all_rows(
-            query_factory=lambda offset, page_size: (
-                db.table("scan_opportunity_model_evaluations")
-                .select(
-                    "opportunity_key,model_key,capture_role,surface,sport,event,team,sportsbook,sportsbook_key,market,event_id,"
-                    "player_name,selection_side,line_value,first_seen_at,last_seen_at,first_true_prob,last_true_prob,"
-                    "first_reference_odds,last_reference_odds,first_ev_percentage,last_ev_percentage,"
-                    "first_confidence_score,last_confidence_score,first_reference_bookmaker_count,last_reference_bookmaker_count,"
-                    "first_interpolation_mode,last_interpolation_mode,close_reference_odds,close_opposing_reference_odds,"
-                    "close_true_prob,close_quality,close_captured_at,first_clv_ev_percent,last_clv_ev_percent,"
-                    "first_beat_close,last_beat_close,first_brier_score,last_brier_score,first_log_loss,last_log_loss"
-                )
-                .order("opportunity_key", desc=False)
-                .order("model_key", desc=False)
-                .range(offset, offset + page_size - 1)
-            )
+def _breakdown_items(
+    merged: dict[tuple[str, str], CalibrationMetricAccumulator],
+    dimension: str,
+) -> list[ModelCalibrationBreakdownItem]:
+    items = [
+        ModelCalibrationBreakdownItem(
+            key=key,
+            captured_count=accumulator.captured_count,
+            valid_close_count=accumulator.valid_close_count,
+            paired_close_count=accumulator.paired_close_count,
+            avg_brier_score=accumulator.average("brier", 6),
+            avg_log_loss=accumulator.average("log_loss", 6),
+            avg_clv_percent=accumulator.average("clv", 2),
+            beat_close_pct=accumulator.beat_close_pct(),
         )
-    except Exception as exc:
-        if is_missing_scan_opportunity_model_evaluations_error(exc):
-            return empty_model_calibration_summary(shadow_candidate_set=_get_shadow_candidate_summary(db))
-        raise
-
-    if not rows:
-        return empty_model_calibration_summary(shadow_candidate_set=_get_shadow_candidate_summary(db))
-
-    shadow_candidate_set = _get_shadow_candidate_summary(db)
-
-    for row in rows:
-        row["_close_status"] = _comparison_close_status(row)
-        first_seen_dt = _coerce_datetime(row.get("first_seen_at"))
-        row["_cohort_key"] = first_seen_dt.date().isoformat() if first_seen_dt is not None else "unknown"
-
-    valid_rows = [row for row in rows if row.get("_close_status") == "valid"]
-    fallback_rows = [row for row in valid_rows if row.get("close_quality") == "single"]
-    paired_rows, comparison_opportunity_keys = _paired_release_gate_rows(valid_rows)
-    paired_opportunity_keys = {
-        str(baseline.get("opportunity_key") or "")
-        for baseline, _candidate in paired_rows
-        if str(baseline.get("opportunity_key") or "")
-    }
-
-    by_model = _build_breakdown(
-        rows,
-        key_fn=lambda row: row.get("model_key") or "Unknown",
-        paired_opportunity_keys=paired_opportunity_keys,
-    )
-    by_market = _build_breakdown(
-        rows,
-        key_fn=lambda row: row.get("market") or "Unknown",
-        paired_opportunity_keys=paired_opportunity_keys,
-    )
-    by_sportsbook = _build_breakdown(
-        rows,
-        key_fn=lambda row: row.get("sportsbook") or "Unknown",
-        paired_opportunity_keys=paired_opportunity_keys,
-    )
-    by_interpolation_mode = _build_breakdown(
-        rows,
-        key_fn=lambda row: row.get("first_interpolation_mode") or "Unknown",
-        paired_opportunity_keys=paired_opportunity_keys,
-    )
+        for (item_dimension, key), accumulator in merged.items()
+        if item_dimension == dimension and accumulator.captured_count > 0
+    ]
+    items.sort(key=lambda item: (-item.valid_close_count, -item.captured_count, item.key))
+    return items
 
-    cohort_trend: list[ModelCalibrationCohortTrendRow] = []
-    for cohort_key in sorted({str(row.get("_cohort_key") or "unknown") for row in rows}):
-        bucket_rows = [row for row in rows if row.get("_cohort_key") == cohort_key]
-        valid_bucket_rows = [row for row in bucket_rows if row.get("_close_status") == "valid"]
-        cohort_trend.append(
-            ModelCalibrationCohortTrendRow(
-                cohort_key=cohort_key,
-                captured_count=len(bucket_rows),
-                valid_close_count=len(valid_bucket_rows),
-                avg_brier_score=_average_metric(valid_bucket_rows, "first_brier_score", 6),
-                avg_log_loss=_average_metric(valid_bucket_rows, "first_log_loss", 6),
-                avg_clv_percent=_average_metric(valid_bucket_rows, "first_clv_ev_percent", 2),
-                beat_close_pct=(
-                    round(
-                        (
-                            sum(1 for row in valid_bucket_rows if row.get("first_beat_close") is True)
-                            / len(valid_bucket_rows)
-                        ) * 100,
-                        2,
-                    )
-                    if valid_bucket_rows
-                    else None
-                ),
-            )
-        )
 
+def _build_recent_comparisons(rows: list[dict[str, Any]]) -> list[ModelCalibrationRecentComparisonRow]:
     comparison_groups: dict[str, list[dict[str, Any]]] = defaultdict(list)
     for row in rows:
         comparison_groups[str(row.get("opportunity_key") or "")].append(row)
@@ -734,7 +1047,7 @@ def get_model_calibration_summary(db) -> ModelCalibrationSummaryResponse:
         key=lambda key: _coerce_datetime((comparison_groups[key][0]).get("first_seen_at")) or _utc_now(),
         reverse=True,
     )
-    for opportunity_key in ordered_keys[:12]:
+    for opportunity_key in ordered_keys[:RECENT_COMPARISON_LIMIT]:
         group = comparison_groups[opportunity_key]
         baseline = next((row for row in group if str(row.get("model_key") or "") == BASELINE_MODEL_KEY), None)
         shadow = next((row for row in group if str(row.get("model_key") or "") in {SHADOW_MODEL_KEY, LIVE_V2_MODEL_KEY}), None)
@@ -765,26 +1078,34 @@ def get_model_calibration_summary(db) -> ModelCalibrationSummaryResponse:
                 candidate_clv_ev_percent=_coerce_float(shadow.get("first_clv_ev_percent")) if shadow else None,
             )
         )
+    return recent_comparisons
 
-    baseline_rows = [baseline for baseline, _candidate in paired_rows]
-    candidate_rows = [candidate for _baseline, candidate in paired_rows]
-    baseline_beat_close_pct = (
-        round((sum(1 for row in baseline_rows if row.get("first_beat_close") is True) / len(baseline_rows)) * 100, 2)
-        if baseline_rows
-        else None
-    )
-    candidate_beat_close_pct = (
-        round((sum(1 for row in candidate_rows if row.get("first_beat_close") is True) / len(candidate_rows)) * 100, 2)
-        if candidate_rows
-        else None
+
+def _fetch_recent_comparison_rows(db) -> list[dict[str, Any]]:
+    result = (
+        db.table("scan_opportunity_model_evaluations")
+        .select(MODEL_EVALUATION_SUMMARY_COLUMNS)
+        .order("first_seen_at", desc=True)
+        .limit(RECENT_COMPARISON_ROW_LIMIT)
+        .execute()
     )
-    baseline_avg_brier = _average_metric(baseline_rows, "first_brier_score", 6)
-    candidate_avg_brier = _average_metric(candidate_rows, "first_brier_score", 6)
-    baseline_avg_log = _average_metric(baseline_rows, "first_log_loss", 6)
-    candidate_avg_log = _average_metric(candidate_rows, "first_log_loss", 6)
-    baseline_avg_clv = _average_metric(baseline_rows, "first_clv_ev_percent", 2)
-    candidate_avg_clv = _average_metric(candidate_rows, "first_clv_ev_percent", 2)
-    pairwise_diagnostics = _release_gate_pairwise_diagnostics(paired_rows)
+    return list(result.data or [])
+
+
+def _build_release_gate(
+    *,
+    baseline: CalibrationMetricAccumulator,
+    candidate: CalibrationMetricAccumulator,
+    pairs: ReleaseGatePairAccumulator,
+) -> ModelCalibrationReleaseGate:
+    baseline_beat_close_pct = baseline.beat_close_pct()
+    candidate_beat_close_pct = candidate.beat_close_pct()
+    baseline_avg_brier = baseline.average("brier", 6)
+    candidate_avg_brier = candidate.average("brier", 6)
+    baseline_avg_log = baseline.average("log_loss", 6)
+    candidate_avg_log = candidate.average("log_loss", 6)
+    baseline_avg_clv = baseline.average("clv", 2)
+    candidate_avg_clv = candidate.average("clv", 2)
 
     brier_delta = _metric_delta(candidate_avg_brier, baseline_avg_brier, 6)
     log_loss_delta = _metric_delta(candidate_avg_log, baseline_avg_log, 6)
@@ -792,7 +1113,7 @@ def get_model_calibration_summary(db) -> ModelCalibrationSummaryResponse:
     beat_close_delta = _metric_delta(candidate_beat_close_pct, baseline_beat_close_pct, 2)
 
     reasons: list[str] = []
-    eligible = len(paired_rows) >= 200
+    eligible = pairs.pair_count >= 200
     if not eligible:
         reasons.append("Need at least 200 paired valid closes shared by baseline and shadow models.")
     if eligible and candidate_avg_brier is not None and baseline_avg_brier is not None and candidate_avg_brier >= baseline_avg_brier:
@@ -838,11 +1159,11 @@ def get_model_calibration_summary(db) -> ModelCalibrationSummaryResponse:
     else:
         verdict = "fail"
 
-    release_gate = ModelCalibrationReleaseGate(
+    return ModelCalibrationReleaseGate(
         candidate_model_key=SHADOW_MODEL_KEY,
         baseline_model_key=BASELINE_MODEL_KEY,
-        candidate_valid_close_count=len(candidate_rows),
-        baseline_valid_close_count=len(baseline_rows),
+        candidate_valid_close_count=candidate.valid_close_count,
+        baseline_valid_close_count=baseline.valid_close_count,
         candidate_avg_brier_score=candidate_avg_brier,
         baseline_avg_brier_score=baseline_avg_brier,
         candidate_avg_log_loss=candidate_avg_log,
@@ -855,7 +1176,7 @@ def get_model_calibration_summary(db) -> ModelCalibrationSummaryResponse:
         log_loss_delta=log_loss_delta,
         avg_clv_delta_pct_points=avg_clv_delta,
         beat_close_delta_pct_points=beat_close_delta,
-        **pairwise_diagnostics,
+        **pairs.diagnostics(),
         verdict=verdict,
         deadband_brier=RELEASE_GATE_BRIER_DEADBAND,
         deadband_log_loss=RELEASE_GATE_LOG_LOSS_DEADBAND,
@@ -867,22 +1188,90 @@ def get_model_calibration_summary(db) -> ModelCalibrationSummaryResponse:
         reasons=reasons or ["Shadow model passed the default promotion gates."],
     )
 
+
+def summarize_model_calibration_rollups(
+    rollups: dict[ModelCalibrationRollupKey, ModelCalibrationAccumulator],
+    *,
+    recent_comparisons: list[ModelCalibrationRecentComparisonRow],
+    shadow_candidate_set: PlayerPropShadowCandidateSummary,
+) -> ModelCalibrationSummaryResponse:
+    merged: dict[tuple[str, str], CalibrationMetricAccumulator] = {}
+    by_cohort: dict[str, CalibrationMetricAccumulator] = {}
+    pairs = ReleaseGatePairAccumulator()
+    for (cohort_key, dimension, dimension_key), accumulator in rollups.items():
+        if isinstance(accumulator, ReleaseGatePairAccumulator):
+            pairs.merge(accumulator)
+            continue
+        merged.setdefault((dimension, dimension_key), CalibrationMetricAccumulator()).merge(accumulator)
+        if dimension == ROLLUP_DIMENSION_COHORT:
+            by_cohort.setdefault(cohort_key, CalibrationMetricAccumulator()).merge(accumulator)
+
+    totals = merged.get((ROLLUP_DIMENSION_COHORT, ROLLUP_COHORT_ALL_KEY)) or CalibrationMetricAccumulator()
+    if totals.captured_count <= 0:
+        return empty_model_calibration_summary(shadow_candidate_set=shadow_candidate_set)
+
+    cohort_trend = [
+        ModelCalibrationCohortTrendRow(
+            cohort_key=cohort_key,
+            captured_count=accumulator.captured_count,
+            valid_close_count=accumulator.valid_close_count,
+            avg_brier_score=accumulator.average("brier", 6),
+            avg_log_loss=accumulator.average("log_loss", 6),
+            avg_clv_percent=accumulator.average("clv", 2),
+            beat_close_pct=accumulator.beat_close_pct(),
+        )
+        for cohort_key, accumulator in sorted(by_cohort.items())
+        if accumulator.captured_count > 0
+    ]
+
     return ModelCalibrationSummaryResponse(
-        captured_count=len(rows),
-        valid_close_count=len(valid_rows),
-        paired_close_count=len(paired_rows),
-        fallback_close_count=len(fallback_rows),
-        paired_close_pct=(
-            round((len(paired_rows) / len(comparison_opportunity_keys)) * 100, 2)
-            if comparison_opportunity_keys
-            else None
-        ),
-        by_model=by_model,
-        by_market=by_market,
-        by_sportsbook=by_sportsbook,
-        by_interpolation_mode=by_interpolation_mode,
+        captured_count=totals.captured_count,
+        valid_close_count=totals.valid_close_count,
+        paired_close_count=pairs.pair_count,
+        fallback_close_count=totals.fallback_close_count,
+        paired_close_pct=_pct(pairs.pair_count, pairs.comparison_count),
+        by_model=_breakdown_items(merged, ROLLUP_DIMENSION_MODEL),
+        by_market=_breakdown_items(merged, ROLLUP_DIMENSION_MARKET),
+        by_sportsbook=_breakdown_items(merged, ROLLUP_DIMENSION_SPORTSBOOK),
+        by_interpolation_mode=_breakdown_items(merged, ROLLUP_DIMENSION_INTERPOLATION_MODE),
         cohort_trend=cohort_trend,
         recent_comparisons=recent_comparisons,
         shadow_candidate_set=shadow_candidate_set,
-        release_gate=release_gate,
+        release_gate=_build_release_gate(
+            baseline=merged.get((ROLLUP_DIMENSION_RELEASE_GATE, ROLLUP_RELEASE_GATE_BASELINE_KEY))
+            or CalibrationMetricAccumulator(),
+            candidate=merged.get((ROLLUP_DIMENSION_RELEASE_GATE, ROLLUP_RELEASE_GATE_CANDIDATE_KEY))
+            or CalibrationMetricAccumulator(),
+            pairs=pairs,
+        ),
+    )
+
+
+def get_model_calibration_summary(db) -> ModelCalibrationSummaryResponse:
+    rollups = _load_model_calibration_rollups(db)
+    if rollups is not None:
+        try:
+            recent_rows = _fetch_recent_comparison_rows(db)
+        except Exception as exc:
+            if not is_missing_scan_opportunity_model_evaluations_error(exc):
+                raise
+            recent_rows = []
+        return summarize_model_calibration_rollups(
+            rollups,
+            recent_comparisons=_build_recent_comparisons(recent_rows),
+            shadow_candidate_set=_get_shadow_candidate_summary(db),
+        )
+
+    # Table missing or never seeded by a rebuild: fold the raw evaluation rows once.
+    try:
+        rows = _fetch_model_evaluation_rows(db)
+    except Exception as exc:
+        if is_missing_scan_opportunity_model_evaluations_error(exc):
+            return empty_model_calibration_summary(shadow_candidate_set=_get_shadow_candidate_summary(db))
+        raise
+
+    return summarize_model_calibration_rollups(
+        build_model_calibration_rollups(rows),
+        recent_comparisons=_build_recent_comparisons(rows),
+        shadow_candidate_set=_get_shadow_candidate_summary(db),
     )
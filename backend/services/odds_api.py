@@ -18,10 +18,19 @@ from datetime import datetime, timezone, timedelta
 from typing import Any
 from types import SimpleNamespace
 from dotenv import load_dotenv
-from calculations import american_to_decimal, kelly_fraction
+from calculations import american_to_decimal
+from services.odds_api_budget import (
+    CreditReservation,
+    OddsApiBudgetExceeded,
+    odds_api_request_slot,
+    reserve_odds_api_credits,
+    settle_odds_api_credits,
+)
+from services.pricing_kernel import devig_two_way, price_side
+from services.runtime_support import retry_supabase_async
 from services.sportsbook_deeplinks import resolve_sportsbook_deeplink
 from services.shared_state import get_scan_cache, set_scan_cache
-from services.team_aliases import build_short_event_label, canonical_short_name, canonical_team_token
+from services.team_aliases import build_short_event_label, canonical_player_token, canonical_short_name, canonical_team_token
 from utils.request_context import get_correlation_id, get_request_id
 
 load_dotenv()
@@ -483,19 +492,12 @@ def devig_pinnacle(outcome_a_price: float, outcome_b_price: float) -> dict:
 
     Returns {"team_a": float, "team_b": float} — probabilities summing to 1.0.
     """
-    dec_a = american_to_decimal(outcome_a_price)
-    dec_b = american_to_decimal(outcome_b_price)
-
-    implied_a = 1.0 / dec_a
-    implied_b = 1.0 / dec_b
-    overround = implied_a + implied_b
-
     # Multiplicative power method for more accurate de-vigging
     # Solves for k where (implied_a^k + implied_b^k) = 1
     # Approximation: divide each by the overround (additive method)
     # This is the standard industry approach for two-way markets
-    true_prob_a = implied_a / overround
-    true_prob_b = implied_b / overround
+    # Memoized per price pair; every target book reuses the same Pinnacle pair.
+    true_prob_a, true_prob_b = devig_two_way(float(outcome_a_price), float(outcome_b_price))
 
     return {"team_a": true_prob_a, "team_b": true_prob_b}
 
@@ -558,19 +560,43 @@ def calculate_edge(true_prob: float, book_american_odds: float) -> dict:
         book_implied_prob: what the book's odds imply
         true_prob: the de-vigged sharp probability
         book_decimal: book's decimal odds
+        base_kelly_fraction: full Kelly from the rounded true_prob / book_decimal
     """
-    book_decimal = american_to_decimal(book_american_odds)
-    book_implied_prob = 1.0 / book_decimal
+    return price_side(float(true_prob), float(book_american_odds))._asdict()
 
-    ev_raw = (true_prob * book_decimal) - 1.0
-    ev_percentage = round(ev_raw * 100, 2)
 
-    return {
-        "ev_percentage": ev_percentage,
-        "book_implied_prob": round(book_implied_prob, 4),
-        "true_prob": round(true_prob, 4),
-        "book_decimal": round(book_decimal, 4),
-    }
+def _market_region_cost(markets: str, regions: str) -> int:
+    """The Odds API bills one credit per market per region."""
+    market_count = len([m for m in str(markets).split(",") if m.strip()])
+    region_count = len([r for r in str(regions).split(",") if r.strip()])
+    return max(1, market_count) * max(1, region_count)
+
+
+def _reserve_odds_api_call(
+    *,
+    source: str,
+    endpoint: str,
+    sport: str | None,
+    cost_key: str,
+    default_cost: int,
+) -> CreditReservation:
+    try:
+        return reserve_odds_api_credits(source=source, cost_key=cost_key, default_cost=default_cost)
+    except OddsApiBudgetExceeded as e:
+        _append_odds_api_activity(
+            source=source,
+            endpoint=endpoint,
+            sport=sport,
+            cache_hit=False,
+            outbound_call_made=False,
+            status_code=None,
+            duration_ms=None,
+            api_requests_remaining=e.remaining,
+            credits_used_last=None,
+            error_type=type(e).__name__,
+            error_message=str(e),
+        )
+        raise
 
 
 async def fetch_odds(
@@ -601,13 +627,23 @@ async def fetch_odds(
         "includeSids": "true",
     }
 
-    started = time.monotonic()
     endpoint_value = endpoint or f"/sports/{sport}/odds"
+    reservation = _reserve_odds_api_call(
+        source=source,
+        endpoint=endpoint_value,
+        sport=sport,
+        cost_key=f"odds:{markets}:{regions}",
+        default_cost=_market_region_cost(markets, regions),
+    )
+    started = time.monotonic()
 
+    resp_headers = None
     try:
         from services.http_client import request_with_retries
 
-        resp = await request_with_retries("GET", url, params=params, retries=2)
+        async with odds_api_request_slot(reservation):
+            resp = await request_with_retries("GET", url, params=params, retries=2)
+        resp_headers = resp.headers
         resp.raise_for_status()
         duration_ms = (time.monotonic() - started) * 1000
         remaining = resp.headers.get("x-requests-remaining") or resp.headers.get("x-request-remaining")
@@ -664,6 +700,8 @@ async def fetch_odds(
             error_message=str(e),
         )
         raise
+    finally:
+        settle_odds_api_credits(reservation, resp_headers)
 
 
 def _extract_totals_market(bookmakers: list[dict], book_key: str) -> dict | None:
@@ -863,13 +901,23 @@ async def fetch_events(
         raise ValueError("ODDS_API_KEY not set in environment")
 
     url = f"{ODDS_API_BASE}/sports/{sport}/events"
-    started = time.monotonic()
     endpoint_value = f"/sports/{sport}/events"
+    reservation = _reserve_odds_api_call(
+        source=source,
+        endpoint=endpoint_value,
+        sport=sport,
+        cost_key="events",
+        default_cost=0,
+    )
+    started = time.monotonic()
 
+    resp_headers = None
     try:
         from services.http_client import request_with_retries
 
-        resp = await request_with_retries("GET", url, params={"apiKey": ODDS_API_KEY}, retries=2)
+        async with odds_api_request_slot(reservation):
+            resp = await request_with_retries("GET", url, params={"apiKey": ODDS_API_KEY}, retries=2)
+        resp_headers = resp.headers
         resp.raise_for_status()
         duration_ms = (time.monotonic() - started) * 1000
         remaining = resp.headers.get("x-requests-remaining") or resp.headers.get("x-request-remaining")
@@ -927,6 +975,8 @@ async def fetch_events(
             error_message=str(e),
         )
         raise
+    finally:
+        settle_odds_api_credits(reservation, resp_headers)
 
 
 def _extract_h2h_bookmaker_market(bookmakers: list[dict], book_key: str) -> dict | None:
@@ -961,133 +1011,51 @@ def _extract_outcomes(bookmakers: list[dict], book_key: str) -> dict | None:
     return outcomes
 
 
-async def scan_for_ev(sport: str = "basketball_nba") -> dict:
-    """
-    Full pipeline: fetch → de-vig → compare → return +EV bets and metadata.
-    Scans across all TARGET_BOOKS.
-    """
-    data, resp = await fetch_odds(sport, source="scan_for_ev")
-    events = data if isinstance(data, list) else []
-    ev_bets = []
-    events_with_pinnacle = 0
-
-    for event in events:
-        home = event["home_team"]
-        away = event["away_team"]
-        commence = event.get("commence_time", "")
-
-        pin_outcomes = _extract_outcomes(event.get("bookmakers", []), SHARP_BOOK)
-        if not pin_outcomes:
-            continue
-
-        pin_home_raw = pin_outcomes.get(home)
-        pin_away_raw = pin_outcomes.get(away)
-        if pin_home_raw is None or pin_away_raw is None:
-            continue
-        pin_home = float(pin_home_raw)
-        pin_away = float(pin_away_raw)
-        draw_key = _find_draw_key(pin_outcomes, home, away)
-        if draw_key:
-            draw_price_raw = pin_outcomes.get(draw_key)
-            if draw_price_raw is None:
-                continue
-            true_probs_n = devig_outcomes({home: pin_home, away: pin_away, draw_key: float(draw_price_raw)})
-            if not true_probs_n:
-                continue
-            true_probs = {"team_a": true_probs_n[home], "team_b": true_probs_n[away]}
-            true_prob_draw = true_probs_n[draw_key]
-        else:
-            true_probs = devig_pinnacle(pin_home, pin_away)
-            true_prob_draw = None
-        had_any_book = False
-
-        for book_key, book_display in TARGET_BOOKS.items():
-            book_market = _extract_h2h_bookmaker_market(event.get("bookmakers", []), book_key)
-            if not book_market:
-                continue
-            book_outcomes = book_market["outcomes"]
-
-            book_home_raw = book_outcomes.get(home)
-            book_away_raw = book_outcomes.get(away)
-            if book_home_raw is None or book_away_raw is None:
-                continue
-            book_home = float(book_home_raw)
-            book_away = float(book_away_raw)
-
-            had_any_book = True
-
-            home_edge = calculate_edge(true_probs["team_a"], book_home)
-            if home_edge["ev_percentage"] > 0:
-                ev_bets.append({
-                    "sportsbook": book_display,
-                    "sport": event.get("sport_key", sport),
-                    "event": f"{away} @ {home}",
-                    "event_short": build_short_event_label(event.get("sport_key", sport), away, home),
-                    "commence_time": commence,
-                    "team": home,
-                    "team_short": canonical_short_name(event.get("sport_key", sport), home),
-                    "opponent_short": canonical_short_name(event.get("sport_key", sport), away),
-                    "pinnacle_odds": pin_home,
-                    "book_odds": book_home,
-                    "true_prob": home_edge["true_prob"],
-                    "base_kelly_fraction": round(kelly_fraction(home_edge["true_prob"], home_edge["book_decimal"]), 6),
-                    "ev_percentage": home_edge["ev_percentage"],
-                    "book_decimal": home_edge["book_decimal"],
-                })
-
-            away_edge = calculate_edge(true_probs["team_b"], book_away)
-            if away_edge["ev_percentage"] > 0:
-                ev_bets.append({
-                    "sportsbook": book_display,
-                    "sport": event.get("sport_key", sport),
-                    "event": f"{away} @ {home}",
-                    "event_short": build_short_event_label(event.get("sport_key", sport), away, home),
-                    "commence_time": commence,
-                    "team": away,
-                    "team_short": canonical_short_name(event.get("sport_key", sport), away),
-                    "opponent_short": canonical_short_name(event.get("sport_key", sport), home),
-                    "pinnacle_odds": pin_away,
-                    "book_odds": book_away,
-                    "true_prob": away_edge["true_prob"],
-                    "base_kelly_fraction": round(kelly_fraction(away_edge["true_prob"], away_edge["book_decimal"]), 6),
-                    "ev_percentage": away_edge["ev_percentage"],
-                    "book_decimal": away_edge["book_decimal"],
-                })
-
-            if true_prob_draw is not None:
-                book_draw_key = _find_draw_key(book_outcomes, home, away)
-                if book_draw_key and book_draw_key in book_outcomes:
-                    draw_edge = calculate_edge(true_prob_draw, book_outcomes[book_draw_key])
-                    if draw_edge["ev_percentage"] > 0:
-                        ev_bets.append({
-                            "sportsbook": book_display,
-                            "sport": event.get("sport_key", sport),
-                            "event": f"{away} @ {home}",
-                            "event_short": build_short_event_label(event.get("sport_key", sport), away, home),
-                            "commence_time": commence,
-                            "team": book_draw_key,
-                            "team_short": canonical_short_name(event.get("sport_key", sport), book_draw_key),
-                            "opponent_short": None,
-                            "pinnacle_odds": pin_outcomes[draw_key],
-                            "book_odds": book_outcomes[book_draw_key],
-                            "true_prob": draw_edge["true_prob"],
-                            "base_kelly_fraction": round(kelly_fraction(draw_edge["true_prob"], draw_edge["book_decimal"]), 6),
-                            "ev_percentage": draw_edge["ev_percentage"],
-                            "book_decimal": draw_edge["book_decimal"],
-                        })
-
-        if had_any_book:
-            events_with_pinnacle += 1
-
+_EV_OPPORTUNITY_FIELDS = (
+    "sportsbook",
+    "sport",
+    "event",
+    "event_short",
+    "commence_time",
+    "team",
+    "team_short",
+    "opponent_short",
+    "pinnacle_odds",
+    "book_odds",
+    "true_prob",
+    "base_kelly_fraction",
+    "ev_percentage",
+    "book_decimal",
+)
+
+
+def ev_opportunities_from_sides(sides: list[dict]) -> list[dict]:
+    """+EV moneyline sides from a `scan_all_sides` result, best edge first."""
+    ev_bets = [
+        {field: side.get(field) for field in _EV_OPPORTUNITY_FIELDS}
+        for side in sides
+        if isinstance(side, dict)
+        and (side.get("market_key") or "h2h") == "h2h"
+        and float(side.get("ev_percentage") or 0) > 0
+    ]
     ev_bets.sort(key=lambda b: b["ev_percentage"], reverse=True)
+    return ev_bets
 
-    remaining = resp.headers.get("x-requests-remaining") or resp.headers.get("x-request-remaining")
 
+async def scan_for_ev(sport: str = "basketball_nba", source: str = "scan_for_ev") -> dict:
+    """
+    Return +EV moneyline bets and metadata for the legacy /api/scan-bets endpoint.
+
+    A projection over the cached `scan_all_sides` result: it shares its TTL,
+    cross-worker cache entry and Odds API activity accounting, so repeated
+    calls inside the cache window cost no credits.
+    """
+    result = await get_cached_or_scan(sport, source=source)
     return {
-        "opportunities": ev_bets,
-        "events_fetched": len(events),
-        "events_with_both_books": events_with_pinnacle,
-        "api_requests_remaining": remaining,
+        "opportunities": ev_opportunities_from_sides(result.get("sides") or []),
+        "events_fetched": result.get("events_fetched") or 0,
+        "events_with_both_books": result.get("events_with_both_books") or 0,
+        "api_requests_remaining": result.get("api_requests_remaining"),
     }
 
 
@@ -1605,6 +1573,7 @@ async def run_jit_clv_snatcher(db, *, include_summary: bool = False) -> int | di
     from datetime import datetime, timezone, timedelta
     from services.clv_tracking import (
         CLOSE_WINDOW_MINUTES,
+        build_reference_index,
         has_valid_close_snapshot,
         repair_recent_clv_tracking_identity,
         update_bet_reference_snapshots,
@@ -1622,25 +1591,31 @@ async def run_jit_clv_snatcher(db, *, include_summary: bool = False) -> int | di
     window_end_iso = window_end.isoformat()
     identity_backfill = repair_recent_clv_tracking_identity(db, now=now)
 
-    bet_result = (
-        db.table("bets")
-        .select(
-            "id,surface,clv_sport_key,commence_time,pinnacle_odds_at_close,clv_updated_at,"
-            "source_event_id,clv_event_id,source_market_key"
-        )
-        .eq("result", "pending")
-        .not_.is_("clv_sport_key", "null")
-        .gt("commence_time", now_iso)
-        .lte("commence_time", window_end_iso)
-        .execute()
-    )
-    try:
-        opportunity_result = (
-            db.table("scan_opportunities")
-            .select("id,sport,surface,event_id,source_market_key,commence_time,reference_odds_at_close,close_captured_at")
+    bet_result = await retry_supabase_async(
+        lambda: (
+            db.table("bets")
+            .select(
+                "id,surface,clv_sport_key,commence_time,pinnacle_odds_at_close,clv_updated_at,"
+                "source_event_id,clv_event_id,source_market_key"
+            )
+            .eq("result", "pending")
+            .not_.is_("clv_sport_key", "null")
             .gt("commence_time", now_iso)
             .lte("commence_time", window_end_iso)
             .execute()
+        ),
+        label="bets.select_jit_clv_window",
+    )
+    try:
+        opportunity_result = await retry_supabase_async(
+            lambda: (
+                db.table("scan_opportunities")
+                .select("id,sport,surface,event_id,source_market_key,commence_time,reference_odds_at_close,close_captured_at")
+                .gt("commence_time", now_iso)
+                .lte("commence_time", window_end_iso)
+                .execute()
+            ),
+            label="scan_opportunities.select_jit_clv_window",
         )
     except Exception as e:
         if is_missing_scan_opportunities_error(e):
@@ -1648,12 +1623,15 @@ async def run_jit_clv_snatcher(db, *, include_summary: bool = False) -> int | di
         else:
             raise
     try:
-        pickem_result = (
-            db.table("pickem_research_observations")
-            .select("id,sport,event_id,market_key,commence_time,close_reference_odds,close_captured_at")
-            .gt("commence_time", now_iso)
-            .lte("commence_time", window_end_iso)
-            .execute()
+        pickem_result = await retry_supabase_async(
+            lambda: (
+                db.table("pickem_research_observations")
+                .select("id,sport,event_id,market_key,commence_time,close_reference_odds,close_captured_at")
+                .gt("commence_time", now_iso)
+                .lte("commence_time", window_end_iso)
+                .execute()
+            ),
+            label="pickem_research_observations.select_jit_clv_window",
         )
     except Exception as e:
         if is_missing_pickem_research_observations_error(e):
@@ -1820,18 +1798,27 @@ async def run_jit_clv_snatcher(db, *, include_summary: bool = False) -> int | di
             for key, value in (fetched_summary.get("market_counts") or {}).items():
                 fetched_side_markets[key] = int(fetched_side_markets.get(key, 0)) + int(value)
 
-            bet_updates = update_bet_reference_snapshots(db, sides=sides, allow_close=True, now=now)
+            reference_index = build_reference_index(sides)
+            bet_updates = update_bet_reference_snapshots(
+                db,
+                sides=sides,
+                allow_close=True,
+                now=now,
+                reference_index=reference_index,
+            )
             opportunity_updates = update_scan_opportunity_reference_snapshots(
                 db,
                 sides=sides,
                 allow_close=True,
                 now=now,
+                reference_index=reference_index,
             )
             pickem_updates = update_pickem_research_close_snapshots(
                 db,
                 sides=sides,
                 allow_close=True,
                 now=now,
+                reference_index=reference_index,
             )
             for total_bucket, partial in (
                 (total_bet_updates, bet_updates),
@@ -2110,7 +2097,7 @@ async def fetch_scores(sport: str, source: str = "auto_settle") -> list[dict]:
 
     daysFrom=2 returns games completed in the last 2 days — wide enough to
     catch overnight finishes and any games that ran into extra time.
-    Costs 1 API token per sport call.
+    Costs 2 API tokens per sport call (1 without daysFrom).
     """
     if not ODDS_API_KEY:
         raise ValueError("ODDS_API_KEY not set in environment")
@@ -2121,11 +2108,21 @@ async def fetch_scores(sport: str, source: str = "auto_settle") -> list[dict]:
         "daysFrom": 2,
         "dateFormat": "iso",
     }
+    reservation = _reserve_odds_api_call(
+        source=source,
+        endpoint=f"/sports/{sport}/scores",
+        sport=sport,
+        cost_key="scores:daysFrom=2",
+        default_cost=2,
+    )
     started = time.monotonic()
+    resp_headers = None
     try:
         from services.http_client import request_with_retries
 
-        resp = await request_with_retries("GET", url, params=params, retries=2)
+        async with odds_api_request_slot(reservation):
+            resp = await request_with_retries("GET", url, params=params, retries=2)
+        resp_headers = resp.headers
         resp.raise_for_status()
         duration_ms = (time.monotonic() - started) * 1000
         remaining = resp.headers.get("x-requests-remaining") or resp.headers.get("x-request-remaining")
@@ -2183,6 +2180,8 @@ async def fetch_scores(sport: str, source: str = "auto_settle") -> list[dict]:
             error_message=str(e),
         )
         raise
+    finally:
+        settle_odds_api_credits(reservation, resp_headers)
 
 
 def _grade_ml(
@@ -2655,16 +2654,19 @@ async def run_auto_settler(db, source: str = "auto_settle") -> int:
     now_iso = now.isoformat()
 
     try:
-        result = (
-            db.table("bets")
-            .select(
-                "id,market,surface,clv_sport_key,clv_team,commence_time,clv_event_id,"
-                "participant_name,source_market_key,line_value,selection_side"
-            )
-            .eq("result", "pending")
-            .not_.is_("clv_sport_key", "null")
-            .lt("commence_time", now_iso)
-            .execute()
+        result = await retry_supabase_async(
+            lambda: (
+                db.table("bets")
+                .select(
+                    "id,market,surface,clv_sport_key,clv_team,commence_time,clv_event_id,"
+                    "participant_name,source_market_key,line_value,selection_side"
+                )
+                .eq("result", "pending")
+                .not_.is_("clv_sport_key", "null")
+                .lt("commence_time", now_iso)
+                .execute()
+            ),
+            label="bets.select_pending_auto_settle",
         )
     except Exception as e:
         # Backward compatibility: if migration for clv_event_id is not applied yet,
@@ -2972,8 +2974,7 @@ def get_last_auto_settler_summary() -> dict | None:
 
 
 def _selection_key_token(value: str | None) -> str:
-    raw = str(value or "").strip().lower()
-    return "".join(ch for ch in raw if ch.isalnum())
+    return canonical_player_token(value)
 
 
 def _selection_line_token(value: float | int | None, *, include_plus: bool = False) -> str | None:
@@ -3053,8 +3054,11 @@ async def scan_all_sides(sport: str = "basketball_nba", source: str = "unknown")
 
         event_id = str(event.get("id") or "").strip() or None
         sport_key = event.get("sport_key", sport)
+        # Label fields are shared by every side of the event; build them once here.
         event_label = f"{away} @ {home}"
         event_short = build_short_event_label(sport_key, away, home)
+        home_short = canonical_short_name(sport_key, home)
+        away_short = canonical_short_name(sport_key, away)
         pin_outcomes = _extract_outcomes(event.get("bookmakers", []), SHARP_BOOK)
         if not pin_outcomes:
             continue
@@ -3080,6 +3084,17 @@ async def scan_all_sides(sport: str = "basketball_nba", source: str = "unknown")
             true_prob_draw = None
         pin_spreads_market = _extract_spreads_bookmaker_market(event.get("bookmakers", []), SHARP_BOOK, home, away)
         pin_totals_market = _extract_totals_bookmaker_market(event.get("bookmakers", []), SHARP_BOOK)
+        # One de-vig per Pinnacle line; every target book below prices against it.
+        spread_true_probs = (
+            devig_pinnacle(float(pin_spreads_market["home_odds"]), float(pin_spreads_market["away_odds"]))
+            if pin_spreads_market
+            else None
+        )
+        totals_true_probs = (
+            devig_pinnacle(float(pin_totals_market["over_odds"]), float(pin_totals_market["under_odds"]))
+            if pin_totals_market
+            else None
+        )
         had_any_book = False
 
         for book_key, book_display in TARGET_BOOKS.items():
@@ -3124,12 +3139,12 @@ async def scan_all_sides(sport: str = "basketball_nba", source: str = "unknown")
                         "event_short": event_short,
                         "commence_time": commence,
                         "team": home,
-                        "team_short": canonical_short_name(sport_key, home),
-                        "opponent_short": canonical_short_name(sport_key, away),
+                        "team_short": home_short,
+                        "opponent_short": away_short,
                         "pinnacle_odds": pin_home,
                         "book_odds": book_home,
                         "true_prob": home_edge["true_prob"],
-                        "base_kelly_fraction": round(kelly_fraction(home_edge["true_prob"], home_edge["book_decimal"]), 6),
+                        "base_kelly_fraction": home_edge["base_kelly_fraction"],
                         "book_decimal": home_edge["book_decimal"],
                         "ev_percentage": home_edge["ev_percentage"],
                     })
@@ -3151,12 +3166,12 @@ async def scan_all_sides(sport: str = "basketball_nba", source: str = "unknown")
                         "event_short": event_short,
                         "commence_time": commence,
                         "team": away,
-                        "team_short": canonical_short_name(sport_key, away),
-                        "opponent_short": canonical_short_name(sport_key, home),
+                        "team_short": away_short,
+                        "opponent_short": home_short,
                         "pinnacle_odds": pin_away,
                         "book_odds": book_away,
                         "true_prob": away_edge["true_prob"],
-                        "base_kelly_fraction": round(kelly_fraction(away_edge["true_prob"], away_edge["book_decimal"]), 6),
+                        "base_kelly_fraction": away_edge["base_kelly_fraction"],
                         "book_decimal": away_edge["book_decimal"],
                         "ev_percentage": away_edge["ev_percentage"],
                     })
@@ -3193,7 +3208,7 @@ async def scan_all_sides(sport: str = "basketball_nba", source: str = "unknown")
                                 "pinnacle_odds": pin_outcomes[draw_key],
                                 "book_odds": book_outcomes[book_draw_key],
                                 "true_prob": draw_edge["true_prob"],
-                                "base_kelly_fraction": round(kelly_fraction(draw_edge["true_prob"], draw_edge["book_decimal"]), 6),
+                                "base_kelly_fraction": draw_edge["base_kelly_fraction"],
                                 "book_decimal": draw_edge["book_decimal"],
                                 "ev_percentage": draw_edge["ev_percentage"],
                             })
@@ -3206,10 +3221,6 @@ async def scan_all_sides(sport: str = "basketball_nba", source: str = "unknown")
                 and abs(float(pin_spreads_market["away_spread"]) - float(book_spreads_market["away_spread"])) <= 0.01
             ):
                 had_any_book = True
-                spread_true_probs = devig_pinnacle(
-                    float(pin_spreads_market["home_odds"]),
-                    float(pin_spreads_market["away_odds"]),
-                )
                 home_spread_edge = calculate_edge(spread_true_probs["team_a"], float(book_spreads_market["home_odds"]))
                 away_spread_edge = calculate_edge(spread_true_probs["team_b"], float(book_spreads_market["away_odds"]))
                 home_spread_link, home_spread_link_level = resolve_sportsbook_deeplink(
@@ -3246,12 +3257,12 @@ async def scan_all_sides(sport: str = "basketball_nba", source: str = "unknown")
                     "event_short": event_short,
                     "commence_time": commence,
                     "team": home,
-                    "team_short": canonical_short_name(sport_key, home),
-                    "opponent_short": canonical_short_name(sport_key, away),
+                    "team_short": home_short,
+                    "opponent_short": away_short,
                     "pinnacle_odds": float(pin_spreads_market["home_odds"]),
                     "book_odds": float(book_spreads_market["home_odds"]),
                     "true_prob": home_spread_edge["true_prob"],
-                    "base_kelly_fraction": round(kelly_fraction(home_spread_edge["true_prob"], home_spread_edge["book_decimal"]), 6),
+                    "base_kelly_fraction": home_spread_edge["base_kelly_fraction"],
                     "book_decimal": home_spread_edge["book_decimal"],
                     "ev_percentage": home_spread_edge["ev_percentage"],
                 })
@@ -3275,12 +3286,12 @@ async def scan_all_sides(sport: str = "basketball_nba", source: str = "unknown")
                     "event_short": event_short,
                     "commence_time": commence,
                     "team": away,
-                    "team_short": canonical_short_name(sport_key, away),
-                    "opponent_short": canonical_short_name(sport_key, home),
+                    "team_short": away_short,
+                    "opponent_short": home_short,
                     "pinnacle_odds": float(pin_spreads_market["away_odds"]),
                     "book_odds": float(book_spreads_market["away_odds"]),
                     "true_prob": away_spread_edge["true_prob"],
-                    "base_kelly_fraction": round(kelly_fraction(away_spread_edge["true_prob"], away_spread_edge["book_decimal"]), 6),
+                    "base_kelly_fraction": away_spread_edge["base_kelly_fraction"],
                     "book_decimal": away_spread_edge["book_decimal"],
                     "ev_percentage": away_spread_edge["ev_percentage"],
                 })
@@ -3292,10 +3303,6 @@ async def scan_all_sides(sport: str = "basketball_nba", source: str = "unknown")
                 and abs(float(pin_totals_market["total"]) - float(book_totals_market["total"])) <= 0.01
             ):
                 had_any_book = True
-                totals_true_probs = devig_pinnacle(
-                    float(pin_totals_market["over_odds"]),
-                    float(pin_totals_market["under_odds"]),
-                )
                 over_edge = calculate_edge(totals_true_probs["team_a"], float(book_totals_market["over_odds"]))
                 under_edge = calculate_edge(totals_true_probs["team_b"], float(book_totals_market["under_odds"]))
                 total_token = _selection_line_token(book_totals_market["total"])
@@ -3336,7 +3343,7 @@ async def scan_all_sides(sport: str = "basketball_nba", source: str = "unknown")
                     "pinnacle_odds": float(pin_totals_market["over_odds"]),
                     "book_odds": float(book_totals_market["over_odds"]),
                     "true_prob": over_edge["true_prob"],
-                    "base_kelly_fraction": round(kelly_fraction(over_edge["true_prob"], over_edge["book_decimal"]), 6),
+                    "base_kelly_fraction": over_edge["base_kelly_fraction"],
                     "book_decimal": over_edge["book_decimal"],
                     "ev_percentage": over_edge["ev_percentage"],
                 })
@@ -3365,7 +3372,7 @@ async def scan_all_sides(sport: str = "basketball_nba", source: str = "unknown")
                     "pinnacle_odds": float(pin_totals_market["under_odds"]),
                     "book_odds": float(book_totals_market["under_odds"]),
                     "true_prob": under_edge["true_prob"],
-                    "base_kelly_fraction": round(kelly_fraction(under_edge["true_prob"], under_edge["book_decimal"]), 6),
+                    "base_kelly_fraction": under_edge["base_kelly_fraction"],
                     "book_decimal": under_edge["book_decimal"],
                     "ev_percentage": under_edge["ev_percentage"],
                 })
@@ -0,0 +1,393 @@
+"""
+Odds API credit budget shared by every job and worker.
+
+Each outbound Odds API call is classified by its `source` into a job class
+with a priority (close capture > settlement > board drop > manual scan >
+ops lookup). Before the call it reserves its estimated cost against the last
+`x-requests-remaining` seen by any worker. It then waits for a request slot,
+where higher-priority callers go first. Afterwards it records the real cost
+from `x-requests-last`, which becomes the estimate for the next call with the
+same endpoint/market mix. State lives in `shared_state`, i.e. Redis when
+configured.
+
+Lower-priority jobs are refused when they would push remaining credits under
+their floor (`ODDS_API_CREDIT_FLOORS`) or past their monthly budget
+(`ODDS_API_JOB_BUDGETS`). Manual scans and ops lookups are also refused when
+`ODDS_API_MONTHLY_CREDITS` is set and spend runs ahead of a linear monthly
+pace. Close capture is never refused.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import os
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, AsyncIterator, Mapping
+
+from services.runtime_support import log_event
+from services.shared_state import (
+    add_expiring_member,
+    get_counter,
+    get_expiring_members,
+    get_json,
+    get_json_fields,
+    increment_counter,
+    remove_expiring_member,
+    set_json,
+    set_json_field,
+)
+
+JOB_CLOSE_CAPTURE = "close_capture"
+JOB_SETTLEMENT = "settlement"
+JOB_BOARD_DROP = "board_drop"
+JOB_MANUAL_SCAN = "manual_scan"
+JOB_OPS_LOOKUP = "ops_lookup"
+
+# Lower value = higher priority.
+JOB_PRIORITIES = {
+    JOB_CLOSE_CAPTURE: 0,
+    JOB_SETTLEMENT: 1,
+    JOB_BOARD_DROP: 2,
+    JOB_MANUAL_SCAN: 3,
+    JOB_OPS_LOOKUP: 4,
+}
+DEFAULT_CREDIT_FLOORS = {
+    JOB_CLOSE_CAPTURE: 0,
+    JOB_SETTLEMENT: 0,
+    JOB_BOARD_DROP: 250,
+    JOB_MANUAL_SCAN: 1000,
+    JOB_OPS_LOOKUP: 2000,
+}
+HOT_PACE_DEGRADED_JOBS = frozenset({JOB_MANUAL_SCAN, JOB_OPS_LOOKUP})
+# Exact sources; anything containing clv/close or settle is matched by substring first.
+SOURCE_JOB_CLASSES = {
+    "scheduler": JOB_BOARD_DROP,
+    "scheduled_board_drop": JOB_BOARD_DROP,
+    "cron": JOB_BOARD_DROP,
+    "cron_scan": JOB_BOARD_DROP,
+    "ops_trigger": JOB_BOARD_DROP,
+    "ops_trigger_board_drop": JOB_BOARD_DROP,
+    "manual_scan": JOB_MANUAL_SCAN,
+    "manual_refresh": JOB_MANUAL_SCAN,
+    "scan_for_ev": JOB_MANUAL_SCAN,
+    "frontend": JOB_MANUAL_SCAN,
+    "fresh_scan": JOB_MANUAL_SCAN,
+    "backend": JOB_MANUAL_SCAN,
+    "unknown": JOB_MANUAL_SCAN,
+    "ops": JOB_OPS_LOOKUP,
+    "ops_alt_pitcher_k_lookup": JOB_OPS_LOOKUP,
+    "benchmark": JOB_OPS_LOOKUP,
+}
+# Unlisted sources get a middle tier rather than the most restrictive one.
+DEFAULT_SOURCE_JOB_CLASS = JOB_MANUAL_SCAN
+
+_REMAINING_KEY = "odds_api_budget:remaining"
+# One "<id>:<cost>" member per in-flight reservation, each with its own expiry, so
+# a worker that died mid-call leaks its reservation for at most the TTL.
+_RESERVATIONS_KEY = "odds_api_budget:reservations"
+# Hash of cost_key -> learned cost; each settle writes only its own field.
+_COSTS_KEY = "odds_api_budget:learned_costs"
+_STATE_TTL_SECONDS = 40 * 24 * 60 * 60
+_RESERVED_TTL_SECONDS = 10 * 60
+
+_warned_unknown_sources: set[str] = set()
+
+
+class OddsApiBudgetExceeded(RuntimeError):
+    """A call was refused to protect credits for higher-priority jobs."""
+
+    def __init__(self, *, source: str, job: str, reason: str, estimated_cost: int, remaining: int | None) -> None:
+        super().__init__(f"Odds API budget refused {job} call from {source}: {reason}")
+        self.source = source
+        self.job = job
+        self.reason = reason
+        self.estimated_cost = estimated_cost
+        self.remaining = remaining
+
+
+@dataclass(frozen=True)
+class CreditReservation:
+    source: str
+    job: str
+    cost_key: str
+    estimated_cost: int
+    reservation_id: str | None = None
+
+
+def job_class_for_source(source: str | None) -> str:
+    normalized = str(source or "").strip().lower()
+    if "clv" in normalized or "close" in normalized:
+        return JOB_CLOSE_CAPTURE
+    if "settle" in normalized:
+        return JOB_SETTLEMENT
+    job = SOURCE_JOB_CLASSES.get(normalized)
+    if job is not None:
+        return job
+    if "board_drop" in normalized:
+        return JOB_BOARD_DROP
+    if normalized.startswith("manual"):
+        return JOB_MANUAL_SCAN
+    if normalized not in _warned_unknown_sources:
+        _warned_unknown_sources.add(normalized)
+        log_event(
+            "odds_api.budget.unknown_source",
+            level="warning",
+            source=source,
+            job=DEFAULT_SOURCE_JOB_CLASS,
+        )
+    return DEFAULT_SOURCE_JOB_CLASS
+
+
+def _parse_job_ints(raw: str | None) -> dict[str, int]:
+    out: dict[str, int] = {}
+    for item in str(raw or "").split(","):
+        job, _, value = item.partition("=")
+        job = job.strip()
+        if job not in JOB_PRIORITIES:
+            continue
+        try:
+            out[job] = max(0, int(value))
+        except ValueError:
+            continue
+    return out
+
+
+def _credit_floors() -> dict[str, int]:
+    floors = {**DEFAULT_CREDIT_FLOORS, **_parse_job_ints(os.getenv("ODDS_API_CREDIT_FLOORS"))}
+    floors[JOB_CLOSE_CAPTURE] = 0
+    return floors
+
+
+def _job_budgets() -> dict[str, int]:
+    budgets = _parse_job_ints(os.getenv("ODDS_API_JOB_BUDGETS"))
+    budgets.pop(JOB_CLOSE_CAPTURE, None)
+    return budgets
+
+
+def _env_int(name: str) -> int | None:
+    try:
+        value = int(os.getenv(name) or "")
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name) or default)
+    except ValueError:
+        return default
+
+
+def _parse_header_int(headers: Mapping[str, Any] | None, *names: str) -> int | None:
+    if headers is None:
+        return None
+    for name in names:
+        raw = headers.get(name)
+        if raw in (None, ""):
+            continue
+        try:
+            return int(float(raw))
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def _month_key(now: datetime) -> str:
+    return now.strftime("%Y-%m")
+
+
+def _spent_key(job: str, now: datetime) -> str:
+    return f"odds_api_budget:spent:{_month_key(now)}:{job}"
+
+
+def _last_remaining() -> int | None:
+    state = get_json(_REMAINING_KEY)
+    if not isinstance(state, dict):
+        return None
+    remaining = state.get("remaining")
+    return int(remaining) if isinstance(remaining, (int, float)) else None
+
+
+def _month_elapsed_fraction(now: datetime) -> float:
+    start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if start.month == 12:
+        end = start.replace(year=start.year + 1, month=1)
+    else:
+        end = start.replace(month=start.month + 1)
+    return (now - start).total_seconds() / (end - start).total_seconds()
+
+
+def is_running_hot(remaining: int | None, *, now: datetime | None = None) -> bool:
+    """True when remaining credits trail a linear spend of `ODDS_API_MONTHLY_CREDITS` by more than the slack."""
+    quota = _env_int("ODDS_API_MONTHLY_CREDITS")
+    if quota is None or remaining is None:
+        return False
+    now = now or datetime.now(UTC)
+    paced_remaining = quota * (1.0 - _month_elapsed_fraction(now))
+    return remaining < paced_remaining * _env_float("ODDS_API_HOT_PACE_RATIO", 0.8)
+
+
+def reserved_credits() -> int:
+    """Credits held by reservations that are still in flight (expired ones are pruned)."""
+    total = 0
+    for member in get_expiring_members(_RESERVATIONS_KEY):
+        try:
+            total += int(member.rsplit(":", 1)[1])
+        except (IndexError, ValueError):
+            continue
+    return total
+
+
+def estimate_cost(cost_key: str, default_cost: int) -> int:
+    learned = get_json_fields(_COSTS_KEY).get(cost_key)
+    if isinstance(learned, dict) and isinstance(learned.get("cost"), (int, float)):
+        return max(0, int(learned["cost"]))
+    return max(0, int(default_cost))
+
+
+def _refusal_reason(job: str, estimated_cost: int, remaining: int | None, now: datetime) -> str | None:
+    if job == JOB_CLOSE_CAPTURE:
+        return None
+    if remaining is not None:
+        available = remaining - reserved_credits()
+        floor = _credit_floors().get(job, 0)
+        if available - estimated_cost < floor:
+            return f"would leave {available - estimated_cost} credits, floor is {floor}"
+        if job in HOT_PACE_DEGRADED_JOBS and is_running_hot(remaining, now=now):
+            return "monthly credit spend is ahead of pace"
+    budget = _job_budgets().get(job)
+    if budget is not None:
+        spent = get_counter(_spent_key(job, now))
+        if spent + estimated_cost > budget:
+            return f"monthly {job} budget of {budget} credits is spent ({spent})"
+    return None
+
+
+def reserve_odds_api_credits(*, source: str, cost_key: str, default_cost: int) -> CreditReservation:
+    """Reserve the estimated cost of one call, or raise `OddsApiBudgetExceeded`."""
+    job = job_class_for_source(source)
+    estimated_cost = estimate_cost(cost_key, default_cost)
+    remaining = _last_remaining()
+    reason = _refusal_reason(job, estimated_cost, remaining, datetime.now(UTC))
+    if reason is not None:
+        log_event(
+            "odds_api.budget.refused",
+            level="warning",
+            source=source,
+            job=job,
+            cost_key=cost_key,
+            estimated_cost=estimated_cost,
+            remaining=remaining,
+            reason=reason,
+        )
+        raise OddsApiBudgetExceeded(
+            source=source,
+            job=job,
+            reason=reason,
+            estimated_cost=estimated_cost,
+            remaining=remaining,
+        )
+    reservation_id = None
+    if estimated_cost:
+        reservation_id = f"{uuid.uuid4().hex}:{estimated_cost}"
+        add_expiring_member(_RESERVATIONS_KEY, reservation_id, _RESERVED_TTL_SECONDS)
+    return CreditReservation(
+        source=source,
+        job=job,
+        cost_key=cost_key,
+        estimated_cost=estimated_cost,
+        reservation_id=reservation_id,
+    )
+
+
+def settle_odds_api_credits(reservation: CreditReservation, headers: Mapping[str, Any] | None) -> None:
+    """Release the reservation and learn from the response's credit headers (None when no response)."""
+    try:
+        if reservation.reservation_id:
+            remove_expiring_member(_RESERVATIONS_KEY, reservation.reservation_id)
+        now = datetime.now(UTC)
+        remaining = _parse_header_int(headers, "x-requests-remaining", "x-request-remaining")
+        if remaining is not None:
+            set_json(_REMAINING_KEY, {"remaining": remaining, "observed_at": now.isoformat()}, _STATE_TTL_SECONDS)
+        used = _parse_header_int(headers, "x-requests-last")
+        if used is None:
+            return
+        if used:
+            increment_counter(_spent_key(reservation.job, now), used, _STATE_TTL_SECONDS)
+        set_json_field(_COSTS_KEY, reservation.cost_key, {"cost": used, "observed_at": now.isoformat()}, _STATE_TTL_SECONDS)
+    except Exception as exc:
+        log_event(
+            "odds_api.budget.settle_failed",
+            level="warning",
+            source=reservation.source,
+            error_class=type(exc).__name__,
+            error=str(exc),
+        )
+
+
+def _max_concurrency() -> int:
+    return max(1, _env_int("ODDS_API_MAX_CONCURRENCY") or 6)
+
+
+class _PriorityGate:
+    """Per-process cap on in-flight Odds API calls; queued callers are admitted by job priority."""
+
+    def __init__(self) -> None:
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+
+    async def acquire(self, priority: int) -> None:
+        if self._active < _max_concurrency() and not self._waiters:
+            self._active += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self._active = max(0, self._active - 1)
+        while self._waiters and self._active < _max_concurrency():
+            _priority, _seq, future = heapq.heappop(self._waiters)
+            if future.done() or future.get_loop().is_closed():
+                continue
+            self._active += 1
+            future.set_result(None)
+
+
+_GATE = _PriorityGate()
+
+
+@asynccontextmanager
+async def odds_api_request_slot(reservation: CreditReservation) -> AsyncIterator[None]:
+    await _GATE.acquire(JOB_PRIORITIES.get(reservation.job, len(JOB_PRIORITIES)))
+    try:
+        yield
+    finally:
+        _GATE.release()
+
+
+def get_odds_api_budget_snapshot() -> dict[str, Any]:
+    now = datetime.now(UTC)
+    remaining = _last_remaining()
+    return {
+        "remaining": remaining,
+        "reserved": reserved_credits(),
+        "running_hot": is_running_hot(remaining, now=now),
+        "monthly_credits": _env_int("ODDS_API_MONTHLY_CREDITS"),
+        "floors": _credit_floors(),
+        "budgets": _job_budgets(),
+        "spent_this_month": {job: get_counter(_spent_key(job, now)) for job in JOB_PRIORITIES},
+        "learned_costs": get_json_fields(_COSTS_KEY),
+    }
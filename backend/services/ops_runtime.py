@@ -11,7 +11,7 @@ from typing import Any
 
 from fastapi import FastAPI
 
-from database import get_db
+from database import fake_supabase_enabled, get_db
 from services.runtime_support import log_event, retry_supabase, utc_now_iso
 from services.shared_state import is_redis_enabled
 
@@ -277,6 +277,8 @@ def runtime_state() -> dict:
 
 
 def check_db_ready() -> tuple[bool, str | None]:
+    if fake_supabase_enabled():
+        return check_db_ready_via_client()
     url = (os.getenv("SUPABASE_URL") or "").strip().rstrip("/")
     key = (os.getenv("SUPABASE_SERVICE_ROLE_KEY") or "").strip()
     if not url or not key:
@@ -11,12 +11,16 @@ from models import (
     PickEmResearchRecentRow,
     PickEmResearchSummaryResponse,
 )
+from services.clv_tracking import ReferenceIndex
+from services.supabase_merge import is_missing_rpc_function_error, merge_rows_via_rpc
 from services.supabase_paging import fetch_all_rows
 
 OBSERVATION_KIND = "board_pickem_consensus"
 EV_BASIS_BEST_MARKET = "best_market_price"
 EV_BASIS_UNPRICED = "unpriced"
 OBSERVATION_QUERY_CHUNK_SIZE = 200
+OBSERVATION_MERGE_CHUNK_SIZE = 500
+PICKEM_OBSERVATION_MERGE_FUNCTION = "merge_pickem_research_observations"
 
 PROBABILITY_BUCKET_ORDER = ["50-55%", "55-60%", "60-65%", "65-70%", "70%+", "Unknown"]
 BOOKS_MATCHED_BUCKET_ORDER = ["1 book", "2 books", "3 books", "4+ books", "Unknown"]
@@ -222,6 +226,84 @@ def empty_pickem_research_summary() -> PickEmResearchSummaryResponse:
     )
 
 
+def _pickem_observation_insert_payload(observation_key: str, payload: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "observation_key": observation_key,
+        "surfaced_count": 1,
+        "latest_reference_odds": None,
+        "latest_reference_updated_at": None,
+        "close_reference_odds": None,
+        "close_opposing_reference_odds": None,
+        "close_true_prob": None,
+        "close_quality": None,
+        "close_captured_at": None,
+        "close_edge_pct": None,
+        "actual_result": None,
+        "settled_at": None,
+        **payload,
+    }
+
+
+def _capture_pickem_research_observations_row_by_row(
+    db,
+    prepared: list[tuple[str, dict[str, Any]]],
+) -> tuple[int, int]:
+    """Legacy select-then-write path used until the merge function is deployed."""
+    observation_keys = [observation_key for observation_key, _payload in prepared]
+    existing_rows: list[dict[str, Any]] = []
+    try:
+        for key_chunk in _chunked(observation_keys, OBSERVATION_QUERY_CHUNK_SIZE):
+            existing = (
+                db.table("pickem_research_observations")
+                .select("id,observation_key,surfaced_count")
+                .in_("observation_key", key_chunk)
+                .execute()
+            )
+            existing_rows.extend(existing.data or [])
+    except Exception as exc:
+        if is_missing_pickem_research_observations_error(exc):
+            return 0, 0
+        raise
+
+    existing_by_key = {
+        str(row.get("observation_key") or ""): row
+        for row in existing_rows
+        if row.get("observation_key")
+    }
+
+    inserts: list[dict[str, Any]] = []
+    updated = 0
+
+    for observation_key, payload in prepared:
+        existing_row = existing_by_key.get(observation_key)
+        if existing_row is None:
+            inserts.append(_pickem_observation_insert_payload(observation_key, payload))
+            continue
+
+        updated += 1
+        db.table("pickem_research_observations").update(
+            {
+                "last_source": payload["last_source"],
+                "last_seen_at": payload["last_seen_at"],
+                "last_display_probability": payload["last_display_probability"],
+                "last_fair_odds_american": payload["last_fair_odds_american"],
+                "last_books_matched_count": payload["last_books_matched_count"],
+                "last_confidence_label": payload["last_confidence_label"],
+                "last_selected_sportsbook": payload["last_selected_sportsbook"],
+                "last_selected_market_odds": payload["last_selected_market_odds"],
+                "last_projected_edge_pct": payload["last_projected_edge_pct"],
+                "ev_basis": payload["ev_basis"],
+                "surfaced_count": int(existing_row.get("surfaced_count") or 0) + 1,
+            }
+        ).eq("id", existing_row["id"]).execute()
+
+    if inserts:
+        for insert_chunk in _chunked(inserts, OBSERVATION_QUERY_CHUNK_SIZE):
+            db.table("pickem_research_observations").insert(insert_chunk).execute()
+
+    return len(inserts), updated
+
+
 def capture_pickem_research_observations(
     db,
     *,
@@ -296,75 +378,28 @@ def capture_pickem_research_observations(
     if not prepared:
         return {"eligible_seen": 0, "inserted": 0, "updated": 0}
 
-    observation_keys = [observation_key for observation_key, _payload in prepared]
-    existing_rows: list[dict[str, Any]] = []
+    # One merge statement cannot touch the same key twice; the latest card wins.
+    prepared = list({observation_key: (observation_key, payload) for observation_key, payload in prepared}.values())
     try:
-        for key_chunk in _chunked(observation_keys, OBSERVATION_QUERY_CHUNK_SIZE):
-            existing = (
-                db.table("pickem_research_observations")
-                .select("id,observation_key,surfaced_count")
-                .in_("observation_key", key_chunk)
-                .execute()
-            )
-            existing_rows.extend(existing.data or [])
+        merged = merge_rows_via_rpc(
+            db,
+            function_name=PICKEM_OBSERVATION_MERGE_FUNCTION,
+            rows=[_pickem_observation_insert_payload(observation_key, payload) for observation_key, payload in prepared],
+            chunk_size=OBSERVATION_MERGE_CHUNK_SIZE,
+        )
     except Exception as exc:
-        if is_missing_pickem_research_observations_error(exc):
+        # Check the function first: its name contains the table name.
+        if is_missing_rpc_function_error(exc, PICKEM_OBSERVATION_MERGE_FUNCTION):
+            inserted, updated = _capture_pickem_research_observations_row_by_row(db, prepared)
+        elif is_missing_pickem_research_observations_error(exc):
             return {"eligible_seen": len(prepared), "inserted": 0, "updated": 0}
-        raise
-
-    existing_by_key = {
-        str(row.get("observation_key") or ""): row
-        for row in existing_rows
-        if row.get("observation_key")
-    }
-
-    inserts: list[dict[str, Any]] = []
-    updated = 0
-
-    for observation_key, payload in prepared:
-        existing_row = existing_by_key.get(observation_key)
-        if existing_row is None:
-            inserts.append(
-                {
-                    "observation_key": observation_key,
-                    "surfaced_count": 1,
-                    "latest_reference_odds": None,
-                    "latest_reference_updated_at": None,
-                    "close_reference_odds": None,
-                    "close_opposing_reference_odds": None,
-                    "close_true_prob": None,
-                    "close_quality": None,
-                    "close_captured_at": None,
-                    "close_edge_pct": None,
-                    "actual_result": None,
-                    "settled_at": None,
-                    **payload,
-                }
-            )
-            continue
-
-        updated += 1
-        db.table("pickem_research_observations").update(
-            {
-                "last_source": payload["last_source"],
-                "last_seen_at": payload["last_seen_at"],
-                "last_display_probability": payload["last_display_probability"],
-                "last_fair_odds_american": payload["last_fair_odds_american"],
-                "last_books_matched_count": payload["last_books_matched_count"],
-                "last_confidence_label": payload["last_confidence_label"],
-                "last_selected_sportsbook": payload["last_selected_sportsbook"],
-                "last_selected_market_odds": payload["last_selected_market_odds"],
-                "last_projected_edge_pct": payload["last_projected_edge_pct"],
-                "ev_basis": payload["ev_basis"],
-                "surfaced_count": int(existing_row.get("surfaced_count") or 0) + 1,
-            }
-        ).eq("id", existing_row["id"]).execute()
-
-    if inserts:
-        for insert_chunk in _chunked(inserts, OBSERVATION_QUERY_CHUNK_SIZE):
-            db.table("pickem_research_observations").insert(insert_chunk).execute()
+        else:
+            raise
+    else:
+        inserted = sum(int(row.get("inserted_count") or 0) for row in merged)
+        updated = sum(int(row.get("updated_count") or 0) for row in merged)
 
-    return {"eligible_seen": len(prepared), "inserted": len(inserts), "updated": updated}
+    return {"eligible_seen": len(prepared), "inserted": inserted, "updated": updated}
 
 
 def update_pickem_research_close_snapshots(
@@ -373,6 +408,7 @@ def update_pickem_research_close_snapshots(
     sides: list[dict[str, Any]],
     allow_close: bool,
     now: datetime | None = None,
+    reference_index: ReferenceIndex | None = None,
 ) -> dict[str, Any]:
     if not sides:
         from services.clv_tracking import _new_snapshot_update_summary, _normalize_snapshot_summary
@@ -381,28 +417,27 @@ def update_pickem_research_close_snapshots(
 
     from services.clv_tracking import (
         _bump_counter,
-        _build_reference_coverage,
         _diagnose_prop_reference_miss,
         _mark_snapshot_reason,
         _mark_identity_backfill,
         _new_snapshot_update_summary,
         _normalize_snapshot_summary,
         _repair_pickem_identity_row,
-        build_prop_reference_pair_snapshots,
-        build_prop_reference_snapshots,
+        build_reference_index,
         has_valid_close_snapshot,
         lookup_prop_opposing_reference_odds,
         lookup_prop_reference_odds,
         should_capture_close_snapshot,
     )
 
-    prop_snapshot_by_event, prop_snapshot_by_time = build_prop_reference_snapshots(sides)
-    prop_pair_by_event, prop_pair_by_time = build_prop_reference_pair_snapshots(sides)
-    coverage = _build_reference_coverage(sides)
-    if not prop_snapshot_by_event and not prop_snapshot_by_time:
+    index = reference_index or build_reference_index(sides)
+    prop_snapshot_by_event, prop_snapshot_by_time = index.prop_snapshot_by_event, index.prop_snapshot_by_time
+    prop_pair_by_event, prop_pair_by_time = index.prop_pair_by_event, index.prop_pair_by_time
+    coverage = index.coverage
+    if not index.has_prop_references():
         return _normalize_snapshot_summary(_new_snapshot_update_summary())
 
-    sports = sorted({str(side.get("sport") or "").strip() for side in sides if side.get("sport")})
+    sports = index.sports
     try:
         query = (
             db.table("pickem_research_observations")
@@ -519,7 +554,7 @@ async def settle_pickem_research_observations(
     from services.prop_settler import (
         build_player_stat_map,
         fetch_boxscore_provider_events_for_rows,
-        fetch_boxscore_summary,
+        get_cached_boxscore_summary,
         grade_prop,
         resolve_boxscore_event_id,
     )
@@ -567,6 +602,7 @@ async def settle_pickem_research_observations(
         provider_prefetch_rows,
         sport_field="sport",
         commence_time_field="commence_time",
+        event_id_field="event_id",
         now=current,
     )
 
@@ -606,6 +642,7 @@ async def settle_pickem_research_observations(
             telemetry=telemetry,
             context="pickem_research",
             ref_id=str(row.get("id")) if row.get("id") is not None else None,
+            odds_event_ids=(row.get("event_id"),),
         )
         provider_event_id = res.provider_event_id
         if not provider_event_id:
@@ -615,7 +652,7 @@ async def settle_pickem_research_observations(
         summary_cache_key = (sport, provider_event_id)
         if summary_cache_key not in boxscore_summary_cache:
             try:
-                boxscore_summary_cache[summary_cache_key] = await fetch_boxscore_summary(
+                boxscore_summary_cache[summary_cache_key] = await get_cached_boxscore_summary(
                     sport,
                     provider_event_id,
                 )
@@ -5,6 +5,7 @@ from typing import Any, Literal
 
 from calculations import american_to_decimal
 from services.scan_cache import load_latest_scan_payload
+from services.team_aliases import canonical_player_token
 
 
 BOARD_VIEW_OPPORTUNITIES = "opportunities"
@@ -113,7 +114,7 @@ def _persist_chunked_rows(
 
 
 def _canonicalize(value: str | None) -> str:
-    return "".join(ch for ch in str(value or "").strip().lower() if ch.isalnum())
+    return canonical_player_token(value)
 
 
 def _median(values: list[float]) -> float:
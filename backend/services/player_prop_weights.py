@@ -6,12 +6,24 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from services.shared_state import get_json, set_json
+from services.supabase_merge import is_missing_rpc_function_error, merge_rows_via_rpc
+from services.supabase_paging import fetch_all_rows
 
 PLAYER_PROP_WEIGHT_CACHE_KEY = "player-prop-model-weights"
 PLAYER_PROP_WEIGHT_CACHE_TTL_SECONDS = 60 * 60 * 6
 PLAYER_PROP_WEIGHT_LOOKBACK_DAYS_ENV = "PLAYER_PROP_WEIGHT_LOOKBACK_DAYS"
 PLAYER_PROP_WEIGHT_MIN_SAMPLES_ENV = "PLAYER_PROP_WEIGHT_MIN_SAMPLES"
 PLAYER_PROP_WEIGHT_SUPPORTED_MODELS = {"props_v2_shadow", "props_v2_live"}
+PLAYER_PROP_WEIGHT_MODEL_FAMILY = "props_v2"
+PLAYER_PROP_WEIGHT_DECAY_DAYS = 7.0
+PLAYER_PROP_WEIGHT_ACCUMULATOR_TABLE = "player_prop_model_weight_accumulators"
+PLAYER_PROP_WEIGHT_MAX_LOOKBACK_DAYS = 90
+PLAYER_PROP_WEIGHT_WRITE_CHUNK_SIZE = 500
+# Written only by a full rebuild; until it exists the accumulators may hold just the
+# deltas recorded since migration 026, so training folds the raw rows instead.
+PLAYER_PROP_WEIGHT_SEEDED_MARKER_KEY = ("__meta__", "seeded")
+PLAYER_PROP_WEIGHT_ACCUMULATOR_INCREMENT_FUNCTION = "increment_player_prop_weight_accumulators"
+PLAYER_PROP_WEIGHT_ACCUMULATOR_REPLACE_FUNCTION = "replace_player_prop_weight_accumulators"
 PLAYER_PROP_WEIGHT_DEFAULTS: dict[str, float] = {
     "betonlineag": 3.0,
     "bovada": 1.5,
@@ -50,7 +62,7 @@ def get_player_prop_weight_lookback_days() -> int:
         parsed = int(raw)
     except Exception:
         parsed = 30
-    return max(7, min(parsed, 90))
+    return max(7, min(parsed, PLAYER_PROP_WEIGHT_MAX_LOOKBACK_DAYS))
 
 
 def get_player_prop_weight_min_samples() -> int:
@@ -122,71 +134,382 @@ def get_player_prop_weight_overrides(db=None) -> dict[str, dict[str, float]]:
     return weights
 
 
+def is_missing_player_prop_weight_accumulators_error(error: Exception) -> bool:
+    msg = str(error)
+    return "PGRST205" in msg or (PLAYER_PROP_WEIGHT_ACCUMULATOR_TABLE in msg and "schema cache" in msg)
+
+
+def _day_start(value: datetime) -> datetime:
+    return datetime(value.year, value.month, value.day, tzinfo=timezone.utc)
+
+
+def _weight_sample(row: dict[str, Any]) -> tuple[tuple[str, str, str], float, float] | None:
+    """Return ((market, book, close date), abs error, intra-day decay boost) for a closed row."""
+    model_key = str(row.get("model_key") or "").strip().lower()
+    if model_key not in PLAYER_PROP_WEIGHT_SUPPORTED_MODELS:
+        return None
+    close_prob = _coerce_float(row.get("close_true_prob"))
+    first_prob = _coerce_float(row.get("first_true_prob"))
+    close_captured_at = _coerce_datetime(row.get("close_captured_at"))
+    if close_prob is None or first_prob is None or close_captured_at is None:
+        return None
+    close_captured_at = close_captured_at.astimezone(timezone.utc)
+    day_start = _day_start(close_captured_at)
+    # Samples are stored relative to their bucket's midnight so a whole day can be
+    # decayed to "now" with one multiplication at training time.
+    offset_days = (close_captured_at - day_start).total_seconds() / 86400.0
+    key = (
+        str(row.get("market") or "").strip(),
+        str(row.get("sportsbook_key") or "").strip().lower(),
+        day_start.date().isoformat(),
+    )
+    return key, abs(first_prob - close_prob), math.exp(offset_days / PLAYER_PROP_WEIGHT_DECAY_DAYS)
+
+
+def build_player_prop_weight_accumulators(
+    rows: list[dict[str, Any]],
+) -> dict[tuple[str, str, str], dict[str, float]]:
+    """Fold closed evaluation rows into per-(market, book, close date) error accumulators."""
+    accumulators: dict[tuple[str, str, str], dict[str, float]] = {}
+    for row in rows:
+        sample = _weight_sample(row)
+        if sample is None:
+            continue
+        key, error, boost = sample
+        bucket = accumulators.setdefault(key, {"error_weight_sum": 0.0, "weight_sum": 0.0, "sample_count": 0})
+        bucket["error_weight_sum"] += error * boost
+        bucket["weight_sum"] += boost
+        bucket["sample_count"] += 1
+    return accumulators
+
+
+def player_prop_weight_accumulator_delta(
+    *,
+    before_rows: list[dict[str, Any]],
+    after_rows: list[dict[str, Any]],
+) -> dict[tuple[str, str, str], dict[str, float]]:
+    delta = build_player_prop_weight_accumulators(after_rows)
+    for key, bucket in build_player_prop_weight_accumulators(before_rows).items():
+        target = delta.setdefault(key, {"error_weight_sum": 0.0, "weight_sum": 0.0, "sample_count": 0})
+        for field, value in bucket.items():
+            target[field] -= value
+    return {
+        key: bucket
+        for key, bucket in delta.items()
+        if any(abs(value) > 1e-12 for value in bucket.values())
+    }
+
+
+def apply_player_prop_weight_accumulator_delta(
+    db,
+    *,
+    before_rows: list[dict[str, Any]],
+    after_rows: list[dict[str, Any]],
+) -> int:
+    """Merge a close-snapshot change into the persisted accumulators; returns buckets written."""
+    delta = player_prop_weight_accumulator_delta(before_rows=before_rows, after_rows=after_rows)
+    if not delta:
+        return 0
+
+    updated_at = _utc_now().isoformat()
+    try:
+        merged_counts = merge_rows_via_rpc(
+            db,
+            function_name=PLAYER_PROP_WEIGHT_ACCUMULATOR_INCREMENT_FUNCTION,
+            rows=[_accumulator_record(key, change, updated_at) for key, change in delta.items()],
+            chunk_size=PLAYER_PROP_WEIGHT_WRITE_CHUNK_SIZE,
+        )
+    except Exception as exc:
+        if is_missing_player_prop_weight_accumulators_error(exc):
+            return 0
+        if not is_missing_rpc_function_error(exc, PLAYER_PROP_WEIGHT_ACCUMULATOR_INCREMENT_FUNCTION):
+            raise
+    else:
+        return sum(int(row.get("bucket_count") or 0) for row in merged_counts)
+    return _apply_player_prop_weight_accumulator_delta_row_by_row(db, delta, updated_at)
+
+
+def _accumulator_record(
+    key: tuple[str, str, str],
+    bucket: dict[str, float],
+    updated_at: str,
+) -> dict[str, Any]:
+    market_key, sportsbook_key, close_date = key
+    return {
+        "model_family": PLAYER_PROP_WEIGHT_MODEL_FAMILY,
+        "market_key": market_key,
+        "sportsbook_key": sportsbook_key,
+        "close_date": close_date,
+        "error_weight_sum": bucket["error_weight_sum"],
+        "weight_sum": bucket["weight_sum"],
+        "sample_count": int(bucket["sample_count"]),
+        "updated_at": updated_at,
+    }
+
+
+def _apply_player_prop_weight_accumulator_delta_row_by_row(
+    db,
+    delta: dict[tuple[str, str, str], dict[str, float]],
+    updated_at: str,
+) -> int:
+    """Select-then-upsert path used until the increment function is deployed; concurrent writers can lose a delta."""
+    try:
+        existing = (
+            db.table(PLAYER_PROP_WEIGHT_ACCUMULATOR_TABLE)
+            .select("market_key,sportsbook_key,close_date,error_weight_sum,weight_sum,sample_count")
+            .eq("model_family", PLAYER_PROP_WEIGHT_MODEL_FAMILY)
+            .in_("close_date", sorted({key[2] for key in delta}))
+            .execute()
+        )
+    except Exception as exc:
+        if is_missing_player_prop_weight_accumulators_error(exc):
+            return 0
+        raise
+
+    current = {
+        (
+            str(row.get("market_key") or ""),
+            str(row.get("sportsbook_key") or "").lower(),
+            str(row.get("close_date") or "")[:10],
+        ): row
+        for row in (existing.data or [])
+    }
+    records = []
+    for key, change in delta.items():
+        row = current.get(key) or {}
+        records.append(
+            _accumulator_record(
+                key,
+                {
+                    "error_weight_sum": max(0.0, (_coerce_float(row.get("error_weight_sum")) or 0.0) + change["error_weight_sum"]),
+                    "weight_sum": max(0.0, (_coerce_float(row.get("weight_sum")) or 0.0) + change["weight_sum"]),
+                    "sample_count": max(0, int(_coerce_float(row.get("sample_count")) or 0) + int(change["sample_count"])),
+                },
+                updated_at,
+            )
+        )
+
+    db.table(PLAYER_PROP_WEIGHT_ACCUMULATOR_TABLE).upsert(
+        records,
+        on_conflict="model_family,market_key,sportsbook_key,close_date",
+    ).execute()
+    return len(records)
+
+
+def rebuild_player_prop_weight_accumulators(db, *, now: datetime | None = None) -> int:
+    """Recompute accumulator buckets from raw evaluations (backfill/repair)."""
+    current = now or _utc_now()
+    cutoff = _day_start(current - timedelta(days=PLAYER_PROP_WEIGHT_MAX_LOOKBACK_DAYS))
+    try:
+        rows = _load_windowed_evaluation_rows(db, cutoff=cutoff)
+    except Exception as exc:
+        if is_missing_scan_opportunity_model_evaluations_error(exc):
+            return 0
+        raise
+
+    accumulators = build_player_prop_weight_accumulators(rows)
+    updated_at = current.isoformat()
+    records = [_accumulator_record(key, bucket, updated_at) for key, bucket in accumulators.items()]
+    marker = _accumulator_record(
+        (*PLAYER_PROP_WEIGHT_SEEDED_MARKER_KEY, current.date().isoformat()),
+        {"error_weight_sum": 0.0, "weight_sum": 0.0, "sample_count": len(rows)},
+        updated_at,
+    )
+    try:
+        # One transaction: training keeps reading the previous buckets until the swap commits.
+        db.rpc(
+            PLAYER_PROP_WEIGHT_ACCUMULATOR_REPLACE_FUNCTION,
+            {"p_model_family": PLAYER_PROP_WEIGHT_MODEL_FAMILY, "p_rows": [*records, marker]},
+        ).execute()
+    except Exception as exc:
+        if not is_missing_rpc_function_error(exc, PLAYER_PROP_WEIGHT_ACCUMULATOR_REPLACE_FUNCTION):
+            raise
+        # Without the function, the marker is deleted first and written last, so training
+        # falls back to the raw rows instead of reading a half-written family.
+        db.table(PLAYER_PROP_WEIGHT_ACCUMULATOR_TABLE).delete().eq(
+            "model_family", PLAYER_PROP_WEIGHT_MODEL_FAMILY
+        ).execute()
+        for start in range(0, len(records), PLAYER_PROP_WEIGHT_WRITE_CHUNK_SIZE):
+            db.table(PLAYER_PROP_WEIGHT_ACCUMULATOR_TABLE).upsert(
+                records[start : start + PLAYER_PROP_WEIGHT_WRITE_CHUNK_SIZE],
+                on_conflict="model_family,market_key,sportsbook_key,close_date",
+            ).execute()
+        db.table(PLAYER_PROP_WEIGHT_ACCUMULATOR_TABLE).upsert(
+            [marker],
+            on_conflict="model_family,market_key,sportsbook_key,close_date",
+        ).execute()
+    return len(records)
+
+
+def _load_player_prop_weight_accumulators(
+    db,
+    *,
+    cutoff: datetime,
+) -> dict[tuple[str, str, str], dict[str, float]] | None:
+    """Buckets inside the window, or None when the table is missing or has not been seeded by a rebuild."""
+    try:
+        marker = (
+            db.table(PLAYER_PROP_WEIGHT_ACCUMULATOR_TABLE)
+            .select("close_date")
+            .eq("model_family", PLAYER_PROP_WEIGHT_MODEL_FAMILY)
+            .eq("market_key", PLAYER_PROP_WEIGHT_SEEDED_MARKER_KEY[0])
+            .eq("sportsbook_key", PLAYER_PROP_WEIGHT_SEEDED_MARKER_KEY[1])
+            .limit(1)
+            .execute()
+        )
+        if not marker.data:
+            return None
+        rows = fetch_all_rows(
+            query_factory=lambda offset, page_size: (
+                db.table(PLAYER_PROP_WEIGHT_ACCUMULATOR_TABLE)
+                .select("market_key,sportsbook_key,close_date,error_weight_sum,weight_sum,sample_count")
+                .eq("model_family", PLAYER_PROP_WEIGHT_MODEL_FAMILY)
+                .gte("close_date", cutoff.date().isoformat())
+                .order("close_date", desc=False)
+                .order("market_key", desc=False)
+                .order("sportsbook_key", desc=False)
+                .range(offset, offset + page_size - 1)
+            )
+        )
+    except Exception as exc:
+        if is_missing_player_prop_weight_accumulators_error(exc):
+            return None
+        raise
+
+    return {
+        (
+            str(row.get("market_key") or "").strip(),
+            str(row.get("sportsbook_key") or "").strip().lower(),
+            str(row.get("close_date") or "")[:10],
+        ): {
+            "error_weight_sum": _coerce_float(row.get("error_weight_sum")) or 0.0,
+            "weight_sum": _coerce_float(row.get("weight_sum")) or 0.0,
+            "sample_count": int(_coerce_float(row.get("sample_count")) or 0),
+        }
+        for row in rows
+        if str(row.get("market_key") or "").strip() != PLAYER_PROP_WEIGHT_SEEDED_MARKER_KEY[0]
+    }
+
+
+def _load_windowed_evaluation_rows(db, *, cutoff: datetime) -> list[dict[str, Any]]:
+    return fetch_all_rows(
+        query_factory=lambda offset, page_size: (
+            db.table("scan_opportunity_model_evaluations")
+            .select("id,model_key,market,sportsbook_key,first_true_prob,close_true_prob,close_captured_at")
+            .in_("model_key", sorted(PLAYER_PROP_WEIGHT_SUPPORTED_MODELS))
+            .gte("close_captured_at", cutoff.isoformat())
+            .order("id", desc=False)
+            .range(offset, offset + page_size - 1)
+        )
+    )
+
+
+def _diff_player_prop_weights(
+    db,
+    upserts: list[dict[str, Any]],
+) -> list[dict[str, Any]] | None:
+    try:
+        result = db.table("player_prop_model_weights").select(
+            "model_family,market_key,sportsbook_key,weight"
+        ).execute()
+    except Exception as exc:
+        if is_missing_player_prop_model_weights_error(exc):
+            return None
+        raise
+
+    current = {
+        (str(row.get("market_key") or ""), str(row.get("sportsbook_key") or "").lower()): _coerce_float(row.get("weight"))
+        for row in (result.data or [])
+        if str(row.get("model_family") or PLAYER_PROP_WEIGHT_MODEL_FAMILY).strip().lower() == PLAYER_PROP_WEIGHT_MODEL_FAMILY
+    }
+    diff: list[dict[str, Any]] = []
+    for payload in upserts:
+        key = (str(payload["market_key"]), str(payload["sportsbook_key"]).lower())
+        current_weight = current.get(key)
+        proposed_weight = float(payload["weight"])
+        if current_weight is None:
+            status = "new"
+        elif abs(current_weight - proposed_weight) < 1e-4:
+            status = "unchanged"
+        else:
+            status = "changed"
+        diff.append(
+            {
+                "market_key": payload["market_key"],
+                "sportsbook_key": payload["sportsbook_key"],
+                "current_weight": current_weight,
+                "proposed_weight": proposed_weight,
+                "weight_delta": round(proposed_weight - current_weight, 4) if current_weight is not None else None,
+                "sample_count": payload["sample_count"],
+                "weighted_mae": payload["weighted_mae"],
+                "status": status,
+            }
+        )
+    diff.sort(key=lambda item: (item["market_key"], item["sportsbook_key"]))
+    return diff
+
+
 def train_player_prop_model_weights(
     db,
     *,
     now: datetime | None = None,
+    dry_run: bool = False,
 ) -> dict[str, Any]:
     current = now or _utc_now()
     lookback_days = get_player_prop_weight_lookback_days()
     min_samples = get_player_prop_weight_min_samples()
     cutoff = current - timedelta(days=lookback_days)
 
-    try:
-        result = db.table("scan_opportunity_model_evaluations").select(
-            "id,model_key,market,sportsbook_key,first_true_prob,close_true_prob,close_captured_at"
-        ).execute()
-    except Exception as exc:
-        if is_missing_scan_opportunity_model_evaluations_error(exc):
-            return {
-                "ok": False,
-                "trained_rows": 0,
-                "markets": 0,
-                "lookback_days": lookback_days,
-                "min_samples": min_samples,
-                "reason": "missing_evaluations_table",
-            }
-        raise
+    accumulators = _load_player_prop_weight_accumulators(db, cutoff=cutoff)
+    training_source = "accumulators"
+    if accumulators is None:
+        # Accumulators missing or never seeded by a rebuild: fold the windowed raw rows instead.
+        try:
+            recent_rows = _load_windowed_evaluation_rows(db, cutoff=cutoff)
+        except Exception as exc:
+            if is_missing_scan_opportunity_model_evaluations_error(exc):
+                return {
+                    "ok": False,
+                    "trained_rows": 0,
+                    "markets": 0,
+                    "lookback_days": lookback_days,
+                    "min_samples": min_samples,
+                    "reason": "missing_evaluations_table",
+                }
+            raise
+        accumulators = build_player_prop_weight_accumulators(recent_rows)
+        training_source = "evaluations"
 
-    recent_rows: list[dict[str, Any]] = []
-    for row in result.data or []:
-        model_key = str(row.get("model_key") or "").strip().lower()
-        if model_key not in PLAYER_PROP_WEIGHT_SUPPORTED_MODELS:
-            continue
-        close_prob = _coerce_float(row.get("close_true_prob"))
-        first_prob = _coerce_float(row.get("first_true_prob"))
-        close_captured_at = _coerce_datetime(row.get("close_captured_at"))
-        if close_prob is None or first_prob is None or close_captured_at is None:
-            continue
-        if close_captured_at < cutoff:
+    grouped: dict[str, dict[str, dict[str, float]]] = {}
+    source_rows = 0
+    for (market_key, sportsbook_key, close_date), bucket in accumulators.items():
+        try:
+            day_start = datetime.fromisoformat(close_date).replace(tzinfo=timezone.utc)
+        except ValueError:
             continue
-        recent_rows.append(dict(row))
-
-    grouped: dict[str, dict[str, list[tuple[float, float]]]] = {}
-    for row in recent_rows:
-        market_key = str(row.get("market") or "").strip()
-        sportsbook_key = str(row.get("sportsbook_key") or "").strip().lower()
-        close_prob = float(row["close_true_prob"])
-        first_prob = float(row["first_true_prob"])
-        close_captured_at = _coerce_datetime(row.get("close_captured_at")) or current
-        age_days = max(0.0, (current - close_captured_at).total_seconds() / 86400.0)
-        recency_weight = math.exp(-age_days / 7.0)
-        grouped.setdefault(market_key, {}).setdefault(sportsbook_key, []).append((abs(first_prob - close_prob), recency_weight))
+        age_days = max(0.0, (current - day_start).total_seconds() / 86400.0)
+        decay = math.exp(-age_days / PLAYER_PROP_WEIGHT_DECAY_DAYS)
+        totals = grouped.setdefault(market_key, {}).setdefault(
+            sportsbook_key,
+            {"error_weight_sum": 0.0, "weight_sum": 0.0, "sample_count": 0},
+        )
+        totals["error_weight_sum"] += bucket["error_weight_sum"] * decay
+        totals["weight_sum"] += bucket["weight_sum"] * decay
+        totals["sample_count"] += int(bucket["sample_count"])
+        source_rows += int(bucket["sample_count"])
 
     upserts: list[dict[str, Any]] = []
     for market_key, market_group in grouped.items():
         raw_weights: dict[str, float] = {}
         counts: dict[str, int] = {}
         metrics: dict[str, float] = {}
-        for sportsbook_key, samples in market_group.items():
-            counts[sportsbook_key] = len(samples)
-            if len(samples) < min_samples:
+        for sportsbook_key, totals in market_group.items():
+            counts[sportsbook_key] = int(totals["sample_count"])
+            if counts[sportsbook_key] < min_samples:
                 continue
-            weighted_error_sum = sum(error * weight for error, weight in samples)
-            total_weight = sum(weight for _error, weight in samples)
-            if total_weight <= 0:
+            if totals["weight_sum"] <= 0:
                 continue
-            weighted_mae = weighted_error_sum / total_weight
+            weighted_mae = totals["error_weight_sum"] / totals["weight_sum"]
             metrics[sportsbook_key] = weighted_mae
             raw_weights[sportsbook_key] = 1.0 / max(weighted_mae, 0.015)
 
@@ -201,7 +524,7 @@ def train_player_prop_model_weights(
             normalized = max(0.5, min(round(raw_weight / mean_weight, 4), 3.5))
             upserts.append(
                 {
-                    "model_family": "props_v2",
+                    "model_family": PLAYER_PROP_WEIGHT_MODEL_FAMILY,
                     "market_key": market_key,
                     "sportsbook_key": sportsbook_key,
                     "weight": normalized,
@@ -211,10 +534,29 @@ def train_player_prop_model_weights(
                 }
             )
 
+    summary = {
+        "ok": True,
+        "trained_rows": len(upserts),
+        "markets": len({row["market_key"] for row in upserts}),
+        "lookback_days": lookback_days,
+        "min_samples": min_samples,
+        "source_rows": source_rows,
+        "training_source": training_source,
+        "dry_run": dry_run,
+    }
+
+    if dry_run:
+        diff = _diff_player_prop_weights(db, upserts)
+        summary["diff"] = diff or []
+        if diff is None:
+            summary["reason"] = "missing_weights_table"
+        return summary
+
     if upserts:
         try:
-            existing = db.table("player_prop_model_weights").select(
-                "id,market_key,sportsbook_key"
+            db.table("player_prop_model_weights").upsert(
+                upserts,
+                on_conflict="model_family,market_key,sportsbook_key",
             ).execute()
         except Exception as exc:
             if is_missing_player_prop_model_weights_error(exc):
@@ -228,18 +570,6 @@ def train_player_prop_model_weights(
                 }
             raise
 
-        existing_by_key = {
-            (str(row.get("market_key") or ""), str(row.get("sportsbook_key") or "").lower()): row
-            for row in (existing.data or [])
-        }
-        for payload in upserts:
-            key = (str(payload.get("market_key") or ""), str(payload.get("sportsbook_key") or "").lower())
-            row = existing_by_key.get(key)
-            if row is None:
-                db.table("player_prop_model_weights").insert(payload).execute()
-            else:
-                db.table("player_prop_model_weights").update(payload).eq("id", row["id"]).execute()
-
     weights = _normalized_weight_payload(upserts)
     if weights:
         set_json(
@@ -248,11 +578,4 @@ def train_player_prop_model_weights(
             PLAYER_PROP_WEIGHT_CACHE_TTL_SECONDS,
         )
 
-    return {
-        "ok": True,
-        "trained_rows": len(upserts),
-        "markets": len({row["market_key"] for row in upserts}),
-        "lookback_days": lookback_days,
-        "min_samples": min_samples,
-        "source_rows": len(recent_rows),
-    }
+    return summary
@@ -11,7 +11,7 @@ from typing import Any
 
 import httpx
 
-from calculations import american_to_decimal, decimal_to_american, kelly_fraction
+from calculations import decimal_to_american, kelly_fraction
 from services.player_prop_candidate_observations import PLAYER_PROP_MODEL_CANDIDATE_SETS_KEY
 from services.player_prop_weights import get_player_prop_weight_overrides
 from services.player_prop_markets import (
@@ -24,17 +24,23 @@ from services.espn_scoreboard import (
     extract_national_tv_matchups,
     fetch_nba_scoreboard_window,
 )
+from services.event_odds_broker import EventOddsBroker
 from services.odds_api import (
     CACHE_TTL_SECONDS,
     ODDS_API_BASE,
     ODDS_API_KEY,
     _append_odds_api_activity,
+    _market_region_cost,
     _parse_credits_used_last,
+    _reserve_odds_api_call,
     fetch_events,
 )
+from services.odds_api_budget import odds_api_request_slot, settle_odds_api_credits
+from services.pricing_kernel import decimal_odds, devig_two_way
+from services.prizepicks import PrizePicksBoardIndex, index_prizepicks_board, prizepicks_team_pair
 from services.sportsbook_deeplinks import resolve_sportsbook_deeplink
 from services.shared_state import get_json, get_scan_cache, set_json, set_scan_cache
-from services.team_aliases import canonical_short_name, canonical_team_token, build_short_event_label
+from services.team_aliases import canonical_player_token, canonical_short_name, canonical_team_token, build_short_event_label
 
 
 PLAYER_PROPS_SURFACE = "player_props"
@@ -317,9 +323,19 @@ def _canonical_team_name(name: str | None, *, sport: str | None = None) -> str:
 
 
 def _canonical_player_name(name: str | None) -> str:
-    if not name:
-        return ""
-    return "".join(ch for ch in str(name).strip().lower() if ch.isalnum())
+    return canonical_player_token(name)
+
+
+def _event_team_short_names(sport: str | None, *, home: str, away: str) -> dict[str, str]:
+    """Short names for an event's two teams, built once and shared by all of its candidates."""
+    return {team: canonical_short_name(sport, team) for team in (home, away) if team}
+
+
+def _team_short_name(team_short_names: dict[str, str], sport: str | None, team: str | None) -> str | None:
+    if not team:
+        return None
+    short_name = team_short_names.get(team)
+    return short_name if short_name is not None else canonical_short_name(sport, team)
 
 
 def _extract_player_name(description: str | None) -> str:
@@ -418,7 +434,7 @@ def _normalize_prop_outcomes(
     return flattened
 
 
-async def _fetch_prop_market_for_event(*, sport: str, event_id: str, markets: list[str], source: str) -> tuple[dict, httpx.Response]:
+async def _request_prop_markets_for_event(*, sport: str, event_id: str, markets: list[str], source: str) -> tuple[dict, httpx.Response]:
     if not ODDS_API_KEY:
         raise ValueError("ODDS_API_KEY not set in environment")
 
@@ -432,12 +448,22 @@ async def _fetch_prop_market_for_event(*, sport: str, event_id: str, markets: li
         "includeSids": "true",
     }
 
-    started = time.monotonic()
     endpoint = f"/sports/{sport}/events/{event_id}/odds"
+    reservation = _reserve_odds_api_call(
+        source=source,
+        endpoint=endpoint,
+        sport=sport,
+        cost_key=f"event_odds:{params['markets']}:{params['regions']}",
+        default_cost=_market_region_cost(params["markets"], params["regions"]),
+    )
+    started = time.monotonic()
+    resp_headers = None
     try:
         from services.http_client import request_with_retries
 
-        resp = await request_with_retries("GET", url, params=params, retries=2)
+        async with odds_api_request_slot(reservation):
+            resp = await request_with_retries("GET", url, params=params, retries=2)
+        resp_headers = resp.headers
         resp.raise_for_status()
         duration_ms = (time.monotonic() - started) * 1000
         remaining = resp.headers.get("x-requests-remaining") or resp.headers.get("x-request-remaining")
@@ -478,6 +504,16 @@ async def _fetch_prop_market_for_event(*, sport: str, event_id: str, markets: li
             error_message=str(e),
         )
         raise
+    finally:
+        settle_odds_api_credits(reservation, resp_headers)
+
+
+_EVENT_ODDS_BROKER = EventOddsBroker(lambda **kwargs: _request_prop_markets_for_event(**kwargs))
+
+
+async def _fetch_prop_market_for_event(*, sport: str, event_id: str, markets: list[str], source: str) -> tuple[dict, httpx.Response]:
+    """Event prop odds for `markets`, merged with concurrent requests for the same event and served from short-lived per-market slices."""
+    return await _EVENT_ODDS_BROKER.fetch(sport=sport, event_id=event_id, markets=markets, source=source)
 
 
 async def _get_alt_pitcher_k_cached_event_market_payload(
@@ -698,20 +734,13 @@ def _collect_prop_market_presence(
 
 def _devig_pair_probabilities(over_outcome: dict, under_outcome: dict) -> dict[str, float] | None:
     try:
-        over_decimal = american_to_decimal(float(over_outcome["price"]))
-        under_decimal = american_to_decimal(float(under_outcome["price"]))
+        over_prob, under_prob = devig_two_way(float(over_outcome["price"]), float(under_outcome["price"]))
     except Exception:
         return None
 
-    implied_over = 1 / over_decimal
-    implied_under = 1 / under_decimal
-    implied_total = implied_over + implied_under
-    if implied_total <= 0:
-        return None
-
     return {
-        "over": implied_over / implied_total,
-        "under": implied_under / implied_total,
+        "over": over_prob,
+        "under": under_prob,
     }
 
 
@@ -1181,7 +1210,7 @@ def _build_prop_model_evaluations_for_candidate(
     book_odds: float,
     weight_overrides: dict[str, dict[str, float]] | None = None,
 ) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
-    book_decimal = american_to_decimal(book_odds)
+    book_decimal = decimal_odds(float(book_odds))
     active_model_key = get_player_prop_active_model_key()
     shadow_model_key = get_player_prop_shadow_model_key(active_model_key)
     model_keys = [active_model_key]
@@ -1265,7 +1294,7 @@ def _american_price_quality(american: float | int | None) -> float | None:
     if american is None:
         return None
     try:
-        return american_to_decimal(float(american))
+        return decimal_odds(float(american))
     except Exception:
         return None
 
@@ -1471,6 +1500,8 @@ def _build_prop_side_candidates(
     event_id = event_payload.get("id")
     commence_time = str(event_payload.get("commence_time") or "")
     event_name = f"{away} @ {home}".strip()
+    event_short = build_short_event_label(sport, away, home)
+    team_short_names = _event_team_short_names(sport, home=home, away=away)
     candidates: list[dict] = []
     selection_pairs_by_market_book, deeplink_context_by_market_book = _build_prop_market_book_pairs(
         bookmakers=bookmakers,
@@ -1569,15 +1600,15 @@ def _build_prop_side_candidates(
                             "sportsbook_deeplink_level": deeplink_level,
                             "sport": sport,
                             "event": event_name,
-                            "event_short": build_short_event_label(sport, away, home),
+                            "event_short": event_short,
                             "commence_time": commence_time,
                             "market": market_key,
                             "player_name": player_name,
                             "participant_id": participant_id,
                             "team": player_team,
-                            "team_short": canonical_short_name(sport, player_team) if player_team else None,
+                            "team_short": _team_short_name(team_short_names, sport, player_team),
                             "opponent": opponent,
-                            "opponent_short": canonical_short_name(sport, opponent) if opponent else None,
+                            "opponent_short": _team_short_name(team_short_names, sport, opponent),
                             "selection_side": side,
                             "line_value": line_value,
                             "display_name": display_name,
@@ -1853,6 +1884,8 @@ def _build_exact_line_reference_index(
     event_id = str(event_payload.get("id") or "").strip() or None
     commence_time = str(event_payload.get("commence_time") or "")
     event_name = f"{away} @ {home}".strip()
+    event_short = build_short_event_label(sport, away, home)
+    team_short_names = _event_team_short_names(sport, home=home, away=away)
     selection_pairs_by_market_book, deeplink_context_by_market_book = _build_prop_market_book_pairs(
         bookmakers=bookmakers,
         target_markets=target_markets,
@@ -1893,14 +1926,14 @@ def _build_exact_line_reference_index(
                         "event_id": event_id,
                         "sport": sport,
                         "event": event_name,
-                        "event_short": build_short_event_label(sport, away, home),
+                        "event_short": event_short,
                         "commence_time": commence_time,
                         "player_name": player_name,
                         "participant_id": participant_id,
                         "team": player_team,
-                        "team_short": canonical_short_name(sport, player_team) if player_team else None,
+                        "team_short": _team_short_name(team_short_names, sport, player_team),
                         "opponent": opponent,
-                        "opponent_short": canonical_short_name(sport, opponent) if opponent else None,
+                        "opponent_short": _team_short_name(team_short_names, sport, opponent),
                         "player_key": player_key,
                         "team_key": team_key,
                         "market_key": market_key,
@@ -1999,9 +2032,16 @@ def _build_prizepicks_comparison_cards(
     target_markets: list[str],
     player_context_lookup: dict[str, dict[str, str | None]] | None = None,
     prizepicks_projections: list[dict] | None = None,
+    prizepicks_index: PrizePicksBoardIndex | None = None,
     min_reference_bookmakers: int,
 ) -> tuple[list[dict], dict[str, int]]:
-    if not prizepicks_projections:
+    """PrizePicks cards for one event; pass `prizepicks_index` (built once per scan) to skip other games' projections."""
+    if prizepicks_index is None:
+        prizepicks_index = index_prizepicks_board(prizepicks_projections or [])
+    event_pair = prizepicks_team_pair(event_payload.get("home_team"), event_payload.get("away_team"))
+    # Projections with no resolvable matchup sit under () and are checked against every event.
+    player_groups = [prizepicks_index.get(pair) or {} for pair in dict.fromkeys((event_pair, ()))]
+    if not any(player_groups):
         return [], {"matched": 0, "unmatched": 0, "filtered": 0}
 
     reference_index, fallback_index = _build_exact_line_reference_index(
@@ -2009,6 +2049,7 @@ def _build_prizepicks_comparison_cards(
         target_markets=target_markets,
         player_context_lookup=player_context_lookup,
     )
+    reference_player_keys = {key[0] for key in reference_index} | {key[0] for key in fallback_index}
 
     cards: list[dict] = []
     matched = 0
@@ -2016,69 +2057,72 @@ def _build_prizepicks_comparison_cards(
     filtered = 0
     seen_keys: set[str] = set()
 
-    for projection in prizepicks_projections:
-        market_key = str(projection.get("market_key") or "").strip()
-        if market_key not in target_markets:
+    for player_key, projections in (item for group in player_groups for item in group.items()):
+        if player_key not in reference_player_keys:
+            unmatched += sum(1 for projection in projections if str(projection.get("market_key") or "").strip() in target_markets)
             continue
-        player_key = _canonical_player_name(projection.get("player_name"))
-        team_key = _canonical_team_name(projection.get("team"))
-        line_value = projection.get("line_value")
+        for projection in projections:
+            market_key = str(projection.get("market_key") or "").strip()
+            if market_key not in target_markets:
+                continue
+            team_key = _canonical_team_name(projection.get("team"))
+            line_value = projection.get("line_value")
 
-        reference = reference_index.get((player_key, team_key, market_key, line_value))
-        if not reference:
-            reference = fallback_index.get((player_key, market_key, line_value))
+            reference = reference_index.get((player_key, team_key, market_key, line_value))
+            if not reference:
+                reference = fallback_index.get((player_key, market_key, line_value))
 
-        if not reference:
-            unmatched += 1
-            continue
+            if not reference:
+                unmatched += 1
+                continue
 
-        if int(reference.get("exact_line_bookmaker_count") or 0) < min_reference_bookmakers:
-            filtered += 1
-            continue
+            if int(reference.get("exact_line_bookmaker_count") or 0) < min_reference_bookmakers:
+                filtered += 1
+                continue
 
-        consensus_over_prob = float(reference["consensus_over_prob"])
-        consensus_under_prob = float(reference["consensus_under_prob"])
-        comparison_key = "|".join(
-            [
-                str(reference.get("event_id") or projection.get("event_id") or "").strip(),
-                market_key,
-                player_key,
-                "" if line_value is None else str(line_value),
-            ]
-        )
-        if comparison_key in seen_keys:
-            continue
-        seen_keys.add(comparison_key)
+            consensus_over_prob = float(reference["consensus_over_prob"])
+            consensus_under_prob = float(reference["consensus_under_prob"])
+            comparison_key = "|".join(
+                [
+                    str(reference.get("event_id") or projection.get("event_id") or "").strip(),
+                    market_key,
+                    player_key,
+                    "" if line_value is None else str(line_value),
+                ]
+            )
+            if comparison_key in seen_keys:
+                continue
+            seen_keys.add(comparison_key)
 
-        cards.append(
-            {
-                "comparison_key": comparison_key,
-                "event_id": reference.get("event_id") or projection.get("event_id"),
-                "sport": str(reference.get("sport") or "basketball_nba"),
-                "event": str(reference.get("event") or projection.get("event") or ""),
-                "commence_time": str(reference.get("commence_time") or projection.get("commence_time") or ""),
-                "player_name": str(reference.get("player_name") or projection.get("player_name") or ""),
-                "participant_id": reference.get("participant_id") or projection.get("participant_id"),
-                "team": reference.get("team") or projection.get("team"),
-                "opponent": reference.get("opponent") or projection.get("opponent"),
-                "market_key": market_key,
-                "market": str(reference.get("market") or market_key),
-                "prizepicks_line": float(line_value),
-                "exact_line_bookmakers": list(reference.get("exact_line_bookmakers") or []),
-                "exact_line_bookmaker_count": int(reference.get("exact_line_bookmaker_count") or 0),
-                "consensus_over_prob": consensus_over_prob,
-                "consensus_under_prob": consensus_under_prob,
-                "consensus_side": "over" if consensus_over_prob >= consensus_under_prob else "under",
-                "confidence_label": str(reference.get("confidence_label") or "thin"),
-                "best_over_sportsbook": reference.get("best_over_sportsbook"),
-                "best_over_odds": reference.get("best_over_odds"),
-                "best_over_deeplink_url": reference.get("best_over_deeplink_url"),
-                "best_under_sportsbook": reference.get("best_under_sportsbook"),
-                "best_under_odds": reference.get("best_under_odds"),
-                "best_under_deeplink_url": reference.get("best_under_deeplink_url"),
-            }
-        )
-        matched += 1
+            cards.append(
+                {
+                    "comparison_key": comparison_key,
+                    "event_id": reference.get("event_id") or projection.get("event_id"),
+                    "sport": str(reference.get("sport") or "basketball_nba"),
+                    "event": str(reference.get("event") or projection.get("event") or ""),
+                    "commence_time": str(reference.get("commence_time") or projection.get("commence_time") or ""),
+                    "player_name": str(reference.get("player_name") or projection.get("player_name") or ""),
+                    "participant_id": reference.get("participant_id") or projection.get("participant_id"),
+                    "team": reference.get("team") or projection.get("team"),
+                    "opponent": reference.get("opponent") or projection.get("opponent"),
+                    "market_key": market_key,
+                    "market": str(reference.get("market") or market_key),
+                    "prizepicks_line": float(line_value),
+                    "exact_line_bookmakers": list(reference.get("exact_line_bookmakers") or []),
+                    "exact_line_bookmaker_count": int(reference.get("exact_line_bookmaker_count") or 0),
+                    "consensus_over_prob": consensus_over_prob,
+                    "consensus_under_prob": consensus_under_prob,
+                    "consensus_side": "over" if consensus_over_prob >= consensus_under_prob else "under",
+                    "confidence_label": str(reference.get("confidence_label") or "thin"),
+                    "best_over_sportsbook": reference.get("best_over_sportsbook"),
+                    "best_over_odds": reference.get("best_over_odds"),
+                    "best_over_deeplink_url": reference.get("best_over_deeplink_url"),
+                    "best_under_sportsbook": reference.get("best_under_sportsbook"),
+                    "best_under_odds": reference.get("best_under_odds"),
+                    "best_under_deeplink_url": reference.get("best_under_deeplink_url"),
+                }
+            )
+            matched += 1
 
     return cards, {"matched": matched, "unmatched": unmatched, "filtered": filtered}
 
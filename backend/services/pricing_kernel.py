@@ -0,0 +1,167 @@
+"""
+Memoized pricing kernel for scanner sides and bet responses.
+
+A slate prices the same numbers over and over: every target book on an event
+is compared against one Pinnacle pair, prop references reuse each book's
+Over/Under pair for every candidate, and a refresh mostly sees unchanged
+prices. Dashboards rebuild EV and CLV for the same bet rows on every request.
+
+These helpers are pure functions of prices, so each sits behind a bounded LRU
+(`PRICING_CACHE_SIZE` entries, default 8192) keyed by the exact float inputs.
+Bet EV only caches its price terms: stake and promo fields differ per bet, so
+the EV arithmetic itself runs uncached. Results are identical to the uncached
+math in `calculations` and `services.odds_api`; dict results are copied so
+callers may mutate them.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+from calculations import DEFAULT_VIG, american_to_decimal, calculate_clv, calculate_hold_from_odds, kelly_fraction
+
+PRICING_CACHE_SIZE = max(1, int(os.getenv("PRICING_CACHE_SIZE", "8192")))
+
+
+class SidePrice(NamedTuple):
+    ev_percentage: float
+    book_implied_prob: float
+    true_prob: float
+    book_decimal: float
+    base_kelly_fraction: float
+
+
+class BetPrice(NamedTuple):
+    decimal_odds: float
+    implied_prob: float
+
+
+_BOOST_PROMOS = {"boost_30": 0.30, "boost_50": 0.50, "boost_100": 1.00, "boost_custom": None}
+
+
+@lru_cache(maxsize=PRICING_CACHE_SIZE)
+def decimal_odds(american_odds: float) -> float:
+    return american_to_decimal(american_odds)
+
+
+@lru_cache(maxsize=PRICING_CACHE_SIZE)
+def devig_two_way(price_a: float, price_b: float) -> tuple[float, float]:
+    """Additive no-vig probabilities for a two-way American price pair."""
+    implied_a = 1.0 / decimal_odds(price_a)
+    implied_b = 1.0 / decimal_odds(price_b)
+    overround = implied_a + implied_b
+    return implied_a / overround, implied_b / overround
+
+
+@lru_cache(maxsize=PRICING_CACHE_SIZE)
+def price_side(true_prob: float, book_american_odds: float) -> SidePrice:
+    """Scanner edge for one side; Kelly uses the rounded probability and decimal, as the side payload shows them."""
+    book_decimal = decimal_odds(book_american_odds)
+    rounded_prob = round(true_prob, 4)
+    rounded_decimal = round(book_decimal, 4)
+    return SidePrice(
+        ev_percentage=round(((true_prob * book_decimal) - 1.0) * 100, 2),
+        book_implied_prob=round(1.0 / book_decimal, 4),
+        true_prob=rounded_prob,
+        book_decimal=rounded_decimal,
+        base_kelly_fraction=round(kelly_fraction(rounded_prob, rounded_decimal), 6),
+    )
+
+
+@lru_cache(maxsize=PRICING_CACHE_SIZE)
+def bet_price(decimal_odds_for_ev: float) -> BetPrice:
+    """Rounded decimal and implied probability for a bet's effective price."""
+    return BetPrice(decimal_odds=round(decimal_odds_for_ev, 4), implied_prob=1 / decimal_odds_for_ev)
+
+
+def bet_ev(
+    *,
+    stake: float,
+    decimal_odds: float,
+    promo_type: str,
+    k_factor: float,
+    boost_percent: float | None = None,
+    winnings_cap: float | None = None,
+    vig: float | None = None,
+    true_prob: float | None = None,
+) -> dict[str, Any]:
+    """`calculations.calculate_ev` with the price terms read from the cache."""
+    price = bet_price(decimal_odds)
+    is_boost = promo_type in _BOOST_PROMOS
+    effective_boost = _BOOST_PROMOS.get(promo_type) or 0.0
+    if promo_type == "boost_custom":
+        effective_boost = boost_percent / 100 if boost_percent is not None else 0.0
+
+    base_winnings = stake * (decimal_odds - 1)
+    if promo_type == "bonus_bet":
+        win_payout = base_winnings
+    elif is_boost:
+        extra_winnings = base_winnings * effective_boost
+        if winnings_cap is not None and extra_winnings > winnings_cap:
+            extra_winnings = winnings_cap
+        win_payout = stake + base_winnings + extra_winnings
+    else:
+        win_payout = stake * decimal_odds
+
+    effective_vig = vig if vig is not None else DEFAULT_VIG
+    if promo_type == "bonus_bet":
+        ev_per_dollar = 1 - price.implied_prob
+    elif promo_type in ("no_sweat", "promo_qualifier"):
+        ev_per_dollar = -effective_vig
+    elif is_boost:
+        potential_extra = effective_boost * (decimal_odds - 1)
+        if winnings_cap is not None:
+            potential_extra = min(potential_extra, winnings_cap / stake)
+        ev_per_dollar = price.implied_prob * potential_extra - effective_vig
+    elif true_prob is not None:
+        ev_per_dollar = (true_prob * decimal_odds) - 1.0
+    else:
+        ev_per_dollar = -effective_vig
+
+    return {
+        "ev_per_dollar": round(ev_per_dollar, 6),
+        "ev_total": round(stake * ev_per_dollar, 2),
+        "win_payout": round(win_payout, 2),
+        "decimal_odds": price.decimal_odds,
+    }
+
+
+@lru_cache(maxsize=PRICING_CACHE_SIZE)
+def hold_from_odds(odds1: float, odds2: float) -> float | None:
+    return calculate_hold_from_odds(odds1, odds2)
+
+
+@lru_cache(maxsize=PRICING_CACHE_SIZE)
+def _bet_clv(book_american: float, close_pinnacle_american: float) -> dict[str, Any]:
+    return calculate_clv(book_american, close_pinnacle_american)
+
+
+def bet_clv(book_american: float, close_pinnacle_american: float) -> dict[str, Any]:
+    """`calculations.calculate_clv` (single-sided close) through the cache."""
+    return dict(_bet_clv(book_american, close_pinnacle_american))
+
+
+_CACHES = {
+    "decimal_odds": decimal_odds,
+    "devig_two_way": devig_two_way,
+    "price_side": price_side,
+    "bet_price": bet_price,
+    "hold_from_odds": hold_from_odds,
+    "bet_clv": _bet_clv,
+}
+
+
+def get_pricing_cache_stats() -> dict[str, dict[str, int]]:
+    """Hits, misses and size per kernel cache, for ops status."""
+    stats = {}
+    for name, cached in _CACHES.items():
+        info = cached.cache_info()
+        stats[name] = {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize}
+    return stats
+
+
+def clear_pricing_caches() -> None:
+    for cached in _CACHES.values():
+        cached.cache_clear()
@@ -5,9 +5,12 @@ from typing import Any
 
 import httpx
 
+from services.team_aliases import canonical_player_token, canonical_team_token
+
 
 PRIZEPICKS_API_URL = "https://api.prizepicks.com/projections"
 PRIZEPICKS_NBA_LEAGUE_ID = 7
+PRIZEPICKS_NBA_SPORT_KEY = "basketball_nba"
 PRIZEPICKS_STANDARD_ODDS_TYPE = "standard"
 PRIZEPICKS_SUPPORTED_MARKETS: dict[str, str] = {
     "Points": "player_points",
@@ -16,6 +19,9 @@ PRIZEPICKS_SUPPORTED_MARKETS: dict[str, str] = {
     "3-PT Made": "player_threes",
 }
 
+# {team_pair: {player_key: [projection, ...]}} from `index_prizepicks_board`.
+PrizePicksBoardIndex = dict[tuple[str, ...], dict[str, list[dict[str, Any]]]]
+
 logger = logging.getLogger("ev_tracker")
 _prizepicks_board_cache: dict[str, Any] = {"fetched_at": 0.0, "board": []}
 PRIZEPICKS_BOARD_CACHE_TTL_SECONDS = 300
@@ -51,7 +57,7 @@ def _resolve_related(
 
 
 def _canonical_token(value: str | None) -> str:
-    return "".join(ch for ch in str(value or "").strip().lower() if ch.isalnum())
+    return canonical_player_token(value)
 
 
 def _team_full_name(team_item: dict[str, Any] | None) -> str | None:
@@ -223,3 +229,24 @@ async def fetch_prizepicks_nba_board() -> list[dict[str, Any]]:
     _prizepicks_board_cache["fetched_at"] = now
     _prizepicks_board_cache["board"] = normalized
     return normalized
+
+
+def prizepicks_team_pair(team_a: str | None, team_b: str | None, *, sport: str | None = PRIZEPICKS_NBA_SPORT_KEY) -> tuple[str, ...]:
+    """Order-free canonical key for a matchup; `()` when either team is missing."""
+    tokens = sorted(canonical_team_token(sport, team) for team in (team_a, team_b))
+    return tuple(tokens) if all(tokens) else ()
+
+
+def index_prizepicks_board(board: list[dict[str, Any]]) -> PrizePicksBoardIndex:
+    """Group a fetched board by matchup and player once per scan, so each event only reads its own projections."""
+    index: PrizePicksBoardIndex = {}
+    for projection in board:
+        if not isinstance(projection, dict):
+            continue
+        if projection.get("home_team") and projection.get("away_team"):
+            team_pair = prizepicks_team_pair(projection.get("home_team"), projection.get("away_team"))
+        else:
+            team_pair = prizepicks_team_pair(projection.get("team"), projection.get("opponent"))
+        player_key = str(projection.get("player_key") or "") or _canonical_token(projection.get("player_name"))
+        index.setdefault(team_pair, {}).setdefault(player_key, []).append(projection)
+    return index
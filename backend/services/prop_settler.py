@@ -9,6 +9,7 @@ boxscore providers:
 
 from __future__ import annotations
 
+import asyncio
 import re
 from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
@@ -27,6 +28,13 @@ from services.espn_scoreboard import (
     fetch_nba_scoreboard_for_dates,
 )
 from services.http_client import request_with_retries
+from services.provider_event_map import (
+    MAPPING_SOURCE_SETTLEMENT,
+    ProviderEventMapping,
+    get_provider_event_mapping,
+    remember_provider_event_mapping,
+)
+from services.shared_state import get_json, set_json
 
 MLB_STATSAPI_SCHEDULE_URL = "https://statsapi.mlb.com/api/v1/schedule"
 MLB_STATSAPI_BOXSCORE_URL_TEMPLATE = "https://statsapi.mlb.com/api/v1/game/{game_pk}/boxscore"
@@ -129,6 +137,8 @@ def create_prop_settle_telemetry() -> dict[str, Any]:
         "props_player_not_found": 0,
         "props_stat_missing": 0,
         "props_boxscore_fetch_failed": 0,
+        "props_boxscore_fetched": 0,
+        "props_boxscore_cache_hits": 0,
     }
 
 
@@ -329,58 +339,123 @@ def _string_similarity(a: str, b: str) -> float:
     return SequenceMatcher(None, a, b).ratio()
 
 
+_FUZZY_MIN_RATIO = 0.91
+_FUZZY_MIN_LEN = 6
+_FUZZY_MIN_MARGIN = 0.02
+
+
+class PlayerNameIndex:
+    """
+    Name lookups precomputed once per boxscore stat map.
+
+    Matching semantics are those of the original linear scans (first key in
+    stat-map order wins each tier); the index only replaces the scans with dict
+    lookups and prunes SequenceMatcher work with its exact upper bounds.
+    Results are memoized per (normalized name, raw name), so every bet on the
+    same player in a game reuses one lookup.
+    """
+
+    def __init__(self, stat_map: dict[str, dict[str, float]]) -> None:
+        self.stat_map = stat_map
+        self._keys: list[str] = list(stat_map)
+        self._stripped: list[str] = [_strip_generational_suffix(k) for k in self._keys]
+        self._position: dict[str, int] = {k: i for i, k in enumerate(self._keys)}
+        self._first_by_stripped: dict[str, str] = {}
+        # suffix (len >= 4) -> positions of keys ending with it, in stat-map order.
+        self._suffix_positions: dict[str, list[int]] = {}
+        for pos, (key, stripped) in enumerate(zip(self._keys, self._stripped)):
+            self._first_by_stripped.setdefault(stripped, key)
+            for i in range(len(key) - 3):
+                self._suffix_positions.setdefault(key[i:], []).append(pos)
+        self._matchers: list[SequenceMatcher | None] = [None] * len(self._keys)
+        self._memo: dict[tuple[str, str], str | None] = {}
+
+    def match(self, norm: str, raw_name: str | None) -> tuple[dict[str, float] | None, str]:
+        """Same contract as `_match_player_stat_key`."""
+        if norm in self.stat_map:
+            return self.stat_map[norm], "exact"
+        memo_key = (norm, str(raw_name or ""))
+        if memo_key in self._memo:
+            key = self._memo[memo_key]
+        else:
+            key = self._memo[memo_key] = self._match_fuzzy_key(norm, raw_name)
+        if key is None:
+            return None, "none"
+        return self.stat_map[key], "fuzzy"
+
+    def _match_fuzzy_key(self, norm: str, raw_name: str | None) -> str | None:
+        ns = _strip_generational_suffix(norm)
+
+        if len(ns) >= 4 and ns in self._first_by_stripped:
+            return self._first_by_stripped[ns]
+
+        if len(norm) >= 4:
+            # First key (in stat-map order) that ends with norm or that norm ends with.
+            positions = [self._position[norm[i:]] for i in range(len(norm) - 3) if norm[i:] in self._position]
+            containing = self._suffix_positions.get(norm)
+            if containing:
+                positions.append(containing[0])
+            if positions:
+                return self._keys[min(positions)]
+
+        parts = _token_parts(raw_name)
+        if len(parts) >= 2 and len(parts[0]) == 1 and len(parts[-1]) >= 4:
+            initial = parts[0][0]
+            last = parts[-1]
+            matches = [
+                self._keys[pos]
+                for pos in self._suffix_positions.get(last, [])
+                if len(self._keys[pos]) >= len(last) + 1 and self._keys[pos].startswith(initial)
+            ]
+            if len(matches) == 1:
+                return matches[0]
+
+        return self._best_similar_key(ns)
+
+    def _best_similar_key(self, ns: str) -> str | None:
+        if len(ns) < _FUZZY_MIN_LEN:
+            return None
+        candidates: list[tuple[float, str]] = []
+        for pos, ks in enumerate(self._stripped):
+            if len(ks) < _FUZZY_MIN_LEN:
+                continue
+            # ratio() <= real_quick_ratio() <= quick_ratio(); skip pairs whose bound misses.
+            if 2.0 * min(len(ns), len(ks)) / (len(ns) + len(ks)) < _FUZZY_MIN_RATIO:
+                continue
+            matcher = self._matchers[pos]
+            if matcher is None:
+                matcher = self._matchers[pos] = SequenceMatcher(None, "", ks)
+            matcher.set_seq1(ns)
+            if matcher.quick_ratio() < _FUZZY_MIN_RATIO:
+                continue
+            r = matcher.ratio()
+            if r >= _FUZZY_MIN_RATIO:
+                candidates.append((r, self._keys[pos]))
+        if len(candidates) == 1:
+            return candidates[0][1]
+        if len(candidates) > 1:
+            candidates.sort(key=lambda x: -x[0])
+            if candidates[0][0] - candidates[1][0] >= _FUZZY_MIN_MARGIN:
+                return candidates[0][1]
+        return None
+
+
 def _match_player_stat_key(
     norm: str,
     raw_name: str | None,
     stat_map: dict[str, dict[str, float]],
+    name_index: PlayerNameIndex | None = None,
 ) -> tuple[dict[str, float] | None, str]:
     """
     Map bet participant string to a normalized boxscore player row.
 
     Returns (player_stats, match_kind) where match_kind is exact|fuzzy|none.
+    Tiers, first hit wins: exact key, suffix-stripped equality, suffix
+    containment, unique initial + last name, then SequenceMatcher >= 0.91 with a
+    0.02 lead. Pass a prebuilt `name_index` to reuse lookups across bets.
     """
-    if norm in stat_map:
-        return stat_map[norm], "exact"
-
-    ns = _strip_generational_suffix(norm)
-
-    for k, v in stat_map.items():
-        if _strip_generational_suffix(k) == ns and len(ns) >= 4:
-            return v, "fuzzy"
-
-    for k, v in stat_map.items():
-        if k.endswith(norm) or norm.endswith(k):
-            if len(k) >= 4 and len(norm) >= 4:
-                return v, "fuzzy"
-
-    parts = _token_parts(raw_name)
-    if len(parts) >= 2 and len(parts[0]) == 1 and len(parts[-1]) >= 4:
-        initial = parts[0][0]
-        last = parts[-1]
-        matches = [
-            k
-            for k in stat_map
-            if k.endswith(last) and len(k) >= len(last) + 1 and k.startswith(initial)
-        ]
-        if len(matches) == 1:
-            return stat_map[matches[0]], "fuzzy"
-
-    candidates: list[tuple[float, str, dict[str, float]]] = []
-    for k, v in stat_map.items():
-        ks = _strip_generational_suffix(k)
-        r = _string_similarity(ns, ks)
-        if r >= 0.91 and min(len(ns), len(ks)) >= 6:
-            candidates.append((r, k, v))
-    if len(candidates) == 1:
-        return candidates[0][2], "fuzzy"
-    if len(candidates) > 1:
-        candidates.sort(key=lambda x: -x[0])
-        best_r, _, best_v = candidates[0]
-        second_r = candidates[1][0]
-        if best_r - second_r >= 0.02:
-            return best_v, "fuzzy"
-
-    return None, "none"
+    index = name_index if name_index is not None else PlayerNameIndex(stat_map)
+    return index.match(norm, raw_name)
 
 
 def _parse_utc_iso(timestamp: str | None) -> datetime | None:
@@ -715,6 +790,7 @@ async def resolve_mlb_game_pk(
     telemetry: dict[str, Any] | None = None,
     context: str = "prop",
     ref_id: str | None = None,
+    odds_event_ids: tuple[str | None, ...] = (),
 ) -> BoxscoreResolveResult:
     home_key = _canonical_team_name(home_team, sport=MLB_SPORT_KEY)
     away_key = _canonical_team_name(away_team, sport=MLB_SPORT_KEY)
@@ -746,6 +822,29 @@ async def resolve_mlb_game_pk(
         _record_mlb_resolve_telemetry(telemetry, result, context=context, ref_id=ref_id)
         return result
 
+    mapping = get_provider_event_mapping(
+        MLB_SPORT_KEY,
+        odds_event_ids=(*odds_event_ids, odds_event_id),
+        matchup_key=cache_key,
+        require_settlement_verified=True,
+    )
+    if mapping is not None and mapping.provider == "mlb_statsapi":
+        result = BoxscoreResolveResult(
+            provider="mlb_statsapi",
+            provider_event_id=mapping.provider_event_id,
+            odds_event_id=odds_event_id,
+            matchup=matchup_label,
+            score_matched=mapping.score_matched,
+            fallback_used=mapping.fallback_used,
+            confidence_tier=mapping.confidence_tier,
+            date_delta_hours=mapping.date_delta_hours,
+            home_away_tiebreak_used=mapping.home_away_tiebreak_used,
+            from_cache=True,
+        )
+        cache[cache_key] = result
+        _record_mlb_resolve_telemetry(telemetry, result, context=context, ref_id=ref_id)
+        return result
+
     bet_dt = _parse_utc_iso(commence_time)
     if schedule_games is None:
         merged = await fetch_mlb_schedule_for_dates(build_auto_settle_mlb_schedule_dates(bet_dt, now=now))
@@ -838,6 +937,24 @@ async def resolve_mlb_game_pk(
         from_cache=False,
     )
     cache[cache_key] = result
+    remember_provider_event_mapping(
+        ProviderEventMapping(
+            sport=MLB_SPORT_KEY,
+            provider="mlb_statsapi",
+            provider_event_id=game_pk,
+            odds_event_id=odds_event_id,
+            matchup=matchup_label,
+            final=True,
+            source=MAPPING_SOURCE_SETTLEMENT,
+            confidence_tier=confidence_tier,
+            score_matched=result.score_matched,
+            fallback_used=fallback_used,
+            date_delta_hours=date_delta_hours,
+            home_away_tiebreak_used=home_away_tiebreak_used,
+        ),
+        odds_event_ids=odds_event_ids,
+        matchup_key=cache_key,
+    )
     _record_mlb_resolve_telemetry(telemetry, result, context=context, ref_id=ref_id)
     return result
 
@@ -1083,8 +1200,15 @@ async def resolve_espn_event_id(
     telemetry: dict[str, Any] | None = None,
     context: str = "prop",
     ref_id: str | None = None,
+    odds_event_ids: tuple[str | None, ...] = (),
 ) -> EspnResolveResult:
-    """Match Odds API home/away (+ optional score check) to an ESPN NBA event id (final only)."""
+    """
+    Match Odds API home/away (+ optional score check) to an ESPN NBA event id (final only).
+
+    `odds_event_ids` are the bet's own Odds API event ids; with the completed
+    event's id and the matchup key they address the durable provider-event map,
+    which is read before scanning the scoreboard and written after a resolution.
+    """
     hk = _canonical_team_name(home_team)
     ak = _canonical_team_name(away_team)
     odds_event_id = (
@@ -1116,6 +1240,29 @@ async def resolve_espn_event_id(
         _record_espn_resolve_telemetry(telemetry, out, context=context, ref_id=ref_id)
         return out
 
+    mapping = get_provider_event_mapping(
+        NBA_SPORT_KEY,
+        odds_event_ids=(*odds_event_ids, odds_event_id),
+        matchup_key=cache_key,
+        require_settlement_verified=True,
+    )
+    if mapping is not None and mapping.provider == "espn":
+        out = EspnResolveResult(
+            espn_event_id=mapping.provider_event_id,
+            odds_event_id=odds_event_id,
+            matchup=matchup_label,
+            score_matched=mapping.score_matched,
+            fallback_used=mapping.fallback_used,
+            confidence_tier=mapping.confidence_tier,
+            date_delta_hours=mapping.date_delta_hours,
+            home_away_tiebreak_used=mapping.home_away_tiebreak_used,
+            from_cache=True,
+        )
+        cache[cache_key] = out
+        _log_espn_resolve_line(out, context=context, ref_id=ref_id)
+        _record_espn_resolve_telemetry(telemetry, out, context=context, ref_id=ref_id)
+        return out
+
     bet_dt = _parse_utc_iso(commence_time)
     if scoreboard_events is not None:
         events = scoreboard_events
@@ -1234,6 +1381,24 @@ async def resolve_espn_event_id(
         from_cache=False,
     )
     cache[cache_key] = result
+    remember_provider_event_mapping(
+        ProviderEventMapping(
+            sport=NBA_SPORT_KEY,
+            provider="espn",
+            provider_event_id=eid,
+            odds_event_id=odds_event_id,
+            matchup=matchup_label,
+            final=True,
+            source=MAPPING_SOURCE_SETTLEMENT,
+            confidence_tier=confidence_tier,
+            score_matched=score_matched,
+            fallback_used=fallback_used,
+            date_delta_hours=delta_h,
+            home_away_tiebreak_used=home_away_tiebreak_used,
+        ),
+        odds_event_ids=odds_event_ids,
+        matchup_key=cache_key,
+    )
     _log_espn_resolve_line(result, context=context, ref_id=ref_id)
     _record_espn_resolve_telemetry(telemetry, result, context=context, ref_id=ref_id)
     return result
@@ -1267,6 +1432,7 @@ async def resolve_boxscore_event_id(
     telemetry: dict[str, Any] | None = None,
     context: str = "prop",
     ref_id: str | None = None,
+    odds_event_ids: tuple[str | None, ...] = (),
 ) -> BoxscoreResolveResult:
     normalized_sport = str(sport or "").strip().lower()
     provider_events = (provider_events_by_sport or {}).get(normalized_sport)
@@ -1284,6 +1450,7 @@ async def resolve_boxscore_event_id(
             telemetry=telemetry,
             context=context,
             ref_id=ref_id,
+            odds_event_ids=odds_event_ids,
         )
         return _boxscore_result_from_espn(result)
 
@@ -1300,6 +1467,7 @@ async def resolve_boxscore_event_id(
             telemetry=telemetry,
             context=context,
             ref_id=ref_id,
+            odds_event_ids=odds_event_ids,
         )
 
     return BoxscoreResolveResult(
@@ -1322,6 +1490,95 @@ async def fetch_boxscore_summary(sport: str, provider_event_id: str) -> dict[str
     return {}
 
 
+# Settlement only resolves completed games, so a fetched boxscore is final and
+# can be shared for a long time; the short TTL covers a summary ESPN still
+# reports as in progress.
+BOXSCORE_PREFETCH_CONCURRENCY = 8
+BOXSCORE_FINAL_CACHE_TTL_SECONDS = 24 * 60 * 60
+BOXSCORE_PROVISIONAL_CACHE_TTL_SECONDS = 60
+
+
+def _boxscore_summary_cache_key(sport: str, provider_event_id: str) -> str:
+    return f"settle:boxscore:{sport}:{provider_event_id}"
+
+
+def _boxscore_summary_is_final(sport: str, summary: dict[str, Any]) -> bool:
+    if sport != NBA_SPORT_KEY:
+        # MLB boxscores carry no game state; the resolver only returns final games.
+        return True
+    competitions = (summary.get("header") or {}).get("competitions") if isinstance(summary.get("header"), dict) else None
+    if not isinstance(competitions, list) or not competitions or not isinstance(competitions[0], dict):
+        return True
+    status_type = (competitions[0].get("status") or {}).get("type") or {}
+    if not isinstance(status_type, dict) or "completed" not in status_type:
+        return True
+    return bool(status_type.get("completed"))
+
+
+async def get_cached_boxscore_summary(
+    sport: str,
+    provider_event_id: str,
+    *,
+    telemetry: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """`fetch_boxscore_summary` behind the shared-state cache; fetch errors propagate."""
+    cache_key = _boxscore_summary_cache_key(sport, provider_event_id)
+    cached = get_json(cache_key)
+    if isinstance(cached, dict) and isinstance(cached.get("summary"), dict):
+        _telemetry_bump(telemetry, "props_boxscore_cache_hits")
+        return cached["summary"]
+
+    summary = await fetch_boxscore_summary(sport, provider_event_id)
+    _telemetry_bump(telemetry, "props_boxscore_fetched")
+    if summary:
+        ttl = (
+            BOXSCORE_FINAL_CACHE_TTL_SECONDS
+            if _boxscore_summary_is_final(sport, summary)
+            else BOXSCORE_PROVISIONAL_CACHE_TTL_SECONDS
+        )
+        set_json(
+            cache_key,
+            {"fetched_at": datetime.now(timezone.utc).isoformat(), "summary": summary},
+            ttl,
+        )
+    return summary
+
+
+async def prefetch_boxscore_summaries(
+    summary_cache_keys: list[tuple[str, str]],
+    boxscore_summary_cache: dict[tuple[str, str], dict[str, Any]],
+    *,
+    telemetry: dict[str, Any] | None = None,
+    concurrency: int = BOXSCORE_PREFETCH_CONCURRENCY,
+) -> dict[tuple[str, str], Exception]:
+    """
+    Load every distinct (sport, provider_event_id) into `boxscore_summary_cache`
+    concurrently (at most `concurrency` requests in flight).
+
+    Returns fetch failures by key; failed keys are left out of the cache.
+    """
+    pending = [key for key in dict.fromkeys(summary_cache_keys) if key not in boxscore_summary_cache]
+    failures: dict[tuple[str, str], Exception] = {}
+    if not pending:
+        return failures
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _load(key: tuple[str, str]) -> None:
+        async with semaphore:
+            try:
+                boxscore_summary_cache[key] = await get_cached_boxscore_summary(
+                    key[0],
+                    key[1],
+                    telemetry=telemetry,
+                )
+            except Exception as e:
+                _telemetry_bump(telemetry, "props_boxscore_fetch_failed")
+                failures[key] = e
+
+    await asyncio.gather(*(_load(key) for key in pending))
+    return failures
+
+
 def _build_boxscore_date_union_for_commence_values(
     sport: str,
     commence_values: list[Any],
@@ -1348,6 +1605,7 @@ async def fetch_boxscore_provider_events_for_rows(
     *,
     sport_field: str,
     commence_time_field: str = "commence_time",
+    event_id_field: str | None = None,
     now: datetime | None = None,
 ) -> dict[str, list[dict[str, Any]]]:
     commence_by_sport: dict[str, list[Any]] = {}
@@ -1357,6 +1615,13 @@ async def fetch_boxscore_provider_events_for_rows(
         sport = str(row.get(sport_field) or "").strip().lower()
         if sport not in SUPPORTED_PROP_BOX_SCORE_SPORTS:
             continue
+        # Events settlement already resolved resolve from the provider-event map, not the scoreboard.
+        if event_id_field and get_provider_event_mapping(
+            sport,
+            odds_event_ids=(row.get(event_id_field),),
+            require_settlement_verified=True,
+        ):
+            continue
         commence_by_sport.setdefault(sport, []).append(row.get(commence_time_field))
 
     provider_events_by_sport: dict[str, list[dict[str, Any]]] = {}
@@ -1388,6 +1653,7 @@ def grade_prop(
     stat_map: dict[str, dict[str, float]],
     *,
     sport: str = NBA_SPORT_KEY,
+    name_index: PlayerNameIndex | None = None,
 ) -> tuple[str | None, dict[str, Any]]:
     """Return (win|loss|push|None, detail) for telemetry (player_match, stat_present)."""
     detail: dict[str, Any] = {
@@ -1410,7 +1676,7 @@ def grade_prop(
     if side not in ("over", "under"):
         return None, detail
 
-    player_stats, match_kind = _match_player_stat_key(norm, player_name, stat_map)
+    player_stats, match_kind = _match_player_stat_key(norm, player_name, stat_map, name_index)
     if not player_stats:
         detail["player_match"] = "none"
         return None, detail
@@ -1428,6 +1694,21 @@ def grade_prop(
     return ("win" if actual < line else "loss"), detail
 
 
+def _player_name_index_for_summary(
+    player_index_cache: dict[tuple[str, str], PlayerNameIndex],
+    summary_cache_key: tuple[str, str],
+    summary: dict[str, Any],
+    *,
+    sport: str,
+) -> PlayerNameIndex:
+    """Build the stat map and name index once per boxscore and reuse them across bets."""
+    name_index = player_index_cache.get(summary_cache_key)
+    if name_index is None:
+        name_index = PlayerNameIndex(build_player_stat_map(summary, sport=sport))
+        player_index_cache[summary_cache_key] = name_index
+    return name_index
+
+
 def _record_prop_grade_telemetry(
     telemetry: dict[str, Any] | None,
     grade: str | None,
@@ -1498,17 +1779,27 @@ def grade_parlay_ml_leg(
     )
 
 
-async def grade_parlay_prop_leg(
+def _parlay_leg_odds_event_id(leg: dict[str, Any]) -> str | None:
+    return str(
+        leg.get("sourceEventId")
+        or leg.get("source_event_id")
+        or leg.get("eventId")
+        or leg.get("event_id")
+        or ""
+    ).strip() or None
+
+
+async def resolve_parlay_prop_leg_event(
     leg: dict[str, Any],
     completed_events_by_sport: dict[str, list[dict]],
-    boxscore_summary_cache: dict[tuple[str, str], dict[str, Any]],
     boxscore_resolve_cache_by_sport: dict[str, dict[tuple[str, str, str], Any]],
     *,
     now: datetime | None = None,
     provider_events_by_sport: dict[str, list[dict[str, Any]]] | None = None,
     telemetry: dict[str, Any] | None = None,
     ref_id: str | None = None,
-) -> str | None:
+) -> tuple[str, str] | None:
+    """Return the (sport, provider_event_id) boxscore key for a gradeable prop leg."""
     from services.odds_api import _select_completed_event_for_bet
 
     sport = str(leg.get("sport") or "").strip().lower()
@@ -1519,26 +1810,13 @@ async def grade_parlay_prop_leg(
     if not is_auto_settle_supported_prop_market(sport, mk):
         return None
 
-    line_raw = leg.get("lineValue") if leg.get("lineValue") is not None else leg.get("line_value")
-    side = leg.get("selectionSide") or leg.get("selection_side")
-    player = leg.get("participantName") or leg.get("participant_name")
-
     events = completed_events_by_sport.get(sport) or []
     synthetic = {
-        "clv_event_id": str(
-            leg.get("sourceEventId")
-            or leg.get("source_event_id")
-            or leg.get("eventId")
-            or leg.get("event_id")
-            or ""
-        ).strip()
-        or None,
+        "clv_event_id": _parlay_leg_odds_event_id(leg),
         "clv_team": leg.get("team"),
         "commence_time": leg.get("commenceTime") or leg.get("commence_time"),
         "clv_sport_key": sport,
     }
-    if synthetic["clv_event_id"] == "":
-        synthetic["clv_event_id"] = None
 
     event, _reason = _select_completed_event_for_bet(synthetic, events)
     if event is None:
@@ -1561,29 +1839,88 @@ async def grade_parlay_prop_leg(
         telemetry=telemetry,
         context="parlay_leg",
         ref_id=ref_id,
+        odds_event_ids=(synthetic["clv_event_id"],),
     )
     provider_event_id = res.provider_event_id
     if not provider_event_id:
         return None
+    return sport, provider_event_id
 
-    summary_cache_key = (sport, provider_event_id)
-    if summary_cache_key not in boxscore_summary_cache:
-        try:
-            boxscore_summary_cache[summary_cache_key] = await fetch_boxscore_summary(
-                sport,
-                provider_event_id,
-            )
-        except Exception:
-            _telemetry_bump(telemetry, "props_boxscore_fetch_failed")
-            boxscore_summary_cache[summary_cache_key] = {}
 
-    summary = boxscore_summary_cache.get(summary_cache_key) or {}
-    stat_map = build_player_stat_map(summary, sport=sport)
-    grade, detail = grade_prop(player, mk, line_raw, side, stat_map, sport=sport)
+def grade_parlay_prop_leg_from_summary(
+    leg: dict[str, Any],
+    summary_cache_key: tuple[str, str],
+    boxscore_summary_cache: dict[tuple[str, str], dict[str, Any]],
+    *,
+    telemetry: dict[str, Any] | None = None,
+    player_index_cache: dict[tuple[str, str], PlayerNameIndex] | None = None,
+) -> str | None:
+    """Grade a resolved prop leg against an already-fetched boxscore."""
+    mk = str(leg.get("marketKey") or leg.get("market_key") or "").strip()
+    line_raw = leg.get("lineValue") if leg.get("lineValue") is not None else leg.get("line_value")
+    side = leg.get("selectionSide") or leg.get("selection_side")
+    player = leg.get("participantName") or leg.get("participant_name")
+    sport = summary_cache_key[0]
+
+    name_index = _player_name_index_for_summary(
+        player_index_cache if player_index_cache is not None else {},
+        summary_cache_key,
+        boxscore_summary_cache.get(summary_cache_key) or {},
+        sport=sport,
+    )
+    grade, detail = grade_prop(
+        player,
+        mk,
+        line_raw,
+        side,
+        name_index.stat_map,
+        sport=sport,
+        name_index=name_index,
+    )
     _record_prop_grade_telemetry(telemetry, grade, detail)
     return grade
 
 
+async def grade_parlay_prop_leg(
+    leg: dict[str, Any],
+    completed_events_by_sport: dict[str, list[dict]],
+    boxscore_summary_cache: dict[tuple[str, str], dict[str, Any]],
+    boxscore_resolve_cache_by_sport: dict[str, dict[tuple[str, str, str], Any]],
+    *,
+    now: datetime | None = None,
+    provider_events_by_sport: dict[str, list[dict[str, Any]]] | None = None,
+    telemetry: dict[str, Any] | None = None,
+    ref_id: str | None = None,
+    player_index_cache: dict[tuple[str, str], PlayerNameIndex] | None = None,
+) -> str | None:
+    summary_cache_key = await resolve_parlay_prop_leg_event(
+        leg,
+        completed_events_by_sport,
+        boxscore_resolve_cache_by_sport,
+        now=now,
+        provider_events_by_sport=provider_events_by_sport,
+        telemetry=telemetry,
+        ref_id=ref_id,
+    )
+    if summary_cache_key is None:
+        return None
+
+    failures = await prefetch_boxscore_summaries(
+        [summary_cache_key],
+        boxscore_summary_cache,
+        telemetry=telemetry,
+    )
+    if summary_cache_key in failures:
+        boxscore_summary_cache[summary_cache_key] = {}
+    return grade_parlay_prop_leg_from_summary(
+        leg,
+        summary_cache_key,
+        boxscore_summary_cache,
+        telemetry=telemetry,
+        player_index_cache=player_index_cache,
+    )
+
+
 async def grade_parlay_leg(
     leg: dict[str, Any],
     completed_events_by_sport: dict[str, list[dict]],
@@ -1594,6 +1931,7 @@ async def grade_parlay_leg(
     provider_events_by_sport: dict[str, list[dict[str, Any]]] | None = None,
     telemetry: dict[str, Any] | None = None,
     prop_ref_id: str | None = None,
+    player_index_cache: dict[tuple[str, str], PlayerNameIndex] | None = None,
 ) -> str | None:
     surface = str(leg.get("surface") or "").strip().lower()
     if surface == "player_props":
@@ -1606,6 +1944,7 @@ async def grade_parlay_leg(
             provider_events_by_sport=provider_events_by_sport,
             telemetry=telemetry,
             ref_id=prop_ref_id,
+            player_index_cache=player_index_cache,
         )
     if surface == "straight_bets":
         return grade_parlay_ml_leg(leg, completed_events_by_sport)
@@ -1639,7 +1978,7 @@ def _build_parlay_provider_prefetch_rows(
     now: datetime,
 ) -> list[dict[str, Any]]:
     rows: list[dict[str, Any]] = []
-    seen: set[tuple[str, str]] = set()
+    seen: set[tuple[str, str, str]] = set()
     for bet in parlay_bets:
         meta = bet.get("selection_meta")
         if not isinstance(meta, dict):
@@ -1651,11 +1990,15 @@ def _build_parlay_provider_prefetch_rows(
                 continue
             sport = str(leg.get("sport") or "").strip()
             commence_time = leg.get("commenceTime") or leg.get("commence_time")
-            key = (sport.lower(), str(commence_time or "").strip())
+            event_id = _parlay_leg_odds_event_id(leg)
+            key = (sport.lower(), str(commence_time or "").strip(), event_id or "")
             if not sport or key in seen:
                 continue
             seen.add(key)
-            rows.append({"sport": sport, "commence_time": commence_time})
+            row = {"sport": sport, "commence_time": commence_time}
+            if event_id:
+                row["event_id"] = event_id
+            rows.append(row)
     return rows
 
 
@@ -1696,14 +2039,18 @@ async def settle_standalone_props(
     }
     settled = 0
     boxscore_summary_cache: dict[tuple[str, str], dict[str, Any]] = {}
+    player_index_cache: dict[tuple[str, str], PlayerNameIndex] = {}
     boxscore_resolve_cache_by_sport: dict[str, dict[tuple[str, str, str], Any]] = {}
     provider_events_by_sport = await fetch_boxscore_provider_events_for_rows(
         prop_bets,
         sport_field="clv_sport_key",
         commence_time_field="commence_time",
+        event_id_field="clv_event_id",
         now=now,
     )
 
+    # Resolve every bet's boxscore first so each game is fetched once, concurrently.
+    resolved_bets: list[tuple[dict[str, Any], tuple[str, str]]] = []
     for bet in prop_bets:
         sport = str(bet.get("clv_sport_key") or "").strip().lower()
         if not is_standalone_prop_bet(bet):
@@ -1734,6 +2081,7 @@ async def settle_standalone_props(
             telemetry=telemetry,
             context="standalone_prop",
             ref_id=str(bet.get("id")) if bet.get("id") is not None else None,
+            odds_event_ids=(bet.get("clv_event_id"),),
         )
         provider_event_id = res.provider_event_id
         if not provider_event_id:
@@ -1744,23 +2092,27 @@ async def settle_standalone_props(
             )
             continue
 
-        summary_cache_key = (sport, provider_event_id)
-        if summary_cache_key not in boxscore_summary_cache:
-            try:
-                boxscore_summary_cache[summary_cache_key] = await fetch_boxscore_summary(
-                    sport,
-                    provider_event_id,
-                )
-            except Exception as e:
-                _telemetry_bump(telemetry, "props_boxscore_fetch_failed")
-                skipped["boxscore_fetch_failed"] += 1
-                print(
-                    f"[Auto-Settler:props] boxscore fetch failed for sport={sport} "
-                    f"provider_event_id={provider_event_id}: {e}"
-                )
-                continue
+        resolved_bets.append((bet, (sport, provider_event_id)))
+
+    fetch_failures = await prefetch_boxscore_summaries(
+        [summary_cache_key for _bet, summary_cache_key in resolved_bets],
+        boxscore_summary_cache,
+        telemetry=telemetry,
+    )
 
-        stat_map = build_player_stat_map(
+    for bet, summary_cache_key in resolved_bets:
+        sport, provider_event_id = summary_cache_key
+        if summary_cache_key in fetch_failures:
+            skipped["boxscore_fetch_failed"] += 1
+            print(
+                f"[Auto-Settler:props] boxscore fetch failed for sport={sport} "
+                f"provider_event_id={provider_event_id}: {fetch_failures[summary_cache_key]}"
+            )
+            continue
+
+        name_index = _player_name_index_for_summary(
+            player_index_cache,
+            summary_cache_key,
             boxscore_summary_cache[summary_cache_key],
             sport=sport,
         )
@@ -1770,8 +2122,9 @@ async def settle_standalone_props(
             mk,
             bet.get("line_value"),
             bet.get("selection_side"),
-            stat_map,
+            name_index.stat_map,
             sport=sport,
+            name_index=name_index,
         )
         _record_prop_grade_telemetry(telemetry, grade, g_detail)
         if grade is None:
@@ -1816,15 +2169,19 @@ async def settle_parlays(
     }
     settled = 0
     boxscore_summary_cache: dict[tuple[str, str], dict[str, Any]] = {}
+    player_index_cache: dict[tuple[str, str], PlayerNameIndex] = {}
     boxscore_resolve_cache_by_sport: dict[str, dict[tuple[str, str, str], Any]] = {}
     provider_prefetch_rows = _build_parlay_provider_prefetch_rows(parlay_bets, now=now)
     provider_events_by_sport = await fetch_boxscore_provider_events_for_rows(
         provider_prefetch_rows,
         sport_field="sport",
         commence_time_field="commence_time",
+        event_id_field="event_id",
         now=now,
     )
 
+    # Resolve every prop leg's boxscore first so each game is fetched once, concurrently.
+    planned_bets: list[tuple[dict[str, Any], list[str | None], list[tuple[int, dict[str, Any], tuple[str, str]]]]] = []
     for bet in parlay_bets:
         meta = bet.get("selection_meta")
         if not isinstance(meta, dict):
@@ -1837,6 +2194,7 @@ async def settle_parlays(
 
         bid = str(bet.get("id") or "")
         leg_outcomes: list[str | None] = []
+        prop_legs: list[tuple[int, dict[str, Any], tuple[str, str]]] = []
         for leg in legs:
             if not isinstance(leg, dict):
                 leg_outcomes.append(None)
@@ -1849,6 +2207,20 @@ async def settle_parlays(
 
             lid = str(leg.get("id") or "")
             prop_ref = f"{bid}:{lid}" if bid or lid else None
+            if str(leg.get("surface") or "").strip().lower() == "player_props":
+                summary_cache_key = await resolve_parlay_prop_leg_event(
+                    leg,
+                    completed_events_by_sport,
+                    boxscore_resolve_cache_by_sport,
+                    now=now,
+                    provider_events_by_sport=provider_events_by_sport,
+                    telemetry=telemetry,
+                    ref_id=prop_ref,
+                )
+                if summary_cache_key is not None:
+                    prop_legs.append((len(leg_outcomes), leg, summary_cache_key))
+                leg_outcomes.append(None)
+                continue
             g = await grade_parlay_leg(
                 leg,
                 completed_events_by_sport,
@@ -1858,8 +2230,28 @@ async def settle_parlays(
                 provider_events_by_sport=provider_events_by_sport,
                 telemetry=telemetry,
                 prop_ref_id=prop_ref,
+                player_index_cache=player_index_cache,
             )
             leg_outcomes.append(g)
+        planned_bets.append((bet, leg_outcomes, prop_legs))
+
+    fetch_failures = await prefetch_boxscore_summaries(
+        [summary_cache_key for _bet, _outcomes, prop_legs in planned_bets for _i, _leg, summary_cache_key in prop_legs],
+        boxscore_summary_cache,
+        telemetry=telemetry,
+    )
+    for summary_cache_key in fetch_failures:
+        boxscore_summary_cache[summary_cache_key] = {}
+
+    for bet, leg_outcomes, prop_legs in planned_bets:
+        for leg_index, leg, summary_cache_key in prop_legs:
+            leg_outcomes[leg_index] = grade_parlay_prop_leg_from_summary(
+                leg,
+                summary_cache_key,
+                boxscore_summary_cache,
+                telemetry=telemetry,
+                player_index_cache=player_index_cache,
+            )
 
         if any(g == "loss" for g in leg_outcomes):
             final = "loss"
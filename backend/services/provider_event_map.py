@@ -0,0 +1,190 @@
+"""
+Durable Odds API event -> provider game id mappings (ESPN event ids, MLB gamePks).
+
+Auto-settle, pick'em settlement and live tracking each used to re-derive this
+mapping from a scoreboard scan on every run. The first successful resolution is
+now written to shared state (Redis when configured) under the Odds API event id,
+plus a matchup/kickoff fallback key, and later lookups read it back.
+
+Live tracking also records its kickoff-verified heuristic matches here. Those are
+good enough to find the game again on the next poll, but settlement only trusts
+mappings it resolved and score-checked itself (`source == "settlement"`).
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, fields, replace
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+from services.live_provider_contracts import LiveBetCandidate
+from services.shared_state import get_json, set_json
+
+PROVIDER_EVENT_MAP_TTL_SECONDS = 14 * 24 * 60 * 60
+MAPPING_SOURCE_SETTLEMENT = "settlement"
+MAPPING_SOURCE_LIVE = "live"
+
+
+@dataclass(frozen=True)
+class ProviderEventMapping:
+    """One resolved Odds API event -> provider event pairing."""
+
+    sport: str
+    provider: str
+    provider_event_id: str
+    odds_event_id: str | None = None
+    matchup: str = ""
+    # True once the pairing was made against a completed provider game.
+    final: bool = False
+    confidence_tier: str = "unresolved"
+    score_matched: bool = False
+    fallback_used: bool = False
+    date_delta_hours: float | None = None
+    home_away_tiebreak_used: bool = False
+    resolved_at: str | None = None
+    # Who made the pairing; entries written before this field existed load as "" (unverified).
+    source: str = ""
+
+    @property
+    def settlement_verified(self) -> bool:
+        return self.final and self.source == MAPPING_SOURCE_SETTLEMENT
+
+
+_MAPPING_FIELDS = {f.name for f in fields(ProviderEventMapping)}
+
+
+def _odds_event_key(sport: str, odds_event_id: str) -> str:
+    return f"provider_event_map:{sport}:odds:{odds_event_id}"
+
+
+def _matchup_key(sport: str, matchup_key: tuple[str, str, str]) -> str:
+    return f"provider_event_map:{sport}:matchup:{'|'.join(matchup_key)}"
+
+
+def _clean_ids(values: Iterable[str | None]) -> list[str]:
+    out: list[str] = []
+    for value in values:
+        cleaned = str(value or "").strip()
+        if cleaned and cleaned not in out:
+            out.append(cleaned)
+    return out
+
+
+def _load(key: str) -> ProviderEventMapping | None:
+    raw = get_json(key)
+    if not isinstance(raw, dict) or not raw.get("provider_event_id"):
+        return None
+    try:
+        return ProviderEventMapping(**{k: v for k, v in raw.items() if k in _MAPPING_FIELDS})
+    except TypeError:
+        return None
+
+
+def get_provider_event_mapping(
+    sport: str,
+    *,
+    odds_event_ids: Iterable[str | None] = (),
+    matchup_key: tuple[str, str, str] | None = None,
+    require_final: bool = False,
+    require_settlement_verified: bool = False,
+) -> ProviderEventMapping | None:
+    """Look up a mapping by Odds API event id(s), then by the matchup/kickoff fallback key."""
+    normalized_sport = str(sport or "").strip().lower()
+    keys = [_odds_event_key(normalized_sport, odds_event_id) for odds_event_id in _clean_ids(odds_event_ids)]
+    if matchup_key is not None:
+        keys.append(_matchup_key(normalized_sport, matchup_key))
+    for key in keys:
+        mapping = _load(key)
+        if mapping is None or (require_final and not mapping.final):
+            continue
+        if require_settlement_verified and not mapping.settlement_verified:
+            continue
+        return mapping
+    return None
+
+
+def remember_provider_event_mapping(
+    mapping: ProviderEventMapping,
+    *,
+    odds_event_ids: Iterable[str | None] = (),
+    matchup_key: tuple[str, str, str] | None = None,
+) -> None:
+    """Store `mapping` under every given key without downgrading what is already stored.
+
+    A final mapping is never overwritten by a non-final one, and a settlement-verified
+    mapping only by another settlement-verified one.
+    """
+    normalized_sport = str(mapping.sport or "").strip().lower()
+    if mapping.resolved_at is None:
+        mapping = replace(mapping, resolved_at=datetime.now(timezone.utc).isoformat())
+    payload: dict[str, Any] = asdict(mapping)
+    keys = [
+        _odds_event_key(normalized_sport, odds_event_id)
+        for odds_event_id in _clean_ids([mapping.odds_event_id, *odds_event_ids])
+    ]
+    if matchup_key is not None:
+        keys.append(_matchup_key(normalized_sport, matchup_key))
+    for key in keys:
+        if not mapping.settlement_verified:
+            existing = _load(key)
+            if existing is not None and (
+                existing.settlement_verified or (existing.final and not mapping.final)
+            ):
+                continue
+        set_json(key, payload, PROVIDER_EVENT_MAP_TTL_SECONDS)
+
+
+def find_mapped_event(
+    sport: str,
+    provider: str,
+    *,
+    odds_event_ids: Iterable[str | None],
+    events: Iterable[Any],
+) -> tuple[Any | None, ProviderEventMapping | None]:
+    """Return the event (anything with `provider_event_id`) a stored mapping points at, if it is in `events`."""
+    mapping = get_provider_event_mapping(sport, odds_event_ids=odds_event_ids)
+    if mapping is None or mapping.provider != provider:
+        return None, None
+    for event in events:
+        if getattr(event, "provider_event_id", None) == mapping.provider_event_id:
+            return event, mapping
+    return None, mapping
+
+
+# Live matches weaker than kickoff-verified (e.g. matchup_only) are not persisted. The
+# ones that are stay source="live", so settlement never short-circuits on them.
+LIVE_MAPPABLE_CONFIDENCES = frozenset({"matchup_plus_time", "player_summary"})
+
+
+def remember_live_event_match(
+    candidate: LiveBetCandidate,
+    event: Any,
+    *,
+    provider: str,
+    confidence: str,
+    mapping: ProviderEventMapping | None = None,
+) -> None:
+    """Persist a live-tracking match, or promote an existing mapping once its game is final."""
+    odds_event_ids = (candidate.source_event_id, candidate.clv_event_id)
+    final = getattr(event, "status", None) == "final"
+    if mapping is not None:
+        if final and not mapping.final:
+            remember_provider_event_mapping(
+                replace(mapping, final=True, resolved_at=None),
+                odds_event_ids=odds_event_ids,
+            )
+        return
+    if confidence not in LIVE_MAPPABLE_CONFIDENCES:
+        return
+    remember_provider_event_mapping(
+        ProviderEventMapping(
+            sport=str(candidate.sport_key or "").strip().lower(),
+            provider=provider,
+            provider_event_id=str(event.provider_event_id),
+            matchup=str(candidate.event_name or ""),
+            final=final,
+            confidence_tier=confidence,
+            source=MAPPING_SOURCE_LIVE,
+        ),
+        odds_event_ids=odds_event_ids,
+    )
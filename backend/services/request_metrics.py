@@ -0,0 +1,241 @@
+"""Per-request timing, round-trip accounting, and per-route latency histograms."""
+
+from __future__ import annotations
+
+import bisect
+import os
+import re
+import threading
+import time
+from typing import Any
+from uuid import uuid4
+
+from services.runtime_support import log_event, utc_now_iso
+from utils.request_context import (
+    get_db_metrics,
+    get_http_metrics,
+    reset_db_metrics,
+    reset_http_metrics,
+    reset_request_context,
+    restore_db_metrics,
+    restore_http_metrics,
+    set_request_context,
+)
+
+# Upper bounds (ms) of the latency buckets; the last bucket is open-ended.
+LATENCY_BUCKET_BOUNDS_MS = (
+    5.0, 10.0, 25.0, 50.0, 75.0, 100.0, 150.0, 250.0, 400.0, 600.0,
+    800.0, 1000.0, 1500.0, 2500.0, 4000.0, 6000.0, 10000.0, 20000.0, 30000.0,
+)
+ROUTE_HISTOGRAM_MAX_ROUTES = 200
+# Health probes, plus the long-lived SSE stream whose duration is connection lifetime, not latency.
+REQUEST_METRICS_QUIET_PATHS = frozenset({"/health", "/ready", "/api/board/events"})
+UNMATCHED_ROUTE_LABEL = "unmatched"
+_INCOMING_ID_RE = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
+
+
+def _slow_request_ms() -> float:
+    try:
+        return max(0.0, float(os.getenv("REQUEST_METRICS_SLOW_MS", "1500")))
+    except ValueError:
+        return 1500.0
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram; percentiles resolve to a bucket upper bound."""
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(LATENCY_BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.error_count = 0
+        self.db_roundtrips = 0
+        self.http_roundtrips = 0
+
+    def observe(self, duration_ms: float, *, status_code: int, db_roundtrips: int, http_roundtrips: int) -> None:
+        self.buckets[bisect.bisect_left(LATENCY_BUCKET_BOUNDS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        if status_code >= 500:
+            self.error_count += 1
+        self.db_roundtrips += db_roundtrips
+        self.http_roundtrips += http_roundtrips
+
+    def percentile(self, quantile: float) -> float | None:
+        if self.count <= 0:
+            return None
+        rank = max(1, int(round(quantile * self.count)))
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                upper = LATENCY_BUCKET_BOUNDS_MS[index] if index < len(LATENCY_BUCKET_BOUNDS_MS) else self.max_ms
+                return round(min(upper, self.max_ms), 2)
+        return round(self.max_ms, 2)
+
+    def snapshot(self) -> dict[str, Any]:
+        count = self.count
+        return {
+            "count": count,
+            "error_count": self.error_count,
+            "mean_ms": round(self.total_ms / count, 2) if count else None,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.max_ms, 2) if count else None,
+            "avg_db_roundtrips": round(self.db_roundtrips / count, 2) if count else None,
+            "avg_http_roundtrips": round(self.http_roundtrips / count, 2) if count else None,
+        }
+
+
+_HISTOGRAMS: dict[str, LatencyHistogram] = {}
+_HISTOGRAMS_LOCK = threading.Lock()
+_HISTOGRAMS_SINCE = utc_now_iso()
+
+
+def record_route_latency(
+    route: str,
+    duration_ms: float,
+    *,
+    status_code: int,
+    db_roundtrips: int = 0,
+    http_roundtrips: int = 0,
+) -> None:
+    with _HISTOGRAMS_LOCK:
+        histogram = _HISTOGRAMS.get(route)
+        if histogram is None:
+            if len(_HISTOGRAMS) >= ROUTE_HISTOGRAM_MAX_ROUTES:
+                route = UNMATCHED_ROUTE_LABEL
+                histogram = _HISTOGRAMS.get(route)
+            if histogram is None:
+                histogram = _HISTOGRAMS[route] = LatencyHistogram()
+        histogram.observe(
+            duration_ms,
+            status_code=status_code,
+            db_roundtrips=db_roundtrips,
+            http_roundtrips=http_roundtrips,
+        )
+
+
+def get_route_latency_snapshot() -> dict[str, Any]:
+    with _HISTOGRAMS_LOCK:
+        routes = [{"route": route, **histogram.snapshot()} for route, histogram in _HISTOGRAMS.items()]
+        since = _HISTOGRAMS_SINCE
+    routes.sort(key=lambda item: (-(item["p95_ms"] or 0.0), -item["count"], item["route"]))
+    return {
+        "since": since,
+        "generated_at": utc_now_iso(),
+        "bucket_bounds_ms": list(LATENCY_BUCKET_BOUNDS_MS),
+        "routes": routes,
+    }
+
+
+def reset_route_latency_histograms() -> None:
+    global _HISTOGRAMS_SINCE
+    with _HISTOGRAMS_LOCK:
+        _HISTOGRAMS.clear()
+        _HISTOGRAMS_SINCE = utc_now_iso()
+
+
+def _header_value(scope: dict[str, Any], name: bytes) -> str | None:
+    for key, value in scope.get("headers") or []:
+        if key.lower() == name:
+            candidate = value.decode("latin-1").strip()
+            return candidate if _INCOMING_ID_RE.match(candidate) else None
+    return None
+
+
+def _route_label(scope: dict[str, Any]) -> str:
+    route = scope.get("route")
+    path_format = getattr(route, "path_format", None) or getattr(route, "path", None)
+    if not path_format:
+        return UNMATCHED_ROUTE_LABEL
+    return f"{scope.get('method', 'GET')} {path_format}"
+
+
+def _server_timing(*, app_ms: float, db: dict[str, Any], http: dict[str, Any]) -> str:
+    return ", ".join(
+        [
+            f'db;dur={db["roundtrip_duration_ms"]};desc="{db["roundtrip_count"]} calls"',
+            f'http;dur={http["roundtrip_duration_ms"]};desc="{http["roundtrip_count"]} calls"',
+            f"app;dur={round(app_ms, 2)}",
+        ]
+    )
+
+
+class RequestMetricsMiddleware:
+    """Pure ASGI middleware: request ids, round-trip accounting, Server-Timing, latency histograms.
+
+    Written against raw ASGI (not BaseHTTPMiddleware) so the endpoint runs in
+    this middleware's context and its round-trip counters are visible here.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope.get("type") != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _header_value(scope, b"x-request-id") or uuid4().hex
+        correlation_id = _header_value(scope, b"x-correlation-id") or request_id
+        request_token, correlation_token = set_request_context(request_id=request_id, correlation_id=correlation_id)
+        db_token = reset_db_metrics()
+        http_token = reset_http_metrics()
+        started_at = time.monotonic()
+        status_code = 500
+
+        async def send_with_timing(message) -> None:
+            nonlocal status_code
+            if message.get("type") == "http.response.start":
+                status_code = int(message.get("status") or 500)
+                headers = list(message.get("headers") or [])
+                timing = _server_timing(
+                    app_ms=(time.monotonic() - started_at) * 1000,
+                    db=get_db_metrics(),
+                    http=get_http_metrics(),
+                )
+                headers.append((b"server-timing", timing.encode("latin-1")))
+                headers.append((b"x-request-id", request_id.encode("latin-1")))
+                if correlation_id != request_id:
+                    headers.append((b"x-correlation-id", correlation_id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            duration_ms = round((time.monotonic() - started_at) * 1000, 2)
+            db = get_db_metrics()
+            http = get_http_metrics()
+            route = _route_label(scope)
+            record_route_latency(
+                route,
+                duration_ms,
+                status_code=status_code,
+                db_roundtrips=int(db["roundtrip_count"]),
+                http_roundtrips=int(http["roundtrip_count"]),
+            )
+            path = str(scope.get("path") or "")
+            if path not in REQUEST_METRICS_QUIET_PATHS:
+                log_event(
+                    "http.request.completed",
+                    level="warning" if duration_ms >= _slow_request_ms() else "info",
+                    request_id=request_id,
+                    correlation_id=correlation_id,
+                    method=scope.get("method"),
+                    route=route,
+                    path=path,
+                    status_code=status_code,
+                    duration_ms=duration_ms,
+                    db_roundtrips=db["roundtrip_count"],
+                    db_duration_ms=db["roundtrip_duration_ms"],
+                    http_roundtrips=http["roundtrip_count"],
+                    http_duration_ms=http["roundtrip_duration_ms"],
+                )
+            restore_http_metrics(http_token)
+            restore_db_metrics(db_token)
+            reset_request_context(request_token=request_token, correlation_token=correlation_token)
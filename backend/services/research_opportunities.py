@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import re
+import uuid
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from typing import Any
@@ -19,6 +21,9 @@ from models import (
 )
 from services.match_keys import scanner_match_key_from_side
 from services.clv_tracking import has_valid_close_snapshot
+from services.model_calibration import record_model_calibration_captures
+from services.shared_state import get_json, set_json
+from services.supabase_merge import is_missing_rpc_function_error, merge_rows_via_rpc
 from services.supabase_paging import fetch_all_rows
 
 UNKNOWN_BUCKET = "Unknown"
@@ -45,6 +50,28 @@ EVENT_DAY_LATER_DAY = "Later day"
 EVENT_DAY_UNKNOWN = "Unknown"
 EVENT_DAY_BUCKET_ORDER = [EVENT_DAY_SAME_DAY, EVENT_DAY_LATER_DAY, EVENT_DAY_UNKNOWN]
 
+# Set-based capture merges (migration 027); capture falls back to row-by-row writes
+# while these functions are not deployed.
+SCAN_OPPORTUNITY_MERGE_FUNCTION = "merge_scan_opportunity_captures"
+MODEL_EVALUATION_MERGE_FUNCTION = "merge_scan_opportunity_model_evaluations"
+
+# Summaries are cached per filter tuple. Close capture bumps the generation so every
+# cached breakdown is dropped at once; the TTL bounds staleness from new captures.
+RESEARCH_SUMMARY_CACHE_PREFIX = "research-opportunities-summary"
+RESEARCH_SUMMARY_CACHE_GENERATION_KEY = f"{RESEARCH_SUMMARY_CACHE_PREFIX}:generation"
+RESEARCH_SUMMARY_CACHE_TTL_SECONDS = 300
+RESEARCH_SUMMARY_CACHE_GENERATION_TTL_SECONDS = 60 * 60 * 24 * 7
+
+SUMMARY_FIELDS = (
+    "opportunity_key,surface,first_seen_at,last_seen_at,commence_time,sport,event,team,sportsbook,market,event_id,"
+    "player_name,source_market_key,selection_side,line_value,"
+    "first_source,last_source,seen_count,first_ev_percentage,first_book_odds,best_book_odds,"
+    "latest_reference_odds,reference_odds_at_close,close_captured_at,clv_ev_percent,beat_close"
+)
+CURRENT_MODEL_SOURCE_PREFIX = "scheduled_board_drop"
+CURRENT_MODEL_SOURCES = ("ops_trigger_board_drop", "cron_board_drop")
+_PUSHDOWN_TOKEN_RE = re.compile(r"^[a-z0-9_]+$")
+
 if ZoneInfo is not None:
     try:
         PHOENIX_TZ = ZoneInfo("America/Phoenix")
@@ -236,36 +263,13 @@ def _model_evaluations_from_side(side: dict[str, Any]) -> list[dict[str, Any]]:
     ]
 
 
-def _capture_scan_opportunity_model_evaluations(
-    db,
+def _model_evaluation_payloads(
     *,
     collapsed_by_key: dict[str, dict[str, Any]],
     source: str,
     captured_at: str,
-) -> None:
-    opportunity_keys = list(collapsed_by_key.keys())
-    if not opportunity_keys:
-        return
-
-    try:
-        existing = (
-            db.table("scan_opportunity_model_evaluations")
-            .select("id,opportunity_key,model_key")
-            .in_("opportunity_key", opportunity_keys)
-            .execute()
-        )
-    except Exception as exc:
-        if is_missing_scan_opportunity_model_evaluations_error(exc):
-            return
-        raise
-
-    existing_by_key = {
-        (str(row.get("opportunity_key") or ""), str(row.get("model_key") or "").strip().lower()): row
-        for row in (existing.data or [])
-        if row.get("opportunity_key") and row.get("model_key")
-    }
-    inserts: list[dict[str, Any]] = []
-
+) -> list[dict[str, Any]]:
+    payloads: list[dict[str, Any]] = []
     for opportunity_key, collapsed in collapsed_by_key.items():
         side = collapsed["side"]
         live_model_key = _default_model_key_for_side(side)
@@ -333,45 +337,126 @@ def _capture_scan_opportunity_model_evaluations(
                 "first_log_loss": None,
                 "last_log_loss": None,
             }
-            existing_row = existing_by_key.get((opportunity_key, model_key))
-            if existing_row is None:
-                inserts.append(payload)
-                continue
+            payloads.append(payload)
+    return payloads
 
-            update_payload = {
-                "capture_role": payload["capture_role"],
-                "surface": payload["surface"],
-                "sport": payload["sport"],
-                "event": payload["event"],
-                "team": payload["team"],
-                "sportsbook": payload["sportsbook"],
-                "sportsbook_key": payload["sportsbook_key"],
-                "market": payload["market"],
-                "event_id": payload["event_id"],
-                "player_name": payload["player_name"],
-                "selection_side": payload["selection_side"],
-                "line_value": payload["line_value"],
-                "reference_source": payload["reference_source"],
-                "last_source": source,
-                "last_seen_at": captured_at,
-                "last_true_prob": payload["last_true_prob"],
-                "last_raw_true_prob": payload["last_raw_true_prob"],
-                "last_book_odds": payload["last_book_odds"],
-                "last_book_decimal": payload["last_book_decimal"],
-                "last_reference_odds": payload["last_reference_odds"],
-                "last_ev_percentage": payload["last_ev_percentage"],
-                "last_confidence_score": payload["last_confidence_score"],
-                "last_confidence_label": payload["last_confidence_label"],
-                "last_reference_bookmaker_count": payload["last_reference_bookmaker_count"],
-                "last_interpolation_mode": payload["last_interpolation_mode"],
-                "last_reference_inputs_json": payload["last_reference_inputs_json"],
-                "last_prob_std": payload["last_prob_std"],
-                "last_shrink_factor": payload["last_shrink_factor"],
-            }
-            db.table("scan_opportunity_model_evaluations").update(update_payload).eq("id", existing_row["id"]).execute()
+
+def _capture_scan_opportunity_model_evaluations_row_by_row(
+    db,
+    *,
+    payloads: list[dict[str, Any]],
+    source: str,
+    captured_at: str,
+) -> list[dict[str, Any]] | None:
+    """Legacy select-then-write path used until the merge function is deployed."""
+    opportunity_keys = sorted({payload["opportunity_key"] for payload in payloads})
+    try:
+        existing = (
+            db.table("scan_opportunity_model_evaluations")
+            .select("id,opportunity_key,model_key")
+            .in_("opportunity_key", opportunity_keys)
+            .execute()
+        )
+    except Exception as exc:
+        if is_missing_scan_opportunity_model_evaluations_error(exc):
+            return None
+        raise
+
+    existing_by_key = {
+        (str(row.get("opportunity_key") or ""), str(row.get("model_key") or "").strip().lower()): row
+        for row in (existing.data or [])
+        if row.get("opportunity_key") and row.get("model_key")
+    }
+    inserts: list[dict[str, Any]] = []
+    for payload in payloads:
+        existing_row = existing_by_key.get((payload["opportunity_key"], payload["model_key"]))
+        if existing_row is None:
+            inserts.append(payload)
+            continue
+
+        update_payload = {
+            "capture_role": payload["capture_role"],
+            "surface": payload["surface"],
+            "sport": payload["sport"],
+            "event": payload["event"],
+            "team": payload["team"],
+            "sportsbook": payload["sportsbook"],
+            "sportsbook_key": payload["sportsbook_key"],
+            "market": payload["market"],
+            "event_id": payload["event_id"],
+            "player_name": payload["player_name"],
+            "selection_side": payload["selection_side"],
+            "line_value": payload["line_value"],
+            "reference_source": payload["reference_source"],
+            "last_source": source,
+            "last_seen_at": captured_at,
+            "last_true_prob": payload["last_true_prob"],
+            "last_raw_true_prob": payload["last_raw_true_prob"],
+            "last_book_odds": payload["last_book_odds"],
+            "last_book_decimal": payload["last_book_decimal"],
+            "last_reference_odds": payload["last_reference_odds"],
+            "last_ev_percentage": payload["last_ev_percentage"],
+            "last_confidence_score": payload["last_confidence_score"],
+            "last_confidence_label": payload["last_confidence_label"],
+            "last_reference_bookmaker_count": payload["last_reference_bookmaker_count"],
+            "last_interpolation_mode": payload["last_interpolation_mode"],
+            "last_reference_inputs_json": payload["last_reference_inputs_json"],
+            "last_prob_std": payload["last_prob_std"],
+            "last_shrink_factor": payload["last_shrink_factor"],
+        }
+        db.table("scan_opportunity_model_evaluations").update(update_payload).eq("id", existing_row["id"]).execute()
 
     if inserts:
         db.table("scan_opportunity_model_evaluations").insert(inserts).execute()
+    return inserts
+
+
+def _capture_scan_opportunity_model_evaluations(
+    db,
+    *,
+    collapsed_by_key: dict[str, dict[str, Any]],
+    source: str,
+    captured_at: str,
+) -> None:
+    payloads = _model_evaluation_payloads(
+        collapsed_by_key=collapsed_by_key,
+        source=source,
+        captured_at=captured_at,
+    )
+    if not payloads:
+        return
+    # One merge statement cannot touch the same (opportunity, model) pair twice.
+    payloads = list({(payload["opportunity_key"], payload["model_key"]): payload for payload in payloads}.values())
+
+    try:
+        merged = merge_rows_via_rpc(db, function_name=MODEL_EVALUATION_MERGE_FUNCTION, rows=payloads)
+    except Exception as exc:
+        # Check the function first: its name contains the table name.
+        if is_missing_rpc_function_error(exc, MODEL_EVALUATION_MERGE_FUNCTION):
+            inserts = _capture_scan_opportunity_model_evaluations_row_by_row(
+                db,
+                payloads=payloads,
+                source=source,
+                captured_at=captured_at,
+            )
+        elif is_missing_scan_opportunity_model_evaluations_error(exc):
+            return
+        else:
+            raise
+    else:
+        # The merge function returns the (opportunity_key, model_key) pairs it inserted.
+        inserted_keys = {
+            (str(row.get("opportunity_key") or ""), str(row.get("model_key") or ""))
+            for row in merged
+        }
+        inserts = [
+            payload
+            for payload in payloads
+            if (payload["opportunity_key"], payload["model_key"]) in inserted_keys
+        ]
+
+    if inserts:
+        record_model_calibration_captures(db, inserts)
 
 
 def is_research_capture_candidate(side: dict[str, Any]) -> bool:
@@ -401,50 +486,71 @@ def is_research_capture_candidate(side: dict[str, Any]) -> bool:
     return True
 
 
-def capture_scan_opportunities(
-    db,
+def _scan_opportunity_insert_payload(
+    opportunity_key: str,
+    collapsed: dict[str, Any],
     *,
-    sides: list[dict[str, Any]],
     source: str,
     captured_at: str,
-) -> dict[str, int]:
-    eligible = [side for side in sides if is_research_capture_candidate(side)]
-    if not eligible:
-        return {"eligible_seen": 0, "inserted": 0, "updated": 0}
-
-    collapsed_by_key: dict[str, dict[str, Any]] = {}
-    for side in eligible:
-        opportunity_key = _opportunity_key_from_side(side)
-        book_odds = float(side["book_odds"])
-        ref_odds = float(_reference_odds_from_side(side) or 0)
-        ev_percentage = float(side["ev_percentage"])
-        current_quality = _price_quality(book_odds)
-        existing = collapsed_by_key.get(opportunity_key)
-        if existing is None:
-            collapsed_by_key[opportunity_key] = {
-                "side": dict(side),
-                "book_odds": book_odds,
-                "ref_odds": ref_odds,
-                "ev_percentage": ev_percentage,
-                "best_book_odds": book_odds,
-                "best_reference_odds": ref_odds,
-                "best_ev_percentage": ev_percentage,
-                "best_quality": current_quality,
-            }
-            continue
+    include_model_keys: bool,
+) -> dict[str, Any]:
+    side = collapsed["side"]
+    book_odds = float(collapsed["book_odds"])
+    ref_odds = float(collapsed["ref_odds"])
+    ev_percentage = float(collapsed["ev_percentage"])
+    surface = str(side.get("surface") or "straight_bets").strip().lower() or "straight_bets"
+    source_market_key = str(side.get("market_key") or "").strip() or None
+    payload = {
+        "opportunity_key": opportunity_key,
+        "surface": surface,
+        "sport": str(side.get("sport") or ""),
+        "event": str(side.get("event") or ""),
+        "commence_time": str(side.get("commence_time") or ""),
+        "team": str(side.get("team") or ""),
+        "sportsbook": str(side.get("sportsbook") or ""),
+        "market": "ML" if surface == "straight_bets" else str(side.get("market") or source_market_key or ""),
+        "event_id": str(side.get("event_id") or "").strip() or None,
+        "player_name": str(side.get("player_name") or "").strip() or None,
+        "source_market_key": source_market_key,
+        "selection_side": str(side.get("selection_side") or "").strip().lower() or None,
+        "line_value": _normalize_line_value(side.get("line_value")),
+        "first_source": source,
+        "last_source": source,
+        "seen_count": 1,
+        "first_seen_at": captured_at,
+        "last_seen_at": captured_at,
+        "best_seen_at": captured_at,
+        "first_book_odds": book_odds,
+        "last_book_odds": book_odds,
+        "best_book_odds": float(collapsed["best_book_odds"]),
+        "first_reference_odds": ref_odds,
+        "last_reference_odds": ref_odds,
+        "best_reference_odds": float(collapsed["best_reference_odds"]),
+        "first_ev_percentage": ev_percentage,
+        "last_ev_percentage": ev_percentage,
+        "best_ev_percentage": float(collapsed["best_ev_percentage"]),
+        "latest_reference_odds": ref_odds,
+        "latest_reference_updated_at": captured_at,
+        "reference_odds_at_close": None,
+        "close_captured_at": None,
+        "clv_ev_percent": None,
+        "beat_close": None,
+    }
+    if include_model_keys:
+        live_model_key = _default_model_key_for_side(side)
+        payload["first_model_key"] = live_model_key
+        payload["last_model_key"] = live_model_key
+    return payload
 
-        existing["side"] = dict(side)
-        existing["book_odds"] = book_odds
-        existing["ref_odds"] = ref_odds
-        existing["ev_percentage"] = ev_percentage
-        best_quality = existing.get("best_quality")
-        if current_quality is not None and (best_quality is None or current_quality > best_quality):
-            existing["best_book_odds"] = book_odds
-            existing["best_reference_odds"] = ref_odds
-            existing["best_ev_percentage"] = ev_percentage
-            existing["best_quality"] = current_quality
 
-    normalized_source = _normalize_source(source)
+def _capture_scan_opportunities_row_by_row(
+    db,
+    *,
+    collapsed_by_key: dict[str, dict[str, Any]],
+    source: str,
+    captured_at: str,
+) -> tuple[int, int]:
+    """Legacy select-then-write path used until the merge function is deployed."""
     opportunity_keys = list(collapsed_by_key.keys())
     existing_fields = (
         "id,opportunity_key,seen_count,best_book_odds,event,commence_time,team,sportsbook,event_id,"
@@ -479,6 +585,19 @@ def capture_scan_opportunities(
     updated = 0
 
     for opportunity_key, collapsed in collapsed_by_key.items():
+        row = existing_by_key.get(opportunity_key)
+        if row is None:
+            insert_payloads.append(
+                _scan_opportunity_insert_payload(
+                    opportunity_key,
+                    collapsed,
+                    source=source,
+                    captured_at=captured_at,
+                    include_model_keys=supports_model_key_columns,
+                )
+            )
+            continue
+
         side = collapsed["side"]
         book_odds = float(collapsed["book_odds"])
         ref_odds = float(collapsed["ref_odds"])
@@ -490,50 +609,6 @@ def capture_scan_opportunities(
         selection_side = str(side.get("selection_side") or "").strip().lower() or None
         line_value = _normalize_line_value(side.get("line_value"))
         live_model_key = _default_model_key_for_side(side)
-        row = existing_by_key.get(opportunity_key)
-
-        if row is None:
-            payload = {
-                "opportunity_key": opportunity_key,
-                "surface": surface,
-                "sport": str(side.get("sport") or ""),
-                "event": str(side.get("event") or ""),
-                "commence_time": str(side.get("commence_time") or ""),
-                "team": str(side.get("team") or ""),
-                "sportsbook": str(side.get("sportsbook") or ""),
-                "market": "ML" if surface == "straight_bets" else str(side.get("market") or source_market_key or ""),
-                "event_id": event_id,
-                "player_name": player_name,
-                "source_market_key": source_market_key,
-                "selection_side": selection_side,
-                "line_value": line_value,
-                "first_source": normalized_source,
-                "last_source": normalized_source,
-                "seen_count": 1,
-                "first_seen_at": captured_at,
-                "last_seen_at": captured_at,
-                "best_seen_at": captured_at,
-                "first_book_odds": book_odds,
-                "last_book_odds": book_odds,
-                "best_book_odds": float(collapsed["best_book_odds"]),
-                "first_reference_odds": ref_odds,
-                "last_reference_odds": ref_odds,
-                "best_reference_odds": float(collapsed["best_reference_odds"]),
-                "first_ev_percentage": ev_percentage,
-                "last_ev_percentage": ev_percentage,
-                "best_ev_percentage": float(collapsed["best_ev_percentage"]),
-                "latest_reference_odds": ref_odds,
-                "latest_reference_updated_at": captured_at,
-                "reference_odds_at_close": None,
-                "close_captured_at": None,
-                "clv_ev_percent": None,
-                "beat_close": None,
-            }
-            if supports_model_key_columns:
-                payload["first_model_key"] = live_model_key
-                payload["last_model_key"] = live_model_key
-            insert_payloads.append(payload)
-            continue
 
         best_book_odds = _coerce_float(row.get("best_book_odds"))
         batch_best_quality = collapsed.get("best_quality")
@@ -550,7 +625,7 @@ def capture_scan_opportunities(
             "source_market_key": source_market_key or row.get("source_market_key"),
             "selection_side": selection_side or row.get("selection_side"),
             "line_value": line_value if line_value is not None else row.get("line_value"),
-            "last_source": normalized_source,
+            "last_source": source,
             "seen_count": int(row.get("seen_count") or 0) + 1,
             "last_seen_at": captured_at,
             "last_book_odds": book_odds,
@@ -577,6 +652,77 @@ def capture_scan_opportunities(
 
     if insert_payloads:
         db.table("scan_opportunities").insert(insert_payloads).execute()
+    return len(insert_payloads), updated
+
+
+def capture_scan_opportunities(
+    db,
+    *,
+    sides: list[dict[str, Any]],
+    source: str,
+    captured_at: str,
+) -> dict[str, int]:
+    eligible = [side for side in sides if is_research_capture_candidate(side)]
+    if not eligible:
+        return {"eligible_seen": 0, "inserted": 0, "updated": 0}
+
+    collapsed_by_key: dict[str, dict[str, Any]] = {}
+    for side in eligible:
+        opportunity_key = _opportunity_key_from_side(side)
+        book_odds = float(side["book_odds"])
+        ref_odds = float(_reference_odds_from_side(side) or 0)
+        ev_percentage = float(side["ev_percentage"])
+        current_quality = _price_quality(book_odds)
+        existing = collapsed_by_key.get(opportunity_key)
+        if existing is None:
+            collapsed_by_key[opportunity_key] = {
+                "side": dict(side),
+                "book_odds": book_odds,
+                "ref_odds": ref_odds,
+                "ev_percentage": ev_percentage,
+                "best_book_odds": book_odds,
+                "best_reference_odds": ref_odds,
+                "best_ev_percentage": ev_percentage,
+                "best_quality": current_quality,
+            }
+            continue
+
+        existing["side"] = dict(side)
+        existing["book_odds"] = book_odds
+        existing["ref_odds"] = ref_odds
+        existing["ev_percentage"] = ev_percentage
+        best_quality = existing.get("best_quality")
+        if current_quality is not None and (best_quality is None or current_quality > best_quality):
+            existing["best_book_odds"] = book_odds
+            existing["best_reference_odds"] = ref_odds
+            existing["best_ev_percentage"] = ev_percentage
+            existing["best_quality"] = current_quality
+
+    normalized_source = _normalize_source(source)
+    merge_rows = [
+        _scan_opportunity_insert_payload(
+            opportunity_key,
+            collapsed,
+            source=normalized_source,
+            captured_at=captured_at,
+            include_model_keys=True,
+        )
+        for opportunity_key, collapsed in collapsed_by_key.items()
+    ]
+    try:
+        merged = merge_rows_via_rpc(db, function_name=SCAN_OPPORTUNITY_MERGE_FUNCTION, rows=merge_rows)
+    except Exception as exc:
+        if not is_missing_rpc_function_error(exc, SCAN_OPPORTUNITY_MERGE_FUNCTION):
+            raise
+        inserted, updated = _capture_scan_opportunities_row_by_row(
+            db,
+            collapsed_by_key=collapsed_by_key,
+            source=normalized_source,
+            captured_at=captured_at,
+        )
+    else:
+        inserted = sum(int(row.get("inserted_count") or 0) for row in merged)
+        updated = sum(int(row.get("updated_count") or 0) for row in merged)
 
     _capture_scan_opportunity_model_evaluations(
         db,
@@ -587,7 +733,7 @@ def capture_scan_opportunities(
 
     return {
         "eligible_seen": len(eligible),
-        "inserted": len(insert_payloads),
+        "inserted": inserted,
         "updated": updated,
     }
 
@@ -888,6 +1034,271 @@ def _aggregate_event_day_breakdown(rows: list[dict[str, Any]]) -> list[ResearchO
     return [grouped_by_key.get(key, _empty_breakdown_item(key)) for key in EVENT_DAY_BUCKET_ORDER]
 
 
+def _derive_model_version(source: str | None) -> str:
+    s = (source or "").strip().lower()
+    # Daily board drops are the "current" pipeline.
+    if s in {"scheduled_board_drop", "ops_trigger_board_drop", "cron_board_drop", "scheduled_board_drop_early_look"}:
+        return "current"
+    if s.startswith("scheduled_board_drop"):
+        return "current"
+
+    # Legacy EV scanner captures.
+    if s in {"manual_scan", "scheduled_scan", "ops_trigger_scan"}:
+        return "legacy"
+
+    return "legacy"
+
+def _derive_capture_class(source: str | None) -> str:
+    s = (source or "").strip().lower()
+    # Manual scans are treated as operator-led QA/experiments.
+    if s == "manual_scan":
+        return "experiment"
+    return "live"
+
+def _derive_live_model_key(row: dict[str, Any]) -> str:
+    explicit = (
+        str(row.get("first_model_key") or "").strip().lower()
+        or str(row.get("last_model_key") or "").strip().lower()
+    )
+    if explicit:
+        return explicit
+    surface = str(row.get("surface") or "straight_bets").strip().lower()
+    if surface == "player_props":
+        return "props_v1_live"
+    return "straight_h2h_live"
+
+def _map_product_source_label(source: str | None) -> str:
+    s = (source or "").strip().lower()
+    if s in {"scheduled_scan"} or s.startswith("scheduled_board_drop"):
+        return "Daily Drop (Scheduled)"
+    if s in {"ops_trigger_scan", "ops_trigger_board_drop"}:
+        return "Daily Drop (Ops Trigger)"
+    if s in {"manual_scan"}:
+        return "Daily Drop (Manual QA)"
+    if s in {"cron_board_drop"}:
+        return "Daily Drop (Cron)"
+    return UNKNOWN_SOURCE_LABEL
+
+def _classify_close_status(row: dict[str, Any]) -> str:
+    reference_at_close = _coerce_float(row.get("reference_odds_at_close"))
+    if reference_at_close is None:
+        return "pending"
+
+    commence_time = row.get("commence_time")
+    captured_at = row.get("close_captured_at")
+    if not commence_time or not captured_at:
+        return "invalid"
+
+    if not has_valid_close_snapshot(commence_time, captured_at):
+        return "invalid"
+
+    clv_ev_percent = _coerce_float(row.get("clv_ev_percent"))
+    beat_close = row.get("beat_close")
+    # A valid close should always have a CLV result; if it doesn't, we treat it as invalid for reporting.
+    if clv_ev_percent is None or beat_close is None:
+        return "invalid"
+
+    return "valid"
+
+
+def _annotate_summary_row(row: dict[str, Any]) -> dict[str, Any]:
+    # Derive close semantics once so all summary/breakdown calculations are consistent.
+    row["_close_status"] = _classify_close_status(row)
+    raw_source = row.get("first_source") or row.get("last_source") or "unknown"
+    row["_model_version"] = _derive_model_version(raw_source)
+    row["_capture_class"] = _derive_capture_class(raw_source)
+    row["_live_model_key"] = _derive_live_model_key(row)
+    row["_product_source_label"] = _map_product_source_label(raw_source)
+
+    # Cohorts are derived from the entry timestamp (first_seen_at) date in UTC.
+    first_seen_dt = _coerce_datetime(row.get("first_seen_at"))
+    if first_seen_dt is None:
+        row["_cohort_key"] = "unknown"
+        row["_cohort_date"] = None
+    else:
+        row["_cohort_date"] = first_seen_dt.date()
+        row["_cohort_key"] = first_seen_dt.date().isoformat()
+    return row
+
+
+def _summary_row_matches(
+    row: dict[str, Any],
+    *,
+    model_version: str | None,
+    capture_class: str | None,
+    scope: str,
+) -> bool:
+    if model_version is not None:
+        if model_version in {"current", "legacy"}:
+            if row.get("_model_version") != model_version:
+                return False
+        elif row.get("_live_model_key") != model_version:
+            return False
+
+    if capture_class is not None and row.get("_capture_class") != capture_class:
+        return False
+
+    # Mirror the default Opportunities board guardrail (displayed lines only).
+    if scope == "board_default" and (_coerce_float(row.get("first_ev_percentage")) or 0.0) <= 1.0:
+        return False
+    return True
+
+
+def _apply_summary_pushdown_filters(
+    query,
+    *,
+    model_version: str | None,
+    capture_class: str | None,
+    scope: str,
+    has_model_key_columns: bool,
+):
+    """Narrow the scan_opportunities query server-side.
+
+    Every pushed-down filter selects a superset of what `_summary_row_matches`
+    accepts (capture writes lowercase sources and model keys), so the Python pass
+    stays authoritative and exotic legacy values are never dropped incorrectly.
+    """
+    if scope == "board_default":
+        query = query.gt("first_ev_percentage", 1.0)
+
+    if capture_class == "experiment":
+        query = query.eq("first_source", "manual_scan")
+    elif capture_class == "live":
+        query = query.neq("first_source", "manual_scan")
+
+    current_sources = ",".join(CURRENT_MODEL_SOURCES)
+    if model_version == "current":
+        query = query.or_(
+            f"first_source.like.{CURRENT_MODEL_SOURCE_PREFIX}*,first_source.in.({current_sources})"
+        )
+    elif model_version == "legacy":
+        query = query.not_.like("first_source", f"{CURRENT_MODEL_SOURCE_PREFIX}*").not_.in_(
+            "first_source",
+            list(CURRENT_MODEL_SOURCES),
+        )
+    elif model_version is not None and has_model_key_columns and _PUSHDOWN_TOKEN_RE.match(model_version):
+        # Rows without explicit model keys fall back to a surface default in Python.
+        query = query.or_(
+            f"first_model_key.eq.{model_version},last_model_key.eq.{model_version},first_model_key.is.null"
+        )
+    return query
+
+
+def _fetch_research_summary_rows(
+    db,
+    *,
+    model_version: str | None,
+    capture_class: str | None,
+    scope: str,
+    trailing_n: int | None,
+    now: datetime | None = None,
+) -> list[dict[str, Any]]:
+    """Load annotated, filtered summary rows.
+
+    With a cohort mode selected (`trailing_n` set) only the newest `trailing_n`
+    cohort dates can contribute, so rows are read in first_seen_at windows that
+    widen until enough dates are found or no older rows remain.
+    """
+
+    def _load(columns: str, has_model_key_columns: bool) -> list[dict[str, Any]]:
+        def _page(since: datetime | None, before: datetime | None) -> list[dict[str, Any]]:
+            def _query_factory(offset: int, page_size: int):
+                query = _apply_summary_pushdown_filters(
+                    db.table("scan_opportunities").select(columns),
+                    model_version=model_version,
+                    capture_class=capture_class,
+                    scope=scope,
+                    has_model_key_columns=has_model_key_columns,
+                )
+                if since is not None:
+                    query = query.gte("first_seen_at", since.isoformat())
+                if before is not None:
+                    query = query.lt("first_seen_at", before.isoformat())
+                return query.order("opportunity_key", desc=False).range(offset, offset + page_size - 1)
+
+            return [
+                row
+                for row in (_annotate_summary_row(raw) for raw in fetch_all_rows(query_factory=_query_factory))
+                if _summary_row_matches(row, model_version=model_version, capture_class=capture_class, scope=scope)
+            ]
+
+        if trailing_n is None:
+            return _page(None, None)
+
+        current = now or _utc_now()
+        today = datetime(current.year, current.month, current.day, tzinfo=timezone.utc)
+        window_days = max(1, trailing_n)
+        window_start = today - timedelta(days=window_days - 1)
+        rows = _page(window_start, None)
+        while len({row["_cohort_date"] for row in rows if row.get("_cohort_date") is not None}) < trailing_n:
+            older = (
+                _apply_summary_pushdown_filters(
+                    db.table("scan_opportunities").select("first_seen_at"),
+                    model_version=model_version,
+                    capture_class=capture_class,
+                    scope=scope,
+                    has_model_key_columns=has_model_key_columns,
+                )
+                .lt("first_seen_at", window_start.isoformat())
+                .order("first_seen_at", desc=True)
+                .limit(1)
+                .execute()
+            )
+            older_seen_at = _coerce_datetime(((older.data or [{}])[0]).get("first_seen_at"))
+            if older_seen_at is None:
+                break
+            window_days *= 2
+            older_day = datetime(older_seen_at.year, older_seen_at.month, older_seen_at.day, tzinfo=timezone.utc)
+            next_start = min(today - timedelta(days=window_days - 1), older_day)
+            rows.extend(_page(next_start, window_start))
+            window_start = next_start
+        if not any(row.get("_cohort_date") is not None for row in rows):
+            # No dated rows at all: the summary falls back to every row, so load them.
+            return _page(None, None)
+        return rows
+
+    try:
+        return _load(f"{SUMMARY_FIELDS},first_model_key,last_model_key", True)
+    except Exception as exc:
+        if is_missing_scan_opportunities_column_error(exc, "first_model_key", "last_model_key"):
+            return _load(SUMMARY_FIELDS, False)
+        raise
+
+
+def _research_summary_cache_key(
+    *,
+    model_version: str | None,
+    capture_class: str | None,
+    cohort_mode: str | None,
+    trailing_n: int,
+    scope: str,
+) -> str:
+    generation_payload = get_json(RESEARCH_SUMMARY_CACHE_GENERATION_KEY)
+    generation = "0"
+    if isinstance(generation_payload, dict):
+        generation = str(generation_payload.get("generation") or "0")
+    cohort = "all" if cohort_mode is None else ("latest" if cohort_mode == "latest" else f"trailing_{trailing_n}")
+    return ":".join(
+        [
+            RESEARCH_SUMMARY_CACHE_PREFIX,
+            generation,
+            model_version or "all",
+            capture_class or "all",
+            cohort,
+            scope,
+        ]
+    )
+
+
+def invalidate_research_opportunities_summary_cache() -> None:
+    """Drop every cached summary breakdown (called after research closes are captured)."""
+    set_json(
+        RESEARCH_SUMMARY_CACHE_GENERATION_KEY,
+        {"generation": uuid.uuid4().hex},
+        RESEARCH_SUMMARY_CACHE_GENERATION_TTL_SECONDS,
+    )
+
+
 def get_research_opportunities_summary(
     db,
     *,
@@ -933,140 +1344,36 @@ def get_research_opportunities_summary(
     else:
         normalized_scope = "all"
 
-    def _derive_model_version(source: str | None) -> str:
-        s = (source or "").strip().lower()
-        # Daily board drops are the "current" pipeline.
-        if s in {"scheduled_board_drop", "ops_trigger_board_drop", "cron_board_drop", "scheduled_board_drop_early_look"}:
-            return "current"
-        if s.startswith("scheduled_board_drop"):
-            return "current"
-
-        # Legacy EV scanner captures.
-        if s in {"manual_scan", "scheduled_scan", "ops_trigger_scan"}:
-            return "legacy"
-
-        return "legacy"
-
-    def _derive_capture_class(source: str | None) -> str:
-        s = (source or "").strip().lower()
-        # Manual scans are treated as operator-led QA/experiments.
-        if s == "manual_scan":
-            return "experiment"
-        return "live"
-
-    def _derive_live_model_key(row: dict[str, Any]) -> str:
-        explicit = (
-            str(row.get("first_model_key") or "").strip().lower()
-            or str(row.get("last_model_key") or "").strip().lower()
-        )
-        if explicit:
-            return explicit
-        surface = str(row.get("surface") or "straight_bets").strip().lower()
-        if surface == "player_props":
-            return "props_v1_live"
-        return "straight_h2h_live"
-
-    def _map_product_source_label(source: str | None) -> str:
-        s = (source or "").strip().lower()
-        if s in {"scheduled_scan"} or s.startswith("scheduled_board_drop"):
-            return "Daily Drop (Scheduled)"
-        if s in {"ops_trigger_scan", "ops_trigger_board_drop"}:
-            return "Daily Drop (Ops Trigger)"
-        if s in {"manual_scan"}:
-            return "Daily Drop (Manual QA)"
-        if s in {"cron_board_drop"}:
-            return "Daily Drop (Cron)"
-        return UNKNOWN_SOURCE_LABEL
-
-    def _classify_close_status(row: dict[str, Any]) -> str:
-        reference_at_close = _coerce_float(row.get("reference_odds_at_close"))
-        if reference_at_close is None:
-            return "pending"
-
-        commence_time = row.get("commence_time")
-        captured_at = row.get("close_captured_at")
-        if not commence_time or not captured_at:
-            return "invalid"
-
-        if not has_valid_close_snapshot(commence_time, captured_at):
-            return "invalid"
-
-        clv_ev_percent = _coerce_float(row.get("clv_ev_percent"))
-        beat_close = row.get("beat_close")
-        # A valid close should always have a CLV result; if it doesn't, we treat it as invalid for reporting.
-        if clv_ev_percent is None or beat_close is None:
-            return "invalid"
-
-        return "valid"
+    cache_key = _research_summary_cache_key(
+        model_version=normalized_model_version,
+        capture_class=normalized_capture_class,
+        cohort_mode=selected_cohort_mode,
+        trailing_n=trailing_n,
+        scope=normalized_scope,
+    )
+    cached = get_json(cache_key)
+    if isinstance(cached, dict):
+        try:
+            return ResearchOpportunitySummaryResponse.model_validate(cached)
+        except Exception:
+            pass
 
     try:
-        summary_fields = (
-            "opportunity_key,surface,first_seen_at,last_seen_at,commence_time,sport,event,team,sportsbook,market,event_id,"
-            "player_name,source_market_key,selection_side,line_value,"
-            "first_source,last_source,seen_count,first_ev_percentage,first_book_odds,best_book_odds,"
-            "latest_reference_odds,reference_odds_at_close,close_captured_at,clv_ev_percent,beat_close"
+        rows = _fetch_research_summary_rows(
+            db,
+            model_version=normalized_model_version,
+            capture_class=normalized_capture_class,
+            scope=normalized_scope,
+            trailing_n=trailing_n if selected_cohort_mode is not None else None,
         )
-        try:
-            rows = fetch_all_rows(
-                query_factory=lambda offset, page_size: (
-                    db.table("scan_opportunities")
-                    .select(f"{summary_fields},first_model_key,last_model_key")
-                    .order("opportunity_key", desc=False)
-                    .range(offset, offset + page_size - 1)
-                )
-            )
-        except Exception as exc:
-            if is_missing_scan_opportunities_column_error(exc, "first_model_key", "last_model_key"):
-                rows = fetch_all_rows(
-                    query_factory=lambda offset, page_size: (
-                        db.table("scan_opportunities")
-                        .select(summary_fields)
-                        .order("opportunity_key", desc=False)
-                        .range(offset, offset + page_size - 1)
-                    )
-                )
-            else:
-                raise
     except Exception as e:
         if is_missing_scan_opportunities_error(e):
             return empty_research_opportunities_summary()
         raise
 
-    # Derive close semantics once so all summary/breakdown calculations are consistent.
-    for row in rows:
-        row["_close_status"] = _classify_close_status(row)
-        raw_source = row.get("first_source") or row.get("last_source") or "unknown"
-        row["_model_version"] = _derive_model_version(raw_source)
-        row["_capture_class"] = _derive_capture_class(raw_source)
-        row["_live_model_key"] = _derive_live_model_key(row)
-        row["_product_source_label"] = _map_product_source_label(raw_source)
-
-    if normalized_model_version is not None:
-        if normalized_model_version in {"current", "legacy"}:
-            rows = [row for row in rows if row.get("_model_version") == normalized_model_version]
-        else:
-            rows = [row for row in rows if row.get("_live_model_key") == normalized_model_version]
-
-    if normalized_capture_class is not None:
-        rows = [row for row in rows if row.get("_capture_class") == normalized_capture_class]
-
-    # Mirror the default Opportunities board guardrail (displayed lines only).
-    if normalized_scope == "board_default":
-        rows = [row for row in rows if (_coerce_float(row.get("first_ev_percentage")) or 0.0) > 1.0]
-
     cohort_trend: list[ResearchOpportunityCohortTrendRow] = []
     selected_cohort_key: str | None = None
 
-    # Cohorts are derived from the entry timestamp (first_seen_at) date in UTC.
-    for row in rows:
-        first_seen_dt = _coerce_datetime(row.get("first_seen_at"))
-        if first_seen_dt is None:
-            row["_cohort_key"] = "unknown"
-            row["_cohort_date"] = None
-        else:
-            row["_cohort_date"] = first_seen_dt.date()
-            row["_cohort_key"] = first_seen_dt.date().isoformat()
-
     known_dates = sorted({row.get("_cohort_date") for row in rows if row.get("_cohort_date") is not None})
     cohort_keys_sorted = [d.isoformat() for d in known_dates]
 
@@ -1229,7 +1536,7 @@ def get_research_opportunities_summary(
     )
     suppressed_by_sample_size = aggregate_status == "sample_too_small"
 
-    return ResearchOpportunitySummaryResponse(
+    summary = ResearchOpportunitySummaryResponse(
         captured_count=captured_count,
         open_count=pending_close_count,
         close_captured_count=close_captured_count,
@@ -1278,3 +1585,5 @@ def get_research_opportunities_summary(
         status_buckets=status_buckets,
         recent_opportunities=recent,
     )
+    set_json(cache_key, summary.model_dump(mode="json"), RESEARCH_SUMMARY_CACHE_TTL_SECONDS)
+    return summary
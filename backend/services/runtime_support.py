@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import os
+import threading
 import time
 from datetime import UTC, datetime
 from typing import Any, Callable
@@ -19,8 +22,6 @@ BOOT_ID = uuid4().hex[:12]
 
 def app_role() -> str:
     """Return normalized runtime role used by entrypoint orchestration."""
-    import os
-
     role = (os.getenv("APP_ROLE") or "api").strip().lower()
     return "scheduler" if role == "scheduler" else "api"
 
@@ -43,65 +44,335 @@ def log_event(event: str, level: str = "info", **fields: Any) -> None:
     getattr(logger, level.lower(), logger.info)(message)
 
 
+SUPABASE_RETRYABLE_ERRORS = (
+    httpx.RemoteProtocolError,
+    httpx.ReadError,
+    httpx.ConnectError,
+    httpx.PoolTimeout,
+    httpx.TimeoutException,
+)
+SUPABASE_BREAKER_MAX_LABELS = 200
+# Shared breaker for labels beyond SUPABASE_BREAKER_MAX_LABELS.
+SUPABASE_BREAKER_OVERFLOW_LABEL = "supabase.overflow"
+
+
+class SupabaseCircuitOpenError(RuntimeError):
+    """Raised without touching the network while a label's circuit breaker is open."""
+
+    def __init__(self, label: str, retry_after_seconds: float):
+        super().__init__(f"Supabase circuit open for {label}; retry in {retry_after_seconds:.1f}s")
+        self.label = label
+        self.retry_after_seconds = retry_after_seconds
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.getenv(name, str(default))))
+    except ValueError:
+        return default
+
+
+class _SupabaseCircuit:
+    """Consecutive-transient-failure breaker plus retry counters for one request label."""
+
+    def __init__(self) -> None:
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at: float | None = None
+        # While half-open, only the call holding the probe reaches Supabase.
+        self.probe_in_flight = False
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+        self.short_circuits = 0
+        self.opens = 0
+        self.last_error: str | None = None
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "calls": self.calls,
+            "retries": self.retries,
+            "failures": self.failures,
+            "short_circuits": self.short_circuits,
+            "opens": self.opens,
+            "last_error": self.last_error,
+        }
+
+
+_CIRCUITS: dict[str, _SupabaseCircuit] = {}
+_CIRCUITS_LOCK = threading.Lock()
+
+
+def _circuit_for(label: str) -> _SupabaseCircuit:
+    circuit = _CIRCUITS.get(label)
+    if circuit is None:
+        if len(_CIRCUITS) >= SUPABASE_BREAKER_MAX_LABELS:
+            label = SUPABASE_BREAKER_OVERFLOW_LABEL
+        circuit = _CIRCUITS.setdefault(label, _SupabaseCircuit())
+    return circuit
+
+
+def _admit_supabase_call(label: str) -> None:
+    """Count the call, or raise SupabaseCircuitOpenError while the breaker is cooling down or probing."""
+    cooldown_seconds = _env_float("SUPABASE_BREAKER_COOLDOWN_SECONDS", 15.0)
+    with _CIRCUITS_LOCK:
+        circuit = _circuit_for(label)
+        if circuit.state == "open":
+            elapsed = time.monotonic() - (circuit.opened_at or 0.0)
+            if elapsed < cooldown_seconds:
+                circuit.short_circuits += 1
+                raise SupabaseCircuitOpenError(label, cooldown_seconds - elapsed)
+            circuit.state = "half_open"
+        if circuit.state == "half_open":
+            if circuit.probe_in_flight:
+                circuit.short_circuits += 1
+                raise SupabaseCircuitOpenError(label, 0.0)
+            circuit.probe_in_flight = True
+        circuit.calls += 1
+
+
+def _record_supabase_success(label: str) -> None:
+    with _CIRCUITS_LOCK:
+        circuit = _circuit_for(label)
+        circuit.consecutive_failures = 0
+        circuit.state = "closed"
+        circuit.probe_in_flight = False
+
+
+def _release_supabase_probe(label: str) -> None:
+    """The call ended without a transport verdict; leave the failure count alone and free the probe."""
+    with _CIRCUITS_LOCK:
+        _circuit_for(label).probe_in_flight = False
+
+
+def _record_supabase_transient_failure(label: str, exc: Exception) -> bool:
+    """Record a transient failure; True when this failure opened (or re-opened) the breaker."""
+    threshold = max(1, int(_env_float("SUPABASE_BREAKER_FAILURE_THRESHOLD", 5)))
+    with _CIRCUITS_LOCK:
+        circuit = _circuit_for(label)
+        circuit.consecutive_failures += 1
+        circuit.last_error = f"{type(exc).__name__}: {exc}"[:200]
+        circuit.probe_in_flight = False
+        if circuit.state == "half_open" or circuit.consecutive_failures >= threshold:
+            opened = circuit.state != "open"
+            circuit.state = "open"
+            circuit.opened_at = time.monotonic()
+            if opened:
+                circuit.opens += 1
+            return True
+        return False
+
+
+def _record_supabase_retry(label: str) -> None:
+    with _CIRCUITS_LOCK:
+        _circuit_for(label).retries += 1
+
+
+def _record_supabase_failure(label: str) -> None:
+    with _CIRCUITS_LOCK:
+        _circuit_for(label).failures += 1
+
+
+def get_supabase_retry_metrics() -> dict[str, Any]:
+    with _CIRCUITS_LOCK:
+        labels = {label: circuit.snapshot() for label, circuit in _CIRCUITS.items()}
+    return {
+        "open_labels": sorted(label for label, item in labels.items() if item["state"] == "open"),
+        "labels": labels,
+    }
+
+
+def reset_supabase_retry_state() -> None:
+    with _CIRCUITS_LOCK:
+        _CIRCUITS.clear()
+
+
+def _retry_delay_seconds(attempt: int) -> float:
+    return min(0.35, 0.1 * (2**attempt))
+
+
+def _supabase_label(f: Callable[[], Any], label: str | None) -> str:
+    """Explicit label, else the request callable's qualified name, so call sites get their own breaker."""
+    if label:
+        return label
+    qualname = getattr(f, "__qualname__", None)
+    if not isinstance(qualname, str) or not qualname:
+        return "supabase.request"
+    return qualname.replace(".<locals>", "")
+
+
+def _on_event_loop_thread() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _handle_supabase_attempt_failure(
+    exc: Exception,
+    *,
+    label: str,
+    attempt: int,
+    retries: int,
+    duration_ms: float,
+    log: Callable[..., None],
+) -> float | None:
+    """Shared failure bookkeeping; returns the backoff before the next attempt, or None to give up."""
+    opened = _record_supabase_transient_failure(label, exc)
+    if opened:
+        log(
+            "supabase.circuit.opened",
+            level="warning",
+            label=label,
+            error_class=type(exc).__name__,
+            error=str(exc),
+        )
+    if attempt == retries - 1 or opened:
+        _record_supabase_failure(label)
+        log(
+            "supabase.request.failed",
+            level="warning",
+            label=label,
+            duration_ms=duration_ms,
+            attempt=attempt + 1,
+            retries=retries,
+            error_class=type(exc).__name__,
+            error=str(exc),
+        )
+        return None
+    _record_supabase_retry(label)
+    return _retry_delay_seconds(attempt)
+
+
+def _log_supabase_retry(
+    exc: Exception,
+    *,
+    label: str,
+    attempt: int,
+    retries: int,
+    duration_ms: float,
+    delay_seconds: float,
+    log: Callable[..., None],
+) -> None:
+    log(
+        "supabase.request.retrying",
+        level="warning",
+        label=label,
+        duration_ms=duration_ms,
+        attempt=attempt + 1,
+        retries=retries,
+        retry_delay_ms=round(delay_seconds * 1000, 2),
+        error_class=type(exc).__name__,
+        error=str(exc),
+    )
+
+
 def retry_supabase(
     f: Callable[[], Any],
     retries: int = 2,
     *,
-    label: str = "supabase.request",
+    label: str | None = None,
     slow_ms: float = 250.0,
+    log: Callable[..., None] | None = None,
 ) -> Any:
-    """Retry a Supabase/PostgREST request on transient transport errors."""
-    last_err = None
-    retryable_errors = (
-        httpx.RemoteProtocolError,
-        httpx.ReadError,
-        httpx.ConnectError,
-        httpx.PoolTimeout,
-        httpx.TimeoutException,
-    )
+    """Retry a Supabase/PostgREST request on transient transport errors.
+
+    `label` names the endpoint and keys its circuit breaker; it defaults to the
+    qualified name of `f`, so each call site gets its own breaker. Fails fast
+    with `SupabaseCircuitOpenError` while that breaker is open, or half-open with
+    its single probe already in flight. Only transport errors count toward
+    opening it.
+
+    On an event-loop thread the request runs once: `f` blocks the loop, and a
+    retry would only block it again. Coroutines should await
+    `retry_supabase_async`, or run their sync caller in a worker thread.
+    """
+    log = log or log_event
+    label = _supabase_label(f, label)
+    if _on_event_loop_thread():
+        retries = 1
+    _admit_supabase_call(label)
     for attempt in range(retries):
         started_at = time.monotonic()
         try:
             result = f()
+        except SUPABASE_RETRYABLE_ERRORS as exc:
             duration_ms = round((time.monotonic() - started_at) * 1000, 2)
             record_db_roundtrip(duration_ms)
-            if attempt > 0 or duration_ms >= slow_ms:
-                log_event(
-                    "supabase.request.completed",
-                    label=label,
-                    duration_ms=duration_ms,
-                    attempt=attempt + 1,
-                    retries=retries,
-                )
-            return result
-        except retryable_errors as exc:
-            last_err = exc
+            delay_seconds = _handle_supabase_attempt_failure(
+                exc, label=label, attempt=attempt, retries=retries, duration_ms=duration_ms, log=log
+            )
+            if delay_seconds is None:
+                raise
+            _log_supabase_retry(
+                exc, label=label, attempt=attempt, retries=retries, duration_ms=duration_ms, delay_seconds=delay_seconds, log=log
+            )
+            time.sleep(delay_seconds)
+            continue
+        except BaseException:
+            # PostgREST answered (4xx/5xx payload) or the caller's code failed: not a transport outage.
+            _release_supabase_probe(label)
+            raise
+        duration_ms = round((time.monotonic() - started_at) * 1000, 2)
+        record_db_roundtrip(duration_ms)
+        _record_supabase_success(label)
+        if attempt > 0 or duration_ms >= slow_ms:
+            log(
+                "supabase.request.completed",
+                label=label,
+                duration_ms=duration_ms,
+                attempt=attempt + 1,
+                retries=retries,
+            )
+        return result
+    return None
+
+
+async def retry_supabase_async(
+    f: Callable[[], Any],
+    retries: int = 2,
+    *,
+    label: str | None = None,
+    slow_ms: float = 250.0,
+    log: Callable[..., None] | None = None,
+) -> Any:
+    """Coroutine variant of `retry_supabase`: runs each attempt in a worker thread and awaits the backoff."""
+    log = log or log_event
+    label = _supabase_label(f, label)
+    _admit_supabase_call(label)
+    for attempt in range(retries):
+        started_at = time.monotonic()
+        try:
+            result = await asyncio.to_thread(f)
+        except SUPABASE_RETRYABLE_ERRORS as exc:
             duration_ms = round((time.monotonic() - started_at) * 1000, 2)
             record_db_roundtrip(duration_ms)
-            if attempt == retries - 1:
-                log_event(
-                    "supabase.request.failed",
-                    level="warning",
-                    label=label,
-                    duration_ms=duration_ms,
-                    attempt=attempt + 1,
-                    retries=retries,
-                    error_class=type(exc).__name__,
-                    error=str(exc),
-                )
+            delay_seconds = _handle_supabase_attempt_failure(
+                exc, label=label, attempt=attempt, retries=retries, duration_ms=duration_ms, log=log
+            )
+            if delay_seconds is None:
                 raise
-            delay_seconds = min(0.35, 0.1 * (2**attempt))
-            log_event(
-                "supabase.request.retrying",
-                level="warning",
+            _log_supabase_retry(
+                exc, label=label, attempt=attempt, retries=retries, duration_ms=duration_ms, delay_seconds=delay_seconds, log=log
+            )
+            await asyncio.sleep(delay_seconds)
+            continue
+        except BaseException:
+            _release_supabase_probe(label)
+            raise
+        duration_ms = round((time.monotonic() - started_at) * 1000, 2)
+        record_db_roundtrip(duration_ms)
+        _record_supabase_success(label)
+        if attempt > 0 or duration_ms >= slow_ms:
+            log(
+                "supabase.request.completed",
                 label=label,
                 duration_ms=duration_ms,
                 attempt=attempt + 1,
                 retries=retries,
-                retry_delay_ms=round(delay_seconds * 1000, 2),
-                error_class=type(exc).__name__,
-                error=str(exc),
             )
-            time.sleep(delay_seconds)
-    if last_err:
-        raise last_err
+        return result
+    return None
@@ -3,6 +3,8 @@ from typing import Any, Callable
 from fastapi import HTTPException
 
 from models import FullScanResponse
+from services.board_response_bodies import STRAIGHT_BETS_SURFACE_BODY, publish_board_body
+from services.scan_payload import build_trusted_scan_payload, scan_response_content
 
 
 DEFAULT_SURFACE = "straight_bets"
@@ -49,6 +51,12 @@ def persist_latest_scan_payload(
                 .execute()
             )
         )
+        if surface == DEFAULT_SURFACE and scope == "latest":
+            publish_board_body(
+                STRAIGHT_BETS_SURFACE_BODY,
+                tuple(scan_payload_version(payload)),
+                lambda: full_scan_response_body(payload),
+            )
     except Exception as e:
         log_event(
             "scan_latest_cache.persist_failed",
@@ -126,21 +134,20 @@ def persist_latest_full_scan(
     retry_supabase: Callable,
     log_event: Callable[..., None],
 ) -> None:
-    normalized_sides = [
-        side if isinstance(side, dict) and side.get("surface") else {"surface": surface, **side}
-        for side in sides
-    ]
-    payload = FullScanResponse(
-        surface=surface,
-        sport=sport,
-        sides=normalized_sides,
-        events_fetched=events_fetched,
-        events_with_both_books=events_with_both_books,
-        api_requests_remaining=api_requests_remaining,
-        scanned_at=scanned_at,
-        diagnostics=diagnostics,
-        prizepicks_cards=prizepicks_cards,
-    ).model_dump()
+    # Sides come from our own scanners: shape them directly instead of re-validating every one.
+    payload = build_trusted_scan_payload(
+        {
+            "surface": surface,
+            "sport": sport,
+            "sides": sides,
+            "events_fetched": events_fetched,
+            "events_with_both_books": events_with_both_books,
+            "api_requests_remaining": api_requests_remaining,
+            "scanned_at": scanned_at,
+            "diagnostics": diagnostics,
+            "prizepicks_cards": prizepicks_cards,
+        }
+    )
     persist_latest_scan_payload(
         db=db,
         payload=payload,
@@ -150,6 +157,23 @@ def persist_latest_full_scan(
     )
 
 
+def scan_payload_version(payload: dict[str, Any]) -> list[Any]:
+    """Identity of a persisted scan payload for ETags; every publish stamps a new `scanned_at`."""
+    sides = payload.get("sides")
+    return [
+        payload.get("surface"),
+        payload.get("sport"),
+        payload.get("scanned_at"),
+        payload.get("events_fetched"),
+        len(sides) if isinstance(sides, list) else None,
+    ]
+
+
+def full_scan_response_body(payload: dict[str, Any]) -> dict[str, Any]:
+    """`payload` as a `FullScanResponse` route would serialize it."""
+    return scan_response_content(payload)
+
+
 def with_enriched_scan_sides(
     *,
     payload: dict[str, Any],
@@ -6,8 +6,12 @@ from datetime import datetime, timezone
 import httpx
 from fastapi import HTTPException
 
+from services.odds_api_budget import OddsApiBudgetExceeded
 from services.player_prop_candidate_observations import PLAYER_PROP_MODEL_CANDIDATE_SETS_KEY
 
+# Budget refusals ease as reservations settle and the monthly pace catches up.
+ODDS_API_BUDGET_RETRY_AFTER_SECONDS = 15 * 60
+
 
 def _merge_model_candidate_sets(
     target: dict[str, list[dict[str, Any]]],
@@ -190,6 +194,13 @@ def apply_manual_scan_bundle(
 def scan_exception_to_http_exception(error: Exception) -> HTTPException:
     if isinstance(error, HTTPException):
         return error
+    if isinstance(error, OddsApiBudgetExceeded):
+        # Our own credit budget said no; this is not an upstream Odds API failure.
+        return HTTPException(
+            status_code=503,
+            detail="Scan credits are reserved for scheduled jobs right now. Please try again later.",
+            headers={"Retry-After": str(ODDS_API_BUDGET_RETRY_AFTER_SECONDS)},
+        )
     if isinstance(error, ValueError):
         return HTTPException(status_code=500, detail=str(error))
     return HTTPException(status_code=502, detail=f"Odds API error: {error}")
@@ -0,0 +1,145 @@
+"""
+Trusted serialization for scan payloads.
+
+Scan payloads carry thousands of sides. Building `FullScanResponse` over them
+(a discriminated union per side), dumping it to persist and validating it
+again through `response_model` dominated manual scan latency, although every
+side comes from our own scanners. Those payloads are now shaped to the
+response schema by a plain field projection instead: unknown keys dropped,
+missing optional fields defaulted, no type coercion.
+
+Persisted payloads are stamped with `schema_version` so readers can tell they
+were produced this way; older rows still go through full validation.
+`SCAN_PAYLOAD_VALIDATE_SAMPLE_RATE` (0-1, default 0) re-validates a sample of
+trusted payloads and logs mismatches without failing the request.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+from typing import Any, Callable
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ValidationError
+
+from models import (
+    FullScanResponse,
+    PlayerPropDiagnosticGame,
+    PlayerPropScanDiagnostics,
+    PlayerPropSide,
+    PrizePicksComparisonCard,
+    StraightBetSide,
+)
+from services.runtime_support import log_event
+
+# Bump when scanner output stops matching the response models field-for-field.
+SCAN_PAYLOAD_SCHEMA_VERSION = 1
+
+_FieldShape = tuple[tuple[str, Any, Callable[[], Any] | None], ...]
+
+
+def _field_shape(model: type[BaseModel]) -> _FieldShape:
+    shape = []
+    for name, field in model.model_fields.items():
+        if field.is_required():
+            shape.append((name, None, None))
+        else:
+            shape.append((name, field.default, field.default_factory))
+    return tuple(shape)
+
+
+_PAYLOAD_SHAPE = _field_shape(FullScanResponse)
+_SIDE_SHAPES = {
+    "straight_bets": _field_shape(StraightBetSide),
+    "player_props": _field_shape(PlayerPropSide),
+}
+_CARD_SHAPE = _field_shape(PrizePicksComparisonCard)
+_DIAGNOSTICS_SHAPE = _field_shape(PlayerPropScanDiagnostics)
+_DIAGNOSTIC_GAME_SHAPE = _field_shape(PlayerPropDiagnosticGame)
+
+
+def _project(row: dict[str, Any], shape: _FieldShape) -> dict[str, Any]:
+    return {
+        name: row[name] if name in row else (factory() if factory is not None else default)
+        for name, default, factory in shape
+    }
+
+
+def _project_diagnostics(diagnostics: Any) -> dict[str, Any] | None:
+    if not isinstance(diagnostics, dict):
+        return None
+    out = _project(diagnostics, _DIAGNOSTICS_SHAPE)
+    games = out.get("curated_games")
+    if isinstance(games, list):
+        out["curated_games"] = [_project(game, _DIAGNOSTIC_GAME_SHAPE) for game in games if isinstance(game, dict)]
+    return out
+
+
+def shape_scan_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    """`payload` in `FullScanResponse` shape, without validating it."""
+    out = _project(payload, _PAYLOAD_SHAPE)
+    surface = out.get("surface") or "straight_bets"
+    out["surface"] = surface
+    sides = payload.get("sides")
+    shaped_sides = []
+    for side in sides if isinstance(sides, list) else []:
+        if not isinstance(side, dict):
+            continue
+        side_surface = side.get("surface") or surface
+        shape = _SIDE_SHAPES.get(side_surface, _SIDE_SHAPES["straight_bets"])
+        shaped_sides.append(_project({**side, "surface": side_surface}, shape))
+    out["sides"] = shaped_sides
+    out["diagnostics"] = _project_diagnostics(payload.get("diagnostics"))
+    cards = payload.get("prizepicks_cards")
+    if isinstance(cards, list):
+        out["prizepicks_cards"] = [_project(card, _CARD_SHAPE) for card in cards if isinstance(card, dict)]
+    return out
+
+
+def build_trusted_scan_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    """Shape scanner output for persistence and stamp it as trusted."""
+    return {**shape_scan_payload(payload), "schema_version": SCAN_PAYLOAD_SCHEMA_VERSION}
+
+
+def is_trusted_scan_payload(payload: object) -> bool:
+    return isinstance(payload, dict) and payload.get("schema_version") == SCAN_PAYLOAD_SCHEMA_VERSION
+
+
+def _validate_sample_rate() -> float:
+    try:
+        return min(1.0, max(0.0, float(os.getenv("SCAN_PAYLOAD_VALIDATE_SAMPLE_RATE", "0"))))
+    except ValueError:
+        return 0.0
+
+
+def maybe_validate_scan_payload(payload: dict[str, Any]) -> None:
+    """Validate a sample of trusted payloads against `FullScanResponse`; log, never raise."""
+    rate = _validate_sample_rate()
+    if rate <= 0 or random.random() >= rate:
+        return
+    try:
+        FullScanResponse.model_validate(payload)
+    except ValidationError as exc:
+        errors = exc.errors()
+        log_event(
+            "scan_payload.validation_failed",
+            level="warning",
+            surface=payload.get("surface"),
+            error_count=len(errors),
+            first_error_loc=".".join(str(part) for part in errors[0]["loc"]) if errors else None,
+            first_error=errors[0]["msg"] if errors else None,
+        )
+
+
+def scan_response_content(payload: dict[str, Any], *, trusted: bool = False) -> dict[str, Any]:
+    """JSON-ready `FullScanResponse` body: projected when trusted, fully validated otherwise."""
+    if trusted or is_trusted_scan_payload(payload):
+        shaped = shape_scan_payload(payload)
+        maybe_validate_scan_payload(shaped)
+        return shaped
+    return FullScanResponse.model_validate(payload).model_dump(mode="json")
+
+
+def scan_json_response(payload: dict[str, Any], *, trusted: bool = False) -> JSONResponse:
+    return JSONResponse(content=scan_response_content(payload, trusted=trusted))
@@ -2,20 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from typing import Any
 
+from fastapi.responses import JSONResponse
+
 from database import get_db
-from models import FullScanResponse, ScanResponse
+from models import ScanResponse
 from services.ops_runtime import persist_ops_job_run, set_ops_status
 from services.runtime_support import log_event, new_run_id, retry_supabase, utc_now_iso
 from services.scan_cache import persist_latest_full_scan as persist_latest_full_scan_service
+from services.scan_payload import scan_json_response
 
 
-def annotate_sides_with_duplicate_state(db, user_id: str, sides: list[dict]) -> list[dict]:
+def annotate_sides_with_duplicate_state(
+    db,
+    user_id: str,
+    sides: list[dict],
+    *,
+    pending_rows: list[dict] | None = None,
+) -> list[dict]:
     from services.scanner_duplicate_detection import annotate_sides_with_duplicate_state as _annotate
 
-    return _annotate(db, user_id, sides)
+    return _annotate(db, user_id, sides, pending_rows=pending_rows)
+
+
+def load_pending_duplicate_rows(db, user_id: str) -> list[dict]:
+    from services.scanner_duplicate_detection import load_pending_duplicate_rows as _load
+
+    return _load(db, user_id)
 
 
 def capture_research_opportunities(sides: list[dict], *, source: str) -> None:
@@ -41,6 +57,29 @@ def capture_research_opportunities(sides: list[dict], *, source: str) -> None:
         )
 
 
+async def record_line_history(sides: list[dict], *, source: str) -> None:
+    """Append this scan's book and Pinnacle prices to the line-movement history; best-effort."""
+    from services.line_history import append_line_ticks
+
+    try:
+        counts = await asyncio.to_thread(
+            append_line_ticks,
+            get_db(),
+            sides=sides,
+            captured_at=utc_now_iso(),
+            log_event=log_event,
+        )
+        log_event("line_history.appended", source=source, **counts)
+    except Exception as exc:
+        log_event(
+            "line_history.append_failed",
+            level="warning",
+            source=source,
+            error_class=type(exc).__name__,
+            error=str(exc),
+        )
+
+
 def capture_model_candidate_observations(
     candidate_sets: dict[str, list[dict]],
     *,
@@ -85,20 +124,32 @@ def sync_pickem_research_from_props_payload(payload: dict | None, *, source: str
         return
 
 
-async def piggyback_clv(sides: list[dict]) -> None:
+async def piggyback_clv(sides: list[dict], *, source: str = "fresh_scan") -> None:
     """
     Best-effort CLV snapshot refresh for pending bets and research opportunities.
+    Also appends the straight-bet prices to the line-movement history.
     Errors are swallowed so scan responses and board publishing remain stable.
     """
     from services.clv_tracking import (
+        build_reference_index,
         update_bet_reference_snapshots,
         update_scan_opportunity_reference_snapshots,
     )
 
+    straight_sides = [side for side in sides if (side.get("surface") or "straight_bets") == "straight_bets"]
+    if straight_sides:
+        await record_line_history(straight_sides, source=source)
+
     try:
         db = get_db()
-        update_bet_reference_snapshots(db, sides=sides, allow_close=True)
-        update_scan_opportunity_reference_snapshots(db, sides=sides, allow_close=True)
+        reference_index = build_reference_index(sides)
+        # The updaters issue blocking PostgREST calls; keep them off the event loop.
+        await asyncio.to_thread(
+            update_bet_reference_snapshots, db, sides=sides, allow_close=True, reference_index=reference_index
+        )
+        await asyncio.to_thread(
+            update_scan_opportunity_reference_snapshots, db, sides=sides, allow_close=True, reference_index=reference_index
+        )
     except Exception as exc:
         print(f"[CLV piggyback] Error: {exc}")
 
@@ -108,7 +159,7 @@ async def apply_fresh_straight_scan_followups(result: dict, *, source: str) -> N
     if not sides or result.get("cache_hit"):
         return
     capture_research_opportunities(sides, source=source)
-    await piggyback_clv(sides)
+    await piggyback_clv(sides, source=source)
 
 
 def get_environment() -> str:
@@ -157,8 +208,9 @@ def build_scan_response(*, sport: str, result: dict) -> ScanResponse:
     )
 
 
-def build_full_scan_response(payload: dict) -> FullScanResponse:
-    return FullScanResponse(**payload)
+def build_full_scan_response(payload: dict) -> JSONResponse:
+    # Manual scan payloads are scanner output; skip `response_model` revalidation.
+    return scan_json_response(payload, trusted=True)
 
 
 def persist_latest_full_scan(
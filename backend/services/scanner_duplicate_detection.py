@@ -1,3 +1,6 @@
+import hashlib
+import json
+
 from calculations import american_to_decimal
 from services.match_keys import (
     normalize_text,
@@ -216,24 +219,53 @@ def _best_priced_pending_row(rows: list[dict]) -> tuple[dict | None, float | Non
     return best_row, best_quality
 
 
-def annotate_sides_with_duplicate_state(db, user_id: str, sides: list[dict]) -> list[dict]:
+PENDING_DUPLICATE_FIELDS = (
+    "id,odds_american,sport,market,surface,sportsbook,commence_time,clv_team,event,"
+    "clv_sport_key,clv_event_id,source_event_id,source_market_key,source_selection_key,result"
+)
+
+
+def load_pending_duplicate_rows(db, user_id: str) -> list[dict]:
+    """The user's pending bets, i.e. everything duplicate state is derived from."""
+    pending_res = (
+        db.table("bets")
+        .select(PENDING_DUPLICATE_FIELDS)
+        .eq("user_id", user_id)
+        .eq("result", "pending")
+        .execute()
+    )
+    return [row for row in (pending_res.data or []) if isinstance(row, dict)]
+
+
+def duplicate_state_version(pending_rows: list[dict]) -> str:
+    """Stable fingerprint of the pending rows; changes whenever duplicate annotations could."""
+    ordered = sorted(pending_rows, key=lambda row: str(row.get("id") or ""))
+    encoded = json.dumps(ordered, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def annotate_sides_with_duplicate_state(
+    db,
+    user_id: str,
+    sides: list[dict],
+    *,
+    pending_rows: list[dict] | None = None,
+) -> list[dict]:
     """
     Backend-owned scanner duplicate state.
 
     Matching scope: pending (unsettled exposure) only.
     State enum: new | logged_elsewhere | already_logged | better_now
+
+    Pass `pending_rows` from `load_pending_duplicate_rows` to reuse rows already
+    loaded for an ETag check instead of querying again.
     """
     if not sides:
         return sides
 
     surfaces = sorted({str(side.get("surface") or "straight_bets") for side in sides})
-    pending_res = (
-        db.table("bets")
-        .select("id,odds_american,sport,market,surface,sportsbook,commence_time,clv_team,event,clv_sport_key,clv_event_id,source_event_id,source_market_key,source_selection_key,result")
-        .eq("user_id", user_id)
-        .eq("result", "pending")
-        .execute()
-    )
+    if pending_rows is None:
+        pending_rows = load_pending_duplicate_rows(db, user_id)
 
     matches_by_source_key: dict[tuple[str, ...], list[dict]] = {}
     cross_book_matches_by_source_key: dict[tuple[str, ...], list[dict]] = {}
@@ -243,7 +275,7 @@ def annotate_sides_with_duplicate_state(db, user_id: str, sides: list[dict]) ->
     legacy_cross_book_matches_by_key: dict[tuple[str, str, str, str], list[dict]] = {}
     prop_matches_by_selection_key: dict[tuple[str, str, str], list[dict]] = {}
     prop_cross_book_matches_by_selection_key: dict[tuple[str, str], list[dict]] = {}
-    for row in pending_res.data or []:
+    for row in pending_rows:
         if row.get("surface") == "player_props":
             selection_key = str(row.get("source_selection_key") or "").strip().lower()
             market_key = str(row.get("source_market_key") or "").strip().lower()
@@ -180,7 +180,8 @@ async def run_auto_settler_job() -> None:
                     summary_meta[key] = summary.get(key)
             if not summary_meta:
                 summary_meta = None
-        ops_runtime.persist_ops_job_run(
+        await asyncio.to_thread(
+            ops_runtime.persist_ops_job_run,
             job_kind="auto_settle",
             source="scheduler",
             status="completed",
@@ -302,7 +303,7 @@ async def run_scheduled_board_drop_job(*, alert_delivery_allowed: bool = False)
 
         if fresh_sides:
             try:
-                await piggyback_clv(fresh_sides)
+                await piggyback_clv(fresh_sides, source="scheduled_board_drop")
             except Exception as exc:
                 log_event(
                     "scheduler.board_drop.clv_piggyback_failed",
@@ -551,7 +552,8 @@ async def run_scheduled_board_drop_job(*, alert_delivery_allowed: bool = False)
     }
     ops_runtime.set_ops_status("last_scheduler_scan", scheduler_status_payload)
     ops_runtime.set_ops_status("last_board_refresh", scheduler_status_payload)
-    ops_runtime.persist_ops_job_run(
+    await asyncio.to_thread(
+        ops_runtime.persist_ops_job_run,
         job_kind="scheduled_board_drop",
         source="scheduler",
         status="completed" if hard_errors == 0 else "completed_with_errors",
@@ -133,6 +133,173 @@ def allow_fixed_window_rate_limit(bucket_key: str, max_requests: int, window_sec
         return count <= max_requests
 
 
+def increment_counter(key: str, amount: int, ttl_seconds: int) -> int:
+    """Atomically add `amount` (may be negative) to an integer counter and return the new value."""
+    client = _get_redis_client()
+    if client is not None:
+        try:
+            value = client.incrby(key, amount)
+            client.expire(key, ttl_seconds)
+            return int(value)
+        except Exception as e:
+            print(f"[SharedState] Redis INCRBY failed for {key}: {e}")
+
+    now = time.time()
+    with _LOCK:
+        existing = _MEMORY_TTL_STORE.get(key)
+        count = 0
+        if existing:
+            expires_at, value = existing
+            if expires_at > now:
+                try:
+                    count = int(value)
+                except ValueError:
+                    count = 0
+        count += amount
+        _MEMORY_TTL_STORE[key] = (now + ttl_seconds, str(count))
+        return count
+
+
+def get_counter(key: str) -> int:
+    client = _get_redis_client()
+    if client is not None:
+        try:
+            raw = client.get(key)
+            return int(raw) if raw else 0
+        except Exception as e:
+            print(f"[SharedState] Redis GET failed for {key}: {e}")
+    raw_local = _memory_get(key)
+    try:
+        return int(raw_local) if raw_local else 0
+    except ValueError:
+        return 0
+
+
+def _memory_json_locked(key: str, now: float) -> dict:
+    """In-memory JSON object stored at `key`; caller holds `_LOCK`."""
+    existing = _MEMORY_TTL_STORE.get(key)
+    if not existing or existing[0] <= now:
+        return {}
+    try:
+        value = json.loads(existing[1])
+    except ValueError:
+        return {}
+    return value if isinstance(value, dict) else {}
+
+
+def add_expiring_member(key: str, member: str, ttl_seconds: int) -> None:
+    """Add `member` to a set where each member expires on its own after `ttl_seconds` (Redis ZSET scored by expiry)."""
+    now = time.time()
+    expires_at = now + ttl_seconds
+    client = _get_redis_client()
+    if client is not None:
+        try:
+            client.zadd(key, {member: expires_at})
+            client.expire(key, ttl_seconds)
+            return
+        except Exception as e:
+            print(f"[SharedState] Redis ZADD failed for {key}: {e}")
+
+    with _LOCK:
+        members = _memory_json_locked(key, now)
+        members[member] = expires_at
+        _MEMORY_TTL_STORE[key] = (max(members.values()), json.dumps(members))
+
+
+def remove_expiring_member(key: str, member: str) -> None:
+    client = _get_redis_client()
+    if client is not None:
+        try:
+            client.zrem(key, member)
+            return
+        except Exception as e:
+            print(f"[SharedState] Redis ZREM failed for {key}: {e}")
+
+    now = time.time()
+    with _LOCK:
+        members = _memory_json_locked(key, now)
+        if members.pop(member, None) is not None:
+            _MEMORY_TTL_STORE[key] = (max(members.values(), default=now), json.dumps(members))
+
+
+def get_expiring_members(key: str) -> list[str]:
+    """Members that have not expired yet; expired ones are pruned on read."""
+    now = time.time()
+    client = _get_redis_client()
+    if client is not None:
+        try:
+            client.zremrangebyscore(key, "-inf", now)
+            return [str(member) for member in client.zrange(key, 0, -1)]
+        except Exception as e:
+            print(f"[SharedState] Redis ZRANGE failed for {key}: {e}")
+
+    with _LOCK:
+        members = _memory_json_locked(key, now)
+        live = {member: expires_at for member, expires_at in members.items() if expires_at > now}
+        if len(live) != len(members):
+            _MEMORY_TTL_STORE[key] = (max(live.values(), default=now), json.dumps(live))
+        return list(live)
+
+
+def set_json_field(key: str, field: str, value: dict | list, ttl_seconds: int) -> None:
+    """Set one field of a JSON hash without rewriting the others (Redis HSET)."""
+    client = _get_redis_client()
+    if client is not None:
+        try:
+            client.hset(key, field, json.dumps(value, default=str))
+            client.expire(key, ttl_seconds)
+            return
+        except Exception as e:
+            print(f"[SharedState] Redis HSET failed for {key}: {e}")
+
+    now = time.time()
+    with _LOCK:
+        fields = _memory_json_locked(key, now)
+        fields[field] = value
+        _MEMORY_TTL_STORE[key] = (now + ttl_seconds, json.dumps(fields, default=str))
+
+
+def get_json_fields(key: str) -> dict:
+    client = _get_redis_client()
+    if client is not None:
+        try:
+            out = {}
+            for field, raw in (client.hgetall(key) or {}).items():
+                try:
+                    out[str(field)] = json.loads(raw)
+                except ValueError:
+                    continue
+            return out
+        except Exception as e:
+            print(f"[SharedState] Redis HGETALL failed for {key}: {e}")
+
+    with _LOCK:
+        return _memory_json_locked(key, time.time())
+
+
+def publish_json(channel: str, value: dict | list) -> bool:
+    """Publish to a Redis pub/sub channel. Returns False when Redis is unavailable so callers fan out locally."""
+    client = _get_redis_client()
+    if client is None:
+        return False
+    try:
+        client.publish(channel, json.dumps(value, default=str))
+        return True
+    except Exception as e:
+        print(f"[SharedState] Redis PUBLISH failed for {channel}: {e}")
+        return False
+
+
+def open_pubsub(channel: str):
+    """Return a Redis PubSub subscribed to `channel`, or None without Redis."""
+    client = _get_redis_client()
+    if client is None:
+        return None
+    pubsub = client.pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(channel)
+    return pubsub
+
+
 def scan_cache_key(sport: str) -> str:
     return f"scan-cache:{sport}"
 
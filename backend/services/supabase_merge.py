@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import Any
+
+DEFAULT_MERGE_CHUNK_SIZE = 500
+
+
+def is_missing_rpc_function_error(error: Exception, function_name: str) -> bool:
+    """True when PostgREST cannot find `function_name` (migration not applied yet)."""
+    msg = str(error)
+    message = str(getattr(error, "message", "") or "")
+    combined = f"{msg} {message}".lower()
+    code = str(getattr(error, "code", "") or "").strip().upper()
+    if code == "PGRST202" or "pgrst202" in combined:
+        return True
+    return function_name.lower() in combined and (
+        "could not find the function" in combined or "schema cache" in combined
+    )
+
+
+def merge_rows_via_rpc(
+    db,
+    *,
+    function_name: str,
+    rows: list[dict[str, Any]],
+    chunk_size: int = DEFAULT_MERGE_CHUNK_SIZE,
+) -> list[dict[str, Any]]:
+    """Send `rows` to a set-based merge function in chunks and collect its result rows."""
+
+    results: list[dict[str, Any]] = []
+    size = max(1, chunk_size)
+    for start in range(0, len(rows), size):
+        response = db.rpc(function_name, {"p_rows": rows[start:start + size]}).execute()
+        data = response.data
+        if isinstance(data, list):
+            results.extend(item for item in data if isinstance(item, dict))
+        elif isinstance(data, dict):
+            results.append(data)
+    return results
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 _NON_ALNUM_RE = re.compile(r"[^a-z0-9\s]+")
@@ -16,6 +18,9 @@ _DIRECTION_MAP = {
     "se": "southeast",
     "sw": "southwest",
 }
+# Scans canonicalize the same few hundred team and player names for every side,
+# prop candidate and projection, so tokens are interned in bounded LRUs.
+NAME_TOKEN_CACHE_SIZE = max(1, int(os.getenv("NAME_TOKEN_CACHE_SIZE", "4096")))
 
 
 @dataclass(frozen=True)
@@ -120,7 +125,12 @@ def _normalize_direction_token(token: str) -> str:
 def normalize_team_name(value: str | None) -> str:
     if not value:
         return ""
-    lowered = str(value).strip().lower()
+    return _normalize_team_token(str(value))
+
+
+@lru_cache(maxsize=NAME_TOKEN_CACHE_SIZE)
+def _normalize_team_token(value: str) -> str:
+    lowered = value.strip().lower()
     lowered = lowered.replace("&", " and ")
     lowered = lowered.replace("'", "")
     lowered = lowered.replace(".", " ")
@@ -183,6 +193,11 @@ def resolve_team_alias(sport_key: str | None, raw_name: str | None) -> str | Non
 def canonical_team_token(sport_key: str | None, raw_name: str | None) -> str:
     if not raw_name:
         return ""
+    return _canonical_team_token(str(sport_key or ""), str(raw_name))
+
+
+@lru_cache(maxsize=NAME_TOKEN_CACHE_SIZE)
+def _canonical_team_token(sport_key: str, raw_name: str) -> str:
     resolved = resolve_team_alias(sport_key, raw_name)
     if resolved:
         return resolved
@@ -201,6 +216,13 @@ def canonical_display_name(sport_key: str | None, raw_name: str | None) -> str:
 
 
 def canonical_short_name(sport_key: str | None, raw_name: str | None) -> str:
+    if not raw_name:
+        return str(raw_name or "").strip()
+    return _canonical_short_name(str(sport_key or ""), str(raw_name))
+
+
+@lru_cache(maxsize=NAME_TOKEN_CACHE_SIZE)
+def _canonical_short_name(sport_key: str, raw_name: str) -> str:
     token = normalize_team_name(raw_name)
     if not token:
         return str(raw_name or "").strip()
@@ -217,3 +239,20 @@ def build_short_event_label(sport_key: str | None, away_team: str | None, home_t
     if not away_short or not home_short:
         return f"{str(away_team or '').strip()} @ {str(home_team or '').strip()}".strip()
     return f"{away_short} @ {home_short}"
+
+
+@lru_cache(maxsize=NAME_TOKEN_CACHE_SIZE)
+def _canonical_player_token(name: str) -> str:
+    return "".join(ch for ch in name.strip().lower() if ch.isalnum())
+
+
+def canonical_player_token(name: str | None) -> str:
+    """Lowercase alphanumeric player key, e.g. "Shai Gilgeous-Alexander" -> "shaigilgeousalexander"."""
+    if not name:
+        return ""
+    return _canonical_player_token(str(name))
+
+
+def clear_name_token_caches() -> None:
+    for cached in (_normalize_team_token, _canonical_team_token, _canonical_short_name, _canonical_player_token):
+        cached.cache_clear()
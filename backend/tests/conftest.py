@@ -20,6 +20,25 @@ async def fake_get_current_user():
     return {"id": TEST_USER_ID, "email": "test@example.com"}
 
 
+@pytest.fixture(autouse=True)
+def _clear_in_memory_shared_state():
+    """Cached boxscores, provider-event mappings, live game state, board bodies and event odds must not leak between tests."""
+    import services.shared_state as shared_state
+    from services.board_response_bodies import reset_board_bodies
+    from services.event_odds_broker import reset_event_odds_brokers
+    from services.live_game_state import reset_live_game_state
+
+    shared_state._MEMORY_TTL_STORE.clear()
+    reset_live_game_state()
+    reset_board_bodies()
+    reset_event_odds_brokers()
+    yield
+    shared_state._MEMORY_TTL_STORE.clear()
+    reset_live_game_state()
+    reset_board_bodies()
+    reset_event_odds_brokers()
+
+
 # ---------- Integration-only fixtures (lazy-load app so unit tests don't load DB) ----------
 
 
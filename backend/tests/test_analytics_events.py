@@ -1,6 +1,12 @@
 from types import SimpleNamespace
 
+from services import analytics_events
 from services.analytics_events import (
+    ENQUEUE_DUPLICATE,
+    ENQUEUE_FULL,
+    ENQUEUE_QUEUED,
+    AnalyticsEventBuffer,
+    build_analytics_event_payload,
     capture_analytics_event,
     capture_backend_event,
     classify_analytics_row,
@@ -143,3 +149,158 @@ def test_normalize_analytics_audience_defaults_to_external() -> None:
     assert normalize_analytics_audience("external") == "external"
     assert normalize_analytics_audience("all") == "all"
     assert normalize_analytics_audience("unexpected") == "external"
+
+
+class _BulkInsertQuery:
+    def __init__(self, db, payload):
+        self._db = db
+        self._payload = payload
+
+    def execute(self):
+        rows = self._payload if isinstance(self._payload, list) else [self._payload]
+        self._db.insert_calls += 1
+        if any(row.get("dedupe_key") in self._db.persisted_keys for row in rows):
+            raise RuntimeError("duplicate key value violates unique constraint idx_analytics_events_dedupe_key")
+        self._db.inserted.extend(rows)
+        return SimpleNamespace(data=rows)
+
+
+class _BulkDB:
+    def __init__(self, persisted_keys: set[str] | None = None):
+        self.persisted_keys = persisted_keys or set()
+        self.inserted: list[dict] = []
+        self.insert_calls = 0
+
+    def table(self, name: str):
+        assert name == "analytics_events"
+        return SimpleNamespace(insert=lambda payload: _BulkInsertQuery(self, payload))
+
+
+def _payload(dedupe_key: str | None) -> dict:
+    return build_analytics_event_payload(
+        event_name="board_viewed",
+        source="frontend",
+        user_id=None,
+        session_id="session-1",
+        route="/",
+        app_area="markets",
+        properties={"surface": "scan"},
+        dedupe_key=dedupe_key,
+    )
+
+
+def test_analytics_event_buffer_dedupes_pending_and_recently_flushed_keys() -> None:
+    buffer = AnalyticsEventBuffer()
+    db = _BulkDB()
+
+    assert buffer.enqueue(_payload("board:1")) == ENQUEUE_QUEUED
+    assert buffer.enqueue(_payload("board:1")) == ENQUEUE_DUPLICATE
+    assert buffer.enqueue(_payload(None)) == ENQUEUE_QUEUED
+    assert buffer.enqueue(_payload(None)) == ENQUEUE_QUEUED
+
+    assert buffer.flush(db=db) == 3
+    assert db.insert_calls == 1
+    assert buffer.enqueue(_payload("board:1")) == ENQUEUE_DUPLICATE
+    assert buffer.stats()["deduped"] == 2
+
+
+def test_analytics_event_buffer_rejects_when_full() -> None:
+    buffer = AnalyticsEventBuffer(max_pending=1)
+
+    assert buffer.enqueue(_payload("a")) == ENQUEUE_QUEUED
+    assert buffer.enqueue(_payload("b")) == ENQUEUE_FULL
+
+
+def test_analytics_event_buffer_falls_back_to_row_inserts_on_dedupe_conflict() -> None:
+    buffer = AnalyticsEventBuffer(chunk_size=10)
+    db = _BulkDB(persisted_keys={"board:2"})
+    for key in ("board:1", "board:2", "board:3"):
+        buffer.enqueue(_payload(key))
+
+    assert buffer.flush(db=db) == 2
+    assert [row["dedupe_key"] for row in db.inserted] == ["board:1", "board:3"]
+    assert buffer.stats()["dropped"] == 0
+
+
+class _FailingDB:
+    def __init__(self):
+        self.insert_calls = 0
+
+    def table(self, name: str):
+        assert name == "analytics_events"
+        return SimpleNamespace(insert=lambda payload: SimpleNamespace(execute=self._fail))
+
+    def _fail(self):
+        self.insert_calls += 1
+        raise RuntimeError("connection reset by peer")
+
+
+def test_analytics_event_buffer_requeues_failed_chunk_without_marking_keys_recent() -> None:
+    buffer = AnalyticsEventBuffer()
+    logged: list[dict] = []
+    buffer.enqueue(_payload("board:1"))
+    buffer.enqueue(_payload(None))
+
+    assert buffer.flush(db=_FailingDB(), log_event=lambda event, **fields: logged.append(fields)) == 0
+    assert buffer.pending_count() == 2
+    assert buffer.enqueue(_payload("board:1")) == ENQUEUE_DUPLICATE
+    assert logged[0]["requeued"] == 2 and logged[0]["dropped"] == 0
+
+    db = _BulkDB()
+    assert buffer.flush(db=db) == 2
+    assert [row["dedupe_key"] for row in db.inserted] == ["board:1", None]
+    assert buffer.stats()["requeued"] == 2
+    assert buffer.stats()["dropped"] == 0
+
+
+def test_analytics_event_buffer_drops_after_max_attempts_and_forgets_key() -> None:
+    buffer = AnalyticsEventBuffer()
+    db = _FailingDB()
+    buffer.enqueue(_payload("board:1"))
+
+    for _ in range(analytics_events._MAX_FLUSH_ATTEMPTS):
+        buffer.flush(db=db)
+
+    assert db.insert_calls == analytics_events._MAX_FLUSH_ATTEMPTS
+    assert buffer.pending_count() == 0
+    assert buffer.stats()["dropped"] == 1
+    # The key never landed, so a client retry is accepted instead of deduped.
+    assert buffer.enqueue(_payload("board:1")) == ENQUEUE_QUEUED
+
+
+def test_analytics_event_buffer_without_requeue_drops_failed_rows() -> None:
+    buffer = AnalyticsEventBuffer()
+    buffer.enqueue(_payload("board:1"))
+
+    assert buffer.flush(db=_FailingDB(), requeue=False) == 0
+    assert buffer.pending_count() == 0
+    assert buffer.stats()["dropped"] == 1
+
+
+def test_capture_backend_event_enqueues_when_buffer_active(monkeypatch) -> None:
+    buffer = AnalyticsEventBuffer()
+    buffer.active = True
+    monkeypatch.setattr(analytics_events, "_EVENT_BUFFER", buffer)
+    db = _DB()
+
+    first = capture_backend_event(
+        db,
+        event_name="bet_logged",
+        user_id="user-1",
+        session_id="session-1",
+        properties={"route": "/bets"},
+        dedupe_key="bet-logged:1",
+    )
+    second = capture_backend_event(
+        db,
+        event_name="bet_logged",
+        user_id="user-1",
+        session_id="session-1",
+        properties={"route": "/bets"},
+        dedupe_key="bet-logged:1",
+    )
+
+    assert first is True
+    assert second is False
+    assert db.inserted == []
+    assert buffer.pending_count() == 1
@@ -3,6 +3,7 @@ from types import SimpleNamespace
 import pytest
 
 from routes import analytics_routes
+from services.analytics_events import AnalyticsEventBuffer
 
 
 @pytest.mark.asyncio
@@ -56,6 +57,27 @@ async def test_ingest_analytics_event_does_not_add_email_for_anonymous(monkeypat
     assert "user_email" not in captured["properties"]
 
 
+@pytest.mark.asyncio
+async def test_ingest_analytics_event_reports_queued_when_buffered(monkeypatch):
+    buffer = AnalyticsEventBuffer()
+    buffer.active = True
+    monkeypatch.setattr(analytics_routes, "_optional_user_from_authorization", lambda _auth: _anonymous_user())
+    monkeypatch.setattr(analytics_routes, "get_analytics_event_buffer", lambda: buffer)
+
+    payload = analytics_routes.AnalyticsEventIngestRequest(
+        event_name="board_viewed",
+        session_id="session-2",
+        dedupe_key="board:queued",
+    )
+
+    first = await analytics_routes.ingest_analytics_event(payload=payload, x_session_id=None, authorization=None)
+    second = await analytics_routes.ingest_analytics_event(payload=payload, x_session_id=None, authorization=None)
+
+    assert first == {"ok": True, "inserted": False, "queued": True}
+    assert second == {"ok": True, "inserted": False, "queued": False}
+    assert buffer.pending_count() == 1
+
+
 @pytest.mark.asyncio
 async def test_optional_user_from_authorization_extracts_id_and_email(monkeypatch):
     dummy_user = SimpleNamespace(id="abc-123", email="person@example.com")
@@ -83,3 +105,54 @@ async def _resolved_user():
 
 async def _anonymous_user():
     return None, None
+
+
+@pytest.mark.asyncio
+async def test_ingest_analytics_event_batch_writes_one_multi_row_insert(monkeypatch):
+    inserts: list[list[dict]] = []
+
+    class _Query:
+        def __init__(self, rows):
+            self._rows = rows
+
+        def execute(self):
+            inserts.append(self._rows)
+            return SimpleNamespace(data=self._rows)
+
+    fake_db = SimpleNamespace(table=lambda _name: SimpleNamespace(insert=lambda rows: _Query(rows)))
+
+    async def _fake_threadpool(func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    monkeypatch.setattr(analytics_routes, "_optional_user_from_authorization", lambda _auth: _resolved_user())
+    monkeypatch.setattr(analytics_routes, "get_db", lambda: fake_db)
+    monkeypatch.setattr(analytics_routes, "run_in_threadpool", _fake_threadpool)
+    monkeypatch.setattr(analytics_routes, "retry_supabase", lambda op: op())
+
+    payload = analytics_routes.AnalyticsEventBatchIngestRequest(
+        events=[
+            {"event_name": "board_viewed", "dedupe_key": "board:1", "properties": {"user_email": "spoofed@example.com"}},
+            {"event_name": "board_viewed", "dedupe_key": "board:1"},
+            {"event_name": "tutorial_started"},
+            {"event_name": "not_a_real_event"},
+        ]
+    )
+
+    response = await analytics_routes.ingest_analytics_event_batch(
+        payload=payload,
+        x_session_id="session-3",
+        authorization="Bearer token",
+    )
+
+    assert response == {
+        "ok": True,
+        "accepted": 2,
+        "queued": 0,
+        "inserted": 2,
+        "duplicates": 1,
+        "rejected": 1,
+    }
+    assert len(inserts) == 1
+    assert [row["event_name"] for row in inserts[0]] == ["board_viewed", "tutorial_started"]
+    assert all(row["session_id"] == "session-3" for row in inserts[0])
+    assert inserts[0][0]["properties"]["user_email"] == "real@example.com"
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timezone
 
 import pytest
@@ -7,6 +8,7 @@ from services.bet_live_tracking import build_live_snapshots_for_rows
 from services.espn_live import EspnLiveProvider
 from services.espn_live import _match_event_for_candidate as _match_espn_event_for_candidate
 from services.espn_live import normalize_espn_nba_event
+from services.live_game_state import get_live_game_state_metrics
 from services.live_provider_contracts import (
     LiveBetCandidate,
     LivePlayerStatRequest,
@@ -235,65 +237,65 @@ def test_espn_match_event_accepts_unordered_player_prop_team_metadata():
     assert reason is None
 
 
-@pytest.mark.asyncio
-async def test_espn_lookup_falls_back_to_player_summary_when_legacy_prop_has_no_teams(monkeypatch):
-    async def _fake_scoreboard_date(_date_value: str):
-        return (
-            [
+def _espn_legacy_scoreboard_rows() -> list[dict]:
+    return [
+        {
+            "id": "espn-legacy",
+            "date": "2026-04-22T02:00:00Z",
+            "competitions": [
                 {
-                    "id": "espn-legacy",
-                    "date": "2026-04-22T02:00:00Z",
-                    "competitions": [
+                    "status": {
+                        "period": 2,
+                        "displayClock": "6:12",
+                        "type": {"state": "in", "name": "STATUS_IN_PROGRESS"},
+                    },
+                    "competitors": [
                         {
-                            "status": {
-                                "period": 2,
-                                "displayClock": "6:12",
-                                "type": {"state": "in", "name": "STATUS_IN_PROGRESS"},
-                            },
-                            "competitors": [
-                                {
-                                    "homeAway": "away",
-                                    "score": "42",
-                                    "team": {"displayName": "Denver Nuggets", "abbreviation": "DEN"},
-                                },
-                                {
-                                    "homeAway": "home",
-                                    "score": "46",
-                                    "team": {"displayName": "Phoenix Suns", "abbreviation": "PHX"},
-                                },
-                            ],
-                        }
+                            "homeAway": "away",
+                            "score": "42",
+                            "team": {"displayName": "Denver Nuggets", "abbreviation": "DEN"},
+                        },
+                        {
+                            "homeAway": "home",
+                            "score": "46",
+                            "team": {"displayName": "Phoenix Suns", "abbreviation": "PHX"},
+                        },
                     ],
                 }
             ],
-            False,
-            False,
-        )
+        }
+    ]
 
-    async def _fake_summary(_event_id: str):
-        return (
-            {
-                "boxscore": {
-                    "players": [
+
+def _espn_jokic_summary() -> dict:
+    return {
+        "boxscore": {
+            "players": [
+                {
+                    "statistics": [
                         {
-                            "statistics": [
+                            "names": ["MIN", "PTS", "REB", "AST"],
+                            "athletes": [
                                 {
-                                    "names": ["MIN", "PTS", "REB", "AST"],
-                                    "athletes": [
-                                        {
-                                            "athlete": {"displayName": "Nikola Jokic"},
-                                            "stats": ["12", "8", "5", "3"],
-                                        }
-                                    ],
+                                    "athlete": {"displayName": "Nikola Jokic"},
+                                    "stats": ["12", "8", "5", "3"],
                                 }
-                            ]
+                            ],
                         }
                     ]
                 }
-            },
-            False,
-            False,
-        )
+            ]
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_espn_lookup_falls_back_to_player_summary_when_legacy_prop_has_no_teams(monkeypatch):
+    async def _fake_scoreboard_date(_date_value: str):
+        return _espn_legacy_scoreboard_rows(), False, False
+
+    async def _fake_summary(_event_id: str):
+        return _espn_jokic_summary(), False, False
 
     monkeypatch.setattr("services.espn_live._fetch_cached_scoreboard_date", _fake_scoreboard_date)
     monkeypatch.setattr("services.espn_live._fetch_cached_summary", _fake_summary)
@@ -333,6 +335,59 @@ async def test_espn_lookup_falls_back_to_player_summary_when_legacy_prop_has_no_
     assert snapshot.player_stat.value == 5
 
 
+@pytest.mark.asyncio
+async def test_concurrent_espn_polls_share_one_refresh_per_game(monkeypatch):
+    scoreboard_calls: list[str] = []
+    summary_calls: list[str] = []
+
+    async def _fake_scoreboard_date(date_value: str):
+        scoreboard_calls.append(date_value)
+        await asyncio.sleep(0)
+        return _espn_legacy_scoreboard_rows(), False, False
+
+    async def _fake_summary(event_id: str):
+        summary_calls.append(event_id)
+        await asyncio.sleep(0)
+        return _espn_jokic_summary(), False, False
+
+    monkeypatch.setattr("services.espn_live._fetch_cached_scoreboard_date", _fake_scoreboard_date)
+    monkeypatch.setattr("services.espn_live._fetch_cached_summary", _fake_summary)
+
+    def _user_rows(user_index: int) -> list[dict]:
+        return [
+            {
+                "id": f"bet-{user_index}",
+                "surface": "player_props",
+                "event": "Nikola Jokic Over 4.5 REB",
+                "result": "pending",
+                "clv_sport_key": "basketball_nba",
+                "clv_team": "Nikola Jokic",
+                "source_market_key": "player_rebounds",
+                "participant_name": "Nikola Jokic",
+                "selection_side": "over",
+                "line_value": 4.5,
+                "commence_time": "2026-04-22T02:00:00Z",
+                "selection_meta": {},
+            }
+        ]
+
+    now = datetime(2026, 4, 22, 3, 15, tzinfo=timezone.utc)
+    responses = await asyncio.gather(
+        *(
+            build_live_snapshots_for_rows(_user_rows(index), now=now, providers={"espn": EspnLiveProvider()})
+            for index in range(6)
+        )
+    )
+
+    for index, response in enumerate(responses):
+        snapshot = response.snapshots_by_bet_id[f"bet-{index}"]
+        assert snapshot.player_stat is not None
+        assert snapshot.player_stat.value == 5
+    assert summary_calls == ["espn-legacy"]
+    assert len(scoreboard_calls) == len(set(scoreboard_calls))
+    assert get_live_game_state_metrics()["espn.players"]["refreshes"] == 1
+
+
 @pytest.mark.asyncio
 async def test_build_live_snapshots_returns_game_and_supported_prop_progress():
     rows = [
@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+import services.board_events as board_events
+from services.board_events import (
+    BOARD_EVENT_DROP,
+    BOARD_EVENT_REFRESH,
+    BOARD_EVENT_SNAPSHOT,
+    format_sse,
+    latest_board_events,
+    publish_board_event,
+    stream_board_events,
+)
+
+
+def _parse_frame(frame: str) -> dict[str, str]:
+    fields = {}
+    for line in frame.strip().splitlines():
+        name, _, value = line.partition(": ")
+        fields[name] = value
+    return fields
+
+
+def test_publish_board_event_keeps_latest_per_kind_and_refresh_surface():
+    publish_board_event(BOARD_EVENT_SNAPSHOT, snapshot_id="snap_a")
+    publish_board_event(BOARD_EVENT_REFRESH, run_id="r1", surface="player_props", status="started")
+    publish_board_event(BOARD_EVENT_REFRESH, run_id="r2", surface="straight_bets", status="completed")
+    publish_board_event(BOARD_EVENT_REFRESH, run_id="r1", surface="player_props", status="completed")
+    publish_board_event(BOARD_EVENT_SNAPSHOT, snapshot_id="snap_b")
+
+    latest = {(event["type"], event.get("surface")): event for event in latest_board_events()}
+
+    assert set(latest) == {
+        (BOARD_EVENT_SNAPSHOT, None),
+        (BOARD_EVENT_REFRESH, "player_props"),
+        (BOARD_EVENT_REFRESH, "straight_bets"),
+    }
+    assert latest[(BOARD_EVENT_SNAPSHOT, None)]["snapshot_id"] == "snap_b"
+    assert latest[(BOARD_EVENT_REFRESH, "player_props")]["status"] == "completed"
+
+
+def test_publish_board_event_swallows_shared_state_failures(monkeypatch):
+    def _boom(*_args, **_kwargs):
+        raise RuntimeError("redis down")
+
+    monkeypatch.setattr(board_events, "set_json", _boom)
+
+    event = publish_board_event(BOARD_EVENT_DROP, run_id="board_1", status="started")
+
+    assert event["type"] == BOARD_EVENT_DROP
+
+
+def test_format_sse_uses_event_id_and_type():
+    frame = _parse_frame(format_sse({"id": "abc", "type": BOARD_EVENT_SNAPSHOT, "snapshot_id": "snap_1"}))
+
+    assert frame["id"] == "abc"
+    assert frame["event"] == BOARD_EVENT_SNAPSHOT
+    assert '"snapshot_id":"snap_1"' in frame["data"]
+
+
+class _FakePubSub:
+    def __init__(self, messages):
+        self._messages = messages
+        self.closed = False
+
+    def listen(self):
+        yield from self._messages
+        raise ConnectionError("connection lost")
+
+    def close(self):
+        self.closed = True
+
+
+def test_listener_closes_dead_pubsub_before_resubscribing(monkeypatch):
+    first = _FakePubSub([{"data": '{"type": "board.snapshot", "snapshot_id": "snap_1"}'}])
+    second = _FakePubSub([{"data": "not json"}, {"data": '{"type": "board.drop", "run_id": "board_2"}'}])
+    reopened = iter([second, None])
+    delivered = []
+
+    def _open_pubsub(_channel):
+        assert first.closed
+        return next(reopened)
+
+    hub = board_events.BoardEventHub()
+    monkeypatch.setattr(hub, "deliver", delivered.append)
+    monkeypatch.setattr(board_events, "open_pubsub", _open_pubsub)
+    monkeypatch.setattr(board_events.time, "sleep", lambda _seconds: None)
+
+    hub._listen(first)
+
+    assert first.closed and second.closed
+    assert [event["type"] for event in delivered] == [BOARD_EVENT_SNAPSHOT, BOARD_EVENT_DROP]
+
+
+@pytest.mark.asyncio
+async def test_stream_replays_latest_then_delivers_live_events_and_keepalives(monkeypatch):
+    monkeypatch.setenv("BOARD_EVENTS_HEARTBEAT_SECONDS", "1")
+    publish_board_event(BOARD_EVENT_SNAPSHOT, snapshot_id="snap_before_connect")
+
+    stream = stream_board_events()
+    assert (await stream.__anext__()).startswith("retry: ")
+    replayed = _parse_frame(await stream.__anext__())
+    assert replayed["event"] == BOARD_EVENT_SNAPSHOT
+    assert "snap_before_connect" in replayed["data"]
+
+    pending = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)
+    published = publish_board_event(BOARD_EVENT_DROP, run_id="board_live", status="props_built")
+    live = _parse_frame(await asyncio.wait_for(pending, timeout=1))
+    assert live["id"] == published["id"]
+    assert live["event"] == BOARD_EVENT_DROP
+
+    assert await asyncio.wait_for(stream.__anext__(), timeout=3) == ": keepalive\n\n"
+    assert board_events._HUB.subscriber_count == 1
+    await stream.aclose()
+    assert board_events._HUB.subscriber_count == 0
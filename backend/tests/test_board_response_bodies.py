@@ -0,0 +1,58 @@
+import gzip
+import json
+
+from services.board_response_bodies import get_board_body, publish_board_body
+from utils.http_cache import encode_json_body, encoded_json_response, etag_matches, negotiate_content_encoding
+
+
+def _large_payload():
+    return {"sides": [{"selection_key": f"evt-{idx}|h2h|home", "book_odds": 110} for idx in range(100)]}
+
+
+def test_published_body_is_reused_until_the_version_changes():
+    builds: list[int] = []
+
+    def _build():
+        builds.append(1)
+        return _large_payload()
+
+    publish_board_body("test:body", ("snap-1", "2026-04-22T09:30:00Z"), _build)
+    first = get_board_body("test:body", ("snap-1", "2026-04-22T09:30:00Z"), _build)
+    second = get_board_body("test:body", ("snap-1", "2026-04-22T09:30:00Z"), _build)
+    newer = get_board_body("test:body", ("snap-2", "2026-04-22T15:00:00Z"), _build)
+
+    assert len(builds) == 2
+    assert first is second
+    assert newer is not first
+    assert json.loads(gzip.decompress(first.gzip)) == _large_payload()
+
+
+def test_publish_failure_is_swallowed_and_leaves_previous_body():
+    publish_board_body("test:body", 1, lambda: {"ok": True})
+    publish_board_body("test:body", 2, lambda: (_ for _ in ()).throw(ValueError("bad payload")))
+
+    assert get_board_body("test:body", 1, lambda: {"rebuilt": True}).identity == b'{"ok":true}'
+
+
+def test_content_negotiation_and_small_bodies():
+    large = encode_json_body(_large_payload())
+    small = encode_json_body({"ok": True})
+
+    assert large.identity is None
+    assert negotiate_content_encoding("gzip, deflate", large) == "gzip"
+    assert negotiate_content_encoding("gzip;q=0, identity", large) == "identity"
+    assert negotiate_content_encoding("*", large) in {"br", "gzip"}
+    assert negotiate_content_encoding(None, large) == "identity"
+    assert negotiate_content_encoding("gzip", small) == "identity"
+
+    plain = encoded_json_response(large, None, headers={"ETag": '"abc"'})
+    assert json.loads(plain.body) == _large_payload()
+    assert plain.headers["etag"] == 'W/"abc"'
+    assert plain.headers["vary"] == "Accept-Encoding"
+    assert "content-encoding" not in plain.headers
+
+    compressed = encoded_json_response(large, "br, gzip", headers={"ETag": '"abc"'})
+    assert compressed.headers["etag"] == plain.headers["etag"]
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    assert etag_matches('"abc"', compressed.headers["etag"])
+    assert etag_matches(compressed.headers["etag"], '"abc"')
@@ -5,6 +5,7 @@ from .test_utils import ensure_supabase_stub
 ensure_supabase_stub()
 
 import routes.board_routes as board_routes
+from services.board_events import latest_board_events
 
 
 def _runtime_hooks(*, sync_calls=None, status_updates=None, persisted_runs=None):
@@ -328,7 +329,7 @@ def test_board_latest_memory_error_returns_controlled_503(auth_client, monkeypat
     monkeypatch.setattr(board_routes, "load_board_snapshot", lambda **_kwargs: _board_snapshot(game_context={"scan_label": "Drop"}))
     monkeypatch.setattr(
         board_routes,
-        "jsonable_encoder",
+        "get_board_body",
         lambda *_args, **_kwargs: (_ for _ in ()).throw(MemoryError("too large")),
     )
 
@@ -344,16 +345,11 @@ def test_board_latest_unexpected_runtime_error_degrades_to_empty_200(auth_client
     monkeypatch.setattr(board_routes, "get_db", lambda: object())
     monkeypatch.setattr(board_routes, "load_board_snapshot", lambda **_kwargs: _board_snapshot(game_context={"scan_label": "Drop"}))
 
-    original_encoder = board_routes.jsonable_encoder
-    calls = {"count": 0}
-
-    def _flaky_encoder(value):
-        calls["count"] += 1
-        if calls["count"] == 1:
-            raise ValueError("bad payload")
-        return original_encoder(value)
-
-    monkeypatch.setattr(board_routes, "jsonable_encoder", _flaky_encoder)
+    monkeypatch.setattr(
+        board_routes,
+        "get_board_body",
+        lambda *_args, **_kwargs: (_ for _ in ()).throw(ValueError("bad payload")),
+    )
 
     resp = auth_client.get("/api/board/latest")
 
@@ -393,6 +389,57 @@ def test_board_latest_surface_straight_bets_success_contract(auth_client, monkey
     assert body["sides"][0].get("scanner_duplicate_state") is None
 
 
+def test_board_latest_surface_straight_bets_serves_bytes_encoded_at_publish(auth_client, monkeypatch):
+    from services.scan_cache import persist_latest_scan_payload
+
+    class _Upsert:
+        def upsert(self, *_args, **_kwargs):
+            return self
+
+        def execute(self):
+            return None
+
+    class _DB:
+        def table(self, _name):
+            return _Upsert()
+
+    payload = {
+        "surface": "straight_bets",
+        "sport": "basketball_nba",
+        "sides": [_straight_side(selection_key=f"evt-1|h2h|lakers-{idx}") for idx in range(12)],
+        "events_fetched": 3,
+        "events_with_both_books": 2,
+        "api_requests_remaining": "490",
+        "scanned_at": "2026-04-22T09:30:00Z",
+    }
+    persist_latest_scan_payload(
+        db=_DB(),
+        payload=payload,
+        retry_supabase=lambda fn: fn(),
+        log_event=lambda *_args, **_kwargs: None,
+        surface="straight_bets",
+    )
+
+    _install_runtime_hooks(monkeypatch)
+    monkeypatch.setattr(board_routes, "get_db", lambda: object())
+    monkeypatch.setattr("services.scan_cache.load_latest_scan_payload", lambda **_kwargs: payload)
+    monkeypatch.setattr(
+        board_routes,
+        "full_scan_response_body",
+        lambda _payload: (_ for _ in ()).throw(AssertionError("body should be served pre-encoded")),
+    )
+
+    resp = auth_client.get("/api/board/latest/surface?surface=straight_bets", headers={"Accept-Encoding": "gzip"})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in resp.headers["vary"]
+    assert resp.headers["etag"]
+    body = resp.json()
+    assert len(body["sides"]) == 12
+    assert body["sides"][0]["team"] == "Lakers"
+
+
 def test_board_latest_surface_player_props_success_reannotates_duplicates(auth_client, monkeypatch):
     payload = {
         "surface": "player_props",
@@ -425,6 +472,62 @@ def test_board_latest_surface_player_props_success_reannotates_duplicates(auth_c
     assert body["sides"][0]["scanner_duplicate_state"] == "already_logged"
 
 
+def test_board_latest_returns_304_when_etag_matches(auth_client, monkeypatch):
+    monkeypatch.setenv("BOARD_LATEST_MODE", "meta_only")
+    _install_runtime_hooks(monkeypatch)
+    monkeypatch.setattr(board_routes, "get_db", lambda: object())
+    monkeypatch.setattr(board_routes, "load_board_snapshot", lambda **_kwargs: _board_snapshot())
+
+    first = auth_client.get("/api/board/latest")
+    etag = first.headers.get("etag")
+
+    assert first.status_code == 200
+    assert etag
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    second = auth_client.get("/api/board/latest", headers={"If-None-Match": etag})
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+
+def test_board_latest_surface_player_props_etag_tracks_pending_bets(auth_client, monkeypatch):
+    payload = {
+        "surface": "player_props",
+        "sport": "basketball_nba",
+        "sides": [_player_prop_side()],
+        "events_fetched": 2,
+        "events_with_both_books": 1,
+        "api_requests_remaining": "88",
+        "scanned_at": "2026-04-22T09:30:00Z",
+    }
+    pending_rows = [{"id": "bet-1", "clv_event_id": "evt-pp-1", "market": "player_points"}]
+    annotate_kwargs = []
+
+    def _annotate(db, user_id, sides, **kwargs):
+        annotate_kwargs.append(kwargs)
+        return sides
+
+    _install_runtime_hooks(monkeypatch)
+    monkeypatch.setattr(board_routes, "get_db", lambda: object())
+    monkeypatch.setattr(board_routes, "load_player_prop_board_legacy_surface", lambda **_kwargs: payload)
+    monkeypatch.setattr(board_routes, "load_pending_duplicate_rows", lambda _db, _uid: list(pending_rows))
+    monkeypatch.setattr(board_routes, "annotate_sides_with_duplicate_state", _annotate)
+
+    first = auth_client.get("/api/board/latest/surface?surface=player_props")
+    etag = first.headers["etag"]
+    unchanged = auth_client.get("/api/board/latest/surface?surface=player_props", headers={"If-None-Match": etag})
+    pending_rows.append({"id": "bet-2", "clv_event_id": "evt-pp-1", "market": "player_rebounds"})
+    changed = auth_client.get("/api/board/latest/surface?surface=player_props", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert annotate_kwargs[0]["pending_rows"] == pending_rows[:1]
+    assert unchanged.status_code == 304
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
 def test_board_latest_surface_missing_payload_returns_null(auth_client, monkeypatch):
     _install_runtime_hooks(monkeypatch)
     monkeypatch.setattr(board_routes, "get_db", lambda: object())
@@ -508,6 +611,10 @@ def test_board_refresh_execution_failure_records_failed_ops_status(auth_client,
     assert status_updates[0]["payload"]["status"] == "failed"
     assert persisted_runs[0]["job_kind"] == "board_scoped_refresh"
     assert persisted_runs[0]["meta"]["response_status_code"] == 502
+    refresh_event = latest_board_events()[-1]
+    assert refresh_event["type"] == "board.refresh"
+    assert refresh_event["surface"] == "player_props"
+    assert refresh_event["status"] == "failed"
 
 
 def test_board_refresh_invalid_refresh_payload_returns_500(auth_client, monkeypatch):
@@ -614,6 +721,12 @@ def test_board_refresh_straight_bets_success_merges_supported_sports(auth_client
     assert persisted_runs[0]["meta"]["canonical_board_updated"] is False
     assert persist_calls[0]["surface"] == "straight_bets"
     assert persist_calls[0]["scan_payload"]["surface"] == "straight_bets"
+    refresh_event = latest_board_events()[-1]
+    assert refresh_event["type"] == "board.refresh"
+    assert refresh_event["status"] == "completed"
+    assert refresh_event["run_id"] == persisted_runs[0]["run_id"]
+    assert refresh_event["refreshed_at"] == "2026-04-22T09:32:00Z"
+    assert refresh_event["total_sides"] == 2
 
 
 def test_board_refresh_player_props_success_returns_optional_fields_and_syncs_when_fresh(auth_client, monkeypatch):
@@ -587,3 +587,95 @@ async def test_run_jit_clv_snatcher_still_updates_bets_when_scan_opportunities_t
 
     assert updated == 1
     assert db.tables["bets"][0]["pinnacle_odds_at_close"] == -108
+
+
+def test_build_reference_index_matches_per_structure_builders():
+    mod = _reload_clv_tracking()
+    sides = [
+        {"sport": "basketball_nba", "event_id": "evt-1", "commence_time": "2026-03-23T15:00:00Z", "team": "Team A", "pinnacle_odds": -120},
+        {"sport": "basketball_nba", "event_id": "evt-1", "commence_time": "2026-03-23T15:00:00Z", "team": "Team B", "pinnacle_odds": 110},
+        {
+            "sport": "basketball_nba",
+            "event_id": "evt-1",
+            "commence_time": "2026-03-23T15:00:00Z",
+            "market_key": "spreads",
+            "team": "Team A",
+            "line_value": -3.5,
+            "pinnacle_odds": -105,
+        },
+        {
+            "surface": "player_props",
+            "sport": "basketball_nba",
+            "event_id": "evt-1",
+            "commence_time": "2026-03-23T15:00:00Z",
+            "player_name": "Nikola Jokic",
+            "participant_id": "p-15",
+            "market_key": "player_points",
+            "selection_side": "over",
+            "line_value": 24.5,
+            "reference_odds": -110,
+        },
+        {"sport": "icehockey_nhl", "commence_time": "2026-03-23T16:00:00Z", "team": "Team C"},
+    ]
+
+    index = mod.build_reference_index(sides)
+
+    assert index.sports == ["basketball_nba", "icehockey_nhl"]
+    assert index.straight_snapshot_by_event[("evt-1", "team b")] == 110
+    assert index.straight_pair_by_time["2026-03-23T15:00:00Z"] == {"team a": -105, "team b": 110}
+    assert index.straight_exact_snapshot_by_event[("evt-1", "team a", "spreads", -3.5)] == -105
+    assert index.straight_exact_pair_by_event[("evt-1", "spreads", 3.5)] == {"team a": -105}
+    assert index.prop_snapshot_by_event[("evt-1", "id:p-15", "player_points", "over", 24.5)] == -110
+    assert index.prop_pair_by_time[("2026-03-23T15:00:00Z", "name:nikola jokic", "player_points", 24.5)] == {"over": -110}
+    assert "time:2026-03-23T16:00:00Z" in index.coverage["straight_events"]
+    assert index.coverage["prop_sides"][("event:evt-1", "player_points", "id:p-15", 24.5)] == {"over"}
+    assert mod.build_prop_reference_snapshots(sides) == (index.prop_snapshot_by_event, index.prop_snapshot_by_time)
+
+
+def test_reference_snapshot_updaters_share_a_prebuilt_reference_index(monkeypatch):
+    mod = _reload_clv_tracking()
+    now = datetime(2026, 3, 23, 12, 0, tzinfo=timezone.utc)
+    commence_time = "2026-03-23T15:00:00Z"
+    db = _DB(
+        bets=[
+            {
+                "id": 41,
+                "result": "pending",
+                "clv_team": "Team X",
+                "commence_time": commence_time,
+                "clv_event_id": "evt-x",
+                "clv_sport_key": "basketball_nba",
+                "pinnacle_odds_at_close": None,
+            }
+        ],
+        scan_opportunities=[
+            {
+                "id": "opp-x",
+                "sport": "basketball_nba",
+                "team": "Team X",
+                "commence_time": commence_time,
+                "event_id": "evt-x",
+                "first_book_odds": 155,
+                "reference_odds_at_close": None,
+            }
+        ],
+    )
+    sides = [{"sport": "basketball_nba", "event_id": "evt-x", "commence_time": commence_time, "team": "Team X", "pinnacle_odds": 135}]
+    reference_index = mod.build_reference_index(sides)
+
+    def _unexpected_rebuild(_sides):
+        raise AssertionError("reference index should not be rebuilt")
+
+    monkeypatch.setattr(mod, "build_reference_index", _unexpected_rebuild)
+
+    bet_counts = mod.update_bet_reference_snapshots(
+        db, sides=sides, allow_close=True, now=now, reference_index=reference_index
+    )
+    opportunity_counts = mod.update_scan_opportunity_reference_snapshots(
+        db, sides=sides, allow_close=True, now=now, reference_index=reference_index
+    )
+
+    assert bet_counts["latest_updated"] == 1
+    assert opportunity_counts["latest_updated"] == 1
+    assert db.tables["bets"][0]["latest_pinnacle_odds"] == 135
+    assert db.tables["scan_opportunities"][0]["latest_reference_odds"] == 135
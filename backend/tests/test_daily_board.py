@@ -165,3 +165,32 @@ async def test_run_daily_board_drop_limits_game_lines_to_nba_and_mlb(monkeypatch
     assert result["summary"]["player_props"]["events_scanned"] == 2
     assert result["summary"]["player_props"]["board_items"]["browse_total"] == 2
 
+
+
+@pytest.mark.asyncio
+async def test_run_daily_board_drop_publishes_failed_board_event(monkeypatch):
+    import services.daily_board as daily_board
+    import services.odds_api as odds_api
+    from services.board_events import BOARD_EVENT_DROP, latest_board_events
+
+    async def _failing_featured_lines_slate(*, sport: str, source: str):
+        raise RuntimeError(f"{sport} slate unavailable")
+
+    async def _fake_fetch_events(sport: str, source: str):
+        return ([], types.SimpleNamespace(headers={}))
+
+    monkeypatch.setattr(odds_api, "fetch_featured_lines_slate", _failing_featured_lines_slate, raising=True)
+    monkeypatch.setattr(odds_api, "fetch_events", _fake_fetch_events, raising=True)
+
+    with pytest.raises(RuntimeError):
+        await daily_board.run_daily_board_drop(
+            db=None,
+            source="scheduled_board_drop",
+            retry_supabase=lambda fn: fn(),
+            log_event=lambda *_args, **_kwargs: None,
+        )
+
+    drop_event = next(event for event in latest_board_events() if event["type"] == BOARD_EVENT_DROP)
+    assert drop_event["status"] == "failed"
+    assert drop_event["error_class"] == "RuntimeError"
+    assert drop_event["run_id"].startswith("board_")
@@ -0,0 +1,95 @@
+import asyncio
+
+import httpx
+import pytest
+
+from services.event_odds_broker import EventOddsBroker
+
+
+def _event_payload(markets: list[str]) -> dict:
+    return {
+        "id": "evt-1",
+        "commence_time": "2026-04-01T23:00:00Z",
+        "bookmakers": [
+            {
+                "key": book,
+                "title": book.title(),
+                "markets": [{"key": market, "outcomes": [{"name": "Over", "description": f"{book}-{market}"}]} for market in markets],
+            }
+            for book in ("draftkings", "pinnacle")
+        ],
+    }
+
+
+def _fake_fetch(calls: list[tuple[list[str], str]]):
+    async def _fetch(*, sport: str, event_id: str, markets: list[str], source: str):
+        calls.append((markets, source))
+        await asyncio.sleep(0)
+        return _event_payload(markets), httpx.Response(200, headers={"x-requests-remaining": "900", "x-requests-last": str(len(markets))})
+
+    return _fetch
+
+
+def _market_keys(payload: dict) -> list[list[str]]:
+    return [[market["key"] for market in book["markets"]] for book in payload["bookmakers"]]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_for_one_event_share_a_call_over_the_market_union(monkeypatch):
+    monkeypatch.setenv("EVENT_ODDS_BATCH_WINDOW_MS", "5")
+    calls: list[tuple[list[str], str]] = []
+    broker = EventOddsBroker(_fake_fetch(calls))
+
+    (scan_payload, scan_resp), (clv_payload, _clv_resp) = await asyncio.gather(
+        broker.fetch(sport="basketball_nba", event_id="evt-1", markets=["player_points", "player_rebounds"], source="manual_scan"),
+        broker.fetch(sport="basketball_nba", event_id="evt-1", markets=["player_points", "player_assists"], source="jit_clv_props"),
+    )
+
+    assert calls == [(["player_assists", "player_points", "player_rebounds"], "jit_clv_props")]
+    assert _market_keys(scan_payload) == [["player_points", "player_rebounds"]] * 2
+    assert _market_keys(clv_payload) == [["player_points", "player_assists"]] * 2
+    assert scan_payload["commence_time"] == "2026-04-01T23:00:00Z"
+    assert scan_resp.headers["x-requests-remaining"] == "900"
+    assert broker.stats.merged == 1
+
+
+@pytest.mark.asyncio
+async def test_fresh_slices_are_served_and_only_missing_markets_are_fetched(monkeypatch):
+    monkeypatch.setenv("EVENT_ODDS_BATCH_WINDOW_MS", "0")
+    calls: list[tuple[list[str], str]] = []
+    broker = EventOddsBroker(_fake_fetch(calls))
+
+    await broker.fetch(sport="basketball_nba", event_id="evt-1", markets=["player_points"], source="scheduled_board_drop")
+    cached, cached_resp = await broker.fetch(sport="basketball_nba", event_id="evt-1", markets=["player_points"], source="clv_daily_props")
+    widened, _ = await broker.fetch(sport="basketball_nba", event_id="evt-1", markets=["player_points", "player_threes"], source="manual_scan")
+
+    assert calls == [(["player_points"], "scheduled_board_drop"), (["player_threes"], "manual_scan")]
+    assert _market_keys(cached) == [["player_points"]] * 2
+    assert cached_resp.headers["x-requests-last"] == "0"
+    assert _market_keys(widened) == [["player_points", "player_threes"]] * 2
+
+    monkeypatch.setenv("EVENT_ODDS_SLICE_TTL_SECONDS", "0")
+    await broker.fetch(sport="basketball_nba", event_id="evt-1", markets=["player_blocks"], source="manual_scan")
+    await broker.fetch(sport="basketball_nba", event_id="evt-1", markets=["player_blocks"], source="manual_scan")
+    assert len(calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_merged_call_is_raised_to_every_waiter(monkeypatch):
+    monkeypatch.setenv("EVENT_ODDS_BATCH_WINDOW_MS", "5")
+    attempts: list[list[str]] = []
+
+    async def _fetch(*, sport: str, event_id: str, markets: list[str], source: str):
+        attempts.append(markets)
+        request = httpx.Request("GET", "https://example.test")
+        raise httpx.HTTPStatusError("missing", request=request, response=httpx.Response(404, request=request))
+
+    broker = EventOddsBroker(_fetch)
+    results = await asyncio.gather(
+        broker.fetch(sport="baseball_mlb", event_id="evt-9", markets=["pitcher_strikeouts"], source="manual_scan"),
+        broker.fetch(sport="baseball_mlb", event_id="evt-9", markets=["batter_hits"], source="manual_scan"),
+        return_exceptions=True,
+    )
+
+    assert len(attempts) == 1
+    assert all(isinstance(result, httpx.HTTPStatusError) for result in results)
@@ -0,0 +1,85 @@
+import pytest
+
+from fake_supabase import FakeSupabase
+
+
+def test_fake_supabase_filters_orders_and_pages_like_postgrest():
+    db = FakeSupabase(
+        {
+            "bets": [
+                {"id": "b1", "user_id": "u1", "result": "pending", "stake": 10, "created_at": "2026-01-03"},
+                {"id": "b2", "user_id": "u1", "result": "win", "stake": 25, "created_at": "2026-01-01"},
+                {"id": "b3", "user_id": "u1", "result": "pending", "stake": 5, "created_at": None},
+                {"id": "b4", "user_id": "u2", "result": "pending", "stake": 50, "created_at": "2026-01-02"},
+            ]
+        }
+    )
+
+    pending = db.table("bets").select("id, stake").eq("user_id", "u1").eq("result", "pending").execute()
+    ordered = db.table("bets").select("id").order("created_at", desc=True).range(0, 1).execute()
+    counted = db.table("bets").select("*", count="exact").in_("id", ["b2", "b4"]).gte("stake", 20).limit(1).execute()
+
+    assert pending.data == [{"id": "b1", "stake": 10}, {"id": "b3", "stake": 5}]
+    assert [row["id"] for row in ordered.data] == ["b3", "b1"]
+    assert counted.count == 2 and len(counted.data) == 1
+
+
+def test_fake_supabase_upsert_update_and_delete_persist_between_queries():
+    db = FakeSupabase()
+
+    db.table("global_scan_cache").upsert([{"key": "a", "payload": {"v": 1}}, {"key": "b", "payload": {"v": 1}}], on_conflict="key").execute()
+    db.table("global_scan_cache").upsert({"key": "a", "payload": {"v": 2}}, on_conflict="key").execute()
+    db.table("global_scan_cache").update({"surface": "player_props"}).eq("key", "b").execute()
+    db.table("global_scan_cache").delete().like("key", "z%").execute()
+
+    rows = {row["key"]: row for row in db.rows("global_scan_cache")}
+    assert rows["a"]["payload"] == {"v": 2}
+    assert rows["b"]["surface"] == "player_props"
+    assert len(rows) == 2
+
+    db.table("global_scan_cache").delete().eq("key", "a").execute()
+    db.table("global_scan_cache").upsert({"key": "a", "payload": {"v": 3}}, on_conflict="key").execute()
+    assert sorted(row["key"] for row in db.rows("global_scan_cache")) == ["a", "b"]
+
+    with pytest.raises(ValueError):
+        db.table("global_scan_cache").select("*").single().execute()
+    assert db.table("global_scan_cache").select("*").eq("key", "zz").maybe_single().execute().data is None
+
+
+def test_fake_supabase_negation_or_filters_rpc_fallback_and_auth():
+    from services.supabase_merge import is_missing_rpc_function_error
+
+    db = FakeSupabase(
+        {
+            "scan_opportunities": [
+                {"id": 1, "first_source": "model_v2_board", "first_model_key": None, "clv_sport_key": "nba"},
+                {"id": 2, "first_source": "manual_scan", "first_model_key": "m1", "clv_sport_key": None},
+                {"id": 3, "first_source": "legacy", "first_model_key": "m2", "clv_sport_key": "nba"},
+            ]
+        }
+    )
+
+    either = db.table("scan_opportunities").select("id").or_("first_source.like.model_v2*,first_source.in.(manual_scan)").execute()
+    legacy = db.table("scan_opportunities").select("id").not_.like("first_source", "model_v2*").not_.is_("clv_sport_key", "null").execute()
+    keyed = db.table("scan_opportunities").select("id").or_("first_model_key.eq.m2,first_model_key.is.null").execute()
+
+    assert [row["id"] for row in either.data] == [1, 2]
+    assert [row["id"] for row in legacy.data] == [3]
+    assert [row["id"] for row in keyed.data] == [1, 3]
+
+    with pytest.raises(Exception) as exc_info:
+        db.rpc("merge_scan_opportunities", {"p_rows": []}).execute()
+    assert is_missing_rpc_function_error(exc_info.value, "merge_scan_opportunities")
+
+    assert db.auth.get_user("user-1").user.id == "user-1"
+    assert db.stats()["scan_opportunities.select"]["calls"] == 3
+
+
+def test_fake_supabase_fills_migration_defaults_and_injects_latency():
+    db = FakeSupabase(latency_ms=5)
+
+    row = db.table("bets").insert({"user_id": "u1", "sport": "NBA", "stake": 10}).execute().data[0]
+
+    assert row["result"] == "pending" and row["event_date"] and row["created_at"]
+    assert row["pinnacle_odds_at_close"] is None
+    assert db.stats()["bets.insert"]["total_ms"] >= 5
@@ -0,0 +1,87 @@
+from datetime import UTC, datetime
+
+import pytest
+
+import services.scan_runtime as scan_runtime
+from fake_supabase import FakeSupabase
+from services.line_history import (
+    append_line_ticks,
+    decode_line_ticks,
+    downsample_line_points,
+    line_price_at,
+    load_line_history,
+)
+
+
+def _side(book_odds, pinnacle_odds, *, sportsbook="DraftKings", surface=None):
+    side = {
+        "sport": "basketball_nba",
+        "event_id": "evt1",
+        "market_key": "h2h",
+        "selection_key": "evt1|h2h|bostonceltics",
+        "sportsbook": sportsbook,
+        "commence_time": "2026-10-20T00:00:00Z",
+        "book_odds": book_odds,
+        "pinnacle_odds": pinnacle_odds,
+    }
+    if surface:
+        side["surface"] = surface
+    return side
+
+
+def test_append_line_ticks_delta_encodes_price_moves_per_book_series():
+    db = FakeSupabase()
+
+    first = append_line_ticks(db, sides=[_side(-110, -120), _side(-105, -120, sportsbook="FanDuel")], captured_at="2026-10-19T12:00:00.400Z")
+    quiet = append_line_ticks(db, sides=[_side(-110, -120)], captured_at="2026-10-19T12:05:00Z")
+    moved = append_line_ticks(db, sides=[_side(+100, -135)], captured_at="2026-10-19T12:15:00Z")
+
+    assert first == {"series": 3, "ticked": 3}
+    assert quiet == {"series": 2, "ticked": 0}
+    assert moved == {"series": 2, "ticked": 2}
+    rows = {row["sportsbook"]: row for row in db.rows("line_history")}
+    assert rows["DraftKings"]["ticks"] == [[0, -110], [900, 210]]
+    assert rows["Pinnacle"]["ticks"] == [[0, -120], [900, -15]]
+    assert rows["FanDuel"]["ticks"] == [[0, -105]] and rows["FanDuel"]["last_seen_at"] == "2026-10-19T12:00:00Z"
+    assert rows["DraftKings"]["last_seen_at"] == "2026-10-19T12:15:00Z"
+    assert decode_line_ticks(rows["DraftKings"]["first_tick_at"], rows["DraftKings"]["ticks"]) == [
+        (datetime(2026, 10, 19, 12, 0, tzinfo=UTC), -110),
+        (datetime(2026, 10, 19, 12, 15, tzinfo=UTC), 100),
+    ]
+
+
+def test_load_line_history_slices_ranges_and_downsamples():
+    db = FakeSupabase()
+    for minute, price in ((0, -110), (2, -115), (4, -120), (11, -125), (30, -130)):
+        append_line_ticks(db, sides=[_side(price, None)], captured_at=f"2026-10-19T12:{minute:02d}:00Z")
+
+    [series] = load_line_history(
+        db,
+        event_id="evt1",
+        sportsbook="DraftKings",
+        start=datetime(2026, 10, 19, 12, 3, tzinfo=UTC),
+        end=datetime(2026, 10, 19, 12, 20, tzinfo=UTC),
+    )
+    points = decode_line_ticks(db.rows("line_history")[0]["first_tick_at"], db.rows("line_history")[0]["ticks"])
+
+    assert series["points"] == [
+        {"at": "2026-10-19T12:03:00Z", "price": -115},
+        {"at": "2026-10-19T12:04:00Z", "price": -120},
+        {"at": "2026-10-19T12:11:00Z", "price": -125},
+    ]
+    assert [price for _at, price in downsample_line_points(points, bucket_seconds=600)] == [-110, -120, -125, -130]
+    assert line_price_at(points, datetime(2026, 10, 19, 11, 59, tzinfo=UTC)) is None
+    assert line_price_at(points, datetime(2026, 10, 19, 12, 29, tzinfo=UTC)) == -125
+
+
+@pytest.mark.asyncio
+async def test_piggyback_clv_records_line_history_for_straight_sides_only(monkeypatch):
+    db = FakeSupabase()
+    monkeypatch.setattr(scan_runtime, "get_db", lambda: db)
+
+    await scan_runtime.piggyback_clv(
+        [_side(-110, -120), _side(-140, None, sportsbook="Underdog", surface="player_props")],
+        source="manual_scan",
+    )
+
+    assert sorted(row["sportsbook"] for row in db.rows("line_history")) == ["DraftKings", "Pinnacle"]
@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from services.live_game_state import LiveStateCache
+
+
+@pytest.mark.asyncio
+async def test_live_state_cache_joins_inflight_refresh_and_serves_from_memory():
+    cache: LiveStateCache[int] = LiveStateCache("test.join")
+    loads: list[str] = []
+
+    async def _load() -> int:
+        loads.append("x")
+        await asyncio.sleep(0)
+        return 7
+
+    results = await asyncio.gather(*(cache.get("game-1", _load) for _ in range(4)))
+    again = await cache.get("game-1", _load)
+
+    assert loads == ["x"]
+    assert [value for value, _ in results] == [7, 7, 7, 7]
+    assert sorted(from_memory for _, from_memory in results) == [False, True, True, True]
+    assert again == (7, True)
+    assert (cache.stats.refreshes, cache.stats.joined, cache.stats.hits) == (1, 3, 1)
+
+
+@pytest.mark.asyncio
+async def test_live_state_cache_does_not_store_failed_refresh(monkeypatch):
+    cache: LiveStateCache[int] = LiveStateCache("test.failure")
+    attempts: list[int] = []
+
+    async def _load() -> int:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("provider down")
+        return 3
+
+    with pytest.raises(RuntimeError):
+        await cache.get("game-1", _load)
+
+    assert await cache.get("game-1", _load) == (3, False)
+
+    monkeypatch.setenv("LIVE_GAME_STATE_REFRESH_SECONDS", "0")
+    cache.clear()
+    await cache.get("game-1", _load)
+    await cache.get("game-1", _load)
+    assert len(attempts) == 4
@@ -1,5 +1,6 @@
 from services.model_calibration import (
     get_model_calibration_summary,
+    rebuild_model_calibration_rollups,
     update_scan_opportunity_model_evaluations_close_snapshot,
 )
 
@@ -18,6 +19,7 @@ class _Query:
         self._filters = list(filters or [])
         self._order_by: list[tuple[str, bool]] = []
         self._range: tuple[int, int] | None = None
+        self._limit: int | None = None
 
     def select(self, _fields):
         return self
@@ -30,10 +32,34 @@ class _Query:
         self._range = (int(start), int(end))
         return self
 
+    def limit(self, count):
+        self._limit = int(count)
+        return self
+
     def eq(self, key, value):
         self._filters.append(lambda row: row.get(key) == value)
         return self
 
+    def neq(self, key, value):
+        self._filters.append(lambda row: row.get(key) != value)
+        return self
+
+    def in_(self, key, values):
+        allowed = set(values)
+        self._filters.append(lambda row: row.get(key) in allowed)
+        return self
+
+    def delete(self):
+        return _Query(self._db, self._table_name, mode="delete", filters=self._filters)
+
+    def upsert(self, payload, on_conflict=None):
+        return _Query(
+            self._db,
+            self._table_name,
+            mode="upsert",
+            payload={"rows": payload, "on_conflict": on_conflict},
+        )
+
     def update(self, payload):
         return _Query(
             self._db,
@@ -45,11 +71,28 @@ class _Query:
 
     def execute(self):
         rows = self._db.tables[self._table_name]
+        if self._mode == "upsert":
+            conflict_keys = self._payload["on_conflict"].split(",")
+            for incoming in self._payload["rows"]:
+                existing = next(
+                    (row for row in rows if all(row.get(key) == incoming.get(key) for key in conflict_keys)),
+                    None,
+                )
+                if existing is None:
+                    rows.append(dict(incoming))
+                else:
+                    existing.update(incoming)
+            return _Resp([])
+        if self._mode == "delete":
+            rows[:] = [row for row in rows if not all(predicate(row) for predicate in self._filters)]
+            return _Resp([])
         matched = [row for row in rows if all(predicate(row) for predicate in self._filters)]
         if self._mode == "select":
             for key, desc in reversed(self._order_by):
                 matched.sort(key=lambda row: row.get(key), reverse=desc)
-            if self._range is None:
+            if self._limit is not None:
+                matched = matched[: self._limit]
+            elif self._range is None:
                 matched = matched[:1000]
             else:
                 start, end = self._range
@@ -66,12 +109,63 @@ class _DB:
             "scan_opportunity_model_evaluations": list(rows or []),
             "player_prop_model_candidate_observations": list(candidate_rows or []),
             "player_prop_model_weights": list(weight_rows or []),
+            "scan_opportunity_model_calibration_rollups": [],
         }
 
     def table(self, name):
         assert name in self.tables
         return _Query(self, name)
 
+    def rpc(self, function_name, params):
+        return _Rpc(self, function_name, params["p_rows"])
+
+
+_ROLLUP_MAX_METRICS = {"true_prob_delta_abs_max", "ev_delta_abs_max"}
+
+
+class _Rpc:
+    """Python stand-ins for the migration 029 rollup functions."""
+
+    def __init__(self, db, function_name, rows):
+        self._db = db
+        self._function_name = function_name
+        self._rows = rows
+
+    def execute(self):
+        table = self._db.tables["scan_opportunity_model_calibration_rollups"]
+        if self._function_name == "replace_model_calibration_rollups":
+            table[:] = [dict(row) for row in self._rows]
+            return _Resp(len(self._rows))
+        assert self._function_name == "increment_model_calibration_rollups"
+        self._db.rpc_calls = getattr(self._db, "rpc_calls", 0) + 1
+        for incoming in self._rows:
+            key = (incoming["cohort_key"], incoming["dimension"], incoming["dimension_key"])
+            existing = next((row for row in table if (row["cohort_key"], row["dimension"], row["dimension_key"]) == key), None)
+            if existing is None:
+                table.append(dict(incoming))
+                continue
+            current = existing["metrics"]
+            existing["metrics"] = {
+                name: (
+                    max(current.get(name, 0), incoming["metrics"].get(name, 0))
+                    if name in _ROLLUP_MAX_METRICS
+                    else current.get(name, 0) + incoming["metrics"].get(name, 0)
+                )
+                for name in {*current, *incoming["metrics"]}
+            }
+        return _Resp([{"bucket_count": len(self._rows)}])
+
+
+class _MissingRpcError(Exception):
+    code = "PGRST202"
+
+
+class _NoRpcDB(_DB):
+    """Database before migration 029: the rollup functions are not deployed."""
+
+    def rpc(self, function_name, params):
+        raise _MissingRpcError(f"Could not find the function public.{function_name}")
+
 
 def test_update_scan_opportunity_model_evaluations_close_snapshot_populates_paired_close_metrics():
     db = _DB(
@@ -536,3 +630,159 @@ def test_get_model_calibration_summary_reports_shadow_candidate_overlap_and_weig
     assert shadow.weight_status.override_count == 2
     assert shadow.weight_status.markets_covered == 2
     assert shadow.weight_status.default_only is False
+
+
+def _pending_evaluation_row(eval_id, opportunity_key, model_key, *, true_prob, ev_percentage, interpolation_mode="exact"):
+    return {
+        "id": eval_id,
+        "opportunity_key": opportunity_key,
+        "model_key": model_key,
+        "capture_role": "live" if model_key == "props_v1_live" else "shadow",
+        "surface": "player_props",
+        "sport": "basketball_nba",
+        "event": "Nuggets @ Suns",
+        "sportsbook": "FanDuel",
+        "market": "player_points",
+        "player_name": "Nikola Jokic",
+        "selection_side": "over",
+        "line_value": 24.5,
+        "first_seen_at": "2026-03-30T12:00:00Z",
+        "first_true_prob": true_prob,
+        "last_true_prob": true_prob,
+        "first_book_odds": 105,
+        "last_book_odds": 105,
+        "first_ev_percentage": ev_percentage,
+        "first_interpolation_mode": interpolation_mode,
+        "close_true_prob": None,
+        "close_quality": None,
+        "close_captured_at": None,
+        "first_clv_ev_percent": None,
+        "first_beat_close": None,
+        "first_brier_score": None,
+        "first_log_loss": None,
+    }
+
+
+def _summary_without_recent(summary):
+    dumped = summary.model_dump()
+    dumped.pop("recent_comparisons")
+    return dumped
+
+
+def test_close_snapshot_updates_rollups_incrementally_and_idempotently():
+    db = _DB(
+        rows=[
+            _pending_evaluation_row("eval-1", "opp-1", "props_v1_live", true_prob=0.52, ev_percentage=6.2),
+            _pending_evaluation_row(
+                "eval-2", "opp-1", "props_v2_shadow", true_prob=0.53, ev_percentage=7.0, interpolation_mode="mixed"
+            ),
+            _pending_evaluation_row("eval-3", "opp-2", "props_v1_live", true_prob=0.48, ev_percentage=1.1),
+        ]
+    )
+    assert rebuild_model_calibration_rollups(db) > 0
+    pending_summary = get_model_calibration_summary(db)
+    assert pending_summary.captured_count == 3
+    assert pending_summary.valid_close_count == 0
+
+    for close_odds in (-110, -112):
+        update_scan_opportunity_model_evaluations_close_snapshot(
+            db,
+            opportunity_key="opp-1",
+            close_reference_odds=close_odds,
+            close_opposing_reference_odds=-108,
+            close_captured_at="2026-03-30T18:40:00Z",
+        )
+
+    incremental = get_model_calibration_summary(db)
+    assert incremental.captured_count == 3
+    assert incremental.valid_close_count == 2
+    assert incremental.paired_close_count == 1
+    assert incremental.paired_close_pct == 100.0
+    assert all(item.paired_close_count == 1 for item in incremental.by_model)
+
+    rebuild_model_calibration_rollups(db)
+    rebuilt = get_model_calibration_summary(db)
+    assert _summary_without_recent(incremental) == _summary_without_recent(rebuilt)
+
+
+def test_rollup_summary_matches_raw_row_summary():
+    rows = [
+        _pending_evaluation_row(f"eval-{idx}", f"opp-{idx // 2}", model, true_prob=prob, ev_percentage=ev)
+        for idx, (model, prob, ev) in enumerate(
+            [
+                ("props_v1_live", 0.52, 6.2),
+                ("props_v2_shadow", 0.55, 7.1),
+                ("props_v1_live", 0.47, 2.0),
+                ("props_v2_shadow", 0.47, 2.0),
+            ]
+        )
+    ]
+    raw_db = _DB(rows=[dict(row) for row in rows])
+    rollup_db = _DB(rows=[dict(row) for row in rows])
+    for db in (raw_db, rollup_db):
+        for opportunity_key in ("opp-0", "opp-1"):
+            update_scan_opportunity_model_evaluations_close_snapshot(
+                db,
+                opportunity_key=opportunity_key,
+                close_reference_odds=-115,
+                close_opposing_reference_odds=-105,
+                close_captured_at="2026-03-30T18:40:00Z",
+            )
+    raw_db.tables["scan_opportunity_model_calibration_rollups"] = []
+    rebuild_model_calibration_rollups(rollup_db)
+
+    raw_summary = get_model_calibration_summary(raw_db)
+    rollup_summary = get_model_calibration_summary(rollup_db)
+
+    assert rollup_db.tables["scan_opportunity_model_calibration_rollups"]
+    assert raw_summary.model_dump() == rollup_summary.model_dump()
+    assert rollup_summary.release_gate.identical_true_prob_count == 1
+
+
+def test_unseeded_rollups_are_ignored_until_a_rebuild_writes_the_marker():
+    rows = [
+        _pending_evaluation_row("eval-1", "opp-1", "props_v1_live", true_prob=0.52, ev_percentage=6.2),
+        _pending_evaluation_row("eval-2", "opp-2", "props_v1_live", true_prob=0.48, ev_percentage=1.1),
+    ]
+    db = _DB(rows=[dict(row) for row in rows])
+
+    # The first close snapshot after migration 025 writes a delta for opp-1 only.
+    update_scan_opportunity_model_evaluations_close_snapshot(
+        db,
+        opportunity_key="opp-1",
+        close_reference_odds=-110,
+        close_opposing_reference_odds=-108,
+        close_captured_at="2026-03-30T18:40:00Z",
+    )
+    assert db.rpc_calls == 1
+    assert get_model_calibration_summary(db).captured_count == 2
+
+    rebuild_model_calibration_rollups(db)
+    assert ("__meta__", "seeded", "rebuild") in {
+        (row["cohort_key"], row["dimension"], row["dimension_key"])
+        for row in db.tables["scan_opportunity_model_calibration_rollups"]
+    }
+    assert get_model_calibration_summary(db).captured_count == 2
+
+
+def test_rollups_fall_back_to_table_writes_without_the_rollup_functions():
+    rows = [
+        _pending_evaluation_row("eval-1", "opp-1", "props_v1_live", true_prob=0.52, ev_percentage=6.2),
+        _pending_evaluation_row("eval-2", "opp-1", "props_v2_shadow", true_prob=0.53, ev_percentage=7.0),
+    ]
+    rpc_db = _DB(rows=[dict(row) for row in rows])
+    table_db = _NoRpcDB(rows=[dict(row) for row in rows])
+    for db in (rpc_db, table_db):
+        rebuild_model_calibration_rollups(db)
+        update_scan_opportunity_model_evaluations_close_snapshot(
+            db,
+            opportunity_key="opp-1",
+            close_reference_odds=-115,
+            close_opposing_reference_odds=-105,
+            close_captured_at="2026-03-30T18:40:00Z",
+        )
+
+    assert _summary_without_recent(get_model_calibration_summary(table_db)) == _summary_without_recent(
+        get_model_calibration_summary(rpc_db)
+    )
+    assert get_model_calibration_summary(table_db).valid_close_count == 2
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from services import odds_api_budget
+from services.odds_api_budget import (
+    OddsApiBudgetExceeded,
+    get_odds_api_budget_snapshot,
+    job_class_for_source,
+    reserve_odds_api_credits,
+    settle_odds_api_credits,
+)
+
+
+def _observe_remaining(remaining: int, *, used: int = 1, cost_key: str = "seed") -> None:
+    reservation = reserve_odds_api_credits(source="clv_daily", cost_key=cost_key, default_cost=0)
+    settle_odds_api_credits(reservation, {"x-requests-remaining": str(remaining), "x-requests-last": str(used)})
+
+
+def test_job_class_for_source_maps_known_callers():
+    assert job_class_for_source("jit_clv_props") == "close_capture"
+    assert job_class_for_source("auto_settle_props") == "settlement"
+    assert job_class_for_source("scheduled_board_drop") == "board_drop"
+    assert job_class_for_source("manual_refresh") == "manual_scan"
+    assert job_class_for_source("ops_trigger") == "board_drop"
+    assert job_class_for_source("cron_scan") == "board_drop"
+    assert job_class_for_source("unknown") == "manual_scan"
+    assert job_class_for_source("ops") == "ops_lookup"
+    assert job_class_for_source("some_new_job") == "manual_scan"
+
+
+def test_low_priority_jobs_refused_below_floor_while_close_capture_proceeds(monkeypatch):
+    monkeypatch.setenv("ODDS_API_CREDIT_FLOORS", "manual_scan=500,board_drop=100")
+    _observe_remaining(520)
+
+    with pytest.raises(OddsApiBudgetExceeded) as excinfo:
+        reserve_odds_api_credits(source="manual_scan", cost_key="odds:h2h:us,us2", default_cost=30)
+    assert excinfo.value.job == "manual_scan"
+
+    board = reserve_odds_api_credits(source="scheduled_board_drop", cost_key="odds:h2h:us,us2", default_cost=30)
+    # In-flight reservations count against what later callers may spend.
+    assert get_odds_api_budget_snapshot()["reserved"] == 30
+    with pytest.raises(OddsApiBudgetExceeded):
+        reserve_odds_api_credits(source="manual_refresh", cost_key="odds:h2h:us,us2", default_cost=1)
+
+    close = reserve_odds_api_credits(source="jit_clv", cost_key="odds:h2h:us,us2", default_cost=600)
+    settle_odds_api_credits(board, None)
+    settle_odds_api_credits(close, None)
+    assert get_odds_api_budget_snapshot()["reserved"] == 0
+
+
+def test_leaked_reservation_expires_even_while_other_reservations_keep_arriving(monkeypatch):
+    clock = [1_000_000.0]
+    monkeypatch.setattr(odds_api_budget, "_RESERVED_TTL_SECONDS", 60)
+    monkeypatch.setattr("services.shared_state.time.time", lambda: clock[0])
+
+    reserve_odds_api_credits(source="scheduled_board_drop", cost_key="odds:h2h:us", default_cost=40)  # never settled
+    for _ in range(3):
+        clock[0] += 30
+        settle_odds_api_credits(
+            reserve_odds_api_credits(source="scheduled_board_drop", cost_key="odds:h2h:us", default_cost=5),
+            None,
+        )
+
+    assert odds_api_budget.reserved_credits() == 0
+
+
+def test_settle_learns_cost_and_month_spend_from_response_headers(monkeypatch):
+    monkeypatch.setenv("ODDS_API_JOB_BUDGETS", "ops_lookup=10")
+
+    reservation = reserve_odds_api_credits(source="ops", cost_key="odds:spreads,totals:us", default_cost=2)
+    settle_odds_api_credits(reservation, {"x-requests-remaining": "9000", "x-requests-last": "8"})
+
+    assert odds_api_budget.estimate_cost("odds:spreads,totals:us", 2) == 8
+    snapshot = get_odds_api_budget_snapshot()
+    assert snapshot["remaining"] == 9000
+    assert snapshot["spent_this_month"]["ops_lookup"] == 8
+    with pytest.raises(OddsApiBudgetExceeded) as excinfo:
+        reserve_odds_api_credits(source="ops", cost_key="odds:spreads,totals:us", default_cost=2)
+    assert "budget" in excinfo.value.reason
+
+
+def test_running_hot_degrades_manual_scans_only(monkeypatch):
+    monkeypatch.setenv("ODDS_API_MONTHLY_CREDITS", "1000000000")
+    monkeypatch.setenv("ODDS_API_CREDIT_FLOORS", "manual_scan=0,board_drop=0")
+    _observe_remaining(5000)
+
+    assert get_odds_api_budget_snapshot()["running_hot"] is True
+    with pytest.raises(OddsApiBudgetExceeded):
+        reserve_odds_api_credits(source="manual_scan", cost_key="odds:h2h:us", default_cost=1)
+    reserve_odds_api_credits(source="scheduled_board_drop", cost_key="odds:h2h:us", default_cost=1)
+
+
+@pytest.mark.asyncio
+async def test_request_slots_admit_higher_priority_waiters_first(monkeypatch):
+    monkeypatch.setenv("ODDS_API_MAX_CONCURRENCY", "1")
+    monkeypatch.setattr(odds_api_budget, "_GATE", odds_api_budget._PriorityGate())
+    order: list[str] = []
+    release_first = asyncio.Event()
+
+    async def _call(source: str, hold: asyncio.Event | None = None) -> None:
+        reservation = reserve_odds_api_credits(source=source, cost_key="events", default_cost=0)
+        async with odds_api_budget.odds_api_request_slot(reservation):
+            order.append(source)
+            if hold is not None:
+                await hold.wait()
+
+    first = asyncio.create_task(_call("ops", release_first))
+    await asyncio.sleep(0)
+    waiters = [asyncio.create_task(_call(source)) for source in ("manual_scan", "ops_trigger", "clv_daily")]
+    await asyncio.sleep(0)
+    release_first.set()
+    await asyncio.gather(first, *waiters)
+
+    assert order == ["ops", "clv_daily", "ops_trigger", "manual_scan"]
@@ -81,4 +81,53 @@ async def test_get_cached_or_scan_uses_warm_cache_for_non_bypass_source(monkeypa
     result = await mod.get_cached_or_scan(sport, source="ops_snapshot")
 
     assert result["cache_hit"] is True
-    assert result["sides"] == cached_payload["sides"]
\ No newline at end of file
+    assert result["sides"] == cached_payload["sides"]
+
+@pytest.mark.asyncio
+async def test_scan_for_ev_projects_cached_h2h_sides_without_a_second_scan(monkeypatch):
+    mod = _reload_odds_api()
+    sport = "basketball_nba"
+    scan_calls = []
+
+    def _side(team: str, market_key: str, ev_percentage: float) -> dict:
+        return {
+            "market_key": market_key,
+            "sportsbook": "DraftKings",
+            "sport": sport,
+            "event": "Lakers @ Warriors",
+            "commence_time": "2026-03-20T18:00:00Z",
+            "team": team,
+            "pinnacle_odds": 105,
+            "book_odds": 115,
+            "true_prob": 0.51,
+            "base_kelly_fraction": 0.02,
+            "ev_percentage": ev_percentage,
+            "book_decimal": 2.15,
+        }
+
+    async def _fake_scan(scan_sport: str, source: str = "unknown"):
+        scan_calls.append((scan_sport, source))
+        return {
+            "sides": [
+                _side("Lakers", "h2h", 1.5),
+                _side("Warriors", "h2h", -3.0),
+                _side("Lakers -1.5", "spreads", 4.0),
+                _side("Warriors ML", "h2h", 2.5),
+            ],
+            "events_fetched": 1,
+            "events_with_both_books": 1,
+            "api_requests_remaining": "97",
+        }
+
+    monkeypatch.setattr(mod, "get_scan_cache", lambda _sport: None, raising=True)
+    monkeypatch.setattr(mod, "set_scan_cache", lambda *_args: None, raising=True)
+    monkeypatch.setattr(mod, "scan_all_sides", _fake_scan, raising=True)
+
+    first = await mod.scan_for_ev(sport)
+    second = await mod.scan_for_ev(sport)
+
+    assert scan_calls == [(sport, "scan_for_ev")]
+    assert first == second
+    assert [bet["team"] for bet in first["opportunities"]] == ["Warriors ML", "Lakers"]
+    assert "market_key" not in first["opportunities"][0]
+    assert first["api_requests_remaining"] == "97"
@@ -2,6 +2,7 @@ import asyncio
 import types
 from datetime import datetime, timezone
 
+from services.clv_tracking import ReferenceIndex
 from services.pickem_research import (
     _pickem_auto_settle_candidate,
     capture_pickem_research_observations,
@@ -89,17 +90,57 @@ class _Query:
         return _Resp(inserted)
 
 
+class _MissingFunctionError(Exception):
+    def __init__(self, name):
+        super().__init__(f"Could not find the function public.{name}(p_rows) in the schema cache")
+        self.code = "PGRST202"
+
+
+class _RpcCall:
+    def __init__(self, result):
+        self._result = result
+
+    def execute(self):
+        return _Resp(self._result)
+
+
 class _DB:
-    def __init__(self, rows=None):
+    def __init__(self, rows=None, *, merge_functions=False):
         self.tables = {
             "pickem_research_observations": list(rows or []),
         }
         self._next_id = len(self.tables["pickem_research_observations"]) + 1
+        self.merge_functions = merge_functions
+        self.rpc_calls: list[tuple[str, int]] = []
+        self.table_calls = 0
 
     def table(self, name):
         assert name == "pickem_research_observations"
+        self.table_calls += 1
         return _Query(self, name)
 
+    def rpc(self, name, params):
+        if not self.merge_functions:
+            raise _MissingFunctionError(name)
+        assert name == "merge_pickem_research_observations"
+        rows = params["p_rows"]
+        self.rpc_calls.append((name, len(rows)))
+        table = self.tables["pickem_research_observations"]
+        inserted = updated = 0
+        for incoming in rows:
+            existing = next((row for row in table if row["observation_key"] == incoming["observation_key"]), None)
+            if existing is None:
+                table.append({**incoming, "id": f"obs-{self._next_id}", "surfaced_count": 1})
+                self._next_id += 1
+                inserted += 1
+                continue
+            for key, value in incoming.items():
+                if key.startswith("last_") or key == "ev_basis":
+                    existing[key] = value
+            existing["surfaced_count"] += 1
+            updated += 1
+        return _RpcCall([{"inserted_count": inserted, "updated_count": updated}])
+
 
 def _card(
     *,
@@ -220,6 +261,43 @@ def test_capture_pickem_research_observations_chunks_large_key_batches():
     assert len(db.tables["pickem_research_observations"]) == 205
 
 
+def test_capture_pickem_research_observations_merges_in_chunked_rpc_calls():
+    db = _DB(merge_functions=True)
+    cards = [
+        _card(
+            comparison_key=f"evt-{idx}|nikola-jokic|player_points|24.5",
+            event_id=f"evt-{idx}",
+        )
+        for idx in range(600)
+    ]
+
+    first = capture_pickem_research_observations(
+        db,
+        cards=cards,
+        source="cron_board_drop",
+        captured_at="2026-04-01T15:30:00Z",
+    )
+    second = capture_pickem_research_observations(
+        db,
+        cards=cards[:3] + [cards[0]],
+        source="ops_trigger_board_drop",
+        captured_at="2026-04-01T15:35:00Z",
+    )
+
+    assert first == {"eligible_seen": 600, "inserted": 600, "updated": 0}
+    assert second == {"eligible_seen": 3, "inserted": 0, "updated": 3}
+    assert db.rpc_calls == [
+        ("merge_pickem_research_observations", 500),
+        ("merge_pickem_research_observations", 100),
+        ("merge_pickem_research_observations", 3),
+    ]
+    assert db.table_calls == 0
+    row = next(row for row in db.tables["pickem_research_observations"] if row["event_id"] == "evt-0")
+    assert row["surfaced_count"] == 2
+    assert row["first_source"] == "cron_board_drop"
+    assert row["last_source"] == "ops_trigger_board_drop"
+
+
 def test_update_pickem_research_close_snapshots_populates_latest_and_close_metrics(monkeypatch):
     db = _DB(
         rows=[
@@ -242,12 +320,8 @@ def test_update_pickem_research_close_snapshots_populates_latest_and_close_metri
     )
 
     monkeypatch.setattr(
-        "services.clv_tracking.build_prop_reference_snapshots",
-        lambda _sides: ({"evt-1": {}}, {}),
-    )
-    monkeypatch.setattr(
-        "services.clv_tracking.build_prop_reference_pair_snapshots",
-        lambda _sides: ({"evt-1": {}}, {}),
+        "services.clv_tracking.build_reference_index",
+        lambda _sides: ReferenceIndex(prop_snapshot_by_event={"evt-1": {}}, sports=["basketball_nba"]),
     )
     monkeypatch.setattr(
         "services.clv_tracking.lookup_prop_reference_odds",
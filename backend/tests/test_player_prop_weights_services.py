@@ -0,0 +1,352 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from services.model_calibration import update_scan_opportunity_model_evaluations_close_snapshot
+from services.player_prop_weights import (
+    PLAYER_PROP_WEIGHT_ACCUMULATOR_TABLE,
+    PLAYER_PROP_WEIGHT_SEEDED_MARKER_KEY,
+    apply_player_prop_weight_accumulator_delta,
+    rebuild_player_prop_weight_accumulators,
+    train_player_prop_model_weights,
+)
+
+
+NOW = datetime(2026, 4, 20, 12, 0, tzinfo=timezone.utc)
+
+
+class _Resp:
+    def __init__(self, data):
+        self.data = data
+
+
+class _Query:
+    def __init__(self, db, table_name, *, mode="select", payload=None, filters=None):
+        self._db = db
+        self._table_name = table_name
+        self._mode = mode
+        self._payload = payload or {}
+        self._filters = list(filters or [])
+        self._range: tuple[int, int] | None = None
+
+    def select(self, _fields):
+        return self
+
+    def order(self, _key, desc=False):
+        return self
+
+    def range(self, start, end):
+        self._range = (int(start), int(end))
+        return self
+
+    def limit(self, count):
+        self._range = (0, int(count) - 1)
+        return self
+
+    def eq(self, key, value):
+        self._filters.append(lambda row: row.get(key) == value)
+        return self
+
+    def neq(self, key, value):
+        self._filters.append(lambda row: row.get(key) != value)
+        return self
+
+    def gte(self, key, value):
+        self._db.filter_calls.append((self._table_name, "gte", key))
+        self._filters.append(lambda row: row.get(key) is not None and str(row.get(key)) >= str(value))
+        return self
+
+    def in_(self, key, values):
+        self._db.filter_calls.append((self._table_name, "in", key))
+        allowed = set(values)
+        self._filters.append(lambda row: row.get(key) in allowed)
+        return self
+
+    def delete(self):
+        return _Query(self._db, self._table_name, mode="delete", filters=self._filters)
+
+    def upsert(self, payload, on_conflict=None):
+        return _Query(
+            self._db,
+            self._table_name,
+            mode="upsert",
+            payload={"rows": payload, "on_conflict": on_conflict},
+        )
+
+    def update(self, payload):
+        return _Query(self._db, self._table_name, mode="update", payload=payload, filters=self._filters)
+
+    def execute(self):
+        if self._table_name in self._db.missing_tables:
+            raise Exception(f"PGRST205 Could not find the table 'public.{self._table_name}' in the schema cache")
+        rows = self._db.tables[self._table_name]
+        if self._mode == "upsert":
+            self._db.writes.append(self._table_name)
+            conflict_keys = self._payload["on_conflict"].split(",")
+            for incoming in self._payload["rows"]:
+                existing = next(
+                    (row for row in rows if all(row.get(key) == incoming.get(key) for key in conflict_keys)),
+                    None,
+                )
+                if existing is None:
+                    rows.append(dict(incoming))
+                else:
+                    existing.update(incoming)
+            return _Resp([])
+        if self._mode == "delete":
+            rows[:] = [row for row in rows if not all(predicate(row) for predicate in self._filters)]
+            return _Resp([])
+        matched = [row for row in rows if all(predicate(row) for predicate in self._filters)]
+        if self._mode == "select":
+            if self._range is not None:
+                start, end = self._range
+                matched = matched[start:end + 1]
+            return _Resp([dict(row) for row in matched])
+        for row in matched:
+            row.update(self._payload)
+        return _Resp([])
+
+
+class _DB:
+    def __init__(self, rows=None, weight_rows=None, missing_tables=None):
+        self.tables = {
+            "scan_opportunity_model_evaluations": list(rows or []),
+            "player_prop_model_weights": list(weight_rows or []),
+            "player_prop_model_candidate_observations": [],
+            "scan_opportunity_model_calibration_rollups": [],
+            PLAYER_PROP_WEIGHT_ACCUMULATOR_TABLE: [],
+        }
+        self.missing_tables = set(missing_tables or [])
+        self.filter_calls: list[tuple[str, str, str]] = []
+        self.writes: list[str] = []
+        self.rpc_calls = 0
+
+    def table(self, name):
+        assert name in self.tables
+        return _Query(self, name)
+
+    def rpc(self, function_name, params):
+        if function_name not in _WEIGHT_ACCUMULATOR_FUNCTIONS:
+            raise _MissingRpcError(f"Could not find the function public.{function_name}")
+        return _Rpc(self, function_name, params)
+
+
+_WEIGHT_ACCUMULATOR_FUNCTIONS = {
+    "increment_player_prop_weight_accumulators",
+    "replace_player_prop_weight_accumulators",
+}
+_ACCUMULATOR_KEY_FIELDS = ("model_family", "market_key", "sportsbook_key", "close_date")
+
+
+class _Rpc:
+    """Python stand-ins for the migration 030 accumulator functions."""
+
+    def __init__(self, db, function_name, params):
+        self._db = db
+        self._function_name = function_name
+        self._params = params
+
+    def execute(self):
+        table = self._db.tables[PLAYER_PROP_WEIGHT_ACCUMULATOR_TABLE]
+        if self._function_name == "replace_player_prop_weight_accumulators":
+            family = self._params["p_model_family"]
+            table[:] = [row for row in table if row["model_family"] != family]
+            table.extend({**row, "model_family": family} for row in self._params["p_rows"])
+            return _Resp(len(self._params["p_rows"]))
+        self._db.rpc_calls += 1
+        for incoming in self._params["p_rows"]:
+            key = tuple(incoming[field] for field in _ACCUMULATOR_KEY_FIELDS)
+            existing = next(
+                (row for row in table if tuple(row[field] for field in _ACCUMULATOR_KEY_FIELDS) == key),
+                None,
+            )
+            if existing is None:
+                existing = {**incoming, "error_weight_sum": 0.0, "weight_sum": 0.0, "sample_count": 0}
+                table.append(existing)
+            for field in ("error_weight_sum", "weight_sum", "sample_count"):
+                existing[field] = max(0, existing[field] + incoming[field])
+        return _Resp([{"bucket_count": len(self._params["p_rows"])}])
+
+
+class _MissingRpcError(Exception):
+    code = "PGRST202"
+
+
+class _NoRpcDB(_DB):
+    """Database before migration 030: the accumulator functions are not deployed."""
+
+    def rpc(self, function_name, params):
+        raise _MissingRpcError(f"Could not find the function public.{function_name}")
+
+
+def _eval_row(row_id, *, book, error, hours_ago, market="player_points", model_key="props_v2_live"):
+    return {
+        "id": row_id,
+        "model_key": model_key,
+        "market": market,
+        "sportsbook_key": book,
+        "first_true_prob": 0.5 + error,
+        "close_true_prob": 0.5,
+        "close_captured_at": (NOW - timedelta(hours=hours_ago)).isoformat().replace("+00:00", "Z"),
+    }
+
+
+def _training_rows():
+    rows = []
+    for index in range(30):
+        rows.append(_eval_row(f"dk-{index}", book="draftkings", error=0.02, hours_ago=3 + index * 7))
+        rows.append(_eval_row(f"fd-{index}", book="fanduel", error=0.04, hours_ago=5 + index * 11))
+    rows.append(_eval_row("stale", book="draftkings", error=0.4, hours_ago=24 * 45))
+    rows.append(_eval_row("v1", book="draftkings", error=0.4, hours_ago=2, model_key="props_v1_live"))
+    return rows
+
+
+@pytest.fixture(autouse=True)
+def _weight_env(monkeypatch):
+    monkeypatch.setenv("PLAYER_PROP_WEIGHT_LOOKBACK_DAYS", "30")
+    monkeypatch.setenv("PLAYER_PROP_WEIGHT_MIN_SAMPLES", "25")
+
+
+def _weights_by_book(db):
+    return {row["sportsbook_key"]: row for row in db.tables["player_prop_model_weights"]}
+
+
+def test_train_player_prop_model_weights_pushes_window_filters_when_accumulators_are_empty():
+    db = _DB(rows=_training_rows())
+
+    result = train_player_prop_model_weights(db, now=NOW)
+
+    assert result["ok"] is True
+    assert result["training_source"] == "evaluations"
+    assert result["source_rows"] == 60
+    assert ("scan_opportunity_model_evaluations", "in", "model_key") in db.filter_calls
+    assert ("scan_opportunity_model_evaluations", "gte", "close_captured_at") in db.filter_calls
+    weights = _weights_by_book(db)
+    assert weights["draftkings"]["weighted_mae"] == pytest.approx(0.02, abs=1e-6)
+    assert weights["fanduel"]["weighted_mae"] == pytest.approx(0.04, abs=1e-6)
+    assert weights["draftkings"]["weight"] == pytest.approx(4 / 3, abs=1e-4)
+    assert weights["fanduel"]["weight"] == pytest.approx(2 / 3, abs=1e-4)
+
+
+@pytest.mark.parametrize("db_class", [_DB, _NoRpcDB])
+def test_accumulators_updated_per_close_match_a_full_windowed_retrain(db_class):
+    rows = _training_rows()
+    raw_db = _DB(rows=rows)
+    train_player_prop_model_weights(raw_db, now=NOW)
+
+    incremental_db = db_class(rows=[])
+    # Seed against an empty evaluations table so every bucket below comes from a delta.
+    assert rebuild_player_prop_weight_accumulators(incremental_db, now=NOW) == 0
+    incremental_db.tables["scan_opportunity_model_evaluations"] = list(rows)
+    for row in rows:
+        apply_player_prop_weight_accumulator_delta(incremental_db, before_rows=[], after_rows=[row])
+    # A re-captured close must retract the row's previous contribution.
+    revised = {**rows[0], "close_true_prob": 0.45}
+    apply_player_prop_weight_accumulator_delta(incremental_db, before_rows=[rows[0]], after_rows=[revised])
+    apply_player_prop_weight_accumulator_delta(incremental_db, before_rows=[revised], after_rows=[rows[0]])
+    incremental_db.filter_calls.clear()
+
+    result = train_player_prop_model_weights(incremental_db, now=NOW)
+
+    assert result["training_source"] == "accumulators"
+    assert result["source_rows"] == 60
+    assert (incremental_db.rpc_calls > 0) is (db_class is _DB)
+    assert not any(call[0] == "scan_opportunity_model_evaluations" for call in incremental_db.filter_calls)
+    raw_weights = _weights_by_book(raw_db)
+    incremental_weights = _weights_by_book(incremental_db)
+    for book in ("draftkings", "fanduel"):
+        assert incremental_weights[book]["weight"] == pytest.approx(raw_weights[book]["weight"], abs=1e-4)
+        assert incremental_weights[book]["weighted_mae"] == pytest.approx(raw_weights[book]["weighted_mae"], abs=1e-6)
+        assert incremental_weights[book]["sample_count"] == raw_weights[book]["sample_count"]
+
+
+def test_unseeded_accumulators_are_ignored_until_a_rebuild_writes_the_marker():
+    rows = _training_rows()
+    db = _DB(rows=rows)
+    # Deltas recorded before any backfill cover only part of the window.
+    apply_player_prop_weight_accumulator_delta(db, before_rows=[], after_rows=rows[:4])
+
+    result = train_player_prop_model_weights(db, now=NOW)
+
+    assert result["training_source"] == "evaluations"
+    assert result["source_rows"] == 60
+
+    assert rebuild_player_prop_weight_accumulators(db, now=NOW) > 0
+    marker = [
+        row
+        for row in db.tables[PLAYER_PROP_WEIGHT_ACCUMULATOR_TABLE]
+        if (row["market_key"], row["sportsbook_key"]) == PLAYER_PROP_WEIGHT_SEEDED_MARKER_KEY
+    ]
+    assert len(marker) == 1
+    assert marker[0]["close_date"] == "2026-04-20"
+
+    result = train_player_prop_model_weights(db, now=NOW)
+
+    assert result["training_source"] == "accumulators"
+    assert result["source_rows"] == 60
+
+
+def test_train_player_prop_model_weights_dry_run_diffs_without_writing():
+    db = _DB(
+        rows=_training_rows(),
+        weight_rows=[
+            {"model_family": "props_v2", "market_key": "player_points", "sportsbook_key": "draftkings", "weight": 1.0},
+        ],
+    )
+    assert rebuild_player_prop_weight_accumulators(db, now=NOW) > 0
+    db.writes.clear()
+
+    result = train_player_prop_model_weights(db, now=NOW, dry_run=True)
+
+    assert result["dry_run"] is True
+    assert db.writes == []
+    assert len(db.tables["player_prop_model_weights"]) == 1
+    diff = {item["sportsbook_key"]: item for item in result["diff"]}
+    assert diff["draftkings"]["status"] == "changed"
+    assert diff["draftkings"]["current_weight"] == 1.0
+    assert diff["draftkings"]["weight_delta"] == pytest.approx(0.3333, abs=1e-4)
+    assert diff["fanduel"]["status"] == "new"
+    assert diff["fanduel"]["current_weight"] is None
+
+
+def test_close_snapshot_merges_into_player_prop_weight_accumulators():
+    db = _DB(
+        rows=[
+            {
+                "id": "eval-1",
+                "opportunity_key": "opp-1",
+                "model_key": "props_v2_live",
+                "market": "player_points",
+                "sportsbook_key": "draftkings",
+                "first_true_prob": 0.52,
+                "last_true_prob": 0.52,
+                "first_book_odds": 105,
+                "last_book_odds": 105,
+            }
+        ]
+    )
+
+    update_scan_opportunity_model_evaluations_close_snapshot(
+        db,
+        opportunity_key="opp-1",
+        close_reference_odds=-112,
+        close_opposing_reference_odds=-108,
+        close_captured_at="2026-04-20T18:40:00Z",
+    )
+
+    buckets = db.tables[PLAYER_PROP_WEIGHT_ACCUMULATOR_TABLE]
+    assert len(buckets) == 1
+    assert buckets[0]["market_key"] == "player_points"
+    assert buckets[0]["sportsbook_key"] == "draftkings"
+    assert buckets[0]["close_date"] == "2026-04-20"
+    assert buckets[0]["sample_count"] == 1
+    assert buckets[0]["weight_sum"] > 1.0
+
+
+def test_train_player_prop_model_weights_reports_missing_evaluations_table():
+    db = _DB(missing_tables={"scan_opportunity_model_evaluations", PLAYER_PROP_WEIGHT_ACCUMULATOR_TABLE})
+
+    result = train_player_prop_model_weights(db, now=NOW)
+
+    assert result["ok"] is False
+    assert result["reason"] == "missing_evaluations_table"
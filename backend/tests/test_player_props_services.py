@@ -31,7 +31,7 @@ from services.player_props import (
     scan_player_props,
     scan_player_props_for_event_ids,
 )
-from services.prizepicks import _normalize_prizepicks_projection
+from services.prizepicks import _normalize_prizepicks_projection, index_prizepicks_board
 
 
 def test_get_player_prop_markets_defaults_to_all_when_env_missing(monkeypatch):
@@ -1165,6 +1165,77 @@ def test_build_prizepicks_comparison_cards_allows_thin_exact_line_support_for_pr
     assert counts == {"matched": 1, "unmatched": 0, "filtered": 0}
 
 
+def test_build_prizepicks_comparison_cards_only_reads_the_events_indexed_projections(monkeypatch):
+    import services.player_props as player_props_module
+
+    def _projection(player_name, team, opponent, line_value):
+        return {
+            "player_name": player_name,
+            "team": team,
+            "opponent": opponent,
+            "market_key": "player_points",
+            "line_value": line_value,
+        }
+
+    board_index = index_prizepicks_board(
+        [
+            _projection("Nikola Jokic", "Denver Nuggets", "Phoenix Suns", 24.5),
+            _projection("Devin Booker", "Phoenix Suns", "Denver Nuggets", 27.5),
+            _projection("Jayson Tatum", "Boston Celtics", "Miami Heat", 26.5),
+        ]
+    )
+    event_payload = {
+        "id": "evt-1",
+        "home_team": "Suns",
+        "away_team": "Nuggets",
+        "commence_time": "2026-03-21T03:00:00Z",
+        "bookmakers": [
+            {
+                "key": "draftkings",
+                "markets": [
+                    {
+                        "key": "player_points",
+                        "outcomes": [
+                            {"name": "Over", "description": "Nikola Jokic (Nuggets)", "point": 24.5, "price": 105},
+                            {"name": "Under", "description": "Nikola Jokic (Nuggets)", "point": 24.5, "price": -125},
+                        ],
+                    }
+                ],
+            },
+        ],
+    }
+    reference_builds: list[str] = []
+    original_builder = player_props_module._build_exact_line_reference_index
+
+    def _tracking_builder(**kwargs):
+        reference_builds.append(kwargs["event_payload"]["id"])
+        return original_builder(**kwargs)
+
+    monkeypatch.setattr(player_props_module, "_build_exact_line_reference_index", _tracking_builder)
+
+    cards, counts = _build_prizepicks_comparison_cards(
+        event_payload=event_payload,
+        target_markets=["player_points"],
+        prizepicks_index=board_index,
+        min_reference_bookmakers=1,
+    )
+    other_cards, other_counts = _build_prizepicks_comparison_cards(
+        event_payload={**event_payload, "id": "evt-2", "home_team": "Lakers", "away_team": "Kings"},
+        target_markets=["player_points"],
+        prizepicks_index=board_index,
+        min_reference_bookmakers=1,
+    )
+
+    assert sorted(board_index) == [
+        ("nba_boston_celtics", "nba_miami_heat"),
+        ("nba_denver_nuggets", "nba_phoenix_suns"),
+    ]
+    assert [card["player_name"] for card in cards] == ["Nikola Jokic"]
+    assert counts == {"matched": 1, "unmatched": 1, "filtered": 0}
+    assert other_cards == [] and other_counts == {"matched": 0, "unmatched": 0, "filtered": 0}
+    assert reference_builds == ["evt-1"]
+
+
 @pytest.mark.asyncio
 async def test_lookup_alt_pitcher_k_exact_line_returns_low_confidence_for_two_books(monkeypatch):
     events_payload = [
@@ -0,0 +1,75 @@
+import pytest
+
+from calculations import american_to_decimal, calculate_clv, calculate_ev, kelly_fraction
+from services.odds_api import calculate_edge, devig_pinnacle
+from services.pricing_kernel import bet_clv, bet_ev, clear_pricing_caches, get_pricing_cache_stats
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pricing_caches():
+    clear_pricing_caches()
+    yield
+    clear_pricing_caches()
+
+
+def test_calculate_edge_matches_uncached_math_and_hits_cache_on_repeat():
+    true_prob = devig_pinnacle(-135.0, 115.0)["team_a"]
+    dec_a, dec_b = american_to_decimal(-135.0), american_to_decimal(115.0)
+    expected_prob = (1 / dec_a) / ((1 / dec_a) + (1 / dec_b))
+    book_decimal = american_to_decimal(-120.0)
+
+    first = calculate_edge(true_prob, -120)
+    first["ev_percentage"] = "mutated by caller"
+    second = calculate_edge(true_prob, -120)
+
+    assert true_prob == pytest.approx(expected_prob, abs=0)
+    assert second == {
+        "ev_percentage": round(((expected_prob * book_decimal) - 1.0) * 100, 2),
+        "book_implied_prob": round(1.0 / book_decimal, 4),
+        "true_prob": round(expected_prob, 4),
+        "book_decimal": round(book_decimal, 4),
+        "base_kelly_fraction": round(kelly_fraction(round(expected_prob, 4), round(book_decimal, 4)), 6),
+    }
+    assert get_pricing_cache_stats()["price_side"] == {"hits": 1, "misses": 1, "size": 1, "max_size": 8192}
+
+
+@pytest.mark.parametrize(
+    "promo_type,boost_percent,winnings_cap,vig,true_prob",
+    [
+        ("bonus_bet", None, None, 0.045, None),
+        ("no_sweat", None, None, None, None),
+        ("boost_50", None, 10.0, 0.03, None),
+        ("boost_custom", 25.0, None, None, None),
+        ("standard", None, None, None, 0.43),
+        ("standard", None, None, 0.05, None),
+    ],
+)
+def test_bet_ev_matches_calculate_ev(promo_type, boost_percent, winnings_cap, vig, true_prob):
+    kwargs = dict(
+        stake=25.0,
+        decimal_odds=american_to_decimal(150),
+        promo_type=promo_type,
+        k_factor=0.78,
+        boost_percent=boost_percent,
+        winnings_cap=winnings_cap,
+        vig=vig,
+        true_prob=true_prob,
+    )
+
+    assert bet_ev(**kwargs) == calculate_ev(**kwargs)
+
+
+def test_bet_ev_caches_price_terms_across_stakes_and_clv_returns_copies():
+    odds = american_to_decimal(150)
+    for stake in (10.0, 25.0, 40.0):
+        assert bet_ev(stake=stake, decimal_odds=odds, promo_type="bonus_bet", k_factor=0.78) == calculate_ev(
+            stake=stake, decimal_odds=odds, promo_type="bonus_bet", k_factor=0.78
+        )
+
+    cached = bet_clv(-105, -120)
+    cached["clv_ev_percent"] = 0
+    assert bet_clv(-105, -120) == calculate_clv(-105, -120)
+    stats = get_pricing_cache_stats()
+    assert stats["bet_price"]["hits"] == 2 and stats["bet_price"]["size"] == 1
+    assert "bet_ev" not in stats
+    assert stats["bet_clv"] == {"hits": 1, "misses": 1, "size": 1, "max_size": 8192}
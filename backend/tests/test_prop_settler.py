@@ -1,18 +1,31 @@
 """Unit tests for prop auto-settle helpers (ESPN / Odds cross-check)."""
 
+import asyncio
+import types
 from datetime import datetime, timezone
+from difflib import SequenceMatcher
 
 from services.espn_scoreboard import build_auto_settle_scoreboard_dates
 from services.prop_settler import (
+    BOXSCORE_FINAL_CACHE_TTL_SECONDS,
+    BOXSCORE_PROVISIONAL_CACHE_TTL_SECONDS,
     MLB_SPORT_KEY,
+    PlayerNameIndex,
     _espn_home_away_matches_odds,
     _espn_resolve_cache_key,
     _build_parlay_provider_prefetch_rows,
+    _match_player_stat_key,
+    _normalize_player_name,
     _scores_align_odds_espn,
     _stat_label_to_key,
+    _strip_generational_suffix,
+    _token_parts,
     build_player_stat_map,
+    create_prop_settle_telemetry,
     grade_prop,
     is_auto_settle_supported_prop_market,
+    prefetch_boxscore_summaries,
+    settle_parlays,
 )
 
 
@@ -185,6 +198,71 @@ def test_grade_prop_ambiguous_initial_last_name_skips():
     assert d["player_match"] == "none"
 
 
+def _linear_match_player_stat_key(norm, raw_name, stat_map):
+    """Reference copy of the original linear-scan matcher."""
+    if norm in stat_map:
+        return stat_map[norm], "exact"
+    ns = _strip_generational_suffix(norm)
+    for k, v in stat_map.items():
+        if _strip_generational_suffix(k) == ns and len(ns) >= 4:
+            return v, "fuzzy"
+    for k, v in stat_map.items():
+        if (k.endswith(norm) or norm.endswith(k)) and len(k) >= 4 and len(norm) >= 4:
+            return v, "fuzzy"
+    parts = _token_parts(raw_name)
+    if len(parts) >= 2 and len(parts[0]) == 1 and len(parts[-1]) >= 4:
+        initial, last = parts[0][0], parts[-1]
+        matches = [k for k in stat_map if k.endswith(last) and len(k) >= len(last) + 1 and k.startswith(initial)]
+        if len(matches) == 1:
+            return stat_map[matches[0]], "fuzzy"
+    candidates = []
+    for k, v in stat_map.items():
+        ks = _strip_generational_suffix(k)
+        r = SequenceMatcher(None, ns, ks).ratio() if ns and ks else 0.0
+        if r >= 0.91 and min(len(ns), len(ks)) >= 6:
+            candidates.append((r, k, v))
+    if len(candidates) == 1:
+        return candidates[0][2], "fuzzy"
+    if len(candidates) > 1:
+        candidates.sort(key=lambda x: -x[0])
+        if candidates[0][0] - candidates[1][0] >= 0.02:
+            return candidates[0][2], "fuzzy"
+    return None, "none"
+
+
+def test_player_name_index_matches_linear_scan_semantics():
+    names = [
+        "robertwilliamsiii", "garytrentjr", "jaylenbrown", "jalenbrunson", "jalenbrown",
+        "shaigilgeousalexander", "karlanthonytowns", "nikolajokic", "jokic", "anthonydavis",
+        "anthonyedwards", "kellyoubrejr", "bojanbogdanovic", "bogdanbogdanovic", "tj", "lukadoncic",
+    ]
+    stat_map = {name: {"PTS": float(i)} for i, name in enumerate(names)}
+    queries = [
+        "Robert Williams", "Gary Trent", "Gary Trent Jr.", "Jaylen Brown", "Jalen Brown", "Jalen Brunson",
+        "Shai Gilgeous-Alexander", "Karl-Anthony Towns", "Nikola Jokic", "N. Jokic", "A. Davis", "A. Edwards",
+        "Anthony Edward", "Kelly Oubre", "B. Bogdanovic", "Bojan Bogdanovich", "Luka Doncic", "Luka Dončić",
+        "Jokic", "TJ", "T.J. Smith", "Doncic", "Lukas Doncic", "Nobody Here", "Jalen Browne",
+    ]
+    index = PlayerNameIndex(stat_map)
+    for raw in queries:
+        norm = _normalize_player_name(raw)
+        expected = _linear_match_player_stat_key(norm, raw, stat_map)
+        assert index.match(norm, raw) == expected, raw
+        assert _match_player_stat_key(norm, raw, stat_map) == expected, raw
+        # Memoized second lookup returns the same row.
+        assert index.match(norm, raw) == expected, raw
+
+
+def test_grade_prop_reuses_prebuilt_name_index():
+    stat_map = {"garytrentjr": {"PTS": 20.0}}
+    index = PlayerNameIndex(stat_map)
+    for line, expected in ((19.5, "win"), (20.5, "loss")):
+        g, d = grade_prop("Gary Trent", "player_points", line, "over", stat_map, name_index=index)
+        assert g == expected
+        assert d["player_match"] == "fuzzy"
+    assert len(index._memo) == 1
+
+
 def test_stat_label_to_key_maps_espn_3pt_column():
     """ESPN NBA summary boxscore uses label '3PT' for three-pointers made-attempted."""
     assert _stat_label_to_key("3PT") == "3PM"
@@ -404,3 +482,133 @@ def test_grade_prop_returns_manual_signal_when_mlb_home_runs_stat_missing():
 
 def test_auto_settle_support_includes_mlb_home_runs():
     assert is_auto_settle_supported_prop_market(MLB_SPORT_KEY, "batter_home_runs") is True
+
+
+def _patch_boxscore_shared_cache(monkeypatch):
+    store = {}
+    monkeypatch.setattr("services.prop_settler.get_json", lambda key: store.get(key))
+    monkeypatch.setattr(
+        "services.prop_settler.set_json",
+        lambda key, value, ttl_seconds: store.__setitem__(key, {**value, "_ttl": ttl_seconds}),
+    )
+    return store
+
+
+def test_prefetch_boxscore_summaries_dedupes_caps_concurrency_and_caches_finals(monkeypatch):
+    store = _patch_boxscore_shared_cache(monkeypatch)
+    calls = []
+    in_flight = {"now": 0, "peak": 0}
+
+    async def _fake_fetch(sport, provider_event_id):
+        calls.append((sport, provider_event_id))
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0)
+        in_flight["now"] -= 1
+        if provider_event_id == "bad":
+            raise RuntimeError("boom")
+        if provider_event_id == "live":
+            return {"header": {"competitions": [{"status": {"type": {"completed": False}}}]}}
+        return {"id": provider_event_id}
+
+    monkeypatch.setattr("services.prop_settler.fetch_boxscore_summary", _fake_fetch)
+    keys = [("basketball_nba", "e1"), ("basketball_nba", "e1"), ("baseball_mlb", "g1"), ("basketball_nba", "live"), ("basketball_nba", "bad")]
+    cache = {}
+    telemetry = create_prop_settle_telemetry()
+
+    failures = asyncio.run(prefetch_boxscore_summaries(keys, cache, telemetry=telemetry, concurrency=2))
+
+    assert sorted(calls) == sorted(set(keys))
+    assert in_flight["peak"] == 2
+    assert list(failures) == [("basketball_nba", "bad")]
+    assert ("basketball_nba", "bad") not in cache
+    assert cache[("basketball_nba", "e1")] == {"id": "e1"}
+    assert store["settle:boxscore:basketball_nba:e1"]["_ttl"] == BOXSCORE_FINAL_CACHE_TTL_SECONDS
+    assert store["settle:boxscore:baseball_mlb:g1"]["_ttl"] == BOXSCORE_FINAL_CACHE_TTL_SECONDS
+    assert store["settle:boxscore:basketball_nba:live"]["_ttl"] == BOXSCORE_PROVISIONAL_CACHE_TTL_SECONDS
+    assert telemetry["props_boxscore_fetched"] == 3
+    assert telemetry["props_boxscore_fetch_failed"] == 1
+
+    # A later run (fresh per-call cache) is served from shared state.
+    calls.clear()
+    second = {}
+    asyncio.run(prefetch_boxscore_summaries([("basketball_nba", "e1")], second, telemetry=telemetry))
+    assert calls == []
+    assert second[("basketball_nba", "e1")] == {"id": "e1"}
+    assert telemetry["props_boxscore_cache_hits"] == 1
+
+
+def test_settle_parlays_fetches_each_boxscore_once_across_parlays(monkeypatch):
+    _patch_boxscore_shared_cache(monkeypatch)
+    updates = []
+
+    class _Table:
+        def update(self, payload):
+            self._payload = payload
+            return self
+
+        def eq(self, _field, value):
+            updates.append((value, self._payload["result"]))
+            return self
+
+        def execute(self):
+            return types.SimpleNamespace(data=[])
+
+    db = types.SimpleNamespace(table=lambda _name: _Table())
+
+    def _prop_leg(leg_id, player, line):
+        return {
+            "id": leg_id,
+            "surface": "player_props",
+            "sport": "basketball_nba",
+            "marketKey": "player_points",
+            "team": "Denver Nuggets",
+            "participantName": player,
+            "selectionSide": "over",
+            "lineValue": line,
+            "commenceTime": "2026-04-01T00:00:00Z",
+        }
+
+    parlays = [
+        {"id": "p1", "selection_meta": {"legs": [_prop_leg("a", "Nikola Jokic", 24.5), _prop_leg("b", "Jamal Murray", 19.5)]}},
+        {"id": "p2", "selection_meta": {"legs": [_prop_leg("c", "Jamal Murray", 25.5)]}},
+    ]
+    fetches = []
+
+    async def _fake_provider_events(*_args, **_kwargs):
+        return {"basketball_nba": []}
+
+    async def _fake_resolve(*_args, **_kwargs):
+        return types.SimpleNamespace(provider_event_id="settle-parlay-401", confidence_tier="matchup_plus_time")
+
+    async def _fake_summary(sport, provider_event_id):
+        fetches.append((sport, provider_event_id))
+        return {"boxscore": True}
+
+    monkeypatch.setattr("services.prop_settler.fetch_boxscore_provider_events_for_rows", _fake_provider_events)
+    monkeypatch.setattr("services.prop_settler.resolve_boxscore_event_id", _fake_resolve)
+    monkeypatch.setattr("services.prop_settler.fetch_boxscore_summary", _fake_summary)
+    monkeypatch.setattr(
+        "services.prop_settler.build_player_stat_map",
+        lambda _summary, sport="basketball_nba": {"nikolajokic": {"PTS": 31.0}, "jamalmurray": {"PTS": 22.0}},
+    )
+    monkeypatch.setattr(
+        "services.odds_api._select_completed_event_for_bet",
+        lambda _bet, _events: ({"home_team": "Denver Nuggets", "away_team": "Phoenix Suns"}, "matched"),
+    )
+
+    settled, skipped = asyncio.run(
+        settle_parlays(
+            db,
+            parlays,
+            {"basketball_nba": []},
+            "2026-04-01T12:00:00Z",
+            now=datetime(2026, 4, 1, 12, tzinfo=timezone.utc),
+            source="test",
+        )
+    )
+
+    assert fetches == [("basketball_nba", "settle-parlay-401")]
+    assert settled == 2
+    assert skipped["ungraded"] == 0
+    assert updates == [("p1", "win"), ("p2", "loss")]
@@ -0,0 +1,227 @@
+import asyncio
+from datetime import datetime, timezone
+
+from services.live_provider_contracts import LiveBetCandidate
+from services.prop_settler import (
+    NBA_SPORT_KEY,
+    fetch_boxscore_provider_events_for_rows,
+    resolve_espn_event_id,
+)
+from services.provider_event_map import (
+    MAPPING_SOURCE_SETTLEMENT,
+    ProviderEventMapping,
+    find_mapped_event,
+    get_provider_event_mapping,
+    remember_live_event_match,
+    remember_provider_event_mapping,
+)
+
+
+def _espn_final_event(event_id, *, home, away, home_score, away_score, date):
+    return {
+        "id": event_id,
+        "date": date,
+        "competitions": [
+            {
+                "status": {"type": {"completed": True}},
+                "competitors": [
+                    {"homeAway": "home", "score": str(home_score), "team": {"displayName": home}},
+                    {"homeAway": "away", "score": str(away_score), "team": {"displayName": away}},
+                ],
+            }
+        ],
+    }
+
+
+def _odds_completed_event(event_id):
+    return {
+        "id": event_id,
+        "home_team": "Denver Nuggets",
+        "away_team": "Phoenix Suns",
+        "scores": [
+            {"name": "Denver Nuggets", "score": "115"},
+            {"name": "Phoenix Suns", "score": "101"},
+        ],
+    }
+
+
+def test_mapping_round_trips_by_odds_id_and_matchup_key():
+    matchup_key = ("denvernuggets", "phoenixsuns", "2026-04-01T00:00:00Z")
+    remember_provider_event_mapping(
+        ProviderEventMapping(sport=NBA_SPORT_KEY, provider="espn", provider_event_id="401", odds_event_id="odds-1", final=True),
+        odds_event_ids=("bet-odds-1",),
+        matchup_key=matchup_key,
+    )
+
+    for ids in (("odds-1",), ("bet-odds-1",), (None, "")):
+        mapping = get_provider_event_mapping(NBA_SPORT_KEY, odds_event_ids=ids, matchup_key=matchup_key)
+        assert mapping is not None and mapping.provider_event_id == "401"
+    assert get_provider_event_mapping("baseball_mlb", odds_event_ids=("odds-1",)) is None
+
+    # A later non-final (live) write does not downgrade the final mapping.
+    remember_provider_event_mapping(
+        ProviderEventMapping(sport=NBA_SPORT_KEY, provider="espn", provider_event_id="999", odds_event_id="odds-1"),
+    )
+    assert get_provider_event_mapping(NBA_SPORT_KEY, odds_event_ids=("odds-1",), require_final=True).provider_event_id == "401"
+
+
+def test_resolve_espn_event_id_writes_mapping_then_skips_the_scoreboard():
+    scoreboard = [
+        _espn_final_event(
+            "401",
+            home="Denver Nuggets",
+            away="Phoenix Suns",
+            home_score=115,
+            away_score=101,
+            date="2026-04-01T00:10Z",
+        )
+    ]
+    first = asyncio.run(
+        resolve_espn_event_id(
+            "Denver Nuggets",
+            "Phoenix Suns",
+            "2026-04-01T00:00:00Z",
+            odds_completed_event=_odds_completed_event("espn:401"),
+            cache={},
+            scoreboard_events=scoreboard,
+            odds_event_ids=("odds-evt-1",),
+        )
+    )
+    assert first.espn_event_id == "401"
+    assert first.confidence_tier == "score_verified"
+
+    # Next run: fresh in-run cache and an empty scoreboard; the durable map answers.
+    second = asyncio.run(
+        resolve_espn_event_id(
+            "Denver Nuggets",
+            "Phoenix Suns",
+            "2026-04-01T00:00:00Z",
+            odds_completed_event=_odds_completed_event("espn:401"),
+            cache={},
+            scoreboard_events=[],
+            odds_event_ids=("odds-evt-1",),
+        )
+    )
+    assert second.espn_event_id == "401"
+    assert second.from_cache is True
+    assert second.confidence_tier == "score_verified"
+
+
+def test_fetch_boxscore_provider_events_skips_rows_with_final_mappings(monkeypatch):
+    fetched_dates = []
+
+    async def _fake_scoreboard(dates):
+        fetched_dates.append(list(dates))
+        return {"events": []}
+
+    monkeypatch.setattr("services.prop_settler.fetch_nba_scoreboard_for_dates", _fake_scoreboard)
+    remember_provider_event_mapping(
+        ProviderEventMapping(
+            sport=NBA_SPORT_KEY,
+            provider="espn",
+            provider_event_id="401",
+            odds_event_id="mapped",
+            final=True,
+            source=MAPPING_SOURCE_SETTLEMENT,
+        ),
+    )
+    now = datetime(2026, 4, 2, tzinfo=timezone.utc)
+    rows = [{"clv_sport_key": NBA_SPORT_KEY, "clv_event_id": "mapped", "commence_time": "2026-04-01T00:00:00Z"}]
+
+    out = asyncio.run(
+        fetch_boxscore_provider_events_for_rows(
+            rows,
+            sport_field="clv_sport_key",
+            event_id_field="clv_event_id",
+            now=now,
+        )
+    )
+
+    assert out == {}
+    assert fetched_dates == []
+
+    rows.append({"clv_sport_key": NBA_SPORT_KEY, "clv_event_id": "unmapped", "commence_time": "2026-04-01T00:00:00Z"})
+    asyncio.run(
+        fetch_boxscore_provider_events_for_rows(rows, sport_field="clv_sport_key", event_id_field="clv_event_id", now=now)
+    )
+    assert len(fetched_dates) == 1
+
+
+class _Event:
+    def __init__(self, provider_event_id, status):
+        self.provider_event_id = provider_event_id
+        self.status = status
+
+
+def _candidate(**overrides):
+    values = {
+        "bet_id": "bet-1",
+        "sport_key": NBA_SPORT_KEY,
+        "event_name": "Phoenix Suns @ Denver Nuggets",
+        "commence_time": "2026-04-01T00:00:00Z",
+        "source_event_id": "odds-live-1",
+        "clv_event_id": None,
+        "away_team": "Phoenix Suns",
+        "home_team": "Denver Nuggets",
+        "market_key": None,
+        "participant_name": None,
+        "participant_id": None,
+        "selection_side": None,
+        "line_value": None,
+    }
+    values.update(overrides)
+    return LiveBetCandidate(**values)
+
+
+def test_live_matches_are_persisted_and_promoted_once_final():
+    candidate = _candidate()
+    remember_live_event_match(candidate, _Event("401", "live"), provider="espn", confidence="matchup_only")
+    assert get_provider_event_mapping(NBA_SPORT_KEY, odds_event_ids=("odds-live-1",)) is None
+
+    remember_live_event_match(candidate, _Event("401", "live"), provider="espn", confidence="matchup_plus_time")
+    events = [_Event("400", "final"), _Event("401", "final")]
+    event, mapping = find_mapped_event(NBA_SPORT_KEY, "espn", odds_event_ids=("odds-live-1",), events=events)
+    assert event is events[1]
+    assert mapping.final is False
+    assert get_provider_event_mapping(NBA_SPORT_KEY, odds_event_ids=("odds-live-1",), require_final=True) is None
+
+    remember_live_event_match(candidate, event, provider="espn", confidence="provider_event_map", mapping=mapping)
+    promoted = get_provider_event_mapping(NBA_SPORT_KEY, odds_event_ids=("odds-live-1",), require_final=True)
+    assert promoted is not None and promoted.provider_event_id == "401"
+
+
+def test_settlement_ignores_live_matches_even_after_they_go_final():
+    candidate = _candidate(source_event_id="odds-evt-1")
+    remember_live_event_match(candidate, _Event("999", "final"), provider="espn", confidence="matchup_plus_time")
+    live = get_provider_event_mapping(NBA_SPORT_KEY, odds_event_ids=("odds-evt-1",), require_final=True)
+    assert live is not None and live.final is True and live.settlement_verified is False
+    assert get_provider_event_mapping(NBA_SPORT_KEY, odds_event_ids=("odds-evt-1",), require_settlement_verified=True) is None
+
+    scoreboard = [
+        _espn_final_event(
+            "401",
+            home="Denver Nuggets",
+            away="Phoenix Suns",
+            home_score=115,
+            away_score=101,
+            date="2026-04-01T00:10Z",
+        )
+    ]
+    resolved = asyncio.run(
+        resolve_espn_event_id(
+            "Denver Nuggets",
+            "Phoenix Suns",
+            "2026-04-01T00:00:00Z",
+            odds_completed_event=_odds_completed_event("espn:401"),
+            cache={},
+            scoreboard_events=scoreboard,
+            odds_event_ids=("odds-evt-1",),
+        )
+    )
+    assert resolved.espn_event_id == "401"
+    assert resolved.from_cache is False
+
+    # The settlement-verified mapping replaces the live one and is not downgraded by later live writes.
+    remember_live_event_match(candidate, _Event("999", "final"), provider="espn", confidence="matchup_plus_time")
+    verified = get_provider_event_mapping(NBA_SPORT_KEY, odds_event_ids=("odds-evt-1",), require_settlement_verified=True)
+    assert verified is not None and verified.provider_event_id == "401"
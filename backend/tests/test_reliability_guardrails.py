@@ -119,7 +119,7 @@ def test_ops_status_uses_memory_fallback_when_db_not_ready():
         check_scheduler_freshness=lambda _expected: (True, {"enabled": False, "fresh": True, "jobs": {}}),
         utc_now_iso=lambda: "2026-04-25T00:00:00Z",
         get_db=_get_db,
-        retry_supabase=lambda fn: fn(),
+        retry_supabase=lambda fn, **_: fn(),
         log_event=lambda *_args, **_kwargs: None,
         get_ops_status=lambda: {"last_readiness_failure": {"db_error": "database timeout"}},
     )
@@ -171,3 +171,202 @@ def test_get_db_allows_dedicated_test_supabase(monkeypatch):
 
     assert db.url == "https://test-project.supabase.co"
     assert created == {"url": "https://test-project.supabase.co", "key": "test-key"}
+
+
+
+def test_get_db_serves_fake_supabase_only_in_development_or_test(monkeypatch):
+    import database
+    from fake_supabase import FakeSupabase
+    from services import ops_runtime
+
+    monkeypatch.setenv("USE_FAKE_SUPABASE", "1")
+    monkeypatch.setenv("FAKE_SUPABASE_LATENCY_MS", "1")
+    monkeypatch.delenv("SUPABASE_URL", raising=False)
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setattr(database, "_supabase", None)
+
+    db = database.get_db()
+
+    assert isinstance(db, FakeSupabase)
+    assert ops_runtime.check_db_ready() == (True, None)
+    assert db.stats()["settings.select"]["calls"] == 1
+
+    for environment in ("production", "staging", ""):
+        monkeypatch.setattr(database, "_supabase", None)
+        monkeypatch.setenv("ENVIRONMENT", environment)
+        with pytest.raises(RuntimeError, match="USE_FAKE_SUPABASE"):
+            database.get_db()
+    monkeypatch.delenv("ENVIRONMENT")
+    with pytest.raises(RuntimeError, match="unset"):
+        database.get_db()
+
+@pytest.fixture
+def _fresh_supabase_circuits(monkeypatch):
+    import services.runtime_support as runtime_support
+
+    runtime_support.reset_supabase_retry_state()
+    monkeypatch.setattr(runtime_support.time, "sleep", lambda _seconds: None)
+    yield runtime_support
+    runtime_support.reset_supabase_retry_state()
+
+
+def test_retry_supabase_opens_circuit_after_consecutive_transient_failures(monkeypatch, _fresh_supabase_circuits):
+    import httpx
+
+    runtime_support = _fresh_supabase_circuits
+    monkeypatch.setenv("SUPABASE_BREAKER_FAILURE_THRESHOLD", "3")
+    monkeypatch.setenv("SUPABASE_BREAKER_COOLDOWN_SECONDS", "60")
+    calls = []
+
+    def _flaky():
+        calls.append(1)
+        raise httpx.ConnectError("connection refused")
+
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            runtime_support.retry_supabase(_flaky, label="bets.select_list")
+    with pytest.raises(runtime_support.SupabaseCircuitOpenError):
+        runtime_support.retry_supabase(_flaky, label="bets.select_list")
+
+    assert len(calls) == 3
+    # Other endpoints keep their own breaker.
+    assert runtime_support.retry_supabase(lambda: "ok", label="settings.select") == "ok"
+    metrics = runtime_support.get_supabase_retry_metrics()
+    assert metrics["open_labels"] == ["bets.select_list"]
+    assert metrics["labels"]["bets.select_list"]["opens"] == 1
+    assert metrics["labels"]["bets.select_list"]["short_circuits"] == 1
+    assert metrics["labels"]["bets.select_list"]["retries"] == 1
+
+
+def test_retry_supabase_half_open_probe_closes_circuit(monkeypatch, _fresh_supabase_circuits):
+    import httpx
+
+    runtime_support = _fresh_supabase_circuits
+    monkeypatch.setenv("SUPABASE_BREAKER_FAILURE_THRESHOLD", "1")
+    monkeypatch.setenv("SUPABASE_BREAKER_COOLDOWN_SECONDS", "0")
+
+    def _down():
+        raise httpx.ReadError("reset")
+
+    with pytest.raises(httpx.ReadError):
+        runtime_support.retry_supabase(_down, label="board.load")
+    assert runtime_support.get_supabase_retry_metrics()["open_labels"] == ["board.load"]
+
+    assert runtime_support.retry_supabase(lambda: 7, label="board.load") == 7
+    assert runtime_support.get_supabase_retry_metrics()["labels"]["board.load"]["state"] == "closed"
+
+
+def test_retry_supabase_half_open_admits_a_single_probe(monkeypatch, _fresh_supabase_circuits):
+    import httpx
+
+    runtime_support = _fresh_supabase_circuits
+    monkeypatch.setenv("SUPABASE_BREAKER_FAILURE_THRESHOLD", "1")
+    monkeypatch.setenv("SUPABASE_BREAKER_COOLDOWN_SECONDS", "0")
+
+    def _down():
+        raise httpx.ReadError("reset")
+
+    with pytest.raises(httpx.ReadError):
+        runtime_support.retry_supabase(_down, label="board.load")
+
+    concurrent = []
+
+    def _probe():
+        # A second caller arriving while the probe is in flight is turned away.
+        with pytest.raises(runtime_support.SupabaseCircuitOpenError):
+            runtime_support.retry_supabase(lambda: "second", label="board.load")
+        concurrent.append(True)
+        return "probe"
+
+    assert runtime_support.retry_supabase(_probe, label="board.load") == "probe"
+    assert concurrent == [True]
+    assert runtime_support.get_supabase_retry_metrics()["labels"]["board.load"]["state"] == "closed"
+
+
+def test_retry_supabase_ignores_non_transport_errors_for_the_breaker(monkeypatch, _fresh_supabase_circuits):
+    import httpx
+
+    runtime_support = _fresh_supabase_circuits
+    monkeypatch.setenv("SUPABASE_BREAKER_FAILURE_THRESHOLD", "2")
+    monkeypatch.setenv("SUPABASE_BREAKER_COOLDOWN_SECONDS", "60")
+
+    def _down():
+        raise httpx.ConnectError("connection refused")
+
+    def _rejected():
+        raise ValueError("PGRST116 row not found")
+
+    with pytest.raises(httpx.ConnectError):
+        runtime_support.retry_supabase(_down, retries=1, label="bets.update")
+    with pytest.raises(ValueError):
+        runtime_support.retry_supabase(_rejected, label="bets.update")
+    assert runtime_support.get_supabase_retry_metrics()["labels"]["bets.update"]["consecutive_failures"] == 1
+
+    with pytest.raises(httpx.ConnectError):
+        runtime_support.retry_supabase(_down, retries=1, label="bets.update")
+    assert runtime_support.get_supabase_retry_metrics()["open_labels"] == ["bets.update"]
+
+
+def test_retry_supabase_does_not_retry_on_event_loop_thread(monkeypatch, _fresh_supabase_circuits):
+    import asyncio
+
+    import httpx
+
+    runtime_support = _fresh_supabase_circuits
+    slept = []
+    monkeypatch.setattr(runtime_support.time, "sleep", slept.append)
+    attempts = []
+
+    def _blip():
+        attempts.append(1)
+        raise httpx.RemoteProtocolError("server disconnected")
+
+    async def _run():
+        return runtime_support.retry_supabase(_blip, label="scheduler.persist")
+
+    with pytest.raises(httpx.RemoteProtocolError):
+        asyncio.run(_run())
+    assert slept == []
+    assert len(attempts) == 1
+
+
+def test_retry_supabase_async_awaits_backoff_between_worker_thread_attempts(monkeypatch, _fresh_supabase_circuits):
+    import asyncio
+    import threading
+
+    import httpx
+
+    runtime_support = _fresh_supabase_circuits
+    slept = []
+
+    async def _fake_sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr(runtime_support.asyncio, "sleep", _fake_sleep)
+    attempt_threads = []
+
+    def _flaky():
+        attempt_threads.append(threading.current_thread())
+        if len(attempt_threads) == 1:
+            raise httpx.RemoteProtocolError("server disconnected")
+        return "ok"
+
+    async def _run():
+        return await runtime_support.retry_supabase_async(_flaky, label="bets.select_jit_clv_window")
+
+    assert asyncio.run(_run()) == "ok"
+    assert slept == [0.1]
+    assert threading.main_thread() not in attempt_threads
+    assert runtime_support.get_supabase_retry_metrics()["labels"]["bets.select_jit_clv_window"]["retries"] == 1
+
+
+def test_retry_supabase_labels_unlabelled_calls_by_call_site(_fresh_supabase_circuits):
+    runtime_support = _fresh_supabase_circuits
+
+    def load_board():
+        return runtime_support.retry_supabase(lambda: "board")
+
+    assert load_board() == "board"
+    assert list(runtime_support.get_supabase_retry_metrics()["labels"]) == [
+        "test_retry_supabase_labels_unlabelled_calls_by_call_site.load_board.<lambda>"
+    ]
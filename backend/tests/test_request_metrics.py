@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from routes.ops_cron import ops_request_metrics_impl
+from services.request_metrics import (
+    LatencyHistogram,
+    RequestMetricsMiddleware,
+    get_route_latency_snapshot,
+    record_route_latency,
+    reset_route_latency_histograms,
+)
+from utils.request_context import get_request_id, record_db_roundtrip, record_http_roundtrip
+
+
+@pytest.fixture(autouse=True)
+def _fresh_histograms():
+    reset_route_latency_histograms()
+    yield
+    reset_route_latency_histograms()
+
+
+def _build_app():
+    app = FastAPI()
+    app.add_middleware(RequestMetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: str):
+        # Sync endpoints run in the threadpool; their round-trips must still reach the middleware.
+        record_db_roundtrip(12.5)
+        record_db_roundtrip(7.5)
+        return {"item_id": item_id, "request_id": get_request_id()}
+
+    @app.get("/fanout")
+    async def fanout():
+        async def _call():
+            record_http_roundtrip(30)
+
+        await asyncio.gather(_call(), _call())
+        return {"ok": True}
+
+    return app
+
+
+def test_middleware_sets_request_id_and_server_timing_for_threadpool_endpoints():
+    client = TestClient(_build_app())
+
+    resp = client.get("/items/abc", headers={"X-Request-ID": "req-123"})
+
+    assert resp.status_code == 200
+    assert resp.json()["request_id"] == "req-123"
+    assert resp.headers["x-request-id"] == "req-123"
+    timing = resp.headers["server-timing"]
+    assert 'db;dur=20.0;desc="2 calls"' in timing
+    assert 'http;dur=0.0;desc="0 calls"' in timing
+    assert "app;dur=" in timing
+
+    routes = {item["route"]: item for item in get_route_latency_snapshot()["routes"]}
+    assert routes["GET /items/{item_id}"]["count"] == 1
+    assert routes["GET /items/{item_id}"]["avg_db_roundtrips"] == 2
+
+
+def test_middleware_generates_ids_and_counts_http_roundtrips_across_tasks():
+    client = TestClient(_build_app())
+
+    resp = client.get("/fanout", headers={"X-Request-ID": "bad id with spaces"})
+
+    assert resp.headers["x-request-id"] != "bad id with spaces"
+    assert len(resp.headers["x-request-id"]) == 32
+    assert 'http;dur=60.0;desc="2 calls"' in resp.headers["server-timing"]
+    client.get("/missing")
+    routes = {item["route"] for item in get_route_latency_snapshot()["routes"]}
+    assert routes == {"GET /fanout", "unmatched"}
+
+
+def test_latency_histogram_percentiles_resolve_to_bucket_bounds():
+    histogram = LatencyHistogram()
+    for duration_ms in [3.0] * 90 + [120.0] * 9 + [2200.0]:
+        histogram.observe(duration_ms, status_code=200, db_roundtrips=1, http_roundtrips=0)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot["count"] == 100
+    assert snapshot["p50_ms"] == 5.0
+    assert snapshot["p95_ms"] == 150.0
+    assert snapshot["p99_ms"] == 150.0
+    assert snapshot["max_ms"] == 2200.0
+    assert snapshot["avg_db_roundtrips"] == 1
+
+
+def test_ops_request_metrics_impl_returns_snapshot_and_optionally_resets():
+    record_route_latency("GET /api/bets", 42.0, status_code=200, db_roundtrips=3)
+    tokens = []
+
+    body = ops_request_metrics_impl(
+        "ops-secret",
+        reset=True,
+        require_valid_cron_token=tokens.append,
+        get_snapshot=get_route_latency_snapshot,
+        reset_histograms=reset_route_latency_histograms,
+        get_supabase_metrics=lambda: {"open_labels": [], "labels": {}},
+    )
+
+    assert tokens == ["ops-secret"]
+    assert body["supabase"] == {"open_labels": [], "labels": {}}
+    assert body["reset"] is True
+    assert body["routes"][0]["route"] == "GET /api/bets"
+    assert body["routes"][0]["p50_ms"] == 42.0
+    assert get_route_latency_snapshot()["routes"] == []
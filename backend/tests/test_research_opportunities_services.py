@@ -1,10 +1,20 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
 from services.research_opportunities import (
     capture_scan_opportunities,
     get_research_opportunities_summary,
+    invalidate_research_opportunities_summary_cache,
     is_missing_scan_opportunities_column_error,
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_summary_cache():
+    invalidate_research_opportunities_summary_cache()
+
+
 class _Resp:
     def __init__(self, data):
         self.data = data
@@ -20,6 +30,21 @@ class _Query:
         self._fields = ""
         self._order_by: list[tuple[str, bool]] = []
         self._range: tuple[int, int] | None = None
+        self._limit: int | None = None
+        self._negate_next = False
+
+    @property
+    def not_(self):
+        self._negate_next = True
+        return self
+
+    def _add_filter(self, predicate):
+        if self._negate_next:
+            self._negate_next = False
+            self._filters.append(lambda row: not predicate(row))
+        else:
+            self._filters.append(predicate)
+        return self
 
     def select(self, fields):
         self._fields = str(fields or "")
@@ -42,6 +67,44 @@ class _Query:
         self._filters.append(lambda row: row.get(key) == value)
         return self
 
+    def neq(self, key, value):
+        return self._add_filter(lambda row: row.get(key) != value)
+
+    def gt(self, key, value):
+        return self._add_filter(lambda row: row.get(key) is not None and row.get(key) > value)
+
+    def gte(self, key, value):
+        return self._add_filter(lambda row: row.get(key) is not None and _ts(row.get(key)) >= _ts(value))
+
+    def lt(self, key, value):
+        return self._add_filter(lambda row: row.get(key) is not None and _ts(row.get(key)) < _ts(value))
+
+    def like(self, key, pattern):
+        prefix = pattern.rstrip("*%")
+        return self._add_filter(lambda row: str(row.get(key) or "").startswith(prefix))
+
+    def or_(self, filters):
+        predicates = []
+        for clause in _split_or_clauses(filters):
+            key, op, value = clause.split(".", 2)
+            if op == "eq":
+                predicates.append(lambda row, key=key, value=value: row.get(key) == value)
+            elif op == "is":
+                predicates.append(lambda row, key=key: row.get(key) is None)
+            elif op == "in":
+                allowed = set(value.strip("()").split(","))
+                predicates.append(lambda row, key=key, allowed=allowed: row.get(key) in allowed)
+            elif op == "like":
+                prefix = value.rstrip("*%")
+                predicates.append(lambda row, key=key, prefix=prefix: str(row.get(key) or "").startswith(prefix))
+            else:
+                raise AssertionError(f"unsupported or_ clause {clause}")
+        return self._add_filter(lambda row: any(predicate(row) for predicate in predicates))
+
+    def limit(self, count):
+        self._limit = int(count)
+        return self
+
     def update(self, payload):
         return _Query(
             self._db,
@@ -68,11 +131,15 @@ class _Query:
         if self._mode == "select":
             for key, desc in reversed(self._order_by):
                 matched.sort(key=lambda row: row.get(key), reverse=desc)
-            if self._range is None:
+            if self._limit is not None:
+                matched = matched[: self._limit]
+            elif self._range is None:
                 matched = matched[:1000]
             else:
                 start, end = self._range
                 matched = matched[start:end + 1]
+            if self._table_name == "scan_opportunities":
+                self._db.rows_read += len(matched)
             return _Resp([dict(row) for row in matched])
 
         if self._mode == "update":
@@ -92,8 +159,28 @@ class _Query:
         return _Resp(inserted)
 
 
+class _MissingFunctionError(Exception):
+    def __init__(self, name):
+        super().__init__(f"Could not find the function public.{name}(p_rows) in the schema cache")
+        self.code = "PGRST202"
+
+
+class _RpcCall:
+    def __init__(self, result):
+        self._result = result
+
+    def execute(self):
+        return _Resp(self._result)
+
+
+def _price_quality(odds):
+    if not odds:
+        return None
+    return 1 + odds / 100 if odds >= 100 else 1 + 100 / abs(odds)
+
+
 class _DB:
-    def __init__(self, rows=None, *, missing_table=False, missing_model_key_columns=False):
+    def __init__(self, rows=None, *, missing_table=False, missing_model_key_columns=False, merge_functions=False):
         self.tables = {
             "scan_opportunities": list(rows or []),
             "scan_opportunity_model_evaluations": [],
@@ -101,14 +188,81 @@ class _DB:
         self._next_id = len(self.tables["scan_opportunities"]) + 1
         self._missing_table = missing_table
         self._missing_model_key_columns = missing_model_key_columns
+        self.rows_read = 0
+        self.merge_functions = merge_functions
+        self.rpc_calls: list[str] = []
+        self.table_calls: list[str] = []
+
+    def rpc(self, name, params):
+        if not self.merge_functions:
+            raise _MissingFunctionError(name)
+        self.rpc_calls.append(name)
+        if name == "merge_scan_opportunity_captures":
+            return _RpcCall(self._merge_captures(params["p_rows"]))
+        assert name == "merge_scan_opportunity_model_evaluations"
+        return _RpcCall(self._merge_evaluations(params["p_rows"]))
+
+    def _merge_captures(self, rows):
+        table = self.tables["scan_opportunities"]
+        inserted = updated = 0
+        for incoming in rows:
+            existing = next((row for row in table if row["opportunity_key"] == incoming["opportunity_key"]), None)
+            if existing is None:
+                table.append({**incoming, "id": f"scan_opportunities-{self._next_id}", "seen_count": 1})
+                self._next_id += 1
+                inserted += 1
+                continue
+            better = (_price_quality(incoming["best_book_odds"]) or 0) > (_price_quality(existing["best_book_odds"]) or 0)
+            for key, value in incoming.items():
+                if key.startswith("last_") or key.startswith("latest_"):
+                    existing[key] = value
+                elif key.startswith("best_") and better:
+                    existing[key] = value
+            existing["first_model_key"] = existing.get("first_model_key") or incoming.get("first_model_key")
+            existing["seen_count"] += 1
+            updated += 1
+        return [{"inserted_count": inserted, "updated_count": updated}]
+
+    def _merge_evaluations(self, rows):
+        table = self.tables["scan_opportunity_model_evaluations"]
+        inserted = []
+        for incoming in rows:
+            key = (incoming["opportunity_key"], incoming["model_key"])
+            existing = next((row for row in table if (row["opportunity_key"], row["model_key"]) == key), None)
+            if existing is None:
+                table.append(dict(incoming))
+                inserted.append({"opportunity_key": key[0], "model_key": key[1]})
+                continue
+            existing.update({k: v for k, v in incoming.items() if not k.startswith("first_")})
+        return inserted
 
     def table(self, name):
+        self.table_calls.append(name)
+        if name == "scan_opportunity_model_calibration_rollups":
+            raise RuntimeError("PGRST205 scan_opportunity_model_calibration_rollups schema cache stale")
         assert name in {"scan_opportunities", "scan_opportunity_model_evaluations"}
         if self._missing_table and name == "scan_opportunities":
             raise RuntimeError("PGRST205 scan_opportunities schema cache stale")
         return _Query(self, name)
 
 
+def _ts(value):
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+
+def _split_or_clauses(filters):
+    clauses, depth, current = [], 0, ""
+    for char in filters:
+        if char == "," and depth == 0:
+            clauses.append(current)
+            current = ""
+            continue
+        depth += {"(": 1, ")": -1}.get(char, 0)
+        current += char
+    clauses.append(current)
+    return clauses
+
+
 class _PostgrestLikeColumnError(Exception):
     def __init__(self, message: str, *, code: str = "42703"):
         super().__init__(message)
@@ -871,3 +1025,120 @@ def test_missing_scan_opportunities_column_error_matches_postgrest_apierror_shap
     err = _PostgrestLikeColumnError("column scan_opportunities.first_model_key does not exist")
 
     assert is_missing_scan_opportunities_column_error(err, "first_model_key", "last_model_key") is True
+
+
+def _summary_row(key, *, days_ago, source="scheduled_board_drop", ev=2.0):
+    seen_at = datetime.now(timezone.utc).replace(hour=12, minute=0, second=0, microsecond=0) - timedelta(days=days_ago)
+    return {
+        "opportunity_key": key,
+        "surface": "straight_bets",
+        "first_seen_at": seen_at.isoformat().replace("+00:00", "Z"),
+        "last_seen_at": seen_at.isoformat().replace("+00:00", "Z"),
+        "commence_time": (seen_at + timedelta(hours=6)).isoformat().replace("+00:00", "Z"),
+        "sport": "basketball_nba",
+        "event": "Away @ Home",
+        "team": "Home",
+        "sportsbook": "DraftKings",
+        "market": "ML",
+        "source_market_key": "h2h",
+        "event_id": f"evt-{key}",
+        "first_source": source,
+        "last_source": source,
+        "seen_count": 1,
+        "first_ev_percentage": ev,
+        "first_book_odds": 120,
+        "best_book_odds": 120,
+        "latest_reference_odds": 110,
+        "reference_odds_at_close": None,
+        "close_captured_at": None,
+        "clv_ev_percent": None,
+        "beat_close": None,
+    }
+
+
+def _cohort_rows():
+    rows = []
+    for days_ago in (0, 1, 2, 5, 9):
+        rows.append(_summary_row(f"drop-{days_ago}", days_ago=days_ago))
+        rows.append(_summary_row(f"manual-{days_ago}", days_ago=days_ago, source="manual_scan"))
+    rows.append(_summary_row("thin-edge", days_ago=0, ev=0.5))
+    return rows
+
+
+def test_get_research_opportunities_summary_pushes_filters_and_reads_only_trailing_cohorts():
+    db = _DB(rows=_cohort_rows())
+
+    summary = get_research_opportunities_summary(
+        db,
+        model_version="current",
+        cohort_mode="trailing_3",
+        scope="board_default",
+    )
+
+    assert summary.captured_count == 3
+    assert summary.selected_cohort_key == "trailing_3"
+    assert len(summary.cohort_trend) == 3
+    assert db.rows_read == 3
+
+
+def test_get_research_opportunities_summary_widens_cohort_window_for_sparse_dates():
+    db = _DB(rows=_cohort_rows())
+
+    summary = get_research_opportunities_summary(
+        db,
+        capture_class="experiment",
+        cohort_mode="trailing_5",
+    )
+
+    assert summary.captured_count == 5
+    assert len(summary.cohort_trend) == 5
+    assert {row.first_source for row in summary.recent_opportunities} == {"Daily Drop (Manual QA)"}
+    assert db.rows_read == 5 + 1
+
+
+def test_get_research_opportunities_summary_is_cached_until_closes_invalidate_it():
+    db = _DB(rows=_cohort_rows())
+
+    first = get_research_opportunities_summary(db, scope="board_default")
+    db.tables["scan_opportunities"].append(_summary_row("late", days_ago=0))
+    cached = get_research_opportunities_summary(db, scope="board_default")
+    other_filter = get_research_opportunities_summary(db, scope="all")
+    invalidate_research_opportunities_summary_cache()
+    refreshed = get_research_opportunities_summary(db, scope="board_default")
+
+    assert first.captured_count == 10
+    assert cached.captured_count == 10
+    assert other_filter.captured_count == 12
+    assert refreshed.captured_count == 11
+
+
+def test_capture_scan_opportunities_merges_through_set_based_functions():
+    db = _DB(merge_functions=True)
+
+    first = capture_scan_opportunities(
+        db,
+        sides=[_side(book_odds=120), _prop_side()],
+        source="scheduled_board_drop",
+        captured_at="2026-03-23T18:00:00Z",
+    )
+    second = capture_scan_opportunities(
+        db,
+        sides=[_side(book_odds=140), _prop_side()],
+        source="ops_trigger_board_drop",
+        captured_at="2026-03-23T18:30:00Z",
+    )
+
+    assert first == {"eligible_seen": 2, "inserted": 2, "updated": 0}
+    assert second == {"eligible_seen": 2, "inserted": 0, "updated": 2}
+    assert "scan_opportunities" not in db.table_calls
+    assert db.rpc_calls.count("merge_scan_opportunity_captures") == 2
+    straight = next(row for row in db.tables["scan_opportunities"] if row["surface"] == "straight_bets")
+    assert straight["seen_count"] == 2
+    assert straight["first_source"] == "scheduled_board_drop"
+    assert straight["last_source"] == "ops_trigger_board_drop"
+    assert straight["first_book_odds"] == 120
+    assert straight["best_book_odds"] == 140
+    evaluations = db.tables["scan_opportunity_model_evaluations"]
+    assert len(evaluations) == 1
+    assert evaluations[0]["first_source"] == "scheduled_board_drop"
+    assert evaluations[0]["last_source"] == "ops_trigger_board_drop"
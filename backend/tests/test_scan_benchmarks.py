@@ -0,0 +1,78 @@
+import sys
+from dataclasses import asdict
+
+import pytest
+
+import database
+import services.http_client as http_client
+import services.odds_api as odds_api
+import services.player_props as player_props
+from benchmarks.api_load import parse_mix, run_load
+from benchmarks.scan_pipeline import StageResult, Workload, compare_to_baseline, run_stage
+
+
+@pytest.fixture
+def _restore_benchmark_stubs(monkeypatch):
+    # run_stage swaps in the Odds API stub and a fake DB client; register the originals so they are restored.
+    monkeypatch.setattr(database, "_supabase", database._supabase)
+    monkeypatch.setattr(http_client, "request_with_retries", http_client.request_with_retries)
+    monkeypatch.setattr(odds_api, "ODDS_API_KEY", odds_api.ODDS_API_KEY)
+    monkeypatch.setattr(player_props, "ODDS_API_KEY", player_props.ODDS_API_KEY)
+    monkeypatch.setenv("ODDS_API_KEY", "benchmark")
+    monkeypatch.setenv("EVENT_ODDS_BATCH_WINDOW_MS", "0")
+    monkeypatch.setenv("EVENT_ODDS_SLICE_TTL_SECONDS", "0")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stage", ["scan_all_sides", "persist_player_prop_board_artifacts", "annotate_sides_with_duplicate_state"])
+async def test_scan_benchmark_stages_run_offline_on_a_tiny_slate(_restore_benchmark_stubs, stage):
+    workload = Workload(straight_events=2, prop_events=2, books=4, players_per_team=2, pending_bets=3)
+
+    result = await run_stage(stage, workload, iterations=1, warmup=0)
+
+    assert result.items > 0
+    assert result.p50_ms > 0
+    if sys.platform == "win32":
+        assert result.peak_rss_mb is None
+    else:
+        assert result.peak_rss_mb > 0
+
+
+def test_compare_to_baseline_flags_only_regressions_past_tolerance_for_the_same_workload():
+    workload = Workload()
+    baseline = {
+        "workload": asdict(workload),
+        "stages": {
+            "scan_all_sides": {"p50_ms": 10.0, "peak_rss_mb": 100.0},
+            "merge_player_prop_scan_results": {"p50_ms": 1.0, "peak_rss_mb": 100.0},
+        },
+    }
+    results = [
+        StageResult("scan_all_sides", 5, 80.0, 12.0, 13.0, 140.0, 360),
+        StageResult("merge_player_prop_scan_results", 5, 900.0, 1.1, 1.2, 101.0, 4608),
+    ]
+
+    regressions = compare_to_baseline(results, baseline, workload, tolerance=0.25)
+
+    assert regressions == ["scan_all_sides: peak_rss_mb 100 -> 140 (+40%)"]
+    assert compare_to_baseline(results, baseline, Workload.scaled(2), tolerance=0.25) == []
+
+
+@pytest.mark.asyncio
+async def test_api_load_drives_board_bet_and_dashboard_routes_against_the_fake_db(_restore_benchmark_stubs, monkeypatch):
+    monkeypatch.setenv("USE_FAKE_SUPABASE", "1")
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.delenv("BETA_INVITE_CODE", raising=False)
+    workload = Workload(straight_events=2, prop_events=1, books=4, players_per_team=1, pending_bets=1)
+
+    stats, db_stats, _elapsed = await run_load(
+        users=2,
+        duration=0.3,
+        mix=parse_mix("board=1,bet=1,dashboard=1"),
+        think_ms=0,
+        workload=workload,
+    )
+
+    assert {"GET /api/board/latest", "POST /bets", "GET /summary"} <= set(stats)
+    assert not any(entry.errors for entry in stats.values())
+    assert db_stats["bets.insert"]["calls"] == len(stats["POST /bets"].samples_ms)
@@ -1,6 +1,7 @@
 import pytest
 from fastapi import HTTPException
 
+from models import FullScanResponse
 from services.scan_cache import (
     empty_scan_response,
     is_missing_scan_cache_error,
@@ -12,6 +13,7 @@ from services.scan_cache import (
     resolve_scan_latest_response,
     scan_cache_exception_to_http_exception,
 )
+from services.scan_payload import SCAN_PAYLOAD_SCHEMA_VERSION
 
 
 class _FakeQuery:
@@ -209,6 +211,9 @@ def test_persist_latest_full_scan_builds_expected_payload():
     diagnostics = upsert_payload["payload"]["diagnostics"]
     for key, value in VALID_PROP_DIAGNOSTICS.items():
         assert diagnostics[key] == value
+    assert upsert_payload["payload"]["schema_version"] == SCAN_PAYLOAD_SCHEMA_VERSION
+    assert upsert_payload["payload"]["sides"][0]["surface"] == "straight_bets"
+    FullScanResponse.model_validate(upsert_payload["payload"])
     assert events == []
 
 
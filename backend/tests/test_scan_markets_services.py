@@ -2,6 +2,7 @@ import pytest
 import httpx
 from fastapi import HTTPException
 
+from services.odds_api_budget import OddsApiBudgetExceeded
 from services.scan_markets import (
     manual_scan_sports_for_env,
     aggregate_manual_scan_all_sports,
@@ -244,6 +245,12 @@ def test_scan_exception_to_http_exception_maps_value_and_generic_errors():
     assert g.status_code == 502
     assert g.detail == "Odds API error: upstream boom"
 
+    refused = scan_exception_to_http_exception(
+        OddsApiBudgetExceeded(source="manual_scan", job="manual_scan", reason="ahead of pace", estimated_cost=1, remaining=50)
+    )
+    assert refused.status_code == 503
+    assert refused.headers == {"Retry-After": "900"}
+
     original = HTTPException(status_code=418, detail="teapot")
     same = scan_exception_to_http_exception(original)
     assert same is original
@@ -104,6 +104,7 @@ def test_scan_endpoints_require_auth(public_client):
 def test_ops_endpoints_require_ops_token(public_client):
     assert public_client.get("/api/ops/status").status_code == 401
     assert public_client.get("/api/ops/research-opportunities/summary").status_code == 401
+    assert public_client.get("/api/ops/request-metrics").status_code == 401
     assert public_client.get(
         "/api/ops/alt-pitcher-k-lookup",
         params={
@@ -285,7 +286,7 @@ def test_scan_markets_contract_shape_with_duplicate_fields(auth_client, auth_hea
     fake_db_state = {}
     monkeypatch.setattr(scan_routes, "get_db", lambda: _FakeDB(fake_db_state), raising=True)
     monkeypatch.setattr(scan_routes, "retry_supabase", lambda f: f(), raising=True)
-    monkeypatch.setattr(scan_routes, "annotate_sides_with_duplicate_state", lambda _db, _uid, sides: sides, raising=True)
+    monkeypatch.setattr(scan_routes, "annotate_sides_with_duplicate_state", lambda _db, _uid, sides, **_kwargs: sides, raising=True)
 
     async def _fake_piggyback_clv(_sides):
         return None
@@ -301,6 +302,33 @@ def test_scan_markets_contract_shape_with_duplicate_fields(auth_client, auth_hea
     _assert_shape_like(body, _load_fixture("scan_markets_normal.json"))
 
 
+@pytest.mark.integration
+def test_scan_markets_budget_refusal_returns_503_with_retry_after(auth_client, auth_headers, monkeypatch):
+    import routes.scan_routes as scan_routes
+    import services.odds_api as odds_api
+    from services.odds_api_budget import OddsApiBudgetExceeded
+
+    async def _refused_get_cached_or_scan(_sport: str, source: str = "manual_scan"):
+        raise OddsApiBudgetExceeded(
+            source=source,
+            job="manual_scan",
+            reason="remaining credits would drop below the manual_scan floor",
+            estimated_cost=3,
+            remaining=900,
+        )
+
+    monkeypatch.setattr(scan_routes, "get_db", lambda: _FakeDB({}), raising=True)
+    monkeypatch.setattr(scan_routes, "retry_supabase", lambda f: f(), raising=True)
+    monkeypatch.setattr(odds_api, "SUPPORTED_SPORTS", ["basketball_nba"], raising=True)
+    monkeypatch.setattr(odds_api, "get_cached_or_scan", _refused_get_cached_or_scan, raising=True)
+
+    resp = auth_client.get("/api/scan-markets", params={"sport": "basketball_nba"}, headers=auth_headers)
+
+    assert resp.status_code == 503
+    assert resp.headers["retry-after"] == "900"
+    assert "Odds API error" not in resp.json()["detail"]
+
+
 @pytest.mark.integration
 def test_scan_latest_empty_contract_shape(auth_client, auth_headers, monkeypatch):
     import routes.scan_routes as scan_routes
@@ -324,7 +352,7 @@ def test_scan_latest_duplicate_state_contract_shape(auth_client, auth_headers, m
     fake_db_state = {"select_data": [{"payload": payload}]}
     monkeypatch.setattr(scan_routes, "get_db", lambda: _FakeDB(fake_db_state), raising=True)
     monkeypatch.setattr(scan_routes, "retry_supabase", lambda f: f(), raising=True)
-    monkeypatch.setattr(scan_routes, "annotate_sides_with_duplicate_state", lambda _db, _uid, sides: sides, raising=True)
+    monkeypatch.setattr(scan_routes, "annotate_sides_with_duplicate_state", lambda _db, _uid, sides, **_kwargs: sides, raising=True)
 
     resp = auth_client.get("/api/scan-latest", headers=auth_headers)
     assert resp.status_code == 200
@@ -386,7 +414,7 @@ def test_scan_markets_accepts_player_props_surface(auth_client, auth_headers, mo
     fake_db_state = {}
     monkeypatch.setattr(scan_routes, "get_db", lambda: _FakeDB(fake_db_state), raising=True)
     monkeypatch.setattr(scan_routes, "retry_supabase", lambda f: f(), raising=True)
-    monkeypatch.setattr(scan_routes, "annotate_sides_with_duplicate_state", lambda _db, _uid, sides: sides, raising=True)
+    monkeypatch.setattr(scan_routes, "annotate_sides_with_duplicate_state", lambda _db, _uid, sides, **_kwargs: sides, raising=True)
     monkeypatch.setattr(player_props, "get_cached_or_scan_player_props", _fake_get_cached_or_scan_player_props, raising=True)
 
     resp = auth_client.get(
@@ -453,7 +481,7 @@ def test_scan_latest_accepts_player_props_surface(auth_client, auth_headers, mon
     fake_db_state = {"select_data": [{"payload": payload}]}
     monkeypatch.setattr(scan_routes, "get_db", lambda: _FakeDB(fake_db_state), raising=True)
     monkeypatch.setattr(scan_routes, "retry_supabase", lambda f: f(), raising=True)
-    monkeypatch.setattr(scan_routes, "annotate_sides_with_duplicate_state", lambda _db, _uid, sides: sides, raising=True)
+    monkeypatch.setattr(scan_routes, "annotate_sides_with_duplicate_state", lambda _db, _uid, sides, **_kwargs: sides, raising=True)
 
     resp = auth_client.get(
         "/api/scan-latest",
@@ -476,7 +504,7 @@ def test_player_props_manual_scan_end_to_end_contract(auth_client, auth_headers,
     fake_db_state = {}
     monkeypatch.setattr(scan_routes, "get_db", lambda: _FakeDB(fake_db_state), raising=True)
     monkeypatch.setattr(scan_routes, "retry_supabase", lambda f: f(), raising=True)
-    monkeypatch.setattr(scan_routes, "annotate_sides_with_duplicate_state", lambda _db, _uid, sides: sides, raising=True)
+    monkeypatch.setattr(scan_routes, "annotate_sides_with_duplicate_state", lambda _db, _uid, sides, **_kwargs: sides, raising=True)
 
     async def _fake_scoreboard():
         return {
@@ -1225,7 +1253,7 @@ def test_ops_trigger_board_refresh_piggybacks_clv_with_fresh_sides(auth_client,
     import services.daily_board as daily_board
     import services.discord_alerts as discord_alerts
 
-    captured_sides: list[list[dict]] = []
+    captured_sides: list[tuple[list[dict], str]] = []
     fresh_straight = [{"surface": "straight_bets", "selection_key": "straight-1"}]
     fresh_props = [{"surface": "player_props", "selection_key": "prop-1"}]
 
@@ -1244,8 +1272,8 @@ def test_ops_trigger_board_refresh_piggybacks_clv_with_fresh_sides(auth_client,
             "fresh_prop_sides": fresh_props,
         }
 
-    def _fake_piggyback_clv(sides):
-        captured_sides.append(sides)
+    def _fake_piggyback_clv(sides, *, source):
+        captured_sides.append((sides, source))
 
     monkeypatch.setattr(daily_board, "run_daily_board_drop", _fake_run_daily_board_drop, raising=True)
     monkeypatch.setattr(
@@ -1258,7 +1286,7 @@ def test_ops_trigger_board_refresh_piggybacks_clv_with_fresh_sides(auth_client,
 
     resp = auth_client.post("/api/ops/trigger/board-refresh", headers={"X-Ops-Token": "ops-secret"})
     assert resp.status_code == 200
-    assert captured_sides == [[*fresh_straight, *fresh_props]]
+    assert captured_sides == [([*fresh_straight, *fresh_props], "ops_trigger_board_drop")]
 
 
 @pytest.mark.integration
@@ -1281,7 +1309,7 @@ def test_ops_trigger_board_refresh_skips_clv_piggyback_with_no_fresh_sides(auth_
             "fresh_prop_sides": [],
         }
 
-    def _fake_piggyback_clv(_sides):
+    def _fake_piggyback_clv(_sides, **_kwargs):
         nonlocal piggyback_calls
         piggyback_calls += 1
 
@@ -1320,7 +1348,7 @@ def test_ops_trigger_board_refresh_clv_piggyback_failure_does_not_fail_route(aut
             "fresh_prop_sides": [],
         }
 
-    async def _fake_piggyback_clv(_sides):
+    async def _fake_piggyback_clv(_sides, **_kwargs):
         raise RuntimeError("clv piggyback exploded")
 
     def _tracking_create_task(coro):
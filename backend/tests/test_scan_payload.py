@@ -0,0 +1,118 @@
+import json
+
+from models import FullScanResponse
+from services.scan_payload import (
+    build_trusted_scan_payload,
+    is_trusted_scan_payload,
+    scan_json_response,
+    scan_response_content,
+    shape_scan_payload,
+)
+
+
+def _straight_side(**overrides):
+    side = {
+        "event_id": "evt-1",
+        "market_key": "h2h",
+        "selection_key": "evt-1|h2h|lakers",
+        "sportsbook": "DraftKings",
+        "sport": "basketball_nba",
+        "event": "Lakers @ Celtics",
+        "commence_time": "2026-03-19T20:00:00Z",
+        "team": "Lakers",
+        "pinnacle_odds": 110,
+        "book_odds": 130,
+        "true_prob": 0.52,
+        "base_kelly_fraction": 0.01,
+        "book_decimal": 2.3,
+        "ev_percentage": 2.0,
+        "internal_debug": {"dropped": True},
+    }
+    side.update(overrides)
+    return side
+
+
+def _prop_side():
+    return {
+        "surface": "player_props",
+        "event_id": "evt-pp-1",
+        "market_key": "player_points",
+        "selection_key": "evt-pp-1|player_points|booker|over|24.5",
+        "sportsbook": "FanDuel",
+        "sport": "basketball_nba",
+        "event": "Lakers @ Suns",
+        "commence_time": "2026-04-22T19:00:00Z",
+        "market": "player_points",
+        "player_name": "Devin Booker",
+        "selection_side": "over",
+        "line_value": 24.5,
+        "display_name": "Devin Booker Over 24.5",
+        "reference_odds": -110,
+        "reference_source": "market_median",
+        "reference_bookmakers": ["draftkings", "betmgm"],
+        "book_odds": 105,
+        "true_prob": 0.5,
+        "base_kelly_fraction": 0.01,
+        "book_decimal": 2.05,
+        "ev_percentage": 2.5,
+    }
+
+
+def _payload(**overrides):
+    payload = {
+        "surface": "straight_bets",
+        "sport": "all",
+        "sides": [_straight_side(), {**_prop_side()}],
+        "events_fetched": 2,
+        "events_with_both_books": 2,
+        "api_requests_remaining": "88",
+        "scanned_at": "2026-03-19T19:55:00Z",
+        "pickem_cards": [{"not": "in the response schema"}],
+    }
+    payload.update(overrides)
+    return payload
+
+
+def test_shaped_payload_matches_validated_dump():
+    payload = _payload()
+
+    shaped = shape_scan_payload(payload)
+    # Validation needs the discriminator; shaping fills it from the payload surface.
+    tagged = {**payload, "sides": [{**payload["sides"][0], "surface": "straight_bets"}, payload["sides"][1]]}
+
+    assert shaped == FullScanResponse.model_validate(tagged).model_dump(mode="json")
+    assert "internal_debug" not in shaped["sides"][0]
+    assert shaped["sides"][0]["surface"] == "straight_bets"
+    assert shaped["sides"][0]["scanner_duplicate_state"] is None
+    assert "pickem_cards" not in shaped
+
+
+def test_trusted_payloads_skip_validation_and_untrusted_ones_are_validated():
+    trusted = build_trusted_scan_payload(_payload())
+    legacy = _payload(sides=[_straight_side(book_odds="not-a-number")])
+
+    assert is_trusted_scan_payload(trusted)
+    assert not is_trusted_scan_payload(legacy)
+    assert "schema_version" not in scan_response_content(trusted)
+    assert json.loads(scan_json_response(trusted).body)["sides"][1]["player_name"] == "Devin Booker"
+
+    try:
+        scan_response_content(legacy)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("untrusted payloads must still be validated")
+
+
+def test_sampled_validation_logs_instead_of_raising(monkeypatch):
+    import services.scan_payload as scan_payload
+
+    events = []
+    monkeypatch.setenv("SCAN_PAYLOAD_VALIDATE_SAMPLE_RATE", "1")
+    monkeypatch.setattr(scan_payload, "log_event", lambda event, **fields: events.append((event, fields)))
+
+    content = scan_response_content(_payload(sides=[_straight_side(book_odds="not-a-number")]), trusted=True)
+
+    assert content["sides"][0]["book_odds"] == "not-a-number"
+    assert events and events[0][0] == "scan_payload.validation_failed"
+    assert events[0][1]["first_error_loc"].startswith("sides.0")
@@ -1,4 +1,8 @@
-from services.scanner_duplicate_detection import annotate_sides_with_duplicate_state
+from services.scanner_duplicate_detection import (
+    annotate_sides_with_duplicate_state,
+    duplicate_state_version,
+    load_pending_duplicate_rows,
+)
 
 
 class _Result:
@@ -414,3 +418,17 @@ def test_annotate_sides_with_duplicate_state_marks_logged_elsewhere_for_cross_bo
     assert out[0]["scanner_duplicate_state"] == "logged_elsewhere"
     assert out[0]["best_logged_odds_american"] == 110
     assert out[0]["matched_pending_bet_id"] == "p1"
+
+
+def test_duplicate_state_version_ignores_row_order_and_tracks_changes():
+    rows = [
+        {"id": "p1", "clv_event_id": "evt-1", "odds_american": 110},
+        {"id": "p2", "clv_event_id": "evt-2", "odds_american": -105},
+    ]
+    db = _DB(rows)
+
+    loaded = load_pending_duplicate_rows(db, "user-1")
+
+    assert duplicate_state_version(loaded) == duplicate_state_version(list(reversed(rows)))
+    assert duplicate_state_version(rows) != duplicate_state_version([rows[0], {**rows[1], "odds_american": -110}])
+    assert duplicate_state_version([]) != duplicate_state_version(rows)
@@ -7,6 +7,8 @@ from datetime import datetime, UTC, timedelta, timezone
 import pytest
 from fastapi import HTTPException
 
+from models import FullScanResponse
+
 
 def _reload_runtime(monkeypatch, *, zoneinfo_zoneinfo_override=None):
     """
@@ -371,7 +373,7 @@ async def test_scheduled_board_drop_job_piggybacks_clv_with_fresh_sides(monkeypa
 
     fresh_straight = [{"surface": "straight_bets", "selection_key": "straight-1"}]
     fresh_props = [{"surface": "player_props", "selection_key": "prop-1"}]
-    piggyback_calls: list[list[dict]] = []
+    piggyback_calls: list[tuple[list[dict], str]] = []
 
     async def _fake_run_daily_board_drop(*, db, source, scan_label, mst_anchor_time, retry_supabase, log_event):
         return {
@@ -394,14 +396,14 @@ async def test_scheduled_board_drop_job_piggybacks_clv_with_fresh_sides(monkeypa
 
     monkeypatch.setattr(daily_board, "run_daily_board_drop", _fake_run_daily_board_drop, raising=True)
 
-    async def _fake_piggyback_clv(sides: list[dict]):
-        piggyback_calls.append(sides)
+    async def _fake_piggyback_clv(sides: list[dict], *, source: str):
+        piggyback_calls.append((sides, source))
 
     monkeypatch.setattr(runtime, "_piggyback_clv", _fake_piggyback_clv, raising=True)
 
     await runtime._run_scheduled_board_drop_job(alert_delivery_allowed=True)
 
-    assert piggyback_calls == [[*fresh_straight, *fresh_props]]
+    assert piggyback_calls == [([*fresh_straight, *fresh_props], "scheduled_board_drop")]
 
 
 @pytest.mark.asyncio
@@ -429,7 +431,7 @@ async def test_scheduled_board_drop_job_clv_piggyback_failure_does_not_fail_publ
 
     monkeypatch.setattr(daily_board, "run_daily_board_drop", _fake_run_daily_board_drop, raising=True)
 
-    async def _failing_piggyback_clv(_sides: list[dict]):
+    async def _failing_piggyback_clv(_sides: list[dict], **_kwargs):
         raise RuntimeError("scheduled clv piggyback exploded")
 
     monkeypatch.setattr(runtime, "_piggyback_clv", _failing_piggyback_clv, raising=True)
@@ -1124,7 +1126,9 @@ async def test_scan_markets_returns_backend_duplicate_state_enum(monkeypatch):
     monkeypatch.setattr(odds_api, "get_cached_or_scan", _fake_cached_or_scan, raising=True)
     monkeypatch.setattr(odds_api, "SUPPORTED_SPORTS", ["basketball_nba"], raising=True)
 
-    response = await runtime.scan_markets(sport="basketball_nba", user={"id": "user-1"})
+    raw_response = await runtime.scan_markets(sport="basketball_nba", user={"id": "user-1"})
+    # The route skips response_model revalidation; the body must still satisfy the schema.
+    response = FullScanResponse.model_validate_json(raw_response.body)
 
     assert len(response.sides) == 2
     assert response.sides[0].scanner_duplicate_state == "better_now"
@@ -1,8 +1,10 @@
 from services.team_aliases import (
     build_short_event_label,
     canonical_display_name,
+    canonical_player_token,
     canonical_short_name,
     canonical_team_token,
+    clear_name_token_caches,
     normalize_team_name,
     resolve_team_alias,
 )
@@ -33,3 +35,15 @@ def test_canonical_team_token_falls_back_for_unknown_teams():
 def test_build_short_event_label_uses_team_short_names():
     short_label = build_short_event_label("basketball_nba", "Los Angeles Lakers", "Boston Celtics")
     assert short_label == "LAL @ BOS"
+
+
+def test_canonical_tokens_are_interned_per_sport():
+    clear_name_token_caches()
+
+    first = canonical_team_token("basketball_nba", "LA Lakers")
+    assert canonical_team_token("basketball_nba", "LA Lakers") is first
+    assert canonical_team_token("baseball_mlb", "Kings") == "kings"
+    assert canonical_team_token("basketball_nba", "Kings") == "nba_sacramento_kings"
+    assert canonical_short_name("basketball_nba", None) == ""
+    assert canonical_player_token(" Shai Gilgeous-Alexander ") == "shaigilgeousalexander"
+    assert canonical_player_token(None) == ""
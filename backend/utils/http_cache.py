@@ -0,0 +1,150 @@
+"""Conditional GET helpers (ETags, If-None-Match, 304s) and pre-compressed JSON bodies."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+
+try:
+    import brotli  # type: ignore
+except Exception:
+    brotli = None
+
+# Clients may keep board/scan reads but must revalidate; a matching ETag then costs a bodyless 304.
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+# Below this size compression costs more than it saves; such bodies are kept uncompressed.
+COMPRESS_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 8
+
+
+def strong_etag(*parts: Any) -> str:
+    encoded = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return f'"{hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def weak_etag(*parts: Any) -> str:
+    """Tag for bodies served in several content codings: the br, gzip and identity bytes differ."""
+    return f"W/{strong_etag(*parts)}"
+
+
+def etag_matches(if_none_match: object, etag: str | None) -> bool:
+    # Route functions are also called directly, where the Header default is not a string.
+    if etag is None or not isinstance(if_none_match, str) or not if_none_match.strip():
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    # If-None-Match uses the weak comparison function (RFC 9110 13.1.2).
+    opaque = etag.removeprefix("W/")
+    return any(candidate.removeprefix("W/") == opaque for candidate in candidates)
+
+
+def not_modified_response(etag: str, *, cache_control: str = REVALIDATE_CACHE_CONTROL) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+
+def apply_cache_headers(
+    response: object,
+    etag: str | None,
+    *,
+    cache_control: str = REVALIDATE_CACHE_CONTROL,
+) -> None:
+    if etag is None or not isinstance(response, Response):
+        return
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+
+
+@dataclass(frozen=True)
+class EncodedJsonBody:
+    """A JSON body serialized once. Large bodies keep only compressed variants; `identity` is then None."""
+
+    identity: bytes | None
+    gzip: bytes | None
+    br: bytes | None
+    size: int
+
+    def identity_bytes(self) -> bytes:
+        if self.identity is not None:
+            return self.identity
+        return gzip.decompress(self.gzip or b"")
+
+
+def encode_json_body(content: Any) -> EncodedJsonBody:
+    """Serialize `content` exactly as `JSONResponse` would, then compress it when that pays off."""
+    raw = json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    if len(raw) < COMPRESS_MIN_BYTES:
+        return EncodedJsonBody(identity=raw, gzip=None, br=None, size=len(raw))
+    return EncodedJsonBody(
+        identity=None,
+        gzip=gzip.compress(raw, compresslevel=GZIP_LEVEL, mtime=0),
+        br=brotli.compress(raw, quality=BROTLI_QUALITY) if brotli is not None else None,
+        size=len(raw),
+    )
+
+
+def _accepted_codings(accept_encoding: object) -> dict[str, float]:
+    if not isinstance(accept_encoding, str):
+        return {}
+    accepted: dict[str, float] = {}
+    for token in accept_encoding.split(","):
+        coding, _, params = token.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def negotiate_content_encoding(accept_encoding: object, body: EncodedJsonBody) -> str:
+    """Pick `br`, `gzip` or `identity` for `body` from an Accept-Encoding header value."""
+    accepted = _accepted_codings(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    for coding, variant in (("br", body.br), ("gzip", body.gzip)):
+        if variant is not None and accepted.get(coding, wildcard) > 0:
+            return coding
+    return "identity"
+
+
+def encoded_json_response(
+    body: EncodedJsonBody,
+    accept_encoding: object,
+    *,
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    coding = negotiate_content_encoding(accept_encoding, body)
+    response_headers = dict(headers or {})
+    response_headers["Vary"] = "Accept-Encoding"
+    etag = response_headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        # One tag covers every coding of this body, so it can only be a weak validator.
+        response_headers["ETag"] = f"W/{etag}"
+    if coding == "br":
+        content, response_headers["Content-Encoding"] = body.br, "br"
+    elif coding == "gzip":
+        content, response_headers["Content-Encoding"] = body.gzip, "gzip"
+    else:
+        content = body.identity_bytes()
+    return Response(content=content, status_code=status_code, media_type="application/json", headers=response_headers)
@@ -1,12 +1,37 @@
 from __future__ import annotations
 
 from contextvars import ContextVar, Token
+from dataclasses import dataclass
+
+
+@dataclass
+class RoundtripTotals:
+    """Mutable per-request round-trip totals.
+
+    The context var holds this object rather than plain numbers so sync
+    endpoints running in the threadpool (which execute in a copied context)
+    still add to the totals the request middleware reads afterwards.
+    """
+
+    count: int = 0
+    duration_ms: float = 0.0
+
+    def record(self, duration_ms: float | int | None) -> None:
+        self.count += 1
+        if isinstance(duration_ms, (int, float)):
+            self.duration_ms += float(duration_ms)
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "roundtrip_count": self.count,
+            "roundtrip_duration_ms": round(self.duration_ms, 2),
+        }
 
 
 _request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
 _correlation_id_var: ContextVar[str | None] = ContextVar("correlation_id", default=None)
-_db_roundtrip_count_var: ContextVar[int] = ContextVar("db_roundtrip_count", default=0)
-_db_roundtrip_duration_ms_var: ContextVar[float] = ContextVar("db_roundtrip_duration_ms", default=0.0)
+_db_roundtrips_var: ContextVar[RoundtripTotals | None] = ContextVar("db_roundtrips", default=None)
+_http_roundtrips_var: ContextVar[RoundtripTotals | None] = ContextVar("http_roundtrips", default=None)
 
 
 def set_request_context(*, request_id: str | None, correlation_id: str | None) -> tuple[Token, Token]:
@@ -29,26 +54,41 @@ def get_correlation_id() -> str | None:
     return _correlation_id_var.get()
 
 
-def reset_db_metrics() -> tuple[Token, Token]:
-    return (
-        _db_roundtrip_count_var.set(0),
-        _db_roundtrip_duration_ms_var.set(0.0),
-    )
+def _current_totals(var: ContextVar[RoundtripTotals | None]) -> RoundtripTotals:
+    totals = var.get()
+    if totals is None:
+        totals = RoundtripTotals()
+        var.set(totals)
+    return totals
+
 
+def reset_db_metrics() -> Token:
+    return _db_roundtrips_var.set(RoundtripTotals())
 
-def restore_db_metrics(*, count_token: Token, duration_token: Token) -> None:
-    _db_roundtrip_count_var.reset(count_token)
-    _db_roundtrip_duration_ms_var.reset(duration_token)
+
+def restore_db_metrics(token: Token) -> None:
+    _db_roundtrips_var.reset(token)
 
 
 def record_db_roundtrip(duration_ms: float | int | None = None) -> None:
-    _db_roundtrip_count_var.set(_db_roundtrip_count_var.get() + 1)
-    if isinstance(duration_ms, (int, float)):
-        _db_roundtrip_duration_ms_var.set(_db_roundtrip_duration_ms_var.get() + float(duration_ms))
+    _current_totals(_db_roundtrips_var).record(duration_ms)
 
 
 def get_db_metrics() -> dict[str, float | int]:
-    return {
-        "roundtrip_count": _db_roundtrip_count_var.get(),
-        "roundtrip_duration_ms": round(_db_roundtrip_duration_ms_var.get(), 2),
-    }
+    return _current_totals(_db_roundtrips_var).as_dict()
+
+
+def reset_http_metrics() -> Token:
+    return _http_roundtrips_var.set(RoundtripTotals())
+
+
+def restore_http_metrics(token: Token) -> None:
+    _http_roundtrips_var.reset(token)
+
+
+def record_http_roundtrip(duration_ms: float | int | None = None) -> None:
+    _current_totals(_http_roundtrips_var).record(duration_ms)
+
+
+def get_http_metrics() -> dict[str, float | int]:
+    return _current_totals(_http_roundtrips_var).as_dict()
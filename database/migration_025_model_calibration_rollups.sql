@@ -0,0 +1,26 @@
+-- ============================================================
+-- Migration 025: Model-calibration rollups
+-- ============================================================
+-- Backend-only mergeable accumulators for the ops model-calibration
+-- summary. One row per (first-seen cohort date, dimension, key); the
+-- `metrics` JSON holds counts, sums, and sums of squares (plus paired
+-- release-gate deltas for the `release_gate_pairs` dimension).
+--
+-- Rows are updated incrementally when evaluation rows are captured and
+-- when close snapshots are written. Seed or repair the table after
+-- applying this migration with:
+--   POST /api/ops/trigger/model-calibration-rollups
+
+CREATE TABLE IF NOT EXISTS public.scan_opportunity_model_calibration_rollups (
+  cohort_key TEXT NOT NULL,
+  dimension TEXT NOT NULL,
+  dimension_key TEXT NOT NULL,
+  metrics JSONB NOT NULL DEFAULT '{}'::jsonb,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT timezone('utc', now()),
+  PRIMARY KEY (cohort_key, dimension, dimension_key)
+);
+
+CREATE INDEX IF NOT EXISTS scan_opportunity_model_calibration_rollups_dimension_idx
+  ON public.scan_opportunity_model_calibration_rollups (dimension, cohort_key);
+
+ALTER TABLE public.scan_opportunity_model_calibration_rollups ENABLE ROW LEVEL SECURITY;
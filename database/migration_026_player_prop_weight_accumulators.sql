@@ -0,0 +1,32 @@
+-- ============================================================
+-- Migration 026: Player-prop weight accumulators
+-- ============================================================
+-- Backend-only exponentially decayed error accumulators for the
+-- props_v2 sportsbook weight trainer. One row per (model family,
+-- market, sportsbook, close date); sums are stored relative to the
+-- close date's UTC midnight so training decays a whole day with one
+-- multiplication instead of rescanning raw evaluations.
+--
+-- Rows are updated incrementally when close snapshots are written.
+-- Seed or repair the table after applying this migration with:
+--   POST /api/ops/trigger/player-prop-weights?rebuild_accumulators=true
+
+CREATE TABLE IF NOT EXISTS public.player_prop_model_weight_accumulators (
+  model_family TEXT NOT NULL DEFAULT 'props_v2',
+  market_key TEXT NOT NULL,
+  sportsbook_key TEXT NOT NULL,
+  close_date DATE NOT NULL,
+  error_weight_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+  weight_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+  sample_count INTEGER NOT NULL DEFAULT 0,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT timezone('utc', now()),
+  PRIMARY KEY (model_family, market_key, sportsbook_key, close_date)
+);
+
+CREATE INDEX IF NOT EXISTS player_prop_model_weight_accumulators_close_date_idx
+  ON public.player_prop_model_weight_accumulators (model_family, close_date);
+
+-- Windowed fallback/rebuild scans filter on model_key and close_captured_at,
+-- which scan_opportunity_model_evaluations_model_idx (migration 012) already covers.
+
+ALTER TABLE public.player_prop_model_weight_accumulators ENABLE ROW LEVEL SECURITY;
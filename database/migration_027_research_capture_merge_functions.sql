@@ -0,0 +1,231 @@
+-- ============================================================
+-- Migration 027: Set-based research capture merges
+-- ============================================================
+-- Research and pick'em capture run on every fresh scan and board
+-- drop. Until now each call selected existing rows by key and then
+-- updated them one request at a time. These functions merge a whole
+-- chunk of captures in one INSERT ... ON CONFLICT statement. Counters
+-- are incremented server-side and the best-price comparison happens in
+-- SQL, so concurrent captures cannot lose increments.
+--
+-- The backend sends rows shaped like its insert payloads as `p_rows`
+-- and falls back to the row-by-row path while these functions are
+-- missing (PGRST202).
+
+CREATE OR REPLACE FUNCTION public.research_price_quality(american NUMERIC)
+RETURNS NUMERIC
+LANGUAGE sql
+IMMUTABLE
+AS $$
+  -- Mirrors calculations.american_to_decimal; NULL for unusable odds.
+  SELECT CASE
+    WHEN american IS NULL OR american = 0 THEN NULL
+    WHEN american >= 100 THEN 1 + (american / 100)
+    ELSE 1 + (100 / abs(american))
+  END
+$$;
+
+CREATE OR REPLACE FUNCTION public.merge_scan_opportunity_captures(p_rows JSONB)
+RETURNS TABLE (inserted_count INTEGER, updated_count INTEGER)
+LANGUAGE sql
+AS $$
+  WITH incoming AS (
+    SELECT * FROM jsonb_populate_recordset(NULL::public.scan_opportunities, p_rows)
+  ),
+  merged AS (
+    INSERT INTO public.scan_opportunities AS so (
+      opportunity_key, surface, sport, event, commence_time, team, sportsbook, market,
+      event_id, player_name, source_market_key, selection_side, line_value,
+      first_model_key, last_model_key, first_source, last_source, seen_count,
+      first_seen_at, last_seen_at, best_seen_at,
+      first_book_odds, last_book_odds, best_book_odds,
+      first_reference_odds, last_reference_odds, best_reference_odds,
+      first_ev_percentage, last_ev_percentage, best_ev_percentage,
+      latest_reference_odds, latest_reference_updated_at
+    )
+    SELECT
+      opportunity_key, surface, sport, event, commence_time, team, sportsbook, market,
+      event_id, player_name, source_market_key, selection_side, line_value,
+      first_model_key, last_model_key, first_source, last_source, 1,
+      first_seen_at, last_seen_at, best_seen_at,
+      first_book_odds, last_book_odds, best_book_odds,
+      first_reference_odds, last_reference_odds, best_reference_odds,
+      first_ev_percentage, last_ev_percentage, best_ev_percentage,
+      latest_reference_odds, latest_reference_updated_at
+    FROM incoming
+    ON CONFLICT (opportunity_key) DO UPDATE SET
+      surface = EXCLUDED.surface,
+      event = COALESCE(NULLIF(EXCLUDED.event, ''), so.event),
+      commence_time = COALESCE(NULLIF(EXCLUDED.commence_time, ''), so.commence_time),
+      team = COALESCE(NULLIF(EXCLUDED.team, ''), so.team),
+      sportsbook = COALESCE(NULLIF(EXCLUDED.sportsbook, ''), so.sportsbook),
+      market = CASE
+        WHEN EXCLUDED.surface = 'straight_bets' THEN 'ML'
+        ELSE COALESCE(NULLIF(EXCLUDED.market, ''), so.market)
+      END,
+      event_id = COALESCE(EXCLUDED.event_id, so.event_id),
+      player_name = COALESCE(EXCLUDED.player_name, so.player_name),
+      source_market_key = COALESCE(EXCLUDED.source_market_key, so.source_market_key),
+      selection_side = COALESCE(EXCLUDED.selection_side, so.selection_side),
+      line_value = COALESCE(EXCLUDED.line_value, so.line_value),
+      first_model_key = COALESCE(so.first_model_key, EXCLUDED.first_model_key),
+      last_model_key = EXCLUDED.last_model_key,
+      last_source = EXCLUDED.last_source,
+      seen_count = so.seen_count + 1,
+      last_seen_at = EXCLUDED.last_seen_at,
+      last_book_odds = EXCLUDED.last_book_odds,
+      last_reference_odds = EXCLUDED.last_reference_odds,
+      last_ev_percentage = EXCLUDED.last_ev_percentage,
+      latest_reference_odds = EXCLUDED.latest_reference_odds,
+      latest_reference_updated_at = EXCLUDED.latest_reference_updated_at,
+      best_seen_at = CASE
+        WHEN public.research_price_quality(EXCLUDED.best_book_odds) > COALESCE(public.research_price_quality(so.best_book_odds), 0)
+        THEN EXCLUDED.best_seen_at ELSE so.best_seen_at
+      END,
+      best_book_odds = CASE
+        WHEN public.research_price_quality(EXCLUDED.best_book_odds) > COALESCE(public.research_price_quality(so.best_book_odds), 0)
+        THEN EXCLUDED.best_book_odds ELSE so.best_book_odds
+      END,
+      best_reference_odds = CASE
+        WHEN public.research_price_quality(EXCLUDED.best_book_odds) > COALESCE(public.research_price_quality(so.best_book_odds), 0)
+        THEN EXCLUDED.best_reference_odds ELSE so.best_reference_odds
+      END,
+      best_ev_percentage = CASE
+        WHEN public.research_price_quality(EXCLUDED.best_book_odds) > COALESCE(public.research_price_quality(so.best_book_odds), 0)
+        THEN EXCLUDED.best_ev_percentage ELSE so.best_ev_percentage
+      END
+    RETURNING (xmax = 0) AS inserted
+  )
+  SELECT
+    COUNT(*) FILTER (WHERE inserted)::INTEGER,
+    COUNT(*) FILTER (WHERE NOT inserted)::INTEGER
+  FROM merged
+$$;
+
+CREATE OR REPLACE FUNCTION public.merge_scan_opportunity_model_evaluations(p_rows JSONB)
+RETURNS TABLE (opportunity_key TEXT, model_key TEXT)
+LANGUAGE sql
+AS $$
+  WITH incoming AS (
+    SELECT * FROM jsonb_populate_recordset(NULL::public.scan_opportunity_model_evaluations, p_rows)
+  ),
+  merged AS (
+    INSERT INTO public.scan_opportunity_model_evaluations AS ev (
+      opportunity_key, model_key, capture_role, surface, sport, event, team, sportsbook,
+      sportsbook_key, market, event_id, player_name, selection_side, line_value, reference_source,
+      first_source, last_source, first_seen_at, last_seen_at,
+      first_true_prob, last_true_prob, first_raw_true_prob, last_raw_true_prob,
+      first_book_odds, last_book_odds, first_book_decimal, last_book_decimal,
+      first_reference_odds, last_reference_odds, first_ev_percentage, last_ev_percentage,
+      first_confidence_score, last_confidence_score, first_confidence_label, last_confidence_label,
+      first_reference_bookmaker_count, last_reference_bookmaker_count,
+      first_interpolation_mode, last_interpolation_mode,
+      first_reference_inputs_json, last_reference_inputs_json,
+      first_prob_std, last_prob_std, first_shrink_factor, last_shrink_factor
+    )
+    SELECT
+      opportunity_key, model_key, capture_role, surface, sport, event, team, sportsbook,
+      sportsbook_key, market, event_id, player_name, selection_side, line_value, reference_source,
+      first_source, last_source, first_seen_at, last_seen_at,
+      first_true_prob, last_true_prob, first_raw_true_prob, last_raw_true_prob,
+      first_book_odds, last_book_odds, first_book_decimal, last_book_decimal,
+      first_reference_odds, last_reference_odds, first_ev_percentage, last_ev_percentage,
+      first_confidence_score, last_confidence_score, first_confidence_label, last_confidence_label,
+      first_reference_bookmaker_count, last_reference_bookmaker_count,
+      first_interpolation_mode, last_interpolation_mode,
+      first_reference_inputs_json, last_reference_inputs_json,
+      first_prob_std, last_prob_std, first_shrink_factor, last_shrink_factor
+    FROM incoming
+    ON CONFLICT (opportunity_key, model_key) DO UPDATE SET
+      capture_role = EXCLUDED.capture_role,
+      surface = EXCLUDED.surface,
+      sport = EXCLUDED.sport,
+      event = EXCLUDED.event,
+      team = EXCLUDED.team,
+      sportsbook = EXCLUDED.sportsbook,
+      sportsbook_key = EXCLUDED.sportsbook_key,
+      market = EXCLUDED.market,
+      event_id = EXCLUDED.event_id,
+      player_name = EXCLUDED.player_name,
+      selection_side = EXCLUDED.selection_side,
+      line_value = EXCLUDED.line_value,
+      reference_source = EXCLUDED.reference_source,
+      last_source = EXCLUDED.last_source,
+      last_seen_at = EXCLUDED.last_seen_at,
+      last_true_prob = EXCLUDED.last_true_prob,
+      last_raw_true_prob = EXCLUDED.last_raw_true_prob,
+      last_book_odds = EXCLUDED.last_book_odds,
+      last_book_decimal = EXCLUDED.last_book_decimal,
+      last_reference_odds = EXCLUDED.last_reference_odds,
+      last_ev_percentage = EXCLUDED.last_ev_percentage,
+      last_confidence_score = EXCLUDED.last_confidence_score,
+      last_confidence_label = EXCLUDED.last_confidence_label,
+      last_reference_bookmaker_count = EXCLUDED.last_reference_bookmaker_count,
+      last_interpolation_mode = EXCLUDED.last_interpolation_mode,
+      last_reference_inputs_json = EXCLUDED.last_reference_inputs_json,
+      last_prob_std = EXCLUDED.last_prob_std,
+      last_shrink_factor = EXCLUDED.last_shrink_factor
+    RETURNING ev.opportunity_key, ev.model_key, (ev.xmax = 0) AS inserted
+  )
+  SELECT merged.opportunity_key, merged.model_key FROM merged WHERE merged.inserted
+$$;
+
+CREATE OR REPLACE FUNCTION public.merge_pickem_research_observations(p_rows JSONB)
+RETURNS TABLE (inserted_count INTEGER, updated_count INTEGER)
+LANGUAGE sql
+AS $$
+  WITH incoming AS (
+    SELECT * FROM jsonb_populate_recordset(NULL::public.pickem_research_observations, p_rows)
+  ),
+  merged AS (
+    INSERT INTO public.pickem_research_observations AS obs (
+      observation_key, comparison_key, observation_kind, surface, sport, event, commence_time,
+      market, market_key, event_id, player_name, team, opponent, selection_side, line_value,
+      calibration_bucket, first_source, last_source, surfaced_count, first_seen_at, last_seen_at,
+      first_display_probability, last_display_probability,
+      first_fair_odds_american, last_fair_odds_american,
+      first_books_matched_count, last_books_matched_count,
+      first_confidence_label, last_confidence_label, ev_basis,
+      first_selected_sportsbook, last_selected_sportsbook,
+      first_selected_market_odds, last_selected_market_odds,
+      first_projected_edge_pct, last_projected_edge_pct
+    )
+    SELECT
+      observation_key, comparison_key, observation_kind, surface, sport, event, commence_time,
+      market, market_key, event_id, player_name, team, opponent, selection_side, line_value,
+      calibration_bucket, first_source, last_source, 1, first_seen_at, last_seen_at,
+      first_display_probability, last_display_probability,
+      first_fair_odds_american, last_fair_odds_american,
+      first_books_matched_count, last_books_matched_count,
+      first_confidence_label, last_confidence_label, ev_basis,
+      first_selected_sportsbook, last_selected_sportsbook,
+      first_selected_market_odds, last_selected_market_odds,
+      first_projected_edge_pct, last_projected_edge_pct
+    FROM incoming
+    ON CONFLICT (observation_key) DO UPDATE SET
+      last_source = EXCLUDED.last_source,
+      last_seen_at = EXCLUDED.last_seen_at,
+      last_display_probability = EXCLUDED.last_display_probability,
+      last_fair_odds_american = EXCLUDED.last_fair_odds_american,
+      last_books_matched_count = EXCLUDED.last_books_matched_count,
+      last_confidence_label = EXCLUDED.last_confidence_label,
+      last_selected_sportsbook = EXCLUDED.last_selected_sportsbook,
+      last_selected_market_odds = EXCLUDED.last_selected_market_odds,
+      last_projected_edge_pct = EXCLUDED.last_projected_edge_pct,
+      ev_basis = EXCLUDED.ev_basis,
+      surfaced_count = obs.surfaced_count + 1
+    RETURNING (xmax = 0) AS inserted
+  )
+  SELECT
+    COUNT(*) FILTER (WHERE inserted)::INTEGER,
+    COUNT(*) FILTER (WHERE NOT inserted)::INTEGER
+  FROM merged
+$$;
+
+-- Backend-only: the service role calls these; browser roles never should.
+REVOKE ALL ON FUNCTION public.merge_scan_opportunity_captures(JSONB) FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION public.merge_scan_opportunity_model_evaluations(JSONB) FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION public.merge_pickem_research_observations(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.merge_scan_opportunity_captures(JSONB) TO service_role;
+GRANT EXECUTE ON FUNCTION public.merge_scan_opportunity_model_evaluations(JSONB) TO service_role;
+GRANT EXECUTE ON FUNCTION public.merge_pickem_research_observations(JSONB) TO service_role;
@@ -0,0 +1,98 @@
+-- ============================================================
+-- Migration 028: Line-movement history
+-- ============================================================
+-- Scans only kept the latest reference price per bet and research
+-- opportunity, so line movement could not be reconstructed without
+-- re-scanning. `line_history` keeps one row per (event, market,
+-- selection, book) series with the opening tick time and a JSONB list
+-- of [seconds_since_previous_tick, price_delta] pairs in American odds.
+-- The first pair is [0, opening_price]; a pair is appended only when the
+-- price moves, while `last_seen_at` advances on every scan.
+--
+-- `append_line_history_ticks` appends a chunk of ticks in one
+-- INSERT ... ON CONFLICT statement. The backend sends rows shaped like
+-- services.line_history.build_line_ticks output as `p_rows` and falls
+-- back to select-then-upsert while this function is missing (PGRST202).
+
+CREATE TABLE IF NOT EXISTS public.line_history (
+  series_key TEXT PRIMARY KEY,
+  sport TEXT,
+  event_id TEXT NOT NULL,
+  market_key TEXT,
+  selection_key TEXT NOT NULL,
+  sportsbook TEXT NOT NULL,
+  commence_time TEXT,
+  first_tick_at TIMESTAMP WITH TIME ZONE NOT NULL,
+  last_tick_at TIMESTAMP WITH TIME ZONE NOT NULL,
+  last_seen_at TIMESTAMP WITH TIME ZONE NOT NULL,
+  last_price INTEGER NOT NULL,
+  tick_count INTEGER NOT NULL DEFAULT 1,
+  ticks JSONB NOT NULL DEFAULT '[]'::jsonb,
+  created_at TIMESTAMP WITH TIME ZONE DEFAULT timezone('utc', now()) NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_line_history_event_selection
+  ON public.line_history (event_id, selection_key);
+
+CREATE INDEX IF NOT EXISTS idx_line_history_last_seen_at
+  ON public.line_history (last_seen_at);
+
+ALTER TABLE public.line_history ENABLE ROW LEVEL SECURITY;
+
+CREATE OR REPLACE FUNCTION public.append_line_history_ticks(p_rows JSONB)
+RETURNS TABLE (series_count INTEGER, ticked_count INTEGER)
+LANGUAGE sql
+AS $$
+  WITH incoming AS (
+    SELECT DISTINCT ON (series_key) *
+    FROM jsonb_to_recordset(p_rows) AS r(
+      series_key TEXT,
+      sport TEXT,
+      event_id TEXT,
+      market_key TEXT,
+      selection_key TEXT,
+      sportsbook TEXT,
+      commence_time TEXT,
+      price INTEGER,
+      tick_at TIMESTAMP WITH TIME ZONE
+    )
+    ORDER BY series_key, tick_at DESC
+  ),
+  merged AS (
+    INSERT INTO public.line_history AS lh (
+      series_key, sport, event_id, market_key, selection_key, sportsbook, commence_time,
+      first_tick_at, last_tick_at, last_seen_at, last_price, tick_count, ticks
+    )
+    SELECT
+      series_key, sport, event_id, market_key, selection_key, sportsbook, commence_time,
+      tick_at, tick_at, tick_at, price, 1, jsonb_build_array(jsonb_build_array(0, price))
+    FROM incoming
+    ON CONFLICT (series_key) DO UPDATE SET
+      commence_time = COALESCE(NULLIF(EXCLUDED.commence_time, ''), lh.commence_time),
+      last_seen_at = GREATEST(lh.last_seen_at, EXCLUDED.last_seen_at),
+      ticks = CASE
+        WHEN EXCLUDED.last_price <> lh.last_price AND EXCLUDED.last_tick_at > lh.last_tick_at
+        THEN lh.ticks || jsonb_build_array(jsonb_build_array(
+          FLOOR(EXTRACT(EPOCH FROM EXCLUDED.last_tick_at - lh.last_tick_at))::INTEGER,
+          EXCLUDED.last_price - lh.last_price
+        ))
+        ELSE lh.ticks
+      END,
+      tick_count = lh.tick_count + CASE
+        WHEN EXCLUDED.last_price <> lh.last_price AND EXCLUDED.last_tick_at > lh.last_tick_at THEN 1 ELSE 0
+      END,
+      last_tick_at = CASE
+        WHEN EXCLUDED.last_price <> lh.last_price AND EXCLUDED.last_tick_at > lh.last_tick_at
+        THEN EXCLUDED.last_tick_at ELSE lh.last_tick_at
+      END,
+      last_price = CASE
+        WHEN EXCLUDED.last_price <> lh.last_price AND EXCLUDED.last_tick_at > lh.last_tick_at
+        THEN EXCLUDED.last_price ELSE lh.last_price
+      END
+    RETURNING (last_tick_at = last_seen_at) AS ticked
+  )
+  SELECT
+    COUNT(*)::INTEGER,
+    COUNT(*) FILTER (WHERE ticked)::INTEGER
+  FROM merged
+$$;
@@ -0,0 +1,105 @@
+-- ============================================================
+-- Migration 029: Atomic model-calibration rollup writes
+-- ============================================================
+-- Migration 025 rollups were merged select-then-upsert, so two workers
+-- writing close snapshots at once could lose an increment, and the
+-- rebuild deleted then reinserted the table in separate requests.
+--
+-- `increment_model_calibration_rollups` adds a chunk of rollup deltas
+-- in one INSERT ... ON CONFLICT statement, summing each metric
+-- server-side (the `*_abs_max` fields keep the larger value).
+-- `replace_model_calibration_rollups` swaps the whole table inside one
+-- transaction, so readers keep seeing the previous rollups until it
+-- commits. Its rows include the `__meta__ / seeded / rebuild` marker;
+-- the backend serves rollups only once that marker exists and folds
+-- the raw evaluation rows until then.
+--
+-- The backend falls back to the previous request-by-request path while
+-- these functions are missing (PGRST202).
+
+CREATE OR REPLACE FUNCTION public.merge_rollup_metrics(
+  current_metrics JSONB,
+  delta_metrics JSONB,
+  max_keys TEXT[] DEFAULT '{}'
+)
+RETURNS JSONB
+LANGUAGE sql
+IMMUTABLE
+AS $$
+  SELECT COALESCE(
+    jsonb_object_agg(
+      k,
+      CASE
+        WHEN k = ANY(max_keys) THEN GREATEST(
+          COALESCE((current_metrics ->> k)::NUMERIC, 0),
+          COALESCE((delta_metrics ->> k)::NUMERIC, 0)
+        )
+        ELSE COALESCE((current_metrics ->> k)::NUMERIC, 0) + COALESCE((delta_metrics ->> k)::NUMERIC, 0)
+      END
+    ),
+    '{}'::jsonb
+  )
+  FROM (
+    SELECT jsonb_object_keys(COALESCE(current_metrics, '{}'::jsonb))
+    UNION
+    SELECT jsonb_object_keys(COALESCE(delta_metrics, '{}'::jsonb))
+  ) AS metric_keys(k)
+$$;
+
+CREATE OR REPLACE FUNCTION public.increment_model_calibration_rollups(p_rows JSONB)
+RETURNS TABLE (bucket_count INTEGER)
+LANGUAGE sql
+AS $$
+  WITH incoming AS (
+    SELECT *
+    FROM jsonb_to_recordset(p_rows) AS r(
+      cohort_key TEXT,
+      dimension TEXT,
+      dimension_key TEXT,
+      metrics JSONB,
+      updated_at TIMESTAMPTZ
+    )
+  ),
+  merged AS (
+    INSERT INTO public.scan_opportunity_model_calibration_rollups AS rollup (
+      cohort_key, dimension, dimension_key, metrics, updated_at
+    )
+    SELECT cohort_key, dimension, dimension_key, COALESCE(metrics, '{}'::jsonb), COALESCE(updated_at, timezone('utc', now()))
+    FROM incoming
+    ON CONFLICT (cohort_key, dimension, dimension_key) DO UPDATE SET
+      metrics = public.merge_rollup_metrics(
+        rollup.metrics,
+        EXCLUDED.metrics,
+        ARRAY['true_prob_delta_abs_max', 'ev_delta_abs_max']
+      ),
+      updated_at = GREATEST(rollup.updated_at, EXCLUDED.updated_at)
+    RETURNING 1
+  )
+  SELECT COUNT(*)::INTEGER FROM merged
+$$;
+
+CREATE OR REPLACE FUNCTION public.replace_model_calibration_rollups(p_rows JSONB)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  written INTEGER;
+BEGIN
+  -- Hold off concurrent increments for the swap; plain reads are not blocked.
+  LOCK TABLE public.scan_opportunity_model_calibration_rollups IN SHARE ROW EXCLUSIVE MODE;
+  DELETE FROM public.scan_opportunity_model_calibration_rollups;
+  INSERT INTO public.scan_opportunity_model_calibration_rollups (
+    cohort_key, dimension, dimension_key, metrics, updated_at
+  )
+  SELECT cohort_key, dimension, dimension_key, COALESCE(metrics, '{}'::jsonb), COALESCE(updated_at, timezone('utc', now()))
+  FROM jsonb_to_recordset(p_rows) AS r(
+    cohort_key TEXT,
+    dimension TEXT,
+    dimension_key TEXT,
+    metrics JSONB,
+    updated_at TIMESTAMPTZ
+  );
+  GET DIAGNOSTICS written = ROW_COUNT;
+  RETURN written;
+END;
+$$;
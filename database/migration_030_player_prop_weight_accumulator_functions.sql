@@ -0,0 +1,119 @@
+-- ============================================================
+-- Migration 030: Atomic player-prop weight accumulator writes
+-- ============================================================
+-- Migration 026 accumulators were merged select-then-upsert, so two
+-- workers writing close snapshots at once could lose a sample, and the
+-- rebuild deleted then reinserted a model family in separate requests.
+--
+-- `increment_player_prop_weight_accumulators` adds a chunk of bucket
+-- deltas in one INSERT ... ON CONFLICT statement, summing each column
+-- server-side and clamping at zero like the backend did.
+-- `replace_player_prop_weight_accumulators` swaps one model family's
+-- buckets inside one transaction, so training keeps reading the
+-- previous buckets until it commits. Its rows include the
+-- `__meta__ / seeded` marker; the backend trains from accumulators only
+-- once that marker exists and folds the raw evaluation rows until then.
+--
+-- The backend falls back to the previous request-by-request path while
+-- these functions are missing (PGRST202).
+
+CREATE OR REPLACE FUNCTION public.increment_player_prop_weight_accumulators(p_rows JSONB)
+RETURNS TABLE (bucket_count INTEGER)
+LANGUAGE sql
+AS $$
+  WITH incoming AS (
+    SELECT *
+    FROM jsonb_to_recordset(p_rows) AS r(
+      model_family TEXT,
+      market_key TEXT,
+      sportsbook_key TEXT,
+      close_date DATE,
+      error_weight_sum DOUBLE PRECISION,
+      weight_sum DOUBLE PRECISION,
+      sample_count INTEGER,
+      updated_at TIMESTAMPTZ
+    )
+  ),
+  merged AS (
+    INSERT INTO public.player_prop_model_weight_accumulators AS bucket (
+      model_family, market_key, sportsbook_key, close_date,
+      error_weight_sum, weight_sum, sample_count, updated_at
+    )
+    SELECT
+      model_family,
+      market_key,
+      sportsbook_key,
+      close_date,
+      GREATEST(0, COALESCE(error_weight_sum, 0)),
+      GREATEST(0, COALESCE(weight_sum, 0)),
+      GREATEST(0, COALESCE(sample_count, 0)),
+      COALESCE(updated_at, timezone('utc', now()))
+    FROM incoming
+    ON CONFLICT (model_family, market_key, sportsbook_key, close_date) DO UPDATE SET
+      error_weight_sum = GREATEST(0, bucket.error_weight_sum + COALESCE((
+        SELECT i.error_weight_sum FROM incoming i
+        WHERE i.model_family = EXCLUDED.model_family
+          AND i.market_key = EXCLUDED.market_key
+          AND i.sportsbook_key = EXCLUDED.sportsbook_key
+          AND i.close_date = EXCLUDED.close_date
+      ), 0)),
+      weight_sum = GREATEST(0, bucket.weight_sum + COALESCE((
+        SELECT i.weight_sum FROM incoming i
+        WHERE i.model_family = EXCLUDED.model_family
+          AND i.market_key = EXCLUDED.market_key
+          AND i.sportsbook_key = EXCLUDED.sportsbook_key
+          AND i.close_date = EXCLUDED.close_date
+      ), 0)),
+      sample_count = GREATEST(0, bucket.sample_count + COALESCE((
+        SELECT i.sample_count FROM incoming i
+        WHERE i.model_family = EXCLUDED.model_family
+          AND i.market_key = EXCLUDED.market_key
+          AND i.sportsbook_key = EXCLUDED.sportsbook_key
+          AND i.close_date = EXCLUDED.close_date
+      ), 0)),
+      updated_at = GREATEST(bucket.updated_at, EXCLUDED.updated_at)
+    RETURNING 1
+  )
+  SELECT COUNT(*)::INTEGER FROM merged
+$$;
+
+CREATE OR REPLACE FUNCTION public.replace_player_prop_weight_accumulators(
+  p_model_family TEXT,
+  p_rows JSONB
+)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  written INTEGER;
+BEGIN
+  -- Hold off concurrent increments for the swap; plain reads are not blocked.
+  LOCK TABLE public.player_prop_model_weight_accumulators IN SHARE ROW EXCLUSIVE MODE;
+  DELETE FROM public.player_prop_model_weight_accumulators
+  WHERE model_family = p_model_family;
+  INSERT INTO public.player_prop_model_weight_accumulators (
+    model_family, market_key, sportsbook_key, close_date,
+    error_weight_sum, weight_sum, sample_count, updated_at
+  )
+  SELECT
+    p_model_family,
+    market_key,
+    sportsbook_key,
+    close_date,
+    COALESCE(error_weight_sum, 0),
+    COALESCE(weight_sum, 0),
+    COALESCE(sample_count, 0),
+    COALESCE(updated_at, timezone('utc', now()))
+  FROM jsonb_to_recordset(p_rows) AS r(
+    market_key TEXT,
+    sportsbook_key TEXT,
+    close_date DATE,
+    error_weight_sum DOUBLE PRECISION,
+    weight_sum DOUBLE PRECISION,
+    sample_count INTEGER,
+    updated_at TIMESTAMPTZ
+  );
+  GET DIAGNOSTICS written = ROW_COUNT;
+  RETURN written;
+END;
+$$;
@@ -6,6 +6,7 @@ const EXACT_ALLOWED_BACKEND_PROXY_PATHS = new Set<string>([
   "/ready",
   "/health",
   "/analytics/events",
+  "/analytics/events/batch",
   "/api/scan-markets",
   "/api/scan-latest",
 ]);
@@ -5,11 +5,14 @@ import {
   isAllowedBackendProxyPath,
   normalizeBackendProxyPath,
 } from "@/lib/server/backend-proxy";
+import { fetchUndecoded } from "@/lib/server/undecoded-fetch";
 
 const DEFAULT_PROXY_TIMEOUT_MS = 15000;
 const DEFAULT_OPS_BRIDGE_TIMEOUT_MS = 15000;
 const DEFAULT_ADMIN_BRIDGE_TIMEOUT_MS = 20000;
 const DEFAULT_ADMIN_SCAN_BRIDGE_TIMEOUT_MS = 180000;
+// Statuses whose responses never carry a body (a 304 must be relayed without one).
+const NULL_BODY_STATUSES = new Set([101, 204, 205, 304]);
 
 export type RouteContext = {
   params: {
@@ -109,11 +112,15 @@ function buildUpstreamHeaders(request: Request): Headers {
   const contentType = request.headers.get("content-type");
   const correlationId = request.headers.get("x-correlation-id");
   const accept = request.headers.get("accept");
+  const ifNoneMatch = request.headers.get("if-none-match");
+  const acceptEncoding = request.headers.get("accept-encoding");
 
   if (authorization) headers.set("authorization", authorization);
   if (contentType) headers.set("content-type", contentType);
   if (correlationId) headers.set("x-correlation-id", correlationId);
   if (accept) headers.set("accept", accept);
+  if (ifNoneMatch) headers.set("if-none-match", ifNoneMatch);
+  if (acceptEncoding) headers.set("accept-encoding", acceptEncoding);
 
   return headers;
 }
@@ -125,10 +132,18 @@ function buildDownstreamHeaders(responseHeaders: Headers): Headers {
   const contentType = responseHeaders.get("content-type");
   const correlationId = responseHeaders.get("x-correlation-id");
   const requestId = responseHeaders.get("x-request-id");
+  const etag = responseHeaders.get("etag");
+  const contentEncoding = responseHeaders.get("content-encoding");
+  const vary = responseHeaders.get("vary");
+  const accelBuffering = responseHeaders.get("x-accel-buffering");
 
   if (contentType) headers.set("content-type", contentType);
   if (correlationId) headers.set("x-correlation-id", correlationId);
   if (requestId) headers.set("x-request-id", requestId);
+  if (etag) headers.set("etag", etag);
+  if (contentEncoding) headers.set("content-encoding", contentEncoding);
+  if (vary) headers.set("vary", vary);
+  if (accelBuffering) headers.set("x-accel-buffering", accelBuffering);
 
   return headers;
 }
@@ -169,7 +184,8 @@ export async function proxyRequestImpl(
 
   try {
     const method = request.method.toUpperCase();
-    const fetchFn = deps.fetchFn ?? fetch;
+    // Compressed upstream bodies are relayed as-is along with their Content-Encoding.
+    const fetchFn = deps.fetchFn ?? fetchUndecoded;
     const timeoutMs = resolveTimeoutMs(deps.timeoutMs, proxyTimeoutMs());
     const upstreamBody =
       method === "GET" || method === "HEAD"
@@ -177,6 +193,8 @@ export async function proxyRequestImpl(
         : (() => request.arrayBuffer())();
     const controller = new AbortController();
     const timeout = setTimeout(() => controller.abort(), timeoutMs);
+    // Close the upstream request (and any open event stream) when the client goes away.
+    request.signal?.addEventListener("abort", () => controller.abort(), { once: true });
 
     const response = await fetchFn(targetUrl, {
       method,
@@ -188,7 +206,10 @@ export async function proxyRequestImpl(
       clearTimeout(timeout);
     });
 
-    const responseBody = await response.arrayBuffer();
+    // Stream the body through rather than buffering it, so `text/event-stream` responses
+    // such as /api/board/events deliver each frame as the backend writes it.
+    const responseBody =
+      method === "HEAD" || NULL_BODY_STATUSES.has(response.status) ? null : response.body;
     return new Response(responseBody, {
       status: response.status,
       headers: buildDownstreamHeaders(response.headers),
@@ -0,0 +1,51 @@
+import { request as httpRequest } from "node:http";
+import { request as httpsRequest } from "node:https";
+import { Readable } from "node:stream";
+
+const NULL_BODY_STATUSES = new Set([204, 205, 304]);
+
+/**
+ * A minimal `fetch` for proxies that returns upstream bytes exactly as sent.
+ *
+ * The global `fetch` decodes gzip/br bodies but keeps their `Content-Encoding` header, so a proxy
+ * relaying that header has to read the body without decoding it.
+ */
+export const fetchUndecoded: typeof fetch = (input, init = {}) =>
+  new Promise<Response>((resolve, reject) => {
+    const url = new URL(input instanceof Request ? input.url : String(input));
+    const send = url.protocol === "https:" ? httpsRequest : httpRequest;
+    const headers: Record<string, string> = {};
+    new Headers(init.headers).forEach((value, key) => {
+      headers[key] = value;
+    });
+    const body = init.body instanceof ArrayBuffer ? Buffer.from(init.body) : undefined;
+    if (body) headers["content-length"] = String(body.byteLength);
+
+    const upstream = send(
+      url,
+      { method: init.method ?? "GET", headers, signal: init.signal ?? undefined },
+      (incoming) => {
+        const status = incoming.statusCode ?? 502;
+        const responseHeaders = new Headers();
+        for (const [key, value] of Object.entries(incoming.headers)) {
+          if (value === undefined) continue;
+          for (const item of Array.isArray(value) ? value : [value]) {
+            responseHeaders.append(key, item);
+          }
+        }
+        if (NULL_BODY_STATUSES.has(status) || init.method === "HEAD") {
+          incoming.resume();
+          resolve(new Response(null, { status, headers: responseHeaders }));
+          return;
+        }
+        resolve(
+          new Response(Readable.toWeb(incoming) as unknown as ReadableStream<Uint8Array>, {
+            status,
+            headers: responseHeaders,
+          }),
+        );
+      },
+    );
+    upstream.on("error", reject);
+    upstream.end(body);
+  });
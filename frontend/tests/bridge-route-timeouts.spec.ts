@@ -52,6 +52,106 @@ test.describe("bridge route timeout handling", () => {
     await expect(response.json()).resolves.toMatchObject({ detail: "Backend request timed out" });
   });
 
+  test("backend proxy relays conditional board reads as a bodyless 304", async () => {
+    let upstreamHeaders: Headers | undefined;
+    const fetchFn: typeof fetch = async (_input, init) => {
+      upstreamHeaders = new Headers(init?.headers);
+      return new Response(null, {
+        status: 304,
+        headers: { etag: '"board-v1"', "cache-control": "private, no-cache" },
+      });
+    };
+
+    const response = await proxyRequestImpl(
+      new Request("https://frontend.example/api/backend/api/board/latest", {
+        method: "GET",
+        headers: { "if-none-match": '"board-v1"' },
+      }),
+      { params: { path: ["api", "board", "latest"] } },
+      {
+        backendBaseUrl: "http://backend.internal",
+        fetchFn,
+        timeoutMs: 10,
+      }
+    );
+
+    expect(upstreamHeaders?.get("if-none-match")).toBe('"board-v1"');
+    expect(response.status).toBe(304);
+    expect(response.headers.get("etag")).toBe('"board-v1"');
+    expect(response.headers.get("cache-control")).toBe("private, no-cache");
+    expect(response.body).toBeNull();
+  });
+
+  test("backend proxy relays compressed board bodies without decoding them", async () => {
+    const compressed = new Uint8Array([0x1f, 0x8b, 0x08, 0x00]);
+    let upstreamHeaders: Headers | undefined;
+    const fetchFn: typeof fetch = async (_input, init) => {
+      upstreamHeaders = new Headers(init?.headers);
+      return new Response(compressed, {
+        status: 200,
+        headers: {
+          "content-type": "application/json",
+          "content-encoding": "gzip",
+          vary: "Accept-Encoding",
+          etag: 'W/"board-v1"',
+        },
+      });
+    };
+
+    const response = await proxyRequestImpl(
+      new Request("https://frontend.example/api/backend/api/board/latest", {
+        method: "GET",
+        headers: { "accept-encoding": "br, gzip" },
+      }),
+      { params: { path: ["api", "board", "latest"] } },
+      {
+        backendBaseUrl: "http://backend.internal",
+        fetchFn,
+        timeoutMs: 10,
+      }
+    );
+
+    expect(upstreamHeaders?.get("accept-encoding")).toBe("br, gzip");
+    expect(response.headers.get("content-encoding")).toBe("gzip");
+    expect(response.headers.get("vary")).toBe("Accept-Encoding");
+    expect(response.headers.get("etag")).toBe('W/"board-v1"');
+    expect(new Uint8Array(await response.arrayBuffer())).toEqual(compressed);
+  });
+
+  test("backend proxy streams board events without waiting for the upstream body to end", async () => {
+    const frame = new TextEncoder().encode("retry: 5000\n\n");
+    const fetchFn: typeof fetch = async () =>
+      new Response(
+        new ReadableStream<Uint8Array>({
+          start(controller) {
+            // The upstream stream stays open, like a live SSE connection.
+            controller.enqueue(frame);
+          },
+        }),
+        {
+          status: 200,
+          headers: { "content-type": "text/event-stream", "cache-control": "no-cache" },
+        },
+      );
+
+    const response = await proxyRequestImpl(
+      new Request("https://frontend.example/api/backend/api/board/events", { method: "GET" }),
+      { params: { path: ["api", "board", "events"] } },
+      {
+        backendBaseUrl: "http://backend.internal",
+        fetchFn,
+        timeoutMs: 10,
+      }
+    );
+
+    expect(response.headers.get("content-type")).toBe("text/event-stream");
+    expect(response.headers.get("cache-control")).toBe("no-cache");
+    const reader = response.body!.getReader();
+    const first = await reader.read();
+    expect(first.value).toEqual(frame);
+    await reader.cancel();
+  });
+
   test("ops status bridge returns 504 on timeout", async () => {
     const response = await getOpsStatusRouteImpl({
       assertAccess: allowAccess,